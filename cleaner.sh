@@ -96,6 +96,7 @@ function select_uninstall_mode() {
                 rm -rf "$liboqs_path"
                 rm "$test_data_alg_lists_dir/kem-algs.txt"
                 rm "$test_data_alg_lists_dir/sig-algs.txt"
+                rm -f "$test_data_alg_lists_dir/alg-registry.json"
                 echo -e "\nLiboqs Uninstalled"
                 break;;
             
@@ -103,6 +104,7 @@ function select_uninstall_mode() {
                 # Uninstal OQS-Provider only
                 rm -rf "$oqs_provider_path"
                 rm $test_data_alg_lists_dir/*tls*.txt
+                rm -f "$test_data_alg_lists_dir/alg-registry.json"
                 echo -e "\nOQS-Provider Uninstalled"
                 break;;
 
@@ -0,0 +1,251 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Algorithm registry module for the PQC benchmarking tools. Defines the JSON algorithm registry written alongside the
+algorithm list files in test-data/alg-lists by the get_algorithms.py utility script. The registry holds every algorithm
+list used by the benchmarking and parsing scripts, along with the metadata for each algorithm (its type, family, NIST
+security level, whether it is a PQC-Hybrid algorithm, and its classical component). The parsing scripts load the registry
+once and use exact dictionary and set lookups for the algorithms, falling back to the algorithm list text files for results
+gathered before the registry was introduced. The algorithm metadata is recorded for use when analysing the results, and
+is not currently read by the parsing scripts. The classic TLS algorithms and ciphersuites are also declared here so that
+they are only defined once for the Python scripts. This module is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import re
+import json
+
+# Declare the registry filename, which is stored in the test-data/alg-lists directory
+registry_filename = "alg-registry.json"
+
+# Declare the algorithm lists held in the registry, along with the algorithm type and tool for each list
+alg_lists = {
+    "kem-algs": ("kem", "liboqs"),
+    "sig-algs": ("sig", "liboqs"),
+    "tls-kem-algs": ("kem", "oqs-provider"),
+    "tls-sig-algs": ("sig", "oqs-provider"),
+    "tls-hybr-kem-algs": ("kem", "oqs-provider"),
+    "tls-hybr-sig-algs": ("sig", "oqs-provider"),
+    "tls-speed-kem-algs": ("kem", "oqs-provider"),
+    "tls-speed-sig-algs": ("sig", "oqs-provider"),
+    "classic-tls-kem-algs": ("kem", "classic"),
+    "classic-tls-sig-algs": ("sig", "classic")
+}
+
+# Declare the classic algorithms and ciphersuites used for the classic TLS handshake benchmarking
+classic_tls_algs = {
+    "classic-tls-kem-algs": ["prime256v1", "secp384r1", "secp521r1"],
+    "classic-tls-sig-algs": ["RSA_2048", "RSA_3072", "RSA_4096", "prime256v1", "secp384r1", "secp521r1"]
+}
+tls_ciphersuites = ["TLS_AES_256_GCM_SHA384", "TLS_CHACHA20_POLY1305_SHA256", "TLS_AES_128_GCM_SHA256"]
+
+# Declare the pattern used to separate the classical component from the PQC component of PQC-Hybrid algorithm names. The
+# classical component is either a prefix (p256_mldsa44), a suffix for the composite signatures (mldsa44_p256, mldsa65_pss3072),
+# or combined with the PQC name for the hybrid groups (X25519MLKEM768)
+hybrid_classical = r"rsa[0-9]+|pss[0-9]+|bp[0-9]+|p[0-9]+|x[0-9]+|ed25519|ed448"
+hybrid_pattern = re.compile(
+    rf"^(?P<prefix>{hybrid_classical})_(?P<prefix_pqc>.+)$"
+    rf"|^(?P<suffix_pqc>.+?)_(?P<suffix>{hybrid_classical})$"
+    r"|^(?P<combined>X25519|X448|SecP256r1|SecP384r1|SecP521r1)(?P<combined_pqc>[A-Za-z0-9]+)$"
+)
+
+# Declare the algorithm families, each with the pattern matched against the PQC algorithm name and the NIST security
+# level for each of its parameter sets (lowercase), in the order the patterns are checked. Unknown levels are left empty.
+alg_families = [
+    ("ML-KEM", re.compile(r"^(?:ML-KEM-|mlkem)(?P<param>512|768|1024)$", re.IGNORECASE), {"512": 1, "768": 3, "1024": 5}),
+    ("Kyber", re.compile(r"^Kyber(?P<param>512|768|1024)$", re.IGNORECASE), {"512": 1, "768": 3, "1024": 5}),
+    ("FrodoKEM", re.compile(r"^e?(?:FrodoKEM-|frodo)(?P<param>640|976|1344)-?(?:AES|SHAKE)$", re.IGNORECASE), {"640": 1, "976": 3, "1344": 5}),
+    ("BIKE", re.compile(r"^BIKE-?L(?P<param>[135])$", re.IGNORECASE), {"1": 1, "3": 3, "5": 5}),
+    ("HQC", re.compile(r"^HQC-?(?P<param>128|192|256)$", re.IGNORECASE), {"128": 1, "192": 3, "256": 5}),
+    ("Classic-McEliece", re.compile(r"^Classic-McEliece-(?P<param>\d+)f?$"), {"348864": 1, "460896": 3, "6688128": 5, "6960119": 5, "8192128": 5}),
+    ("NTRU-Prime", re.compile(r"^sntrup(?P<param>\d+)$"), {}),
+    ("ML-DSA", re.compile(r"^(?:ML-DSA-|mldsa)(?P<param>44|65|87)$", re.IGNORECASE), {"44": 2, "65": 3, "87": 5}),
+    ("Dilithium", re.compile(r"^Dilithium(?P<param>[235])$", re.IGNORECASE), {"2": 2, "3": 3, "5": 5}),
+    ("Falcon", re.compile(r"^Falcon-?(?:padded-?)?(?P<param>512|1024)$", re.IGNORECASE), {"512": 1, "1024": 5}),
+    ("SPHINCS+", re.compile(r"^(?:SPHINCS\+-|sphincs)(?:SHA2|SHAKE)-?(?P<param>128|192|256)[fs]-?simple$", re.IGNORECASE), {"128": 1, "192": 3, "256": 5}),
+    ("SLH-DSA", re.compile(r"^SLH[_-]DSA.*?(?P<param>128|192|256)", re.IGNORECASE), {"128": 1, "192": 3, "256": 5}),
+    ("MAYO", re.compile(r"^MAYO-?(?P<param>[1235])$", re.IGNORECASE), {"1": 1, "2": 1, "3": 3, "5": 5}),
+    ("CROSS", re.compile(r"^CROSS-?rsdpg?-?(?P<param>128|192|256)-?(?:balanced|fast|small)$", re.IGNORECASE), {"128": 1, "192": 3, "256": 5}),
+    ("UOV", re.compile(r"^OV[-_](?P<param>Is|Ip|III|V)(?:[-_]pkc(?:[-_]skc)?)?$", re.IGNORECASE), {"is": 1, "ip": 1, "iii": 3, "v": 5}),
+    ("SNOVA", re.compile(r"^SNOVA[-_]?(?P<param>.+)$", re.IGNORECASE), {}),
+    ("RSA", re.compile(r"^RSA_(?P<param>\d+)$"), {}),
+    ("ECC", re.compile(r"^(?P<param>prime256v1|secp384r1|secp521r1)$"), {})
+]
+
+# Declare the loaded registries, keyed by the registry filepath and storing the file modification time with each registry
+loaded_registries = {}
+
+#-----------------------------------------------------------------------------------------------------------
+def get_registry_path(alg_list_dir):
+    """ Helper function for getting the path of the registry file in the supplied algorithm lists directory """
+
+    return os.path.join(alg_list_dir, registry_filename)
+
+#-----------------------------------------------------------------------------------------------------------
+def get_alg_list_dir(root_dir):
+    """ Helper function for getting the algorithm lists directory for the supplied project root directory """
+
+    return os.path.join(root_dir, "test-data", "alg-lists")
+
+#-----------------------------------------------------------------------------------------------------------
+def get_alg_metadata(alg_name):
+    """ Function for creating the metadata for the supplied algorithm name. The classical component is separated
+        from PQC-Hybrid algorithm names, and the family and NIST security level are taken from the first family
+        pattern matching the PQC algorithm name. Any values that can not be determined are left as None. """
+
+    # Separate the classical component from the PQC algorithm name for PQC-Hybrid algorithms
+    hybrid_match = hybrid_pattern.match(alg_name)
+    if hybrid_match is not None:
+        classical_component = hybrid_match.group("prefix") or hybrid_match.group("suffix") or hybrid_match.group("combined")
+        pqc_name = hybrid_match.group("prefix_pqc") or hybrid_match.group("suffix_pqc") or hybrid_match.group("combined_pqc")
+    else:
+        classical_component = None
+        pqc_name = alg_name
+
+    # Get the family and NIST security level from the first matching family pattern
+    family = None
+    nist_level = None
+
+    for family_name, family_pattern, family_levels in alg_families:
+        family_match = family_pattern.match(pqc_name)
+        if family_match is not None:
+            family = family_name
+            nist_level = family_levels.get(family_match.group("param").lower())
+            break
+
+    return {
+        "family": family,
+        "nist_level": nist_level,
+        "hybrid": hybrid_match is not None,
+        "classical_component": classical_component
+    }
+
+#-----------------------------------------------------------------------------------------------------------
+def build_registry(registry_lists):
+    """ Function for building the registry from the supplied algorithm lists, keyed by list name. The metadata for
+        each algorithm is stored under its algorithm type, along with the tools and algorithm lists it appears in """
+
+    # Declare the registry, storing the algorithm lists in the order they were supplied
+    registry = {
+        "lists": {list_name: list(algs) for list_name, algs in registry_lists.items()},
+        "ciphersuites": list(tls_ciphersuites),
+        "algorithms": {"kem": {}, "sig": {}}
+    }
+
+    # Add the metadata for each algorithm, recording every tool and list the algorithm appears in
+    for list_name, algs in registry_lists.items():
+
+        alg_type, tool_name = alg_lists[list_name]
+        type_algs = registry["algorithms"][alg_type]
+
+        for alg in algs:
+
+            if alg not in type_algs:
+                type_algs[alg] = dict(get_alg_metadata(alg), type=alg_type, tools=[], lists=[])
+
+            if tool_name not in type_algs[alg]["tools"]:
+                type_algs[alg]["tools"].append(tool_name)
+
+            type_algs[alg]["lists"].append(list_name)
+
+    return registry
+
+#-----------------------------------------------------------------------------------------------------------
+def read_alg_list_file(filepath):
+    """ Helper function for reading the algorithm names from an algorithm list text file """
+
+    # Read in the algorithm names, skipping any empty lines
+    with open(filepath, "r") as alg_file:
+        return [line.strip() for line in alg_file if line.strip()]
+
+#-----------------------------------------------------------------------------------------------------------
+def write_registry(alg_list_dir):
+    """ Function for writing the registry for the algorithm list text files present in the supplied algorithm lists
+        directory, so that the registry always matches the lists used by the benchmarking scripts. Returns the
+        registry filepath, or None if no algorithm list files are present. """
+
+    # Read in each of the algorithm list files that are present
+    registry_lists = {}
+    for list_name in alg_lists:
+        list_filepath = os.path.join(alg_list_dir, f"{list_name}.txt")
+        if os.path.isfile(list_filepath):
+            registry_lists[list_name] = read_alg_list_file(list_filepath)
+
+    if not registry_lists:
+        return None
+
+    # Build the registry and write it to the algorithm lists directory
+    registry_filepath = get_registry_path(alg_list_dir)
+    with open(registry_filepath, "w") as registry_file:
+        json.dump(build_registry(registry_lists), registry_file, indent=2)
+
+    return registry_filepath
+
+#-----------------------------------------------------------------------------------------------------------
+def load_registry(root_dir):
+    """ Function for loading the registry for the supplied project root directory. The registry is only read from disk
+        the first time it is loaded or if the file has been modified since, with the loaded registry being shared by
+        all callers in the process. Returns None if no registry is present. """
+
+    # Get the registry file modification time, returning None if it is not present
+    registry_filepath = get_registry_path(get_alg_list_dir(root_dir))
+    try:
+        registry_mtime = os.stat(registry_filepath).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    # Return the loaded registry if the file has not changed since it was loaded
+    loaded = loaded_registries.get(registry_filepath)
+    if loaded is not None and loaded[0] == registry_mtime:
+        return loaded[1]
+
+    # Read in the registry and store it for later calls
+    with open(registry_filepath, "r") as registry_file:
+        registry = json.load(registry_file)
+
+    loaded_registries[registry_filepath] = (registry_mtime, registry)
+    return registry
+
+#-----------------------------------------------------------------------------------------------------------
+def get_alg_lists(root_dir, list_names):
+    """ Function for getting the supplied algorithm lists for the project root directory. The lists are taken from
+        the registry if it contains them, otherwise they are read from the algorithm list text files. As the benchmarking
+        scripts only use the text files, any text files present are compared against the registry, with the text files
+        being used and a warning outputted if they differ. Returns the algorithm lists keyed by list name and the source
+        files the lists were loaded from """
+
+    # Set the algorithm list text files and load the registry
+    registry = load_registry(root_dir)
+    alg_list_dir = get_alg_list_dir(root_dir)
+    list_filepaths = [os.path.join(alg_list_dir, f"{list_name}.txt") for list_name in list_names]
+
+    # Use the registry lists if the registry holds all of the requested lists and they match any text files present
+    if registry is not None and all(list_name in registry["lists"] for list_name in list_names):
+
+        changed_lists = [
+            list_name for list_name, filepath in zip(list_names, list_filepaths)
+            if os.path.isfile(filepath) and read_alg_list_file(filepath) != registry["lists"][list_name]
+        ]
+
+        if not changed_lists:
+            return {list_name: list(registry["lists"][list_name]) for list_name in list_names}, [get_registry_path(alg_list_dir)]
+
+        print(f"[WARNING] - The algorithm list files {changed_lists} differ from the {registry_filename} registry, using the list files")
+        print("[WARNING] - Please rerun the get_algorithms.py utility script to rebuild the registry\n")
+
+    # Otherwise read in the algorithm list text files
+    return {list_name: read_alg_list_file(filepath) for list_name, filepath in zip(list_names, list_filepaths)}, list_filepaths
+
+#-----------------------------------------------------------------------------------------------------------
+def get_classic_tls_algs(root_dir, list_name="classic-tls-sig-algs"):
+    """ Helper function for getting the classic TLS algorithms, taken from the registry if present,
+        otherwise using the classic algorithms declared in this module """
+
+    # Return the registry list if the registry holds it
+    registry = load_registry(root_dir)
+    if registry is not None and list_name in registry["lists"]:
+        return list(registry["lists"][list_name])
+
+    return list(classic_tls_algs[list_name])
@@ -0,0 +1,124 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Columnar output module for the PQC benchmarking result parsers. Provides the functions for writing the parsed
+results into partitioned Parquet datasets alongside the CSV result tree, with one dataset per result family
+(Liboqs speed, Liboqs memory, TLS handshake and TLS speed) partitioned by machine and run. Each row keeps the
+up-result file it was parsed from so that values can be traced back to the raw output. The Parquet output is
+optional and requires the pyarrow package to be installed. This module is used internally by the Liboqs and
+OQS-Provider parsing scripts and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import shutil
+import importlib.util
+import pandas as pd
+
+# Declare the dataset directory names for each of the result families
+result_families = {
+    "liboqs_speed": "liboqs-speed",
+    "liboqs_mem": "liboqs-memory",
+    "tls_handshake": "tls-handshake",
+    "tls_speed": "tls-speed"
+}
+
+#-----------------------------------------------------------------------------------------------------------
+def pyarrow_available():
+    """ Helper function for checking if the pyarrow package needed for the Parquet output is installed """
+
+    # Check if the pyarrow package can be found without importing it
+    return importlib.util.find_spec("pyarrow") is not None
+
+#-----------------------------------------------------------------------------------------------------------
+def get_dataset_dir(root_dir, family):
+    """ Helper function for getting the Parquet dataset directory for the supplied result family """
+
+    return os.path.join(root_dir, "test-data", "results", "parquet", result_families[family])
+
+#-----------------------------------------------------------------------------------------------------------
+def get_partition_filepath(root_dir, family, machine_num, run_num):
+    """ Helper function for getting the Parquet file path for the supplied machine and run partition """
+
+    # Set the partition directories using the key=value naming so the partition columns are restored on read
+    partition_dir = os.path.join(get_dataset_dir(root_dir, family), f"machine={machine_num}", f"run={run_num}")
+    return os.path.join(partition_dir, "part-0.parquet")
+
+#-----------------------------------------------------------------------------------------------------------
+def partition_exists(root_dir, family, machine_num, run_num):
+    """ Helper function for checking if the Parquet file has been written for the supplied machine and run """
+
+    return os.path.isfile(get_partition_filepath(root_dir, family, machine_num, run_num))
+
+#-----------------------------------------------------------------------------------------------------------
+def set_numeric_columns(result_df, columns, dtype="float64"):
+    """ Helper function for converting the supplied metric columns to a fixed numeric dtype, so that every
+        partition in a dataset has the same schema. Integer columns should use the nullable Int64 dtype so 
+        that missing metrics are kept as nulls rather than converting the column to floats """
+
+    # Convert each of the columns, setting any values that can not be converted to null
+    for column in columns:
+        if column in result_df.columns:
+            result_df[column] = pd.to_numeric(result_df[column], errors="coerce").astype(dtype)
+
+    return result_df
+
+#-----------------------------------------------------------------------------------------------------------
+def set_string_columns(result_df, columns):
+    """ Helper function for converting the supplied label columns to the pandas string dtype """
+
+    # Convert each of the columns that are present in the dataframe
+    for column in columns:
+        if column in result_df.columns:
+            result_df[column] = result_df[column].astype("string")
+
+    return result_df
+
+#-----------------------------------------------------------------------------------------------------------
+def add_provenance(result_df, root_dir, source_filepaths):
+    """ Helper function for adding the source up-result file for each row, stored relative to the project root """
+
+    # Add the relative source file path as the provenance column
+    result_df["Source File"] = [os.path.relpath(filepath, root_dir) for filepath in source_filepaths]
+    result_df["Source File"] = result_df["Source File"].astype("string")
+
+    return result_df
+
+#-----------------------------------------------------------------------------------------------------------
+def write_partition(root_dir, family, machine_num, run_num, result_df):
+    """ Function for writing the supplied result dataframe as the Parquet file for the machine and run
+        partition of the result family. The file is written to a temporary path first and then moved
+        into place, so an interrupted write does not leave a partial file in the dataset """
+
+    # Move the provenance column to the end of the dataframe
+    result_df = result_df[[column for column in result_df.columns if column != "Source File"] + ["Source File"]]
+
+    # Create the partition directory and write the dataframe to the temporary file
+    partition_filepath = get_partition_filepath(root_dir, family, machine_num, run_num)
+    os.makedirs(os.path.dirname(partition_filepath), exist_ok=True)
+
+    temp_filepath = partition_filepath + ".tmp"
+    result_df.to_parquet(temp_filepath, engine="pyarrow", index=False)
+    os.replace(temp_filepath, partition_filepath)
+
+#-----------------------------------------------------------------------------------------------------------
+def remove_stale_partitions(root_dir, family, machine_num, num_runs):
+    """ Function for removing any run partitions for the machine that are above the current number of runs """
+
+    # Return if there is no partition directory for the machine
+    machine_dir = os.path.join(get_dataset_dir(root_dir, family), f"machine={machine_num}")
+    if not os.path.isdir(machine_dir):
+        return
+
+    # Remove the run partitions that are no longer present in the parsed results
+    for dir_name in os.listdir(machine_dir):
+        if dir_name.startswith("run=") and dir_name[4:].isdigit() and int(dir_name[4:]) > num_runs:
+            shutil.rmtree(os.path.join(machine_dir, dir_name))
+
+#-----------------------------------------------------------------------------------------------------------
+def load_result_family(root_dir, family):
+    """ Function for loading the full Parquet dataset for the supplied result family in a single read.
+        The machine and run partition values are returned as columns in the dataframe """
+
+    return pd.read_parquet(get_dataset_dir(root_dir, family), engine="pyarrow")
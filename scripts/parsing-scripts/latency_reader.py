@@ -0,0 +1,133 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+TLS handshake latency result reader for the OQS-Provider TLS handshake benchmarking results. Reads the per-handshake
+latencies recorded by the tls_latency_driver.py script for the full and resumed handshakes of each algorithm combination,
+and summarises them into their mean, minimum, maximum, and 50th, 95th, and 99th percentile latencies. The latencies are
+also counted into a histogram with fixed log-spaced bins, so that the histograms for each run can be added together when
+the results are averaged. A thread pool can be used to read a full set of latency result files at once, with missing and
+malformed files being returned separately so they can be reported. This module is used internally by the OQS-Provider
+parsing script and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Declare the latency samples record, holding the full and resumed handshake latencies in microseconds
+LatencySamples = namedtuple("LatencySamples", ["full", "resumed"])
+
+# Declare the summary metric columns and the percentiles they are calculated from
+latency_summary_headers = ["Handshakes", "Mean (us)", "Min (us)", "P50 (us)", "P95 (us)", "P99 (us)", "Max (us)"]
+latency_percentiles = [50, 95, 99]
+
+# Declare the histogram columns and the bin edges, which cover 1us to 100s with 10 log-spaced bins for each decade
+latency_histogram_headers = ["Bin Lower (us)", "Bin Upper (us)", "Handshakes"]
+latency_bin_edges = np.logspace(0, 8, 81)
+
+#-----------------------------------------------------------------------------------------------------------
+class LatencyFormatError(ValueError):
+    """ Exception raised when a latency result file does not contain the expected handshake latencies """
+
+#-----------------------------------------------------------------------------------------------------------
+def read_latency_file(filepath):
+    """ Function for reading the full and resumed handshake latencies from the supplied latency result file.
+        Comment lines starting with # are skipped, and each remaining line holds the handshake type and its latency
+        in microseconds. A LatencySamples record is returned, and a LatencyFormatError is raised if the file contains
+        malformed lines or no full handshake latencies. Any errors opening the file are raised to the caller. """
+
+    # Declare the latency lists for each handshake type
+    latencies = {"full": [], "resumed": []}
+
+    # Read in the latency for each handshake line of the file
+    with open(filepath, "r") as latency_file:
+        for line_num, line in enumerate(latency_file, start=1):
+
+            # Skip the comment and empty lines
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            # Split the line into the handshake type and its latency
+            fields = line.split()
+            if len(fields) != 2 or fields[0] not in latencies:
+                raise LatencyFormatError(f"malformed latency line {line_num}")
+
+            try:
+                latencies[fields[0]].append(float(fields[1]))
+            except ValueError:
+                raise LatencyFormatError(f"malformed latency value on line {line_num}")
+
+    # Ensure that the full handshake latencies are present in the file
+    if not latencies["full"]:
+        raise LatencyFormatError("no full handshake latencies present")
+
+    return LatencySamples(np.array(latencies["full"]), np.array(latencies["resumed"]))
+
+#-----------------------------------------------------------------------------------------------------------
+def read_latency_file_safe(filepath):
+    """ Helper function for reading the handshake latencies for use in the thread pool, returning the
+        filepath, latency samples, and any error raised while reading the file. """
+
+    # Read the handshake latencies and return the error rather than raising it
+    try:
+        return filepath, read_latency_file(filepath), None
+    except (OSError, LatencyFormatError) as e:
+        return filepath, None, e
+
+#-----------------------------------------------------------------------------------------------------------
+def scan_latency_files(filepaths, max_workers=None):
+    """ Function for reading the handshake latencies from a list of latency result files using a thread pool.
+        Returns a dictionary of the latency samples keyed by filepath, and a dictionary of the errors
+        for any files that are missing, could not be read, or are malformed. """
+
+    # Declare the latency samples and errors dictionaries
+    samples = {}
+    errors = {}
+
+    # Read the files in the thread pool and sort the results into the samples and errors dictionaries
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for filepath, latency_samples, error in executor.map(read_latency_file_safe, filepaths):
+            if error is None:
+                samples[filepath] = latency_samples
+            else:
+                errors[filepath] = error
+
+    return samples, errors
+
+#-----------------------------------------------------------------------------------------------------------
+def get_summary_cells(latency_samples, reused):
+    """ Helper function for getting the full or resumed handshake latency summary values for a latency result row.
+        Empty values are returned if no latencies are available for the file or handshake type. """
+
+    # Return the empty row values if there are no latencies for the handshake type
+    if latency_samples is None or len(latency_samples[int(reused)]) == 0:
+        return [""] * len(latency_summary_headers)
+
+    # Calculate the summary values, with the percentiles using the default linear interpolation between the closest ranks
+    latencies = latency_samples.resumed if reused else latency_samples.full
+    p50, p95, p99 = np.percentile(latencies, latency_percentiles)
+
+    return [len(latencies), float(latencies.mean()), float(latencies.min()), float(p50), float(p95), float(p99), float(latencies.max())]
+
+#-----------------------------------------------------------------------------------------------------------
+def get_histogram_rows(latency_samples, reused):
+    """ Helper function for getting the histogram rows for the full or resumed handshake latencies, with a row for each
+        non-empty bin containing the bin edges and the number of handshakes. Latencies outside of the bin range are
+        counted in the first or last bin. """
+
+    # Return no rows if there are no latencies for the handshake type
+    if latency_samples is None or len(latency_samples[int(reused)]) == 0:
+        return []
+
+    # Count the latencies into the histogram bins
+    latencies = latency_samples.resumed if reused else latency_samples.full
+    bin_counts, _ = np.histogram(np.clip(latencies, latency_bin_edges[0], latency_bin_edges[-1]), bins=latency_bin_edges)
+
+    # Create the rows for the non-empty bins
+    return [
+        [float(latency_bin_edges[bin_index]), float(latency_bin_edges[bin_index + 1]), int(bin_counts[bin_index])]
+        for bin_index in np.flatnonzero(bin_counts)
+    ]
@@ -11,26 +11,37 @@ This script is called by the central parse_results.py controller and supports mu
 
 #-----------------------------------------------------------------------------------------------------------
 import pandas as pd
-import re
 import os
 import sys
+import io
 import shutil
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from results_averager import LiboqsResultAverager
-
-# Declare the global variables
+from massif_reader import scan_massif_files
+from record_batch import RecordBatchBuilder
+from parse_manifest import ParseManifest
+from parse_profiler import profile_stage
+from up_results_index import UpResultsIndex, check_runs_complete, scan_indexed_files
+import columnar_output
+import parse_profiler
+import alg_registry
+import machine_state
+
+# Declare the global algorithm operations variable
 alg_operations = {'kem_operations': ["keygen", "encaps", "decaps"], 'sig_operations': ["keypair", "sign", "verify"]}
-kem_algs = []
-sig_algs = []
-dir_paths = {}
-num_runs = 0
 
 #-----------------------------------------------------------------------------------------------------------
 def setup_parse_env(root_dir):
     """ Function for setting up the environment for the Liboqs parsing script. 
         The function will set the various directory paths, read in the algorithm 
-        lists and set the root directories. """
+        lists and set the root directories, returning them to the caller. """
 
-    global kem_algs, sig_algs, dir_paths
+    # Declare the base directory paths dictionary and the algorithm lists
+    dir_paths = {}
+    kem_algs = []
+    sig_algs = []
 
     # Ensure the root_dir path is correct before continuing
     if not os.path.isfile(os.path.join(root_dir, ".pqc_eval_dir_marker.tmp")):
@@ -42,25 +53,36 @@ def setup_parse_env(root_dir):
     dir_paths['results_dir'] = os.path.join(root_dir, "test-data", "results", "liboqs")
     dir_paths['up_results'] = os.path.join(root_dir, "test-data", "up-results", "liboqs")
 
-    # Set the alg lists text filenames
-    kem_algs_file = os.path.join(root_dir, "test-data", "alg-lists", "kem-algs.txt")
-    sig_algs_file = os.path.join(root_dir, "test-data", "alg-lists", "sig-algs.txt")
+    # Load the KEM and sig algorithm lists from the algorithm registry (or the alg-list files if no registry is present)
+    alg_lists, dir_paths['alg_list_files'] = alg_registry.get_alg_lists(root_dir, ["kem-algs", "sig-algs"])
+    kem_algs.extend(alg_lists["kem-algs"])
+    sig_algs.extend(alg_lists["sig-algs"])
+
+    return dir_paths, kem_algs, sig_algs
+
+#-----------------------------------------------------------------------------------------------------------
+def set_machine_paths(base_paths, machine_num):
+    """ Helper function for creating the directory paths dictionary for the current machine. A new 
+        dictionary is created for each machine so that machines can be parsed independently of each other. """
+
+    # Copy the base directory paths and set the machine's un-parsed and parsed results directory paths
+    dir_paths = dict(base_paths)
+    dir_paths['mach_results_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}")
+    dir_paths['mach_up_results_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}")
+    dir_paths['up_mem_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}", "mem-results")
+    dir_paths['type_speed_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}", "speed-results")
+    dir_paths['type_mem_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}", "mem-results")
+    dir_paths['raw_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}", "raw-speed-results")
 
-    # Read in the algorithms from the KEM alg-list file
-    with open(kem_algs_file, "r") as kem_file:
-        for line in kem_file:
-            kem_algs.append(line.strip())
-    
-    # Read in the algorithms from the sig alg-list file
-    with open(sig_algs_file, "r") as alg_file:
-        for line in alg_file:
-            sig_algs.append(line.strip())
+    return dir_paths
 
 #-----------------------------------------------------------------------------------------------------------
-def handle_results_dir_creation(machine_num):
+def handle_results_dir_creation(machine_num, dir_paths, results_policy=None):
     """ Function for handling the presence of older parsed results, 
         ensuring that the user is aware of the old results and can choose 
-        how to handle them before the parsing continues. """
+        how to handle them before the parsing continues. If a results policy
+        (overwrite, skip, update, or version) is passed, it is applied without prompting the user.
+        Returns False if the machine should be skipped, otherwise True. """
 
     # Check if there are any old parsed results for current Machine-ID and handle any clashes
     if os.path.exists(dir_paths["type_mem_dir"]) or os.path.exists(dir_paths["type_speed_dir"]):
@@ -68,6 +90,43 @@ def handle_results_dir_creation(machine_num):
         # Output the warning message to the terminal
         print(f"There are already parsed Liboqs testing results present for Machine-ID ({machine_num})\n")
 
+        # Handle the old results using the results policy if one has been passed
+        if results_policy == "skip":
+
+            # Leave the old results in place and skip parsing the current Machine-ID
+            print(f"Skipping the parsing of Liboqs results for Machine-ID ({machine_num})")
+            return False
+
+        elif results_policy == "overwrite":
+
+            # Replace all old results and create a new empty directory to store the parsed results
+            print(f"Removing old results directory for Machine-ID ({machine_num}) before continuing...")
+            shutil.rmtree(dir_paths["mach_results_dir"])
+            os.makedirs(dir_paths["type_speed_dir"])
+            os.makedirs(dir_paths["type_mem_dir"])
+            return True
+
+        elif results_policy == "update":
+
+            # Keep the old results so only new or changed runs are parsed using the machine's parse manifest
+            print(f"Updating old results for Machine-ID ({machine_num}), only new or changed runs will be parsed")
+            os.makedirs(dir_paths["type_speed_dir"], exist_ok=True)
+            os.makedirs(dir_paths["type_mem_dir"], exist_ok=True)
+            return True
+
+        elif results_policy == "version":
+
+            # Move the old results to the next available versioned directory and create a new empty directory
+            version_num = 1
+            while os.path.exists(f"{dir_paths['mach_results_dir']}-v{version_num}"):
+                version_num += 1
+
+            print(f"Moving old results for Machine-ID ({machine_num}) to machine-{machine_num}-v{version_num} before continuing...")
+            os.rename(dir_paths["mach_results_dir"], f"{dir_paths['mach_results_dir']}-v{version_num}")
+            os.makedirs(dir_paths["type_speed_dir"])
+            os.makedirs(dir_paths["type_mem_dir"])
+            return True
+
         # Get the decision from user on how to handle old results before parsing continues
         while True:
 
@@ -76,13 +135,14 @@ def handle_results_dir_creation(machine_num):
             print("Option 1 - Replace old parsed results with new ones")
             print("Option 2 - Exit parsing programme to move old results and rerun after (if you choose this option, please move the entire folder not just its contents)")
             print("Option 3 - Make parsing script programme wait until you have move files before continuing")
-            user_choice = input("Enter option (1/2/3): ")
+            print("Option 4 - Update old parsed results, only parsing new or changed runs")
+            user_choice = input("Enter option (1/2/3/4): ")
 
             if user_choice == "1":
 
                 # Replace all old results and create a new empty directory to store the parsed results
                 print(f"Removing old results directory for Machine-ID ({machine_num}) before continuing...")
-                shutil.rmtree(dir_paths["results_dir"], f"machine-{machine_num}")
+                shutil.rmtree(dir_paths["mach_results_dir"])
                 print("Old results removed")
 
                 os.makedirs(dir_paths["type_speed_dir"])
@@ -114,10 +174,18 @@ def handle_results_dir_creation(machine_num):
                 
                 break
 
+            elif user_choice == "4":
+
+                # Keep the old results so only new or changed runs are parsed
+                print(f"Updating old results for Machine-ID ({machine_num}), only new or changed runs will be parsed")
+                os.makedirs(dir_paths["type_speed_dir"], exist_ok=True)
+                os.makedirs(dir_paths["type_mem_dir"], exist_ok=True)
+                break
+
             else:
 
                 # Output warning message if the user input is not valid
-                print("Incorrect value, please select (1/2/3)")
+                print("Incorrect value, please select (1/2/3/4)")
 
     else:
 
@@ -125,285 +193,458 @@ def handle_results_dir_creation(machine_num):
         os.makedirs(dir_paths["type_speed_dir"])
         os.makedirs(dir_paths["type_mem_dir"])
 
-#-----------------------------------------------------------------------------------------------------------
-def get_peak(mem_file, peak_metrics):
-    """ Helper function for taking the passed massif.out file and getting 
-        the peak memory metrics, returning the values to continue
-        processing. The function comes from the run_mem.py script 
-        found in OQS Profiling Project
-        https://github.com/open-quantum-safe/profiling """
-
-    # Get the max memory metric for current algorithm cryptographic operation
-    with open(mem_file, "r") as lines:
-        peak = -1
-        for line in lines:
-            if line.startswith(" Detailed snapshots: ["):
-                match=re.search(r"\d+ \(peak\).*", line)
-                if match:
-                    peak = int(match.group(0).split()[0])      
-            if (peak > 0):
-                
-                if line.startswith('{: >3d}'.format(peak)): # remove "," and print all numbers except first:
-                    nl = line.replace(",", "")
-                    peak_metrics = nl.split()
-                    del peak_metrics[0]
-                    return peak_metrics
+    return True
 
 #-----------------------------------------------------------------------------------------------------------
-def pre_speed_processing():
-    """ Function for preparing the speed up-result data to 
-        by removing system information in the file, allowing for
-        further processing in the script. """
-    
-    # Setup the destination directory in current machines up-results for pre-processed speed files
-    if not os.path.exists(dir_paths['up_speed_dir']):
-        os.makedirs(dir_paths['up_speed_dir'])
-    else:
-        shutil.rmtree(dir_paths["up_speed_dir"])
-        os.makedirs(dir_paths['up_speed_dir'])
+def read_speed_file(speed_filepath):
+    """ Function for reading a raw Liboqs speed_kem/speed_sig output file in a single pass and returning
+        the result rows in a row batch. The system information before the results table and the footer line
+        are skipped, and the algorithm for each operation row is taken from the section header row above it. """
 
-    # Setting the initial prefix variables for KEM and sig files
-    kem_prefix = "test-kem-speed-"
-    sig_prefix = "test-sig-speed-"
+    # Open the raw speed file and read through it line by line
+    with open(speed_filepath, "r") as speed_file:
 
-    # Pre-format the KEM and sig csv speed files to remove system information from file
-    for run_count in range(1, num_runs+1):
+        # Skip the system information until the results table header is found
+        header_line = next((line for line in speed_file if line.startswith("Operation")), None)
 
-        """ Pre-format the kem csv files """
-        # Set the filename based on current run
-        kem_pre_filename = kem_prefix + str(run_count) + ".csv"
-        kem_filename = os.path.join(dir_paths["raw_speed_dir"], kem_pre_filename)
+        if header_line is None:
+            raise ValueError(f"No results table header found in speed file {speed_filepath}")
 
-        # Read in the results file
-        with open(kem_filename, 'r') as pre_file:
-            rows = pre_file.readlines()
+        # Create the row batch using the stripped table headers and skip the table separator line
+        speed_batch = RecordBatchBuilder(["Algorithm"] + [header.strip() for header in header_line.split("|")])
+        next(speed_file, None)
+        current_alg = None
 
-        # Get the header start index and format the file
-        header_line_index = next(row_index for row_index, line in enumerate(rows) if line.startswith('Operation'))
-        kem_pre_speed_df = pd.read_csv(kem_filename, skiprows=range(header_line_index), skipfooter=1, delimiter='|', engine='python')
-        kem_pre_speed_df = kem_pre_speed_df.iloc[1:]
+        # Loop through the table rows until the footer line is reached
+        for line in speed_file:
 
-        # Write out the pre_formatted file to up-results speed dir
-        speed_dest_dir = os.path.join(dir_paths["up_speed_dir"], kem_pre_filename)
-        kem_pre_speed_df.to_csv(speed_dest_dir, index=False, sep="|")
+            if "|" not in line:
+                break
+
+            row = [cell.strip() for cell in line.split("|")]
 
-        """ Pre-format the Digital Signature csv files """
-        # Set the filename based on current run
-        sig_pre_filename = sig_prefix + str(run_count) + ".csv"
-        sig_filename = os.path.join(dir_paths["raw_speed_dir"], sig_pre_filename)
+            # Set the current algorithm if the row is an algorithm section header with no metrics
+            if not any(row[1:]):
+                current_alg = row[0]
+                continue
 
-        # Read in the file
-        with open(sig_filename, 'r') as pre_file:
-            rows = pre_file.readlines()
+            # Ensure the operation row belongs to an algorithm section before adding it to the batch
+            if current_alg is None:
+                raise ValueError(f"Operation row found before any algorithm header in speed file {speed_filepath}")
 
-        # Get the header start index and format the file
-        header_line_index = next(i for i, line in enumerate(rows) if line.startswith('Operation'))
-        sig_pre_speed_df = pd.read_csv(sig_filename, skiprows=range(header_line_index), skipfooter=1, delimiter='|', engine='python')
-        sig_pre_speed_df = sig_pre_speed_df.iloc[1:]
+            speed_batch.append([current_alg] + row)
 
-        # Write out the pre-formatted file to up-results speed dir
-        speed_dest_dir = os.path.join(dir_paths["up_speed_dir"], sig_pre_filename)
-        sig_pre_speed_df.to_csv(speed_dest_dir, index=False, sep="|")
+    return speed_batch
 
 #-----------------------------------------------------------------------------------------------------------
-def speed_processing():
-    """ Function for processing the Liboqs CPU speed up-results and 
-        exporting the data into a clean CSV format """
-
-    # Set the filename prefix variables
-    kem_prefix = "test-kem-speed-"
-    sig_prefix = "test-sig-speed-"
-
-    # Create the algorithm lists to insert into new header column
-    new_col_kem = [alg for alg in kem_algs for _ in range(3)]
-    new_col_sig = [alg for alg in sig_algs for _ in range(3)]
-    
-    # Read the original csv files and format them
-    for file_count in range(1, num_runs+1):
-
-        """ Format the KEM Files """
-        # Load the KEM file into dataframe
-        filename_kem_pre = kem_prefix + str(file_count) + ".csv"
-        filename_kem_pre = os.path.join(dir_paths['up_speed_dir'], filename_kem_pre)
-        temp_df = pd.read_csv(filename_kem_pre, delimiter="|", index_col=False)
-
-        # Strip the trailing spaces and remove the algorithms from Operation column
-        temp_df.columns = [col.strip() for col in temp_df.columns]
-        temp_df = temp_df.loc[~temp_df['Operation'].str.strip().isin(kem_algs)]
-        temp_df = temp_df.apply(lambda col: col.str.strip() if col.dtype == 'object' else col)
-
-        # Insert the new algorithm column and output the formatted csv
-        temp_df.insert(0, "Algorithm", new_col_kem)
-        filename_kem = kem_prefix + str(file_count) + ".csv"
-        filename_kem = os.path.join(dir_paths['type_speed_dir'], filename_kem)
-        temp_df.to_csv(filename_kem, index=False)
-        
-        """ Formatting the Digital Signature Files """
-        # Load the kem file into dataframe and strip the trailing spaces in columns headers
-        filename_sig_pre = sig_prefix + str(file_count) + ".csv"
-        filename_sig_pre = os.path.join(dir_paths['up_speed_dir'], filename_sig_pre)
-        temp_df = pd.read_csv(filename_sig_pre, delimiter="|", index_col=False)
-
-        # Strip the trailing spaces and remove the algorithms from the Operation column
-        temp_df.columns = [col.strip() for col in temp_df.columns]
-        temp_df = temp_df.loc[~temp_df['Operation'].str.strip().isin(sig_algs)]
-        temp_df = temp_df.apply(lambda col: col.str.strip() if col.dtype == 'object' else col)
-
-        # Insert the new algorithm column and output the formatted csv
-        temp_df.insert(0, 'Algorithm', new_col_sig)
-        filename_sig = sig_prefix + str(file_count) + ".csv"
-        filename_sig = os.path.join(dir_paths['type_speed_dir'], filename_sig)
-        temp_df.to_csv(filename_sig, index=False)
+def speed_processing(dir_paths, runs):
+    """ Function for processing the Liboqs CPU speed up-results for the supplied runs
+        and exporting the data into a clean CSV format. The raw speed files are parsed 
+        directly, without creating pre-formatted copies in the up-results directory """
+
+    # Loop through the runs and parse the KEM and digital signature speed files
+    for run_count in runs:
+        for speed_prefix in ["test-kem-speed-", "test-sig-speed-"]:
+
+            # Parse the raw speed file for the run into its result rows
+            speed_filename = speed_prefix + str(run_count) + ".csv"
+            speed_batch = read_speed_file(os.path.join(dir_paths["raw_speed_dir"], speed_filename))
+
+            # Output the formatted csv file for the run
+            speed_batch.to_dataframe().to_csv(os.path.join(dir_paths["type_speed_dir"], speed_filename), index=False)
 
 #-----------------------------------------------------------------------------------------------------------
-def memory_processing():
-    """ Function for taking in the memory up-results, processing,
-        and outputting the results into a CSV format """
+def memory_processing(dir_paths, runs, kem_algs, sig_algs, up_index=None):
+    """ Function for taking in the memory up-results for the supplied runs, 
+        processing, and outputting the results into a CSV format. The peak metrics
+        for all runs are read up-front using the massif reader thread pool, with only
+        the files present in the up-results index being read if an index is supplied """
 
     # Set the un-parsed memory results directory variables
     kem_up_dir = os.path.join(dir_paths["up_mem_dir"], "kem-mem-metrics")
     sig_up_dir = os.path.join(dir_paths["up_mem_dir"], "sig-mem-metrics")
 
-    # Declare the list variables used in memory processing
-    new_row = []
-    peak_metrics = []
-
-    # Define the header column names for the dataframe
+    # Define the header column names for the dataframe and the empty metrics used when no peak is present
     fieldnames = ["Algorithm", "Operation", "intits", "maxBytes", "maxHeap", "extHeap", "maxStack"]
-    
-    # Loop through the number test runs specified
-    for run_count in range(1, num_runs+1):
+    empty_metrics = [""] * (len(fieldnames) - 2)
+
+    # Build the list of memory up-result files for all runs and read their peak metrics
+    kem_up_filepaths = [
+        os.path.join(kem_up_dir, f"{kem_alg}-{operation}-{run_count}.txt")
+        for run_count in runs for kem_alg in kem_algs for operation in range(0,3,1)
+    ]
+    sig_up_filepaths = [
+        os.path.join(sig_up_dir, f"{sig_alg}-{operation}-{run_count}.txt")
+        for run_count in runs for sig_alg in sig_algs for operation in range(0,3,1)
+    ]
+    peaks, errors = scan_indexed_files(scan_massif_files, kem_up_filepaths + sig_up_filepaths, up_index)
+
+    # Loop through the test runs specified
+    for run_count in runs:
 
-        # Create the dataframe to store memory metrics for the current run
-        mem_results_df = pd.DataFrame(columns=fieldnames)
+        # Create the row batch to store memory metrics for the current run
+        mem_results_batch = RecordBatchBuilder(fieldnames)
 
         # Loop through the KEM algorithms
         for kem_alg in kem_algs:
 
-            # Loop through the cryptographic operations and add to the temp dataframe 
+            # Loop through the cryptographic operations and add to the row batch 
             for operation in range(0,3,1):
 
-                # Parse the metrics and add the results to dataframe row
+                # Get the peak metrics for the current algorithm/operation file
                 kem_up_filename = kem_alg + "-" + str(operation) + "-" + str(run_count) + ".txt"
                 kem_up_filepath = os.path.join(kem_up_dir, kem_up_filename)
 
-                try:
-
-                    # Create peak memory metrics list for current KEM algorithm and setup the new row
-                    peak_metrics = get_peak(kem_up_filepath, peak_metrics)
-                    new_row.extend([kem_alg, alg_operations['kem_operations'][operation]])
-
-                    # Assign empty values for algorithm/operation row if no memory metrics were gathered
-                    if peak_metrics is None:
-                        peak_metrics = []
-                        for _ in range(1, (len(fieldnames) - 2)):
-                            peak_metrics.append("")
-                    
-                    # Fill in the row with algorithm/operation memory metrics before appending to dataframe
-                    new_row.extend(peak_metrics)
-                    mem_results_df.loc[len(mem_results_df)] = new_row
-
-                    # Clear the metric and row lists
-                    peak_metrics.clear()
-                    new_row.clear()
-                
-                except Exception as e:
+                if kem_up_filepath in errors:
                     print(f"\nKEM algorithm memory parsing error, run - {run_count}")
-                    print(f"error - {e}")
+                    print(f"error - {errors[kem_up_filepath]}")
                     print(f"Filename {kem_up_filename}\n")
-                    
+                    continue
+
+                # Assign empty values for algorithm/operation row if no memory metrics were gathered
+                peak = peaks[kem_up_filepath]
+                peak_metrics = list(peak) if peak is not None else empty_metrics
+
+                # Fill in the row with algorithm/operation memory metrics before appending to the batch
+                mem_results_batch.append([kem_alg, alg_operations['kem_operations'][operation]] + peak_metrics)
+
         # Output the KEM csv file for this run
         kem_filename = "kem-mem-metrics-" + str(run_count) + ".csv"
         kem_filepath = os.path.join(dir_paths["type_mem_dir"], kem_filename)
-        mem_results_df.to_csv(kem_filepath, index=False)
+        mem_results_batch.to_dataframe().to_csv(kem_filepath, index=False)
 
         # Loop through the digital signature algorithms
         for sig_alg in sig_algs:
 
-            # Loop through the cryptographic operations and add to the temp dataframe 
+            # Loop through the cryptographic operations and add to the row batch 
             for operation in range(0,3,1):
 
-                # Parse the metrics and add the results to dataframe row
+                # Get the peak metrics for the current algorithm/operation file
                 sig_up_filename = sig_alg + "-" + str(operation) + "-" + str(run_count) + ".txt"
                 sig_up_filepath = os.path.join(sig_up_dir, sig_up_filename)
 
-                try:
-
-                    # Create peak memory metrics list for current sig algorithm and setup the new row
-                    peak_metrics = get_peak(sig_up_filepath, peak_metrics)
-                    new_row.extend((sig_alg, alg_operations['sig_operations'][operation]))
-
-                    # Assign empty values for algorithm/operation row if no memory metrics were gathered
-                    if peak_metrics is None:
-                        peak_metrics = []
-                        for _ in range(0, (len(fieldnames) - 2)):
-                            peak_metrics.append("")
-                        
-                    # Fill in the row with algorithm/operation memory metrics before appending to dataframe
-                    new_row.extend(peak_metrics)
-                    mem_results_df.loc[len(mem_results_df)] = new_row
-
-                    # Clear the metric and row lists
-                    peak_metrics.clear()
-                    new_row.clear()
-                
-                except Exception as e:
+                if sig_up_filepath in errors:
                     print(f"\nsig alg error, run - {run_count}")
-                    print(f"error - {e}")
+                    print(f"error - {errors[sig_up_filepath]}")
                     print(f"Filename {sig_up_filename}\n")
+                    continue
+
+                # Assign empty values for algorithm/operation row if no memory metrics were gathered
+                peak = peaks[sig_up_filepath]
+                peak_metrics = list(peak) if peak is not None else empty_metrics
+
+                # Fill in the row with algorithm/operation memory metrics before appending to the batch
+                mem_results_batch.append([sig_alg, alg_operations['sig_operations'][operation]] + peak_metrics)
 
         # Output the digital signature csv file for this run
         sig_filename = "sig-mem-metrics-" + str(run_count) + ".csv"
         sig_filepath = os.path.join(dir_paths["type_mem_dir"], sig_filename)
-        mem_results_df.to_csv(sig_filepath, index=False)
+        mem_results_batch.to_dataframe().to_csv(sig_filepath, index=False)
 
 #-----------------------------------------------------------------------------------------------------------
-def process_tests(num_machines):
-    """ Function for parsing the results for a single or multiple machines 
-        and stores them as csv files. Once up-results are processed
-        averages are calculated for the results """
-    
-    global dir_paths
-
-    # Create an instance of the Liboqs average generator class before processing results
-    liboqs_avg = LiboqsResultAverager(dir_paths, kem_algs, sig_algs, num_runs, alg_operations)
-
-    # Process the results for the machine/s
-    for machine_num in range(1, num_machines+1):
-        
-        # Set the unparsed-directory paths in the central paths dictionary
-        dir_paths['up_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}", "speed-results")
-        dir_paths['up_mem_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}", "mem-results")
-        dir_paths['type_speed_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}", "speed-results")
-        dir_paths['type_mem_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}", "mem-results")
-        dir_paths['raw_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}", "raw-speed-results")
-
-        # Create the required directories and handling any clashes with previously parsed results
-        handle_results_dir_creation(machine_num)
-
-        # Parse the up-results for Liboqs testing
-        pre_speed_processing()
-        speed_processing()
-        memory_processing()
-
-        # Call the average generation methods for memory and CPU performance results
+def get_run_files(dir_paths, run_num, kem_algs, sig_algs):
+    """ Helper function for getting the un-parsed input files and parsed output files
+        for the supplied run, which are tracked in the machine's parse manifest """
+
+    # Set the raw speed and memory up-result files used for the run
+    input_files = [
+        os.path.join(dir_paths["raw_speed_dir"], f"test-kem-speed-{run_num}.csv"),
+        os.path.join(dir_paths["raw_speed_dir"], f"test-sig-speed-{run_num}.csv")
+    ]
+    input_files.extend(
+        os.path.join(dir_paths["up_mem_dir"], "kem-mem-metrics", f"{kem_alg}-{operation}-{run_num}.txt")
+        for kem_alg in kem_algs for operation in range(0,3,1)
+    )
+    input_files.extend(
+        os.path.join(dir_paths["up_mem_dir"], "sig-mem-metrics", f"{sig_alg}-{operation}-{run_num}.txt")
+        for sig_alg in sig_algs for operation in range(0,3,1)
+    )
+
+    # Set the parsed speed and memory result files created for the run
+    output_files = [
+        os.path.join(dir_paths["type_speed_dir"], f"test-kem-speed-{run_num}.csv"),
+        os.path.join(dir_paths["type_speed_dir"], f"test-sig-speed-{run_num}.csv"),
+        os.path.join(dir_paths["type_mem_dir"], f"kem-mem-metrics-{run_num}.csv"),
+        os.path.join(dir_paths["type_mem_dir"], f"sig-mem-metrics-{run_num}.csv")
+    ]
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def write_columnar_results(machine_num, dir_paths, runs, kem_algs, sig_algs):
+    """ Function for writing the parsed speed and memory results for the supplied runs into the Liboqs 
+        Parquet datasets. The rows are taken from the parsed csv files for each run, with the metric columns
+        converted to numeric dtypes and the source up-result file recorded for each row """
+
+    # Set the speed column names, giving the two standard deviation columns unique names
+    speed_col_names = {"pop. stdev": "Time (us): pop. stdev", "pop. stdev.1": "CPU cycles: pop. stdev"}
+    speed_float_cols = ["Total time (s)", "Time (us): mean", "Time (us): pop. stdev", "CPU cycles: mean", "CPU cycles: pop. stdev"]
+    mem_int_cols = ["intits", "maxBytes", "maxHeap", "extHeap", "maxStack"]
+    root_dir = dir_paths["root_dir"]
+
+    # Loop through the runs and write the speed and memory partitions for each run
+    for run_num in runs:
+
+        # Load the KEM and digital signature speed results for the run
+        speed_dfs = []
+        for alg_type in ["kem", "sig"]:
+
+            speed_df = pd.read_csv(os.path.join(dir_paths["type_speed_dir"], f"test-{alg_type}-speed-{run_num}.csv"))
+            speed_df = speed_df.rename(columns=speed_col_names)
+            speed_df.insert(0, "Algorithm Type", alg_type)
+
+            # Add the raw speed file as the source for each row
+            raw_speed_filepath = os.path.join(dir_paths["raw_speed_dir"], f"test-{alg_type}-speed-{run_num}.csv")
+            speed_df = columnar_output.add_provenance(speed_df, root_dir, [raw_speed_filepath] * len(speed_df))
+            speed_dfs.append(speed_df)
+
+        # Set the speed column dtypes and write the speed partition for the run
+        speed_df = pd.concat(speed_dfs, ignore_index=True)
+        speed_df = columnar_output.set_string_columns(speed_df, ["Algorithm Type", "Algorithm", "Operation"])
+        speed_df = columnar_output.set_numeric_columns(speed_df, ["Iterations"], dtype="Int64")
+        speed_df = columnar_output.set_numeric_columns(speed_df, speed_float_cols)
+        columnar_output.write_partition(root_dir, "liboqs_speed", machine_num, run_num, speed_df)
+
+        # Load the KEM and digital signature memory results for the run
+        mem_dfs = []
+        for alg_type, algs in [("kem", kem_algs), ("sig", sig_algs)]:
+
+            # Only keep the rows for the current algorithm type from the memory results file
+            mem_df = pd.read_csv(os.path.join(dir_paths["type_mem_dir"], f"{alg_type}-mem-metrics-{run_num}.csv"))
+            mem_df = mem_df.loc[mem_df["Algorithm"].isin(algs)].reset_index(drop=True)
+            mem_df.insert(0, "Algorithm Type", alg_type)
+
+            # Add the massif output file for the algorithm and operation as the source for each row
+            operations = alg_operations[f"{alg_type}_operations"]
+            mem_up_dir = os.path.join(dir_paths["up_mem_dir"], f"{alg_type}-mem-metrics")
+            mem_filepaths = [
+                os.path.join(mem_up_dir, f"{alg}-{operations.index(operation)}-{run_num}.txt")
+                for alg, operation in zip(mem_df["Algorithm"], mem_df["Operation"])
+            ]
+            mem_df = columnar_output.add_provenance(mem_df, root_dir, mem_filepaths)
+            mem_dfs.append(mem_df)
+
+        # Set the memory column dtypes and write the memory partition for the run
+        mem_df = pd.concat(mem_dfs, ignore_index=True)
+        mem_df = columnar_output.set_string_columns(mem_df, ["Algorithm Type", "Algorithm", "Operation"])
+        mem_df = columnar_output.set_numeric_columns(mem_df, mem_int_cols, dtype="Int64")
+        columnar_output.write_partition(root_dir, "liboqs_mem", machine_num, run_num, mem_df)
+
+#-----------------------------------------------------------------------------------------------------------
+def get_speed_runs(machine_num, dir_paths, num_runs, drop_noisy_runs=False):
+    """ Function for getting the runs used for the KEM and digital signature speed averages using the machine-state
+        records stored by the test suite measurement harness. A warning is outputted for any noisy runs, which were
+        started on a busy system, and these runs are dropped from the averages if the drop_noisy_runs option is set.
+        The machine-state summary csv file is written if any records are present. """
+
+    # Load the machine-state records for each algorithm type and determine the runs to average
+    all_runs = list(range(1, num_runs+1))
+    type_states = {}
+    speed_runs = {}
+    dropped_runs = {}
+
+    for alg_type in ["kem", "sig"]:
+
+        type_states[alg_type] = machine_state.load_machine_states(dir_paths["raw_speed_dir"], alg_type, all_runs)
+        noisy_runs = machine_state.get_noisy_runs(type_states[alg_type])
+        speed_runs[alg_type] = all_runs
+        dropped_runs[alg_type] = []
+
+        if not noisy_runs:
+            continue
+
+        # Output the noisy runs and drop them from the averages if requested, keeping all runs if every run is noisy
+        print(f"[WARNING] - Machine-ID ({machine_num}) {alg_type} speed runs {noisy_runs} were started on a busy system and are marked as noisy")
+
+        if drop_noisy_runs and len(noisy_runs) == num_runs:
+            print(f"[WARNING] - All of the {alg_type} speed runs for Machine-ID ({machine_num}) are noisy, keeping all runs in the averages")
+
+        elif drop_noisy_runs:
+            speed_runs[alg_type] = [run_num for run_num in all_runs if run_num not in noisy_runs]
+            dropped_runs[alg_type] = noisy_runs
+
+    # Write the machine-state summary if the runs have machine-state records
+    if any(type_states.values()):
+        machine_state.write_state_summary(os.path.join(dir_paths["type_speed_dir"], "machine-state.csv"), type_states, dropped_runs)
+
+    return speed_runs
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_machine(machine_num, dir_paths, num_runs, kem_algs, sig_algs, columnar=False, drop_noisy_runs=False):
+    """ Function for parsing the up-results for a single machine and storing them as csv files. 
+        Only the runs that are new or have changed since the last parse are processed, using the 
+        machine's parse manifest. Once the up-results are processed, the averages are calculated 
+        for all of the runs using the parsed csv files. If the columnar option is set, the parsed
+        results are also written to the Liboqs Parquet datasets. If the drop_noisy_runs option is set, speed
+        runs that were started on a busy system are left out of the speed averages """
+
+    # Index the up-result files for the machine and check that the expected files are present for every run before parsing
+    with profile_stage("liboqs", "up_results_index", machine_num):
+        up_index = UpResultsIndex("liboqs", dir_paths["mach_up_results_dir"])
+        check_runs_complete(up_index, range(1, num_runs+1), lambda run_num: get_run_files(dir_paths, run_num, kem_algs, sig_algs)[0], machine_num)
+
+    # Load the parse manifest for the machine and check if the algorithm lists have changed, requiring a full re-parse
+    with profile_stage("liboqs", "manifest_check", machine_num):
+        manifest = ParseManifest(dir_paths["mach_results_dir"], dir_paths["root_dir"], up_index)
+        alg_lists_current = manifest.entry_is_current("alg-lists", dir_paths["alg_list_files"], [])
+
+        # Determine which of the runs are new or have changed since the last parse
+        runs_to_parse = []
+        for run_num in range(1, num_runs+1):
+            input_files, output_files = get_run_files(dir_paths, run_num, kem_algs, sig_algs)
+            if not alg_lists_current or not manifest.entry_is_current(f"run-{run_num}", input_files, output_files):
+                runs_to_parse.append(run_num)
+
+    # Ensure the raw speed files are present for the runs being parsed, as the runs can not be parsed without them
+    for run_num in runs_to_parse:
+        for alg_type in ["kem", "sig"]:
+            if up_index.lookup("speed", alg_type=alg_type, run=run_num) is None:
+                raise FileNotFoundError(f"Raw speed file test-{alg_type}-speed-{run_num}.csv is missing for Machine-ID ({machine_num}), unable to parse run {run_num}")
+
+    # Remove the parsed results for any previously parsed runs that are no longer present
+    stale_runs = manifest.remove_stale_runs(num_runs)
+    if stale_runs:
+        print(f"Removed parsed results for runs {stale_runs} which are no longer present")
+
+    # Parse the up-results for Liboqs testing for the new or changed runs
+    print(f"Parsing {len(runs_to_parse)} new or changed runs, reusing {num_runs - len(runs_to_parse)} previously parsed runs")
+
+    if runs_to_parse:
+        with profile_stage("liboqs", "speed_processing", machine_num):
+            speed_processing(dir_paths, runs_to_parse)
+        with profile_stage("liboqs", "memory_processing", machine_num):
+            memory_processing(dir_paths, runs_to_parse, kem_algs, sig_algs, up_index)
+
+    # Record the parsed runs in the manifest
+    with profile_stage("liboqs", "manifest_record", machine_num):
+        manifest.record_entry("alg-lists", dir_paths["alg_list_files"], [])
+        for run_num in runs_to_parse:
+            manifest.record_entry(f"run-{run_num}", *get_run_files(dir_paths, run_num, kem_algs, sig_algs))
+        manifest.save()
+
+    # Determine the runs used for the speed averages from the machine-state records
+    with profile_stage("liboqs", "machine_state", machine_num):
+        speed_runs = get_speed_runs(machine_num, dir_paths, num_runs, drop_noisy_runs)
+
+    # Create an instance of the Liboqs average generator class for the machine and calculate the memory and CPU performance averages
+    liboqs_avg = LiboqsResultAverager(dir_paths, kem_algs, sig_algs, num_runs, alg_operations, speed_runs)
+    with profile_stage("liboqs", "avg_mem", machine_num):
         liboqs_avg.avg_mem()
+    with profile_stage("liboqs", "avg_speed", machine_num):
         liboqs_avg.avg_speed()
 
+    # Record the average and statistics result files in the manifest
+    avg_files = [
+        os.path.join(dir_paths["type_mem_dir"], "kem-mem-avg.csv"),
+        os.path.join(dir_paths["type_mem_dir"], "sig-mem-avg.csv"),
+        os.path.join(dir_paths["type_speed_dir"], "kem-speed-avg.csv"),
+        os.path.join(dir_paths["type_speed_dir"], "sig-speed-avg.csv"),
+        os.path.join(dir_paths["type_mem_dir"], "kem-mem-stats.csv"),
+        os.path.join(dir_paths["type_mem_dir"], "sig-mem-stats.csv"),
+        os.path.join(dir_paths["type_speed_dir"], "kem-speed-stats.csv"),
+        os.path.join(dir_paths["type_speed_dir"], "sig-speed-stats.csv")
+    ]
+    manifest.record_entry("averages", [], avg_files)
+    manifest.save()
+
+    # Write the Parquet partitions for the parsed runs and any previously parsed runs that have not been written yet
+    if columnar:
+        columnar_runs = [
+            run_num for run_num in range(1, num_runs+1)
+            if run_num in runs_to_parse
+            or not columnar_output.partition_exists(dir_paths["root_dir"], "liboqs_speed", machine_num, run_num)
+            or not columnar_output.partition_exists(dir_paths["root_dir"], "liboqs_mem", machine_num, run_num)
+        ]
+        with profile_stage("liboqs", "columnar_output", machine_num):
+            write_columnar_results(machine_num, dir_paths, columnar_runs, kem_algs, sig_algs)
+
+        for family in ["liboqs_speed", "liboqs_mem"]:
+            columnar_output.remove_stale_partitions(dir_paths["root_dir"], family, machine_num, num_runs)
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_machine_worker(machine_num, dir_paths, num_runs, kem_algs, sig_algs, columnar=False, drop_noisy_runs=False, profile=False):
+    """ Worker function for parsing a single machine's results in a separate process. The console output 
+        is captured and returned along with any error so that it can be outputted by the main process once
+        the machine has been parsed. If profiling is enabled, the stage records for the machine are also returned. """
+
+    # Enable the stage profiling for the worker process if it is enabled in the main process
+    if profile:
+        parse_profiler.enable_profiling()
+
+    # Parse the machine's results while capturing the console output and any errors
+    output_buffer = io.StringIO()
+    error = None
+
+    with contextlib.redirect_stdout(output_buffer):
+        try:
+            parse_machine(machine_num, dir_paths, num_runs, kem_algs, sig_algs, columnar, drop_noisy_runs)
+        except Exception:
+            error = traceback.format_exc()
+
+    return machine_num, output_buffer.getvalue(), error, parse_profiler.get_records()
+
+#-----------------------------------------------------------------------------------------------------------
+def process_tests(machine_runs, base_paths, kem_algs, sig_algs, max_workers, results_policy=None, columnar=False, drop_noisy_runs=False):
+    """ Function for parsing the results for a single or multiple machines 
+        and stores them as csv files. Once up-results are processed
+        averages are calculated for the results. The machine_runs dictionary maps
+        each Machine-ID to its number of test runs. If more than one worker is 
+        requested, each machine is parsed in its own worker process. """
+
+    # Set the directory paths and create the results directories for each machine, handling any clashes with previously parsed results
+    machine_paths = {}
+    for machine_num in machine_runs:
+        dir_paths = set_machine_paths(base_paths, machine_num)
+        if handle_results_dir_creation(machine_num, dir_paths, results_policy):
+            machine_paths[machine_num] = dir_paths
+
+    # Parse the machines one after another if only a single worker is being used
+    if max_workers <= 1 or len(machine_paths) <= 1:
+        for machine_num, dir_paths in machine_paths.items():
+            parse_machine(machine_num, dir_paths, machine_runs[machine_num], kem_algs, sig_algs, columnar, drop_noisy_runs)
+        return
+
+    # Parse each machine in its own worker process
+    failed_machines = []
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(machine_paths))) as executor:
+
+        # Submit the parsing job for each machine
+        parse_jobs = [
+            executor.submit(parse_machine_worker, machine_num, dir_paths, machine_runs[machine_num], kem_algs, sig_algs, columnar, drop_noisy_runs, parse_profiler.is_enabled())
+            for machine_num, dir_paths in machine_paths.items()
+        ]
+
+        # Output the console output and any errors for each machine in machine order
+        for parse_job in parse_jobs:
+            machine_num, output, error, profile_records = parse_job.result()
+            parse_profiler.add_records(profile_records)
+            print(output, end="")
+
+            if error is not None:
+                print(f"\n[ERROR] - Liboqs parsing failed for Machine-ID ({machine_num}):\n{error}")
+                failed_machines.append(machine_num)
+
+    # Exit if any of the machines failed to parse
+    if failed_machines:
+        print(f"[ERROR] - Liboqs results for Machine-IDs {failed_machines} could not be parsed")
+        sys.exit(1)
+
 #-----------------------------------------------------------------------------------------------------------
 def parse_liboqs(test_opts):
     """ Entrypoint for controlling the parsing of the Liboqs benchmarking results. This function
         is called from the main parsing control script and will call the necessary functions to parse the results """
 
     # Get the test options
-    global num_runs
-    num_machines = test_opts[0]
-    num_runs = test_opts[1]
+    machine_runs = test_opts["machine_runs"]
+    max_workers = test_opts["max_workers"]
+    results_policy = test_opts["results_policy"]
+    columnar = test_opts["columnar"]
+    drop_noisy_runs = test_opts["drop_noisy_runs"]
 
     # Setup the script environment
     print(f"\nPreparing to Parse Liboqs Results:\n")
-    setup_parse_env(test_opts[2])
+    base_paths, kem_algs, sig_algs = setup_parse_env(test_opts["root_dir"])
 
     # Process the results
     print("Parsing results... ")
-    process_tests(num_machines)
\ No newline at end of file
+    process_tests(machine_runs, base_paths, kem_algs, sig_algs, max_workers, results_policy, columnar, drop_noisy_runs)
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Machine-state record reader for the Liboqs CPU speed results. The Liboqs test suite measurement harness stores a
+machine-state record next to each speed test run, holding the CPU cores the test was pinned to, the CPU scaling
+governor, the turbo/boost state, and whether the system was busy when the run started. This module reads these
+records so that noisy runs can be marked in a machine-state summary CSV file and optionally dropped from the speed
+averages. Results gathered before the measurement harness was added have no records, and are treated as not noisy.
+This module is used internally by the Liboqs parsing script and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import pandas as pd
+
+# Declare the machine-state record filename template and the summary file columns
+state_filename = "machine-state-{alg_type}-{run}.txt"
+summary_fields = ["run", "alg_type", "timestamp", "cpu_cores", "scaling_governor", "turbo", "load_avg_1m", "cpu_busy_percent", "max_busy_percent", "warmup"]
+
+#-----------------------------------------------------------------------------------------------------------
+def read_machine_state(filepath):
+    """ Function for reading a machine-state record file into a dictionary of its key=value fields.
+        Returns None if the record file is not present. """
+
+    # Return None if there is no record for the run
+    if not os.path.isfile(filepath):
+        return None
+
+    # Read in the key=value fields, skipping any malformed lines
+    state = {}
+    with open(filepath, "r") as state_file:
+        for line in state_file:
+            key, sep, value = line.strip().partition("=")
+            if sep:
+                state[key] = value
+
+    return state
+
+#-----------------------------------------------------------------------------------------------------------
+def load_machine_states(raw_speed_dir, alg_type, runs):
+    """ Function for loading the machine-state records for the supplied algorithm type and runs from the
+        machine's raw speed results directory. Returns a dictionary of the records keyed by run number,
+        with the runs that have no record being left out. """
+
+    # Read the record for each run that has one
+    states = {}
+    for run_num in runs:
+        state = read_machine_state(os.path.join(raw_speed_dir, state_filename.format(alg_type=alg_type, run=run_num)))
+        if state is not None:
+            states[run_num] = state
+
+    return states
+
+#-----------------------------------------------------------------------------------------------------------
+def get_noisy_runs(states):
+    """ Function for getting the sorted list of runs whose machine-state record shows that the system
+        was busy when the run was started """
+
+    return sorted(run_num for run_num, state in states.items() if state.get("busy") == "1")
+
+#-----------------------------------------------------------------------------------------------------------
+def write_state_summary(summary_filepath, type_states, dropped_runs):
+    """ Function for writing the machine-state summary CSV file, containing a row for each speed test run
+        with a machine-state record. Each row is marked with whether the run was noisy and whether it was
+        dropped from the speed averages. The type_states and dropped_runs dictionaries are keyed by algorithm type. """
+
+    # Create a summary row for each record
+    summary_rows = []
+    for alg_type, states in type_states.items():
+        for run_num, state in sorted(states.items()):
+            summary_row = {field: state.get(field, "") for field in summary_fields}
+            summary_row["run"] = run_num
+            summary_row["alg_type"] = alg_type
+            summary_row["noisy"] = state.get("busy") == "1"
+            summary_row["dropped"] = run_num in dropped_runs.get(alg_type, [])
+            summary_rows.append(summary_row)
+
+    # Export the summary csv file
+    pd.DataFrame(summary_rows, columns=summary_fields + ["noisy", "dropped"]).to_csv(summary_filepath, index=False)
@@ -0,0 +1,133 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Valgrind Massif result reader for the Liboqs memory benchmarking results.
+Extracts the peak memory snapshot from the ms_print reports produced by the automated Liboqs test suite
+(raw massif.out files are also supported) and returns the peak metrics as typed integers. Each file is read
+in a single call and the peak snapshot is located directly, rather than stepping through the file line by line.
+A thread pool can be used to read a full set of memory result files at once. This module is used internally by
+the Liboqs parsing script and is not intended to be run standalone. The peak extraction is based on the run_mem.py
+script found in the OQS Profiling Project https://github.com/open-quantum-safe/profiling
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Declare the peak snapshot record, with the fields in the same order as the parsed memory metrics columns
+MassifPeak = namedtuple("MassifPeak", ["time", "mem_total_B", "mem_heap_B", "mem_heap_extra_B", "mem_stacks_B"])
+
+# Declare the patterns used to locate the peak snapshot in ms_print reports and raw massif.out files
+detailed_snapshots_pattern = re.compile(rb"^ Detailed snapshots: \[([^\]]*)\]", re.MULTILINE)
+peak_index_pattern = re.compile(rb"(\d+) \(peak\)")
+raw_peak_pattern = re.compile(
+    rb"^snapshot=(\d+)\n#-+\ntime=(\d+)\nmem_heap_B=(\d+)\nmem_heap_extra_B=(\d+)\nmem_stacks_B=(\d+)\nheap_tree=peak",
+    re.MULTILINE
+)
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_ms_print_peak(contents):
+    """ Helper function for extracting the peak snapshot metrics from the contents of an ms_print report.
+        The peak snapshot number is taken from the detailed snapshots line and its row is then located directly
+        in the snapshot table. Returns None if the report does not contain a peak snapshot. """
+
+    # Get the peak snapshot number from the detailed snapshots line
+    snapshots_match = detailed_snapshots_pattern.search(contents)
+    if snapshots_match is None:
+        return None
+
+    peak_match = peak_index_pattern.search(snapshots_match.group(1))
+    if peak_match is None:
+        return None
+
+    # Locate the first row for the peak snapshot after the detailed snapshots line
+    peak_row_pattern = re.compile(
+        rb"^ *" + peak_match.group(1) + rb" +([\d,]+) +([\d,]+) +([\d,]+) +([\d,]+) +([\d,]+) *$",
+        re.MULTILINE
+    )
+    row_match = peak_row_pattern.search(contents, snapshots_match.end())
+    if row_match is None:
+        return None
+
+    # Remove the thousands separators and return the peak metrics as integers
+    return MassifPeak(*(int(value.replace(b",", b"")) for value in row_match.groups()))
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_raw_massif_peak(contents):
+    """ Helper function for extracting the peak snapshot metrics from the contents of a raw massif.out file.
+        Returns None if the file does not contain a peak snapshot. """
+
+    # Locate the snapshot block marked as the peak heap tree
+    peak_match = raw_peak_pattern.search(contents)
+    if peak_match is None:
+        return None
+
+    # Get the snapshot metrics and calculate the total memory usage for the peak snapshot
+    time, heap, heap_extra, stacks = (int(value) for value in peak_match.groups()[1:])
+    return MassifPeak(time, heap + heap_extra + stacks, heap, heap_extra, stacks)
+
+#-----------------------------------------------------------------------------------------------------------
+def read_massif_peak(filepath):
+    """ Function for reading the peak memory metrics from the supplied ms_print report or raw massif.out file.
+        The file is read in a single call and a MassifPeak record is returned, or None if the file has no peak
+        snapshot. Any errors opening the file are raised to the caller. """
+
+    # Read in the full file contents
+    with open(filepath, "rb") as mem_file:
+        contents = mem_file.read()
+
+    # Determine the file format and extract the peak snapshot metrics
+    if contents.startswith(b"desc:"):
+        return parse_raw_massif_peak(contents)
+    else:
+        return parse_ms_print_peak(contents)
+
+#-----------------------------------------------------------------------------------------------------------
+def read_massif_peak_safe(filepath):
+    """ Helper function for reading the peak memory metrics for use in the thread pool, returning the
+        filepath, peak metrics, and any error raised while reading the file. """
+
+    # Read the peak metrics and return the error rather than raising it
+    try:
+        return filepath, read_massif_peak(filepath), None
+    except Exception as e:
+        return filepath, None, e
+
+#-----------------------------------------------------------------------------------------------------------
+def scan_massif_files(filepaths, max_workers=None):
+    """ Function for reading the peak memory metrics from a list of memory result files using a thread pool.
+        Returns a dictionary of the peak metrics (or None if no peak is present) keyed by filepath, and
+        a dictionary of the errors for any files that could not be read. """
+
+    # Declare the peak metrics and errors dictionaries
+    peaks = {}
+    errors = {}
+
+    # Read the files in the thread pool and sort the results into the peaks and errors dictionaries
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for filepath, peak, error in executor.map(read_massif_peak_safe, filepaths):
+            if error is None:
+                peaks[filepath] = peak
+            else:
+                errors[filepath] = error
+
+    return peaks, errors
+
+#-----------------------------------------------------------------------------------------------------------
+def scan_massif_dir(dir_path, max_workers=None):
+    """ Function for reading the peak memory metrics for all of the memory result files in the supplied
+        directory using a thread pool. Returns the peaks and errors dictionaries keyed by filename. """
+
+    # Get the memory result files present in the directory
+    with os.scandir(dir_path) as dir_entries:
+        filepaths = [entry.path for entry in dir_entries if entry.is_file()]
+
+    # Read the peak metrics and key the results by filename
+    peaks, errors = scan_massif_files(filepaths, max_workers)
+    peaks = {os.path.basename(filepath): peak for filepath, peak in peaks.items()}
+    errors = {os.path.basename(filepath): error for filepath, error in errors.items()}
+
+    return peaks, errors
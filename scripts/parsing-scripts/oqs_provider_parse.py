@@ -12,95 +12,121 @@ This script is called by the central parse_results.py controller and supports mu
 import pandas as pd
 import os
 import sys
+import io
 import shutil
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from results_averager import OqsProviderResultAverager
-
-# Declare the global variables
-dir_paths = {}
-algs_dict = {}
-pqc_type_vars = {}
-speed_type_vars = {}
-speed_sig_algs = []
-speed_kem_algs = []
-speed_headers = []
-col_headers = {}
-num_runs = 0
+from record_batch import RecordBatchBuilder
+from parse_manifest import ParseManifest
+from parse_profiler import profile_stage
+from stime_reader import scan_stime_files, get_metric_cells
+from latency_reader import scan_latency_files, get_summary_cells, get_histogram_rows, latency_summary_headers, latency_histogram_headers
+from up_results_index import UpResultsIndex, check_runs_complete, scan_indexed_files
+import columnar_output
+import parse_profiler
+import alg_registry
+
+# Declare the column headers dictionary that will be used by the various methods and functions
+col_headers = {
+    'pqc_based_headers': ["Signing Algorithm", "KEM Algorithm", "Reused Session ID", "Connections in User Time", "User Time (s)", "Connections Per User Second", "Connections in Real Time", "Real Time (s)"],
+    'classic_headers': ["Ciphersuite", "Classic Algorithm", "Reused Session ID", "Connections in User Time", "User Time (s)", "Connections Per User Second", "Connections in Real Time", "Real Time (s)"],
+    'pqc_latency_headers': ["Signing Algorithm", "KEM Algorithm", "Reused Session ID"] + latency_summary_headers,
+    'classic_latency_headers': ["Ciphersuite", "Classic Algorithm", "Reused Session ID"] + latency_summary_headers,
+    'pqc_histogram_headers': ["Signing Algorithm", "KEM Algorithm", "Reused Session ID"] + latency_histogram_headers,
+    'classic_histogram_headers': ["Ciphersuite", "Classic Algorithm", "Reused Session ID"] + latency_histogram_headers
+}
+
+# Declare the dictionary which will contain the respective keys for alg_dict and dir_paths for PQC and PQC-Hybrid results
+pqc_type_vars = {
+    "kem_alg_type": ["kem_algs", "hybrid_kem_algs"],
+    "sig_alg_type": ["sig_algs", "hybrid_sig_algs"],
+    "up_results_type": ["pqc_up_handshake_results", "hybrid_up_handshake_results"],
+    "results_type": ["pqc_handshake_results", "hybrid_handshake_results"],
+    "type_prefix": ["pqc", "hybrid"],
+    "base_type": ["pqc_base_results", "hybrid_base_results"]
+}
+
+# Declare the estimated ratio of a chunk's peak processing memory to the size of its parsed rows, used to size the chunks in
+# chunked mode when the process memory cannot be measured
+chunk_memory_overhead = 8
+
+# Declare the speed column headers for the KEM and digital signature results
+speed_headers = [
+    ["Algorithm", "Keygen", "encaps", "decaps", "Keygen/s", "Encaps/s", "Decaps/s"], 
+    ["Algorithm", "Keygen", "Signs", "Verify", "Keygen/s", "sign/s", "verify/s"]
+]
 
 #-----------------------------------------------------------------------------------------------------------
 def setup_parse_env(root_dir):
     """ Function for setting up the environment for the OQS-Provider TLS parsing script. The function
-        will set the various directory paths, read in the algorithm lists, set the root directories 
-        and set the column headers for the CSV files that will be outputted. """
-
-    global dir_paths, col_headers, algs_dict, pqc_type_vars, speed_type_vars, speed_headers
+        will set the various directory paths, read in the algorithm lists and set the root directories,
+        returning the base directory paths and algorithms dictionary to the caller. """
 
     # Ensure the root_dir path is correct before continuing
     if not os.path.isfile(os.path.join(root_dir, ".pqc_eval_dir_marker.tmp")):
         print("Project root directory path file not correct, the main parse_results.py file is not able to establish the correct path!!!")
         sys.exit(1)
 
-    # Note: (at some point consider making these vars into a json file)
+    # Set the test results directory paths in the central paths dictionary
+    dir_paths = {}
+    dir_paths['root_dir'] = root_dir
+    dir_paths['results_dir'] = os.path.join(root_dir, "test-data", "results", "oqs-provider")
+    dir_paths['up_results'] = os.path.join(root_dir, "test-data", "up-results", "oqs-provider")
 
-    # Declare the algorithms dictionary that will be used by the various methods and functions
-    algs_dict = {
-        'kem_algs': [], 
-        'sig_algs': [],
-        "hybrid_kem_algs": [],
-        "hybrid_sig_algs": [],
-        'classic_algs': ["RSA_2048", "RSA_3072", "RSA_4096", "prime256v1", "secp384r1", "secp521r1"], 
-        'ciphers': ["TLS_AES_256_GCM_SHA384", "TLS_CHACHA20_POLY1305_SHA256", "TLS_AES_128_GCM_SHA256"]
+    # Load the PQC and PQC-Hybrid algorithm lists from the algorithm registry (or the alg-list files if no registry is present)
+    alg_list_names = {
+        "kem_algs": "tls-kem-algs",
+        "sig_algs": "tls-sig-algs",
+        "hybrid_kem_algs": "tls-hybr-kem-algs",
+        "hybrid_sig_algs": "tls-hybr-sig-algs"
     }
+    alg_lists, dir_paths['alg_list_files'] = alg_registry.get_alg_lists(root_dir, list(alg_list_names.values()))
 
-    # Declare the column headers dictionary that will be used by the various methods and functions
-    col_headers = {
-        'pqc_based_headers': ["Signing Algorithm", "KEM Algorithm", "Reused Session ID", "Connections in User Time", "User Time (s)", "Connections Per User Second", "Connections in Real Time", "Real Time (s)"],
-        'classic_headers': ["Ciphersuite", "Classic Algorithm", "Reused Session ID", "Connections in User Time", "User Time (s)", "Connections Per User Second", "Connections in Real Time", "Real Time (s)"]
+    # Declare the algorithms dictionary that will be used by the various methods and functions
+    algs_dict = {alg_type: alg_lists[list_name] for alg_type, list_name in alg_list_names.items()}
+    algs_dict['classic_algs'] = alg_registry.get_classic_tls_algs(root_dir)
+    algs_dict['ciphers'] = list(alg_registry.tls_ciphersuites)
 
-    }
+    return dir_paths, algs_dict
 
-    # Declare the dictionary which will contain the respective keys for alg_dict and dir_paths for PQC and PQC-Hybrid results
-    pqc_type_vars = {
-        "kem_alg_type": ["kem_algs", "hybrid_kem_algs"],
-        "sig_alg_type": ["sig_algs", "hybrid_sig_algs"],
-        "up_results_path": "",
-        "results_type": ["pqc_handshake_results", "hybrid_handshake_results"],
-        "type_prefix": ["pqc", "hybrid"],
-        "base_type": ["pqc_base_results", "hybrid_base_results"]
+#-----------------------------------------------------------------------------------------------------------
+def set_machine_paths(base_paths, machine_num):
+    """ Helper function for creating the directory paths dictionary for the current machine. A new 
+        dictionary is created for each machine so that machines can be parsed independently of each other. """
+
+    # Copy the base directory paths and set the machine's results directories paths
+    dir_paths = dict(base_paths)
+    dir_paths['mach_results_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}")
+    dir_paths['mach_up_results_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}")
+    dir_paths['mach_handshake_dir']  = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}", "handshake-results")
+    dir_paths['mach_up_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine_num)}", "speed-results")
+    dir_paths['mach_speed_results_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine_num)}", "speed-results")
+    dir_paths['speed_types_dirs'] = {
+        "pqc": [os.path.join(dir_paths['mach_up_speed_dir'], "pqc"), os.path.join(dir_paths['mach_speed_results_dir'])], 
+        "hybrid": [os.path.join(dir_paths['mach_up_speed_dir'], "hybrid"), os.path.join(dir_paths['mach_speed_results_dir'])],
     }
 
-    # Declare the dictionary which contains testing types and defining the speed column headers
-    speed_type_vars = {"PQC": "", "Hybrid": ""}
-    speed_headers = [
-        ["Algorithm", "Keygen", "encaps", "decaps", "Keygen/s", "Encaps/s", "Decaps/s"], 
-        ["Algorithm", "Keygen", "Signs", "Verify", "Keygen/s", "sign/s", "verify/s"]
-    ]
-
-    # Set the test results directory paths in the central paths dictionary
-    dir_paths['root_dir'] = root_dir
-    dir_paths['results_dir'] = os.path.join(root_dir, "test-data", "results", "oqs-provider")
-    dir_paths['up_results'] = os.path.join(root_dir, "test-data", "up-results", "oqs-provider")
+    # Set the up-results handshake paths so that both PQC and PQC-hybrid results can be processed
+    dir_paths['pqc_up_handshake_results'] = os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "pqc")
+    dir_paths['hybrid_up_handshake_results'] = os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "hybrid")
 
-    # Set the alg-list filenames for the various PQC test types (PQC and PQC-Hybrid)
-    alg_list_files = {
-        "kem_algs": os.path.join(root_dir, "test-data", "alg-lists", "tls-kem-algs.txt"),
-        "sig_algs": os.path.join(root_dir, "test-data", "alg-lists", "tls-sig-algs.txt"),
-        "hybrid_kem_algs": os.path.join(root_dir, "test-data", "alg-lists", "tls-hybr-kem-algs.txt"),
-        "hybrid_sig_algs": os.path.join(root_dir, "test-data", "alg-lists", "tls-hybr-sig-algs.txt")
-    }
-
-    # Pull the algorithm names from the alg-lists files and create the relevant alg lists
-    for alg_type, filepath in alg_list_files.items():
-        with open(filepath, "r") as alg_file:
-            for line in alg_file:
-                algs_dict[alg_type].append(line.strip())
+    # Set the parsed handshake results directory paths
+    dir_paths['pqc_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "pqc")
+    dir_paths['classic_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "classic")
+    dir_paths['hybrid_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "hybrid")
+    dir_paths['pqc_base_results'] = os.path.join(dir_paths['pqc_handshake_results'], "base-results")
+    dir_paths['hybrid_base_results'] = os.path.join(dir_paths['hybrid_handshake_results'], "base-results")
 
-    # Empty the alg_list_files dict as no longer needed
-    alg_list_files = None
+    return dir_paths
 
 #-----------------------------------------------------------------------------------------------------------
-def handle_results_dir_creation(machine_num):
+def handle_results_dir_creation(machine_num, dir_paths, results_policy=None):
     """ Function for handling the presence of older parsed results, ensuring that the user
-        is aware of the old results and can choose how to handle them before the parsing continues. """
+        is aware of the old results and can choose how to handle them before the parsing continues. 
+        If a results policy (overwrite, skip, update, or version) is passed, it is applied without prompting 
+        the user. Returns False if the machine should be skipped, otherwise True. """
 
     # Check if there are any old parsed results for current Machine-ID and handle any clashes
     if os.path.exists(dir_paths["mach_results_dir"]):
@@ -108,6 +134,43 @@ def handle_results_dir_creation(machine_num):
         # Output the warning message to the terminal
         print(f"There are already parsed OQS-Provider testing results present for Machine-ID ({machine_num})\n")
 
+        # Handle the old results using the results policy if one has been passed
+        if results_policy == "skip":
+
+            # Leave the old results in place and skip parsing the current Machine-ID
+            print(f"Skipping the parsing of OQS-Provider results for Machine-ID ({machine_num})")
+            return False
+
+        elif results_policy == "overwrite":
+
+            # Replace all old results and create a new empty directory to store the parsed results
+            print(f"Removing old results directory for Machine-ID ({machine_num}) before continuing...")
+            shutil.rmtree(dir_paths["mach_results_dir"])
+            os.makedirs(dir_paths["mach_handshake_dir"])
+            os.makedirs(dir_paths["mach_speed_results_dir"])
+            return True
+
+        elif results_policy == "update":
+
+            # Keep the old results so only new or changed runs are parsed using the machine's parse manifest
+            print(f"Updating old results for Machine-ID ({machine_num}), only new or changed runs will be parsed")
+            os.makedirs(dir_paths["mach_handshake_dir"], exist_ok=True)
+            os.makedirs(dir_paths["mach_speed_results_dir"], exist_ok=True)
+            return True
+
+        elif results_policy == "version":
+
+            # Move the old results to the next available versioned directory and create a new empty directory
+            version_num = 1
+            while os.path.exists(f"{dir_paths['mach_results_dir']}-v{version_num}"):
+                version_num += 1
+
+            print(f"Moving old results for Machine-ID ({machine_num}) to machine-{machine_num}-v{version_num} before continuing...")
+            os.rename(dir_paths["mach_results_dir"], f"{dir_paths['mach_results_dir']}-v{version_num}")
+            os.makedirs(dir_paths["mach_handshake_dir"])
+            os.makedirs(dir_paths["mach_speed_results_dir"])
+            return True
+
         # Get the decision from user on how to handle old results before parsing continues
         while True:
 
@@ -116,13 +179,14 @@ def handle_results_dir_creation(machine_num):
             print("Option 1 - Replace old parsed results with new ones")
             print("Option 2 - Exit parsing programme to move old results and rerun after (if you choose this option, please move the entire folder not just its contents)")
             print("Option 3 - Make parsing script programme wait until you have move files before continuing")
-            user_choice = input("Enter option (1/2/3): ")
+            print("Option 4 - Update old parsed results, only parsing new or changed runs")
+            user_choice = input("Enter option (1/2/3/4): ")
 
             if user_choice == "1":
 
                 # Replace all old results and create a new empty directory to store the parsed results
                 print(f"Removing old results directory for Machine-ID ({machine_num}) before continuing...")
-                shutil.rmtree(dir_paths["results_dir"], f"machine-{machine_num}")
+                shutil.rmtree(dir_paths["mach_results_dir"])
                 print("Old results removed")
 
                 os.makedirs(dir_paths["mach_handshake_dir"])
@@ -154,10 +218,18 @@ def handle_results_dir_creation(machine_num):
                 
                 break
 
+            elif user_choice == "4":
+
+                # Keep the old results so only new or changed runs are parsed
+                print(f"Updating old results for Machine-ID ({machine_num}), only new or changed runs will be parsed")
+                os.makedirs(dir_paths["mach_handshake_dir"], exist_ok=True)
+                os.makedirs(dir_paths["mach_speed_results_dir"], exist_ok=True)
+                break
+
             else:
                 
 				# Output the warning message if the user input is not valid
-                print("Incorrect value, please select (1/2/3)")
+                print("Incorrect value, please select (1/2/3/4)")
 
     else:
         
@@ -165,123 +237,117 @@ def handle_results_dir_creation(machine_num):
         os.makedirs(dir_paths["mach_handshake_dir"])
         os.makedirs(dir_paths["mach_speed_results_dir"])
 
-#-----------------------------------------------------------------------------------------------------------
-def get_metrics(current_row, test_filepath, get_reuse_metrics):
-    """ Helper function for pulling the current sig/kem metrics from 
-        the supplied OQS-Provider s_time output file. """
-
-    # Get the relevant data from the supplied performance metrics output file
-    try:
-
-        # Open the file and extract the metrics
-        with open(test_filepath, "r") as test_file:
-
-            # Set flag used to determine metric type (first use or session id reused)
-            session_metrics_flag = False
-
-            # Loop through the file lines to pull the performance metrics
-            for line in test_file:
-
-                # Check the line to see if metrics are for session id first use or reused
-                if "reuse" in line:
-                    session_metrics_flag = True
-
-                # Get line 1 metrics using keywords
-                if "connections" in line and "user" in line:
-
-                    # Check if metrics is session first use or reuse
-                    if session_metrics_flag is False and get_reuse_metrics is False:
-
-                        # Store line 1 first use metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3][:-2])
-                        current_row.append(separated_line[4])
+    return True
 
-                    elif session_metrics_flag is True and get_reuse_metrics is True:
-
-                        # Store line 1 session id reuse metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3][:-2])
-                        current_row.append(separated_line[4])
-                
-                # Get line 2 metrics using keywords
-                elif "connections" in line and "real" in line:
-
-                    # Check if metrics is first use or reuse
-                    if session_metrics_flag is False and get_reuse_metrics is False:
-
-                        # Store line 2 first use metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3])
-                        break
+#-----------------------------------------------------------------------------------------------------------
+def report_stime_errors(errors, file_type="TLS handshake"):
+    """ Helper function for outputting the handshake result files that were missing or malformed. The
+        metrics for these files are left empty in the parsed results. """
 
-                    elif session_metrics_flag is True and get_reuse_metrics is True:
+    # Output the missing and malformed files separately
+    for filepath, error in errors.items():
+        if isinstance(error, FileNotFoundError):
+            print(f"[WARNING] - Missing {file_type} file, metrics left empty - {filepath}")
+        else:
+            print(f"[WARNING] - Malformed {file_type} file ({error}), metrics left empty - {filepath}")
 
-                        # Store line 2 session id reuse metrics
-                        separated_line = line.split()
-                        current_row.append(separated_line[0])
-                        current_row.append(separated_line[3])
+#-----------------------------------------------------------------------------------------------------------
+def report_stime_section_errors(metrics):
+    """ Helper function for outputting the handshake result files where only one of the session ID first use or
+        reused sections could be parsed. The metrics for the parsed section are kept, and the metrics for the
+        malformed section are left empty in the parsed results. """
 
-    except:
+    # Output the malformed sections for each partially parsed file
+    for filepath, handshake_metrics in metrics.items():
+        for section_error in handshake_metrics.section_errors:
+            print(f"[WARNING] - Malformed TLS handshake file section ({section_error}), metrics for this section left empty - {filepath}")
 
-        # Output the file not found error and the missing filename
-        print(f"missing file - {test_filepath}")
+#-----------------------------------------------------------------------------------------------------------
+def get_handshake_metrics(current_run, type_index, dir_paths, sig_algs, kem_algs, up_index=None):
+    """ Function for extracting the PQC or PQC-Hybrid TLS handshake metrics for the current run for each of the supplied 
+        signing algorithms combined with every KEM algorithm. The metrics are returned as a dataframe with the session 
+        id first use and reused rows for each sig/kem combination, in signing algorithm order """
+
+    # Declare the row batch used in pre-processing
+    sig_metrics_batch = RecordBatchBuilder(col_headers['pqc_based_headers'])
+
+    # Set the handshake result file for each sig/kem combination and read their metrics using the s_time reader thread pool
+    up_results_dir = dir_paths[pqc_type_vars["up_results_type"][type_index]]
+    test_files = [
+        (sig, kem, os.path.join(up_results_dir, f"tls-handshake-{current_run}-{sig}-{kem}.txt"))
+        for sig in sig_algs
+        for kem in kem_algs
+    ]
+    metrics, errors = scan_indexed_files(scan_stime_files, [test_filepath for _, _, test_filepath in test_files], up_index)
+    report_stime_errors(errors)
+    report_stime_section_errors(metrics)
 
-        # Create an empty row as placeholder for missing file
-        for _ in range(1,6):
-            current_row.append("")
+    # Loop through the sig/kem combinations and add the session id first use and reused rows to the batch
+    for sig, kem, test_filepath in test_files:
+        handshake_metrics = metrics.get(test_filepath)
+        sig_metrics_batch.append([sig, kem, ""] + get_metric_cells(handshake_metrics, reused=False))
+        sig_metrics_batch.append([sig, kem, "*"] + get_metric_cells(handshake_metrics, reused=True))
 
-    return current_row
+    return sig_metrics_batch.to_dataframe()
 
 #-----------------------------------------------------------------------------------------------------------
-def pqc_based_pre_processing(current_run, type_index):
+def pqc_based_pre_processing(current_run, type_index, dir_paths, algs_dict, up_index=None):
     """ Function for pre-processing PQC and PQC-Hybrid TLS results for the current run. This function
         will loop through the sig/kem combinations and extract the metrics for each combination. This creates the 
         full base results for the current run which can later be separated into individual CSV files for each sig/kem combo """
 
-    # Declare the dataframe used in pre-processing
-    sig_metrics_df = pd.DataFrame(columns=col_headers['pqc_based_headers'])
-
-    # Loop through the sig list to create the csv
-    for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+    # Extract the metrics for every sig/kem combination of the current test type
+    sig_metrics_df = get_handshake_metrics(
+        current_run, 
+        type_index, 
+        dir_paths, 
+        algs_dict[pqc_type_vars["sig_alg_type"][type_index]], 
+        algs_dict[pqc_type_vars["kem_alg_type"][type_index]], 
+        up_index
+    )
 
-        # Loop through the KEM files signed with the current sig
-        for kem in algs_dict[pqc_type_vars["kem_alg_type"][type_index]]:
-
-            # Set the filename and path
-            filename = f"tls-handshake-{current_run}-{sig}-{kem}.txt"
-            test_filepath = os.path.join(pqc_type_vars["up_results_path"][type_index], filename)
-            
-            # Get the session id first use metrics for the current KEM
-            current_row = [kem, ""]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=False)
-            current_row.insert(0, sig)
-
-            # Add the session id first use row to the dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['pqc_based_headers'])
-            sig_metrics_df = pd.concat([sig_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
-
-            # Get the session id reused metrics for the current KEM
-            current_row = [kem, "*"]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=True)
-            current_row.insert(0, sig)
-
-            # Add the session id reused use row to the dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['pqc_based_headers'])
-            sig_metrics_df = pd.concat([sig_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
-        
     # Output the full base PQC TLS metrics for the current run
     base_out_filename = f"{pqc_type_vars['type_prefix'][type_index]}-base-results-run-{current_run}.csv"
     output_filepath = os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], base_out_filename)
     sig_metrics_df.to_csv(output_filepath,index=False)
 
 #-----------------------------------------------------------------------------------------------------------
-def pqc_based_processing(current_run):
+def write_sig_results(sig_df, output_filepath):
+    """ Helper function for writing the separated results for a single signing algorithm to csv """
+
+    # Create the storage dir for the signing algorithm if not made and output the results
+    os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
+    sig_df.to_csv(output_filepath, index=False)
+
+#-----------------------------------------------------------------------------------------------------------
+def split_base_results(current_run, base_df, results_dir, sig_algs, max_write_workers=None, file_prefix="tls-handshake"):
+    """ Function for separating the base results for the current run into individual CSV files for each signing
+        algorithm. The base results are grouped on the exact signing algorithm name in a single pass, so that
+        algorithms whose names contain another algorithm's name are kept apart. If more than one write worker
+        is set, the separated files are written using a thread pool. The file prefix sets the result type in
+        the separated filenames """
+
+    # Group the base results on the exact signing algorithm name, using an empty dataframe for any missing algorithms
+    sig_groups = dict(tuple(base_df.groupby("Signing Algorithm", sort=False)))
+    empty_df = base_df.iloc[0:0]
+
+    # Set the output file for each of the signing algorithms
+    sig_outputs = []
+    for sig in sig_algs:
+        output_filepath = os.path.join(results_dir, sig, f"{file_prefix}-{sig}-run-{current_run}.csv")
+        sig_outputs.append((sig_groups.get(sig, empty_df), output_filepath))
+
+    # Write out the separated results for each signing algorithm
+    if max_write_workers is not None and max_write_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_write_workers) as executor:
+            list(executor.map(lambda sig_output: write_sig_results(*sig_output), sig_outputs))
+
+    else:
+        for sig_df, output_filepath in sig_outputs:
+            write_sig_results(sig_df, output_filepath)
+
+#-----------------------------------------------------------------------------------------------------------
+def pqc_based_processing(current_run, dir_paths, algs_dict, max_write_workers=None, up_index=None):
     """ Function for parsing both PQC and PQC-Hybrid TLS results for the current run. The function will
         process the results and output the full base results for the current run and then separate the
         results into individual CSV files for each sig/kem combo. This will be done for both PQC and PQC-Hybrid. """
@@ -290,73 +356,251 @@ def pqc_based_processing(current_run):
     for type_index in range (0,2):
 
         # Perform pre-processing for the current test type
-        pqc_based_pre_processing(current_run, type_index)
+        pqc_based_pre_processing(current_run, type_index, dir_paths, algs_dict, up_index)
 
         # Set the base results filename and path based on current run
         pqc_base_filename = f"{pqc_type_vars['type_prefix'][type_index]}-base-results-run-{current_run}.csv"
         pqc_base_filepath = os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], pqc_base_filename)
 
-        # Create the storage directory and files for separated sig/kem combo results
-        for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+        # Read in the current run base results once and separate them into the results for each signing algorithm
+        base_df = pd.read_csv(pqc_base_filepath)
+        split_base_results(
+            current_run, 
+            base_df, 
+            dir_paths[pqc_type_vars["results_type"][type_index]], 
+            algs_dict[pqc_type_vars["sig_alg_type"][type_index]], 
+            max_write_workers
+        )
 
-            # Set the path for sig/kem combo directory
-            sig_path = os.path.join(dir_paths[pqc_type_vars["results_type"][type_index]], sig)
+#-----------------------------------------------------------------------------------------------------------
+def chunked_pqc_processing(dir_paths, runs, algs_dict, memory_limit_mb, oqs_provider_avg, up_index=None, max_write_workers=None):
+    """ Function for processing the PQC and PQC-Hybrid TLS results in chunks of signing algorithms, used when parsing
+        very large algorithm grids. Each chunk is parsed and separated for all of the supplied runs, and then averaged,
+        before the next chunk is processed, so the peak memory scales with a single chunk rather than the full sig/kem grid.
+        The first chunk holds a single signing algorithm. The peak RSS of the process during each chunk, including the
+        averaging, is measured against the RSS before chunked parsing started, and the next chunk is sized so its memory
+        use stays within the supplied memory limit (in MB). If the peak RSS cannot be measured, the memory use of each
+        chunk is estimated from the size of its parsed rows. A single signing algorithm cannot be split, so a warning is
+        outputted if one uses more than the limit. The base results for each run are built up by appending each chunk's
+        rows, keeping the same row order as the non-chunked parsing """
+
+    # Store the process RSS before any chunks are parsed, used as the baseline for the memory used by each chunk
+    baseline_rss_mb = parse_profiler.get_current_rss_mb()
+    limit_warned = False
 
-            # Create the storage dir for separated sig/kem combo results if not made
-            if not os.path.exists(sig_path):
-                os.makedirs(sig_path)
-            
-            # Read in the current run base results and extracting signature
-            base_df = pd.read_csv(pqc_base_filepath)
-            current_sig_df = base_df[base_df["Signing Algorithm"].str.contains(sig)]
+    # Process the results for both PQC (0) and PQC-Hybrid (1) TLS results
+    for type_index in range (0,2):
+
+        # Set the algorithm lists and results directory for the current test type
+        sig_algs = algs_dict[pqc_type_vars["sig_alg_type"][type_index]]
+        kem_algs = algs_dict[pqc_type_vars["kem_alg_type"][type_index]]
+        results_dir = dir_paths[pqc_type_vars["results_type"][type_index]]
+
+        # Create the base results file for each run containing only the column headers, so each chunk can be appended
+        base_filepaths = {}
+        for current_run in runs:
+            base_out_filename = f"{pqc_type_vars['type_prefix'][type_index]}-base-results-run-{current_run}.csv"
+            base_filepaths[current_run] = os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], base_out_filename)
+            RecordBatchBuilder(col_headers['pqc_based_headers']).to_dataframe().to_csv(base_filepaths[current_run], index=False)
+
+        # Process the signing algorithms in chunks, starting with a single signing algorithm
+        sig_index = 0
+        chunk_size = 1
+
+        while sig_index < len(sig_algs):
+
+            # Reset the peak RSS so the peak memory used by the chunk can be measured
+            peak_measured = parse_profiler.reset_peak_rss() and baseline_rss_mb is not None
+
+            # Parse the chunk for each run, appending it to the base results and separating it into the signing algorithm results
+            chunk_sigs = sig_algs[sig_index:sig_index+chunk_size]
+            chunk_bytes = 0
+
+            for current_run in runs:
+                chunk_df = get_handshake_metrics(current_run, type_index, dir_paths, chunk_sigs, kem_algs, up_index)
+                chunk_df.to_csv(base_filepaths[current_run], mode="a", header=False, index=False)
+                split_base_results(current_run, chunk_df, results_dir, chunk_sigs, max_write_workers)
+                chunk_bytes = max(chunk_bytes, int(chunk_df.memory_usage(deep=True).sum()))
+
+            # Generate the averages for the signing algorithms in the chunk
+            for sig in chunk_sigs:
+                oqs_provider_avg.gen_sig_avgs(type_index, sig)
+
+            sig_index += len(chunk_sigs)
 
-            # Output the current sig filtered df to csv
-            output_filename = f"tls-handshake-{sig}-run-{current_run}.csv"
-            output_filepath = os.path.join(sig_path, output_filename)
-            current_sig_df.to_csv(output_filepath, index=False)
+            # Get the memory used by the chunk from the peak RSS, using the size of its parsed rows as the lower bound, or estimate it if the peak cannot be measured
+            chunk_rows_mb = chunk_bytes / (1024 * 1024)
+            peak_rss_mb = parse_profiler.get_peak_rss_mb() if peak_measured else None
+
+            if peak_rss_mb is not None:
+                chunk_mb = max(peak_rss_mb - baseline_rss_mb, chunk_rows_mb)
+            else:
+                chunk_mb = chunk_rows_mb * chunk_memory_overhead
+
+            # Size the next chunk using the memory used by each signing algorithm in the current chunk
+            if chunk_mb > 0:
+                sig_mb = chunk_mb / len(chunk_sigs)
+                chunk_size = max(1, int(memory_limit_mb // sig_mb))
+
+                # Output a warning if the chunk used more memory than the limit, which can only be avoided if it held more than one signing algorithm
+                if chunk_mb > memory_limit_mb and len(chunk_sigs) > 1:
+                    print(f"[WARNING] - A chunk of {len(chunk_sigs)} signing algorithms used {chunk_mb:.1f}MB, above the {memory_limit_mb}MB chunk memory limit, reducing the next chunk to {chunk_size}")
+
+                elif chunk_mb > memory_limit_mb and not limit_warned:
+                    print(f"[WARNING] - A single signing algorithm used {chunk_mb:.1f}MB, above the {memory_limit_mb}MB chunk memory limit")
+                    limit_warned = True
 
 #-----------------------------------------------------------------------------------------------------------
-def classic_based_processing(current_run):
+def classic_based_processing(current_run, dir_paths, algs_dict, up_index=None):
     """ Function for processing results from classic cipher TLS handshake testing """
 
-    # Set the up-results directory path and create the dataframe used in test processing
+    # Set the up-results directory path and create the row batch used in test processing
     classic_up_results_dir = os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "classic")
-    cipher_metrics_df = pd.DataFrame(columns=col_headers['classic_headers'])
+    cipher_metrics_batch = RecordBatchBuilder(col_headers['classic_headers'])
 
-    # Loop through each ciphersuite
-    for cipher in algs_dict['ciphers']:
-
-        # Looping through each digital signature algorithm for the current ciphersuite
-        for alg in algs_dict['classic_algs']:
+    # Set the handshake result file for each ciphersuite/algorithm combination and read their metrics using the s_time reader thread pool
+    test_files = [
+        (cipher, alg, os.path.join(classic_up_results_dir, f"tls-handshake-classic-{current_run}-{cipher}-{alg}.txt"))
+        for cipher in algs_dict['ciphers']
+        for alg in algs_dict['classic_algs']
+    ]
+    metrics, errors = scan_indexed_files(scan_stime_files, [test_filepath for _, _, test_filepath in test_files], up_index)
+    report_stime_errors(errors)
+    report_stime_section_errors(metrics)
 
-            # Set the filename and path
-            filename = f"tls-handshake-classic-{current_run}-{cipher}-{alg}.txt"
-            test_filepath = os.path.join(classic_up_results_dir, filename)
-            
-            # Get the session id first use metrics for the current signature
-            current_row = [alg, ""]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=False)
-            current_row.insert(0, cipher)
-
-            # Add the session id first use row to dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['classic_headers'])
-            cipher_metrics_df = pd.concat([cipher_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
-            
-            # Get the session id reused metrics for the current signature
-            current_row = [alg, "*"]
-            current_row = get_metrics(current_row, test_filepath, get_reuse_metrics=True)
-            current_row.insert(0, cipher)
-
-            # Add the session id reused use row to dataframe
-            new_row_df = pd.DataFrame([current_row], columns=col_headers['classic_headers'])
-            cipher_metrics_df = pd.concat([cipher_metrics_df, new_row_df], ignore_index=True)
-            current_row.clear()
+    # Loop through the ciphersuite/algorithm combinations and add the session id first use and reused rows to the batch
+    for cipher, alg, test_filepath in test_files:
+        handshake_metrics = metrics.get(test_filepath)
+        cipher_metrics_batch.append([cipher, alg, ""] + get_metric_cells(handshake_metrics, reused=False))
+        cipher_metrics_batch.append([cipher, alg, "*"] + get_metric_cells(handshake_metrics, reused=True))
 
     # Output the full base Classic TLS metrics for current run
     cipher_out_filename = f"classic-results-run-{current_run}.csv"
     output_filepath = os.path.join(dir_paths['classic_handshake_results'], cipher_out_filename)
-    cipher_metrics_df.to_csv(output_filepath, index=False)
+    cipher_metrics_batch.to_dataframe().to_csv(output_filepath, index=False)
+
+#-----------------------------------------------------------------------------------------------------------
+def get_latency_test_files(dir_paths, current_run, algs_dict):
+    """ Helper function for getting the handshake latency result files for the supplied run. Returns a dictionary keyed
+        by the test type (pqc, hybrid, classic) holding the algorithm pair and latency result file for each combination """
+
+    # Set the latency result file for each PQC and PQC-Hybrid sig/kem combination
+    latency_files = {}
+    for type_index in range (0,2):
+        up_results_dir = dir_paths[pqc_type_vars["up_results_type"][type_index]]
+        latency_files[pqc_type_vars['type_prefix'][type_index]] = [
+            (sig, kem, os.path.join(up_results_dir, f"tls-latency-{current_run}-{sig}-{kem}.txt"))
+            for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]
+            for kem in algs_dict[pqc_type_vars["kem_alg_type"][type_index]]
+        ]
+
+    # Set the latency result file for each classic ciphersuite/algorithm combination
+    classic_up_results_dir = os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "classic")
+    latency_files["classic"] = [
+        (cipher, alg, os.path.join(classic_up_results_dir, f"tls-latency-classic-{current_run}-{cipher}-{alg}.txt"))
+        for cipher in algs_dict['ciphers']
+        for alg in algs_dict['classic_algs']
+    ]
+
+    return latency_files
+
+#-----------------------------------------------------------------------------------------------------------
+def latency_files_present(test_files, up_index=None):
+    """ Helper function for checking if any of the supplied latency result files are present, as the handshake
+        latency tests are only performed when enabled on the client """
+
+    # Check the files against the up-results index if supplied, otherwise against the filesystem
+    filepaths = [test_filepath for _, _, test_filepath in test_files]
+
+    if up_index is not None:
+        return len(up_index.split_present(filepaths)[0]) > 0
+
+    return any(os.path.isfile(filepath) for filepath in filepaths)
+
+#-----------------------------------------------------------------------------------------------------------
+def get_latency_output_files(dir_paths, current_run, algs_dict, test_type):
+    """ Helper function for getting the parsed latency summary and histogram files for the supplied run and test type """
+
+    # Return the classic latency files
+    if test_type == "classic":
+        return [
+            os.path.join(dir_paths['classic_handshake_results'], f"classic-latency-run-{current_run}.csv"),
+            os.path.join(dir_paths['classic_handshake_results'], f"classic-latency-histogram-run-{current_run}.csv")
+        ]
+
+    # Return the latency files for each PQC or PQC-Hybrid signing algorithm
+    type_index = pqc_type_vars['type_prefix'].index(test_type)
+    output_files = []
+
+    for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+        sig_path = os.path.join(dir_paths[pqc_type_vars["results_type"][type_index]], sig)
+        output_files.append(os.path.join(sig_path, f"tls-latency-{sig}-run-{current_run}.csv"))
+        output_files.append(os.path.join(sig_path, f"tls-latency-histogram-{sig}-run-{current_run}.csv"))
+
+    return output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def latency_processing(current_run, dir_paths, algs_dict, up_index=None, max_write_workers=None):
+    """ Function for processing the handshake latency results for the current run. For each test type with latency
+        results, the full and resumed handshake latencies for each combination are summarised into their percentiles and
+        counted into the latency histogram. The PQC and PQC-Hybrid results are separated into files for each signing
+        algorithm next to their s_time results, and the classic results are written next to the classic s_time results """
+
+    # Process the latency results for each test type which has latency result files for the run
+    for test_type, test_files in get_latency_test_files(dir_paths, current_run, algs_dict).items():
+
+        if not latency_files_present(test_files, up_index):
+            continue
+
+        # Set the column headers for the test type and create the summary and histogram row batches
+        header_type = "classic" if test_type == "classic" else "pqc"
+        summary_batch = RecordBatchBuilder(col_headers[f'{header_type}_latency_headers'])
+        histogram_batch = RecordBatchBuilder(col_headers[f'{header_type}_histogram_headers'])
+
+        # Read the latency result files using the latency reader thread pool
+        samples, errors = scan_indexed_files(scan_latency_files, [test_filepath for _, _, test_filepath in test_files], up_index)
+        report_stime_errors(errors, "TLS handshake latency")
+
+        # Loop through the combinations and add the full and resumed handshake rows to the batches
+        for alg_1, alg_2, test_filepath in test_files:
+
+            latency_samples = samples.get(test_filepath)
+
+            for reused, reused_marker in [(False, ""), (True, "*")]:
+                summary_batch.append([alg_1, alg_2, reused_marker] + get_summary_cells(latency_samples, reused))
+                histogram_batch.extend([alg_1, alg_2, reused_marker] + histogram_row for histogram_row in get_histogram_rows(latency_samples, reused))
+
+        # Output the classic latency results for the run
+        if test_type == "classic":
+            summary_filepath, histogram_filepath = get_latency_output_files(dir_paths, current_run, algs_dict, test_type)
+            summary_batch.to_dataframe().to_csv(summary_filepath, index=False)
+            histogram_batch.to_dataframe().to_csv(histogram_filepath, index=False)
+            continue
+
+        # Separate the PQC and PQC-Hybrid latency results into the results for each signing algorithm
+        type_index = pqc_type_vars['type_prefix'].index(test_type)
+        results_dir = dir_paths[pqc_type_vars["results_type"][type_index]]
+        sig_algs = algs_dict[pqc_type_vars["sig_alg_type"][type_index]]
+        split_base_results(current_run, summary_batch.to_dataframe(), results_dir, sig_algs, max_write_workers, file_prefix="tls-latency")
+        split_base_results(current_run, histogram_batch.to_dataframe(), results_dir, sig_algs, max_write_workers, file_prefix="tls-latency-histogram")
+
+#-----------------------------------------------------------------------------------------------------------
+def get_latency_run_files(dir_paths, current_run, algs_dict, up_index=None):
+    """ Helper function for getting the latency result input files and parsed output files for the supplied run,
+        which are tracked in the machine's parse manifest alongside the s_time and speed files. Only the test
+        types which have latency result files for the run are included """
+
+    # Declare the input and output file lists
+    input_files = []
+    output_files = []
+
+    # Add the files for each test type that has latency results for the run
+    for test_type, test_files in get_latency_test_files(dir_paths, current_run, algs_dict).items():
+        if latency_files_present(test_files, up_index):
+            input_files.extend(test_filepath for _, _, test_filepath in test_files)
+            output_files.extend(get_latency_output_files(dir_paths, current_run, algs_dict, test_type))
+
+    return input_files, output_files
 
 #-----------------------------------------------------------------------------------------------------------
 def tls_speed_drop_last(data_cells):
@@ -376,11 +620,11 @@ def get_speed_metrics(speed_filepath, alg_type):
     """ Function for extracting the speed metrics from the raw OpenSSL s_speed tool with OQS-Provider output file 
         for the current algorithm type (kem or sig) """
 
-    # Declare the variables needed for getting metrics and setting up the dataframe with test/alg type headers
+    # Declare the variables needed for getting metrics and setting up the row batch with test/alg type headers
     start = False
     data_lists = []
     headers = speed_headers[0] if alg_type == "kem" else speed_headers[1]
-    speed_metrics_df = pd.DataFrame(columns=headers)
+    speed_metrics_batch = RecordBatchBuilder(headers)
 
     # Open the file and extract metrics
     with open(speed_filepath, "r") as speed_file:
@@ -398,7 +642,7 @@ def get_speed_metrics(speed_filepath, alg_type):
             if start:
                 data_lists.append(line.strip())
     
-    # Append the data onto the dataframe
+    # Append the data onto the row batch
     for data in data_lists:
 
         # Insert the alg name to the row
@@ -407,14 +651,13 @@ def get_speed_metrics(speed_filepath, alg_type):
         # Remove any s char present in speed metric values for the row
         data_cells = tls_speed_drop_last(data_cells)
 
-        # Add the new data row to the speed metrics data frame
-        new_row_df = pd.DataFrame([data_cells], columns=headers)
-        speed_metrics_df = pd.concat([speed_metrics_df, new_row_df], ignore_index=True)
+        # Add the new data row to the speed metrics batch
+        speed_metrics_batch.append(data_cells)
 
-    return speed_metrics_df
+    return speed_metrics_batch.to_dataframe()
 
 #-----------------------------------------------------------------------------------------------------------
-def speed_processing(current_run):
+def speed_processing(current_run, dir_paths):
     """ Function for processing OpenSSL s_speed with OQS_Provider metrics for both PQC and PQC-Hybrid algorithms
        for the current run """
 
@@ -439,84 +682,364 @@ def speed_processing(current_run):
             speed_metrics_df.to_csv(output_filepath, index=False)
 
 #-----------------------------------------------------------------------------------------------------------
-def output_processing():
-    """ Function for processing the outputs of the 
-        s_time and s_speed TLS benchmarking tests for the current machine """
-    
-    # Set the result directories paths in the central paths dictionary
-    dir_paths['pqc_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "pqc")
-    dir_paths['classic_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "classic")
-    dir_paths['hybrid_handshake_results'] = os.path.join(dir_paths['mach_handshake_dir'], "hybrid")
-    dir_paths['pqc_base_results'] = os.path.join(dir_paths['pqc_handshake_results'], "base-results")
-    dir_paths['hybrid_base_results'] = os.path.join(dir_paths['hybrid_handshake_results'], "base-results")
+def output_processing(machine_num, dir_paths, runs, algs_dict, up_index=None, max_write_workers=None):
+    """ Function for processing the outputs of the s_time and s_speed TLS benchmarking tests for the supplied runs
+        of the current machine. The write workers set the thread pool size used to write the signing algorithm files """
 
     # Set the base-results files directories for the different test types
-    os.makedirs(dir_paths['pqc_base_results'])
-    os.makedirs(dir_paths['classic_handshake_results'])
-    os.makedirs(dir_paths['hybrid_base_results'])
+    os.makedirs(dir_paths['pqc_base_results'], exist_ok=True)
+    os.makedirs(dir_paths['classic_handshake_results'], exist_ok=True)
+    os.makedirs(dir_paths['hybrid_base_results'], exist_ok=True)
 
     # Loop through the runs and call result processing functions
-    for current_run in range(1, num_runs+1):
-        pqc_based_processing(current_run)
-        classic_based_processing(current_run)
-        speed_processing(current_run)
+    for current_run in runs:
+        with profile_stage("oqs-provider", "pqc_based_processing", machine_num):
+            pqc_based_processing(current_run, dir_paths, algs_dict, max_write_workers, up_index)
+        with profile_stage("oqs-provider", "classic_based_processing", machine_num):
+            classic_based_processing(current_run, dir_paths, algs_dict, up_index)
+        with profile_stage("oqs-provider", "latency_processing", machine_num):
+            latency_processing(current_run, dir_paths, algs_dict, up_index, max_write_workers)
+        with profile_stage("oqs-provider", "speed_processing", machine_num):
+            speed_processing(current_run, dir_paths)
 
 #-----------------------------------------------------------------------------------------------------------
-def process_tests(num_machines, algs_dict):
-    """ Function for controlling the parsing scripts for the OQS-Provider TLS testing up-result files
-        and calling average  calculation scripts """
-    
-    global dir_paths, pqc_type_vars
+def chunked_output_processing(machine_num, dir_paths, runs, algs_dict, memory_limit_mb, oqs_provider_avg, up_index=None, max_write_workers=None):
+    """ Function for processing the outputs of the s_time and s_speed TLS benchmarking tests for the supplied runs 
+        of the current machine in chunked mode. The PQC and PQC-Hybrid results are parsed and averaged in chunks of 
+        signing algorithms, with the smaller classic and speed results being processed for each run as normal """
+
+    # Set the base-results files directories for the different test types
+    os.makedirs(dir_paths['pqc_base_results'], exist_ok=True)
+    os.makedirs(dir_paths['classic_handshake_results'], exist_ok=True)
+    os.makedirs(dir_paths['hybrid_base_results'], exist_ok=True)
+
+    # Process and average the PQC and PQC-Hybrid results in signing algorithm chunks
+    with profile_stage("oqs-provider", "chunked_pqc_processing", machine_num):
+        chunked_pqc_processing(dir_paths, runs, algs_dict, memory_limit_mb, oqs_provider_avg, up_index, max_write_workers)
+
+    # Loop through the runs and call the classic, latency, and speed result processing functions
+    for current_run in runs:
+        with profile_stage("oqs-provider", "classic_based_processing", machine_num):
+            classic_based_processing(current_run, dir_paths, algs_dict, up_index)
+        with profile_stage("oqs-provider", "latency_processing", machine_num):
+            latency_processing(current_run, dir_paths, algs_dict, up_index, max_write_workers)
+        with profile_stage("oqs-provider", "speed_processing", machine_num):
+            speed_processing(current_run, dir_paths)
+
+#-----------------------------------------------------------------------------------------------------------
+def get_speed_file_prefixes(dir_paths):
+    """ Helper function for getting the speed result filename prefix and 
+        up-results/results directories for each of the speed test types """
+
+    # Set the filename prefix for each of the speed test types
+    speed_file_prefixes = []
+    for test_type, dir_list in dir_paths['speed_types_dirs'].items():
+        pqc_fileprefix = "tls-speed" if test_type == "pqc" else "tls-speed-hybrid"
+        speed_file_prefixes.append((pqc_fileprefix, dir_list))
+
+    return speed_file_prefixes
+
+#-----------------------------------------------------------------------------------------------------------
+def get_run_files(dir_paths, current_run, algs_dict):
+    """ Helper function for getting the un-parsed input files and parsed output files
+        for the supplied run, which are tracked in the machine's parse manifest """
 
-    # Create an instance of the OQS-Provider average generator class before processing results
-    oqs_provider_avg = None
+    # Declare the input and output file lists
+    input_files = []
+    output_files = []
+
+    # Set the PQC and PQC-Hybrid handshake files for the run
+    for type_index in range (0,2):
+
+        # Set the up-results file for each sig/kem combination
+        for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+            for kem in algs_dict[pqc_type_vars["kem_alg_type"][type_index]]:
+                filename = f"tls-handshake-{current_run}-{sig}-{kem}.txt"
+                input_files.append(os.path.join(dir_paths[pqc_type_vars["up_results_type"][type_index]], filename))
+
+        # Set the base results file and the separated results file for each sig
+        base_out_filename = f"{pqc_type_vars['type_prefix'][type_index]}-base-results-run-{current_run}.csv"
+        output_files.append(os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], base_out_filename))
+
+        for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+            sig_path = os.path.join(dir_paths[pqc_type_vars["results_type"][type_index]], sig)
+            output_files.append(os.path.join(sig_path, f"tls-handshake-{sig}-run-{current_run}.csv"))
+
+    # Set the classic handshake files for the run
+    classic_up_results_dir = os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "classic")
+    for cipher in algs_dict['ciphers']:
+        for alg in algs_dict['classic_algs']:
+            input_files.append(os.path.join(classic_up_results_dir, f"tls-handshake-classic-{current_run}-{cipher}-{alg}.txt"))
+
+    output_files.append(os.path.join(dir_paths['classic_handshake_results'], f"classic-results-run-{current_run}.csv"))
+
+    # Set the speed files for the run
+    for pqc_fileprefix, dir_list in get_speed_file_prefixes(dir_paths):
+        for alg_type in ["kem", "sig"]:
+            input_files.append(os.path.join(dir_list[0], f"{pqc_fileprefix}-{alg_type}-{str(current_run)}.txt"))
+            output_files.append(os.path.join(dir_list[1], f"{pqc_fileprefix}-{alg_type}-{str(current_run)}.csv"))
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def get_avg_files(dir_paths, algs_dict):
+    """ Helper function for getting the average result files for the 
+        current machine, which are tracked in the machine's parse manifest """
+
+    # Set the average file for each PQC and PQC-Hybrid signing algorithm
+    avg_files = []
+    for type_index in range (0,2):
+        for sig in algs_dict[pqc_type_vars["sig_alg_type"][type_index]]:
+            sig_path = os.path.join(dir_paths[pqc_type_vars["results_type"][type_index]], sig)
+            avg_files.append(os.path.join(sig_path, f"tls-handshake-{sig}-avg.csv"))
+            avg_files.append(os.path.join(sig_path, f"tls-handshake-{sig}-stats.csv"))
+
+    # Set the classic and speed average files
+    avg_files.append(os.path.join(dir_paths['classic_handshake_results'], "classic-speed-avg.csv"))
+    avg_files.append(os.path.join(dir_paths['classic_handshake_results'], "classic-speed-stats.csv"))
+
+    for pqc_fileprefix, dir_list in get_speed_file_prefixes(dir_paths):
+        for alg_type in ["kem", "sig"]:
+            avg_files.append(os.path.join(dir_list[1], f"{pqc_fileprefix}-{alg_type}-avg.csv"))
+            avg_files.append(os.path.join(dir_list[1], f"{pqc_fileprefix}-{alg_type}-stats.csv"))
+
+    return avg_files
+
+#-----------------------------------------------------------------------------------------------------------
+def write_columnar_results(machine_num, dir_paths, runs):
+    """ Function for writing the parsed TLS handshake and speed results for the supplied runs into the 
+        OQS-Provider Parquet datasets. The rows are taken from the parsed csv files for each run, with the 
+        metric columns converted to numeric dtypes and the source up-result file recorded for each row """
+
+    # Set the handshake column order and metric columns, and the label columns used across the result families
+    handshake_cols = ["Test Type", "Signing Algorithm", "KEM Algorithm", "Ciphersuite", "Classic Algorithm"] + col_headers['pqc_based_headers'][2:] + ["Source File"]
+    handshake_count_cols = ["Connections in User Time", "Connections in Real Time"]
+    handshake_time_cols = ["User Time (s)", "Connections Per User Second", "Real Time (s)"]
+    label_cols = ["Test Type", "Algorithm Type", "Signing Algorithm", "KEM Algorithm", "Ciphersuite", "Classic Algorithm", "Algorithm"]
+    speed_metric_cols = sorted(set(speed_headers[0][1:] + speed_headers[1][1:]), key=(speed_headers[0] + speed_headers[1]).index)
+    classic_up_results_dir = os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "classic")
+    root_dir = dir_paths["root_dir"]
+
+    # Loop through the runs and write the handshake and speed partitions for each run
+    for current_run in runs:
+
+        # Load the PQC and PQC-Hybrid base handshake results for the run
+        handshake_dfs = []
+        for type_index in range (0,2):
+
+            base_filename = f"{pqc_type_vars['type_prefix'][type_index]}-base-results-run-{current_run}.csv"
+            handshake_df = pd.read_csv(os.path.join(dir_paths[pqc_type_vars["base_type"][type_index]], base_filename))
+            handshake_df.insert(0, "Test Type", pqc_type_vars['type_prefix'][type_index])
+
+            # Add the s_time output file for the sig/kem combination as the source for each row
+            up_results_dir = dir_paths[pqc_type_vars["up_results_type"][type_index]]
+            handshake_filepaths = [
+                os.path.join(up_results_dir, f"tls-handshake-{current_run}-{sig}-{kem}.txt")
+                for sig, kem in zip(handshake_df["Signing Algorithm"], handshake_df["KEM Algorithm"])
+            ]
+            handshake_dfs.append(columnar_output.add_provenance(handshake_df, root_dir, handshake_filepaths))
+
+        # Load the classic handshake results for the run and add the source for each row
+        handshake_df = pd.read_csv(os.path.join(dir_paths['classic_handshake_results'], f"classic-results-run-{current_run}.csv"))
+        handshake_df.insert(0, "Test Type", "classic")
+        handshake_filepaths = [
+            os.path.join(classic_up_results_dir, f"tls-handshake-classic-{current_run}-{cipher}-{alg}.txt")
+            for cipher, alg in zip(handshake_df["Ciphersuite"], handshake_df["Classic Algorithm"])
+        ]
+        handshake_dfs.append(columnar_output.add_provenance(handshake_df, root_dir, handshake_filepaths))
+
+        # Set the handshake column dtypes, storing the session reuse marker as a boolean, and write the handshake partition
+        handshake_df = pd.concat(handshake_dfs, ignore_index=True).reindex(columns=handshake_cols)
+        handshake_df["Reused Session ID"] = handshake_df["Reused Session ID"].eq("*")
+        handshake_df = columnar_output.set_string_columns(handshake_df, label_cols)
+        handshake_df = columnar_output.set_numeric_columns(handshake_df, handshake_count_cols, dtype="Int64")
+        handshake_df = columnar_output.set_numeric_columns(handshake_df, handshake_time_cols)
+        columnar_output.write_partition(root_dir, "tls_handshake", machine_num, current_run, handshake_df)
+
+        # Load the PQC and PQC-Hybrid speed results for the run
+        speed_dfs = []
+        for pqc_fileprefix, dir_list in get_speed_file_prefixes(dir_paths):
+            for alg_type in ["kem", "sig"]:
+
+                speed_df = pd.read_csv(os.path.join(dir_list[1], f"{pqc_fileprefix}-{alg_type}-{str(current_run)}.csv"))
+                speed_df.insert(0, "Algorithm Type", alg_type)
+                speed_df.insert(0, "Test Type", "pqc" if pqc_fileprefix == "tls-speed" else "hybrid")
+
+                # Add the s_speed output file as the source for each row
+                speed_filepath = os.path.join(dir_list[0], f"{pqc_fileprefix}-{alg_type}-{str(current_run)}.txt")
+                speed_dfs.append(columnar_output.add_provenance(speed_df, root_dir, [speed_filepath] * len(speed_df)))
+
+        # Set the speed column dtypes and write the speed partition for the run
+        speed_df = pd.concat(speed_dfs, ignore_index=True)
+        speed_df = columnar_output.set_string_columns(speed_df, label_cols)
+        speed_df = columnar_output.set_numeric_columns(speed_df, speed_metric_cols)
+        columnar_output.write_partition(root_dir, "tls_speed", machine_num, current_run, speed_df)
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_machine(machine_num, dir_paths, num_runs, algs_dict, columnar=False, chunk_memory_mb=None, write_workers=None):
+    """ Function for parsing the OQS-Provider TLS up-results for a single machine and 
+        calling the average calculation methods for the machine. Only the runs that are new 
+        or have changed since the last parse are processed, using the machine's parse manifest. 
+        If the columnar option is set, the parsed results are also written to the OQS-Provider Parquet datasets.
+        If a chunk memory limit (in MB) is set, the PQC and PQC-Hybrid results are parsed in signing algorithm chunks.
+        The write workers set the number of threads used to write the separated signing algorithm result files """
+
+    # Index the up-result files for the machine and check that the expected files are present for every run before parsing
+    with profile_stage("oqs-provider", "up_results_index", machine_num):
+        up_index = UpResultsIndex("oqs-provider", dir_paths["mach_up_results_dir"])
+        check_runs_complete(up_index, range(1, num_runs+1), lambda current_run: get_run_files(dir_paths, current_run, algs_dict)[0], machine_num)
+
+    # Load the parse manifest for the machine and check if the algorithm lists have changed, requiring a full re-parse
+    with profile_stage("oqs-provider", "manifest_check", machine_num):
+        manifest = ParseManifest(dir_paths["mach_results_dir"], dir_paths["root_dir"], up_index)
+        alg_lists_current = manifest.entry_is_current("alg-lists", dir_paths["alg_list_files"], [])
+
+        # Determine which of the runs are new or have changed since the last parse, including any handshake latency results
+        runs_to_parse = []
+        for current_run in range(1, num_runs+1):
+            input_files, output_files = get_run_files(dir_paths, current_run, algs_dict)
+            latency_inputs, latency_outputs = get_latency_run_files(dir_paths, current_run, algs_dict, up_index)
+            input_files, output_files = input_files + latency_inputs, output_files + latency_outputs
+            if not alg_lists_current or not manifest.entry_is_current(f"run-{current_run}", input_files, output_files):
+                runs_to_parse.append(current_run)
+
+    # Remove the parsed results for any previously parsed runs that are no longer present
+    stale_runs = manifest.remove_stale_runs(num_runs)
+    if stale_runs:
+        print(f"Removed parsed results for runs {stale_runs} which are no longer present")
+
+    # Create an instance of the OQS-Provider average generator class for the machine
     oqs_provider_avg = OqsProviderResultAverager(dir_paths, num_runs, algs_dict, pqc_type_vars, col_headers)
 
-    # Loop through the specified number of machines
-    for machine in range(1, num_machines+1):
-
-        # Set the machine's results directories paths in the central paths dictionary
-        dir_paths['mach_results_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine)}")
-        dir_paths['mach_up_results_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine)}")
-        dir_paths['mach_handshake_dir']  = os.path.join(dir_paths['results_dir'], f"machine-{str(machine)}", "handshake-results")
-        dir_paths['mach_up_speed_dir'] = os.path.join(dir_paths['up_results'], f"machine-{str(machine)}", "speed-results")
-        dir_paths['mach_speed_results_dir'] = os.path.join(dir_paths['results_dir'], f"machine-{str(machine)}", "speed-results")
-        dir_paths['speed_types_dirs'] = {
-            "pqc": [os.path.join(dir_paths['mach_up_speed_dir'], "pqc"), os.path.join(dir_paths['mach_speed_results_dir'])], 
-            "hybrid": [os.path.join(dir_paths['mach_up_speed_dir'], "hybrid"), os.path.join(dir_paths['mach_speed_results_dir'])],
-        }
-
-        # Set the pqc-var types dictionary so that both PQC and PQC-hybrid results can be processed
-        pqc_type_vars.update({
-           "up_results_path": [
-                os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "pqc"), 
-                os.path.join(dir_paths['mach_up_results_dir'], "handshake-results", "hybrid")
-            ], 
-        })
-
-        # Create the results directory for current machine and handle Machine-ID clashes
-        handle_results_dir_creation(machine)
-
-        # Call the processing function and the average calculation methods for the current machine
-        output_processing()
-        oqs_provider_avg.gen_pqc_avgs()
+    # Call the processing function for the new or changed runs of the current machine, using chunked mode if a chunk memory limit is set
+    print(f"Parsing {len(runs_to_parse)} new or changed runs, reusing {num_runs - len(runs_to_parse)} previously parsed runs")
+    if chunk_memory_mb is None:
+        output_processing(machine_num, dir_paths, runs_to_parse, algs_dict, up_index, write_workers)
+    else:
+        print(f"Parsing PQC and PQC-Hybrid results in signing algorithm chunks with a {chunk_memory_mb}MB memory limit")
+        chunked_output_processing(machine_num, dir_paths, runs_to_parse, algs_dict, chunk_memory_mb, oqs_provider_avg, up_index, write_workers)
+
+    # Record the parsed runs in the manifest
+    with profile_stage("oqs-provider", "manifest_record", machine_num):
+        manifest.record_entry("alg-lists", dir_paths["alg_list_files"], [])
+        for current_run in runs_to_parse:
+            input_files, output_files = get_run_files(dir_paths, current_run, algs_dict)
+            latency_inputs, latency_outputs = get_latency_run_files(dir_paths, current_run, algs_dict, up_index)
+            manifest.record_entry(f"run-{current_run}", input_files + latency_inputs, output_files + latency_outputs)
+        manifest.save()
+
+    # Call the average calculation methods, with the PQC and PQC-Hybrid averages already generated for each chunk in chunked mode
+    if chunk_memory_mb is None:
+        with profile_stage("oqs-provider", "gen_pqc_avgs", machine_num):
+            oqs_provider_avg.gen_pqc_avgs()
+    with profile_stage("oqs-provider", "gen_classic_avgs", machine_num):
         oqs_provider_avg.gen_classic_avgs()
+    with profile_stage("oqs-provider", "gen_latency_avgs", machine_num):
+        latency_avg_files = oqs_provider_avg.gen_latency_avgs()
+    with profile_stage("oqs-provider", "gen_speed_avgs", machine_num):
         oqs_provider_avg.gen_speed_avgs(speed_headers)
 
+    # Record the average and statistics result files in the manifest
+    manifest.record_entry("averages", [], get_avg_files(dir_paths, algs_dict) + latency_avg_files)
+    manifest.save()
+
+    # Write the Parquet partitions for the parsed runs and any previously parsed runs that have not been written yet
+    if columnar:
+        columnar_runs = [
+            current_run for current_run in range(1, num_runs+1)
+            if current_run in runs_to_parse
+            or not columnar_output.partition_exists(dir_paths["root_dir"], "tls_handshake", machine_num, current_run)
+            or not columnar_output.partition_exists(dir_paths["root_dir"], "tls_speed", machine_num, current_run)
+        ]
+        with profile_stage("oqs-provider", "columnar_output", machine_num):
+            write_columnar_results(machine_num, dir_paths, columnar_runs)
+
+        for family in ["tls_handshake", "tls_speed"]:
+            columnar_output.remove_stale_partitions(dir_paths["root_dir"], family, machine_num, num_runs)
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_machine_worker(machine_num, dir_paths, num_runs, algs_dict, columnar=False, chunk_memory_mb=None, write_workers=None, profile=False):
+    """ Worker function for parsing a single machine's results in a separate process. The console output 
+        is captured and returned along with any error so that it can be outputted by the main process once
+        the machine has been parsed. If profiling is enabled, the stage records for the machine are also returned. """
+
+    # Enable the stage profiling for the worker process if it is enabled in the main process
+    if profile:
+        parse_profiler.enable_profiling()
+
+    # Parse the machine's results while capturing the console output and any errors
+    output_buffer = io.StringIO()
+    error = None
+
+    with contextlib.redirect_stdout(output_buffer):
+        try:
+            parse_machine(machine_num, dir_paths, num_runs, algs_dict, columnar, chunk_memory_mb, write_workers)
+        except Exception:
+            error = traceback.format_exc()
+
+    return machine_num, output_buffer.getvalue(), error, parse_profiler.get_records()
+
+#-----------------------------------------------------------------------------------------------------------
+def process_tests(machine_runs, base_paths, algs_dict, max_workers, results_policy=None, columnar=False, chunk_memory_mb=None, write_workers=None):
+    """ Function for controlling the parsing scripts for the OQS-Provider TLS testing up-result files
+        and calling average calculation scripts. The machine_runs dictionary maps each Machine-ID to its
+        number of test runs. If more than one worker is requested, each machine is parsed in its own worker process. """
+
+    # Set the directory paths and create the results directory for each machine, handling any Machine-ID clashes
+    machine_paths = {}
+    for machine in machine_runs:
+        dir_paths = set_machine_paths(base_paths, machine)
+        if handle_results_dir_creation(machine, dir_paths, results_policy):
+            machine_paths[machine] = dir_paths
+
+    # Parse the machines one after another if only a single worker is being used
+    if max_workers <= 1 or len(machine_paths) <= 1:
+        for machine, dir_paths in machine_paths.items():
+            parse_machine(machine, dir_paths, machine_runs[machine], algs_dict, columnar, chunk_memory_mb, write_workers)
+        return
+
+    # Parse each machine in its own worker process
+    failed_machines = []
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(machine_paths))) as executor:
+
+        # Submit the parsing job for each machine
+        parse_jobs = [
+            executor.submit(parse_machine_worker, machine, dir_paths, machine_runs[machine], algs_dict, columnar, chunk_memory_mb, write_workers, parse_profiler.is_enabled())
+            for machine, dir_paths in machine_paths.items()
+        ]
+
+        # Output the console output and any errors for each machine in machine order
+        for parse_job in parse_jobs:
+            machine, output, error, profile_records = parse_job.result()
+            parse_profiler.add_records(profile_records)
+            print(output, end="")
+
+            if error is not None:
+                print(f"\n[ERROR] - OQS-Provider parsing failed for Machine-ID ({machine}):\n{error}")
+                failed_machines.append(machine)
+
+    # Exit if any of the machines failed to parse
+    if failed_machines:
+        print(f"[ERROR] - OQS-Provider results for Machine-IDs {failed_machines} could not be parsed")
+        sys.exit(1)
+
 #-----------------------------------------------------------------------------------------------------------
 def parse_oqs_provider(test_opts):
     """ Main function for controlling the parsing of the OQS-Provider TLS handshake and speed results. This function
         is called from the main parsing control script and will call the necessary functions to parse the results """
 
     # Get test options and set test parameter vars
-    global num_runs
-    num_machines = test_opts[0]
-    num_runs = test_opts[1]
+    machine_runs = test_opts["machine_runs"]
+    max_workers = test_opts["max_workers"]
+    results_policy = test_opts["results_policy"]
+    columnar = test_opts["columnar"]
+    chunk_memory_mb = test_opts["chunk_memory_mb"]
+    write_workers = test_opts["write_workers"]
 
     # Setup script environment
     print(f"\nPreparing to Parse OQS-Provider Results:\n")
-    setup_parse_env(test_opts[2])
+    base_paths, algs_dict = setup_parse_env(test_opts["root_dir"])
 
     # Process the OQS-Provider results
     print("Parsing results... ")
-    process_tests(num_machines, algs_dict)
\ No newline at end of file
+    process_tests(machine_runs, base_paths, algs_dict, max_workers, results_policy, columnar, chunk_memory_mb, write_workers)
\ No newline at end of file
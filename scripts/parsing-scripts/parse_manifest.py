@@ -0,0 +1,196 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Parse manifest module for the PQC benchmarking result parsers. Defines a class for recording the content hash,
+size, and modification time of every un-parsed input file and parsed output file for a machine's results. This
+allows the parsing scripts to determine which test runs are new or have changed since the last parse, so only
+those runs are re-parsed while the parsed CSV files for unchanged runs are reused when calculating the averages.
+This module is used internally by the Liboqs and OQS-Provider parsing scripts and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import json
+import hashlib
+
+# Declare the manifest filename and format version, where a change in version causes a full re-parse
+manifest_filename = "parse-manifest.json"
+manifest_version = 1
+
+#-----------------------------------------------------------------------------------------------------------
+def hash_file(filepath):
+    """ Helper function for calculating the SHA-256 hash of the supplied file, reading
+        the file in blocks so that large result files are not loaded into memory at once """
+
+    # Read the file in blocks and update the hash
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as hash_target:
+        for block in iter(lambda: hash_target.read(1024 * 1024), b""):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+#-----------------------------------------------------------------------------------------------------------
+class ParseManifest:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, results_dir, root_dir, up_index=None):
+        """ Class for tracking the input and output files for a machine's parsed results.
+            Files are grouped into named entries (such as a single test run), with each entry
+            holding the file records for its inputs and outputs. The file paths are stored relative
+            to the project root and the manifest is stored in the machine's results directory. If an
+            up-results index is supplied, the details of the un-parsed files are taken from the index. """
+
+        # Set the class variables and load any existing manifest for the machine
+        self.manifest_filepath = os.path.join(results_dir, manifest_filename)
+        self.root_dir = root_dir
+        self.up_index = up_index
+        self.entries = {}
+        self.load()
+
+    #------------------------------------------------------------------------------
+    def load(self):
+        """ Method for loading the existing manifest file if present. A missing, unreadable, or
+            outdated manifest is treated as empty, causing all of the results to be re-parsed """
+
+        # Return if no manifest has been created for the machine yet
+        if not os.path.isfile(self.manifest_filepath):
+            return
+
+        # Read in the manifest entries, ignoring the manifest if it can not be used
+        try:
+            with open(self.manifest_filepath, "r") as manifest_file:
+                manifest_data = json.load(manifest_file)
+
+            if manifest_data.get("version") == manifest_version:
+                self.entries = manifest_data["entries"]
+
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARNING] - Unable to read parse manifest {self.manifest_filepath}, all runs will be re-parsed: {e}")
+            self.entries = {}
+
+    #------------------------------------------------------------------------------
+    def save(self):
+        """ Method for writing the manifest to the machine's results directory. The manifest is written
+            to a temporary file first so an interrupted write can not leave a partial manifest behind """
+
+        # Write the manifest to the temporary file and replace the old manifest
+        temp_filepath = self.manifest_filepath + ".tmp"
+        with open(temp_filepath, "w") as manifest_file:
+            json.dump({"version": manifest_version, "entries": self.entries}, manifest_file, indent=1, sort_keys=True)
+
+        os.replace(temp_filepath, self.manifest_filepath)
+
+    #------------------------------------------------------------------------------
+    def get_file_record(self, filepath, old_record=None):
+        """ Method for creating the record for the supplied file, containing its hash, size and
+            modification time. If the size and modification time match the old record, the file is
+            assumed unchanged and the stored hash is reused. Returns None if the file is not present """
+
+        # Get the file details from the up-results index if it covers the file, returning None if the file is missing
+        if self.up_index is not None and self.up_index.covers(filepath):
+            file_stat = self.up_index.get_entry(filepath)
+            if file_stat is None:
+                return None
+            file_size, file_mtime_ns = file_stat.size, file_stat.mtime_ns
+
+        # Otherwise get the file details from the filesystem
+        else:
+            try:
+                file_stat = os.stat(filepath)
+            except FileNotFoundError:
+                return None
+            file_size, file_mtime_ns = file_stat.st_size, file_stat.st_mtime_ns
+
+        # Reuse the old record if the file has not been modified since it was recorded
+        if old_record is not None and old_record["mtime_ns"] == file_mtime_ns and old_record["size"] == file_size:
+            return old_record
+
+        return {"sha256": hash_file(filepath), "size": file_size, "mtime_ns": file_mtime_ns}
+
+    #------------------------------------------------------------------------------
+    def get_file_records(self, filepaths, old_records):
+        """ Method for creating the file records for the supplied list of files, keyed by the
+            file path relative to the project root """
+
+        # Create the record for each file, reusing the old record where the file is unchanged
+        file_records = {}
+        for filepath in filepaths:
+            rel_path = os.path.relpath(filepath, self.root_dir)
+            file_records[rel_path] = self.get_file_record(filepath, old_records.get(rel_path))
+
+        return file_records
+
+    #------------------------------------------------------------------------------
+    def entry_is_current(self, entry_name, input_files, output_files):
+        """ Method for checking if the supplied entry is unchanged since it was last recorded. The entry
+            is current if the same input files are present with the same content and all of its output files
+            are still present and unmodified. Records for files that have only been touched are refreshed """
+
+        # Return False if the entry has not been recorded before
+        entry = self.entries.get(entry_name)
+        if entry is None:
+            return False
+
+        # Compare the current input and output files against the recorded files
+        for file_type, filepaths in (("inputs", input_files), ("outputs", output_files)):
+
+            old_records = entry[file_type]
+            file_records = self.get_file_records(filepaths, old_records)
+
+            # Ensure the same set of files is being tracked for the entry
+            if file_records.keys() != old_records.keys():
+                return False
+
+            # Ensure the file contents are unchanged, with any missing outputs requiring the entry to be re-parsed
+            for rel_path, file_record in file_records.items():
+
+                old_record = old_records[rel_path]
+
+                if file_record is None or old_record is None:
+                    if file_record is not old_record or file_type == "outputs":
+                        return False
+
+                elif file_record["sha256"] != old_record["sha256"]:
+                    return False
+
+            # Store the refreshed records so touched but unchanged files are not hashed again
+            entry[file_type] = file_records
+
+        return True
+
+    #------------------------------------------------------------------------------
+    def record_entry(self, entry_name, input_files, output_files):
+        """ Method for recording the current state of the input and output files for the supplied entry """
+
+        # Get the old entry records so unchanged files do not need to be hashed again
+        old_entry = self.entries.get(entry_name, {"inputs": {}, "outputs": {}})
+
+        # Create the file records for the entry
+        self.entries[entry_name] = {
+            "inputs": self.get_file_records(input_files, old_entry["inputs"]),
+            "outputs": self.get_file_records(output_files, old_entry["outputs"])
+        }
+
+    #------------------------------------------------------------------------------
+    def remove_stale_runs(self, num_runs):
+        """ Method for removing the entries and parsed output files for any runs recorded in the
+            manifest that are above the current number of runs. Returns the removed run numbers """
+
+        # Get the recorded run entries that are above the current number of runs
+        stale_runs = []
+        for entry_name in list(self.entries):
+            if entry_name.startswith("run-") and int(entry_name[4:]) > num_runs:
+                stale_runs.append(int(entry_name[4:]))
+
+        # Remove the parsed output files and manifest entry for each of the stale runs
+        for run_num in sorted(stale_runs):
+            for rel_path in self.entries[f"run-{run_num}"]["outputs"]:
+                output_filepath = os.path.join(self.root_dir, rel_path)
+                if os.path.isfile(output_filepath):
+                    os.remove(output_filepath)
+
+            del self.entries[f"run-{run_num}"]
+
+        return sorted(stale_runs)
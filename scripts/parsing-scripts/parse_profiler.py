@@ -0,0 +1,300 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Parse profiler module for the PQC benchmarking result parsers. Provides the stage hooks used by the Liboqs and
+OQS-Provider parsing scripts to record the wall time, CPU time, files read, bytes read, and peak memory of each
+parsing stage for each machine when the --profile option is passed to parse_results.py. The recorded stages can be
+written to a Chrome trace file (viewable in chrome://tracing or Perfetto) and summarised at the end of parsing.
+When profiling is not enabled, the stage hooks return a shared no-op context and no file access tracking is installed,
+so normal parsing runs are unaffected. This module is used internally by the parsing scripts and is not intended to
+be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import builtins
+import threading
+import contextlib
+
+# Import the resource module used for the peak memory fallback, which is not available on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Declare the profiler state, which is only used once profiling has been enabled
+profiling_enabled = False
+stage_records = []
+file_counters = {"files_read": 0, "bytes_read": 0}
+counter_lock = threading.Lock()
+original_open = builtins.open
+null_stage = contextlib.nullcontext()
+
+# Declare the highest peak RSS in MB seen before the peak was reset within the current stage
+reset_peak_rss_mb = None
+
+#-----------------------------------------------------------------------------------------------------------
+def counting_open(file, mode="r", *args, **kwargs):
+    """ Replacement for the built-in open function used while profiling, which counts the files
+        opened for reading and their sizes before opening the file as normal """
+
+    # Open the file with the original open function
+    file_obj = original_open(file, mode, *args, **kwargs)
+
+    # Count the file and its size if it has been opened for reading only
+    if "r" in mode and "+" not in mode and not isinstance(file, int):
+        try:
+            file_size = os.fstat(file_obj.fileno()).st_size
+        except (OSError, AttributeError, ValueError):
+            file_size = 0
+
+        with counter_lock:
+            file_counters["files_read"] += 1
+            file_counters["bytes_read"] += file_size
+
+    return file_obj
+
+#-----------------------------------------------------------------------------------------------------------
+def enable_profiling():
+    """ Function for enabling the stage profiling for the current process, clearing any previous
+        stage records and installing the file access tracking """
+
+    global profiling_enabled
+
+    # Reset the stage records and counters and install the counting open function
+    stage_records.clear()
+    file_counters["files_read"] = 0
+    file_counters["bytes_read"] = 0
+    builtins.open = counting_open
+    profiling_enabled = True
+
+#-----------------------------------------------------------------------------------------------------------
+def disable_profiling():
+    """ Function for disabling the stage profiling and restoring the original open function """
+
+    global profiling_enabled
+
+    builtins.open = original_open
+    profiling_enabled = False
+
+#-----------------------------------------------------------------------------------------------------------
+def is_enabled():
+    """ Helper function for checking if the stage profiling is enabled for the current process """
+
+    return profiling_enabled
+
+#-----------------------------------------------------------------------------------------------------------
+def reset_peak_rss():
+    """ Helper function for resetting the peak RSS of the current process so the peak for a single stage or chunk can
+        be measured. The peak before the reset is kept so that a stage which resets the peak part way through still records
+        its full peak. This is only supported on Linux, returning False if the peak could not be reset """
+
+    global reset_peak_rss_mb
+
+    # Store the current peak RSS before it is reset
+    peak_rss = get_peak_rss_mb()
+    if peak_rss is not None:
+        reset_peak_rss_mb = max(reset_peak_rss_mb or 0, peak_rss)
+
+    # Reset the peak RSS using the clear_refs file
+    try:
+        with original_open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+#-----------------------------------------------------------------------------------------------------------
+def get_peak_rss_mb():
+    """ Helper function for getting the peak RSS of the current process in MB. The VmHWM value is used on
+        Linux, falling back to the resource module, and None is returned if neither is available """
+
+    # Read the peak RSS from the process status file on Linux
+    try:
+        with original_open("/proc/self/status", "r") as status_file:
+            for line in status_file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    # Use the resource module peak RSS, which is reported in bytes on macOS and in KB on Linux
+    if resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+    return None
+
+#-----------------------------------------------------------------------------------------------------------
+def get_current_rss_mb():
+    """ Helper function for getting the current RSS of the process in MB from the process status file.
+        This is only supported on Linux, returning None if the current RSS could not be read """
+
+    # Read the current RSS from the process status file
+    try:
+        with original_open("/proc/self/status", "r") as status_file:
+            for line in status_file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    return None
+
+#-----------------------------------------------------------------------------------------------------------
+class StageProfile:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, tool_name, stage_name, machine_num):
+        """ Class for recording the performance of a single parsing stage for a machine. Used as a
+            context manager around the stage, with the stage record being stored when the stage exits. """
+
+        # Set the stage details
+        self.tool_name = tool_name
+        self.stage_name = stage_name
+        self.machine_num = machine_num
+
+    #------------------------------------------------------------------------------
+    def __enter__(self):
+        """ Method for storing the starting values of the stage measurements """
+
+        global reset_peak_rss_mb
+
+        # Reset the peak RSS, clearing the peak kept from before the reset, and store the starting times and file counters
+        self.peak_reset = reset_peak_rss()
+        reset_peak_rss_mb = None
+        self.start_timestamp_us = time.time_ns() // 1000
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+
+        with counter_lock:
+            self.start_counters = dict(file_counters)
+
+        return self
+
+    #------------------------------------------------------------------------------
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """ Method for calculating the stage measurements and storing the stage record """
+
+        # Calculate the elapsed times and the files read during the stage
+        wall_time = time.perf_counter() - self.start_wall
+        cpu_time = time.process_time() - self.start_cpu
+
+        with counter_lock:
+            files_read = file_counters["files_read"] - self.start_counters["files_read"]
+            bytes_read = file_counters["bytes_read"] - self.start_counters["bytes_read"]
+
+        # Get the peak RSS for the stage, including any peak from before the peak was reset within the stage
+        peak_rss = get_peak_rss_mb()
+        if peak_rss is not None and reset_peak_rss_mb is not None:
+            peak_rss = max(peak_rss, reset_peak_rss_mb)
+
+        # Store the stage record, noting if the peak memory is the process peak rather than the stage peak
+        stage_records.append({
+            "tool": self.tool_name,
+            "stage": self.stage_name,
+            "machine": self.machine_num,
+            "pid": os.getpid(),
+            "start_us": self.start_timestamp_us,
+            "wall_s": wall_time,
+            "cpu_s": cpu_time,
+            "files_read": files_read,
+            "bytes_read": bytes_read,
+            "peak_rss_mb": peak_rss,
+            "peak_is_stage": self.peak_reset,
+            "failed": exc_type is not None
+        })
+
+        return False
+
+#-----------------------------------------------------------------------------------------------------------
+def profile_stage(tool_name, stage_name, machine_num):
+    """ Function for getting the context manager used to profile a parsing stage. If profiling is not
+        enabled, a shared no-op context is returned so the stage runs without any profiling overhead """
+
+    # Return the no-op context if profiling is not enabled
+    if not profiling_enabled:
+        return null_stage
+
+    return StageProfile(tool_name, stage_name, machine_num)
+
+#-----------------------------------------------------------------------------------------------------------
+def get_records():
+    """ Helper function for getting a copy of the stage records for the current process, used to
+        return the records from the parsing worker processes to the main process """
+
+    return list(stage_records)
+
+#-----------------------------------------------------------------------------------------------------------
+def add_records(records):
+    """ Helper function for adding the stage records returned from a parsing worker process """
+
+    stage_records.extend(records)
+
+#-----------------------------------------------------------------------------------------------------------
+def write_trace(trace_filepath):
+    """ Function for writing the stage records to a Chrome trace event file. Each machine is shown as its own
+        thread within the process that parsed it, and the stage measurements are included as event arguments. """
+
+    # Create the complete event for each of the stage records
+    trace_events = []
+    for record in stage_records:
+        trace_events.append({
+            "name": record["stage"],
+            "cat": record["tool"],
+            "ph": "X",
+            "ts": record["start_us"],
+            "dur": int(record["wall_s"] * 1000000),
+            "pid": record["pid"],
+            "tid": f"{record['tool']} machine-{record['machine']}",
+            "args": {key: record[key] for key in ["machine", "cpu_s", "files_read", "bytes_read", "peak_rss_mb", "peak_is_stage", "failed"]}
+        })
+
+    # Write out the trace file, including the raw stage records for further analysis
+    os.makedirs(os.path.dirname(trace_filepath), exist_ok=True)
+    with original_open(trace_filepath, "w") as trace_file:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms", "stageRecords": stage_records}, trace_file, indent=1)
+
+#-----------------------------------------------------------------------------------------------------------
+def print_summary(top_n=10):
+    """ Function for outputting a summary of the top stages by total wall time, with each stage being
+        combined across all of its calls for a machine """
+
+    # Return if no stages have been recorded
+    if not stage_records:
+        print("No parsing stages were profiled")
+        return
+
+    # Combine the stage records for each tool, stage and machine
+    stage_totals = {}
+    for record in stage_records:
+
+        stage_key = (record["tool"], record["stage"], record["machine"])
+        totals = stage_totals.setdefault(stage_key, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "files_read": 0, "bytes_read": 0, "peak_rss_mb": None})
+
+        totals["calls"] += 1
+        for metric in ["wall_s", "cpu_s", "files_read", "bytes_read"]:
+            totals[metric] += record[metric]
+
+        if record["peak_rss_mb"] is not None:
+            totals["peak_rss_mb"] = max(totals["peak_rss_mb"] or 0, record["peak_rss_mb"])
+
+    # Sort the stages by their total wall time and get the overall profiled wall time
+    sorted_stages = sorted(stage_totals.items(), key=lambda stage: stage[1]["wall_s"], reverse=True)
+    total_wall = sum(totals["wall_s"] for totals in stage_totals.values())
+
+    # Output the summary table for the top stages
+    print(f"\nParsing profile - top {min(top_n, len(sorted_stages))} of {len(sorted_stages)} stages by wall time:\n")
+    print(f"{'Tool':<14}{'Stage':<28}{'Machine':>8}{'Calls':>7}{'Wall (s)':>10}{'%':>7}{'CPU (s)':>10}{'Files':>8}{'MB read':>10}{'Peak MB':>9}")
+
+    for (tool_name, stage_name, machine_num), totals in sorted_stages[:top_n]:
+        wall_percent = totals["wall_s"] / total_wall * 100 if total_wall > 0 else 0
+        peak_rss = f"{totals['peak_rss_mb']:.1f}" if totals["peak_rss_mb"] is not None else "n/a"
+        print(
+            f"{tool_name:<14}{stage_name:<28}{machine_num:>8}{totals['calls']:>7}{totals['wall_s']:>10.3f}{wall_percent:>6.1f}%"
+            f"{totals['cpu_s']:>10.3f}{totals['files_read']:>8}{totals['bytes_read'] / (1024 * 1024):>10.2f}{peak_rss:>9}"
+        )
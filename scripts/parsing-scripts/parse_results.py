@@ -7,14 +7,126 @@ It allows the user to select whether to parse Liboqs, OQS-Provider, or both resu
 collects the test parameters (e.g., number of machines and runs) used during benchmarking. The script then 
 invokes the appropriate parsing modules and outputs cleaned, formatted CSV files to the results directory 
 at the project root.
+
+Passing the --batch flag runs the script without any user interaction, automatically discovering the Machine-IDs
+and test runs present in the test-data/up-results directory and parsing everything that is found.
+
+Accepted arguments:
+    --batch                                         Parse all discovered results without prompting the user
+    --tool=<liboqs|oqs-provider|all>                Set which results are parsed in batch mode (default all)
+    --on-existing=<overwrite|skip|update|version>   Set how previously parsed results are handled (default: prompt, or update in batch mode)
+    --parallel                                      Parse each machine's results in its own worker process
+    --workers=<num>                                 Set the maximum number of parsing worker processes (implies --parallel)
+    --write-workers=<num>                           Set the number of threads writing the OQS-Provider signing algorithm results (default 1)
+    --chunked                                       Parse the OQS-Provider results in signing algorithm chunks to limit memory use
+    --chunk-memory=<MB>                             Set the memory limit for each chunk in chunked mode (default 256, implies --chunked)
+    --drop-noisy-runs                               Leave the Liboqs speed runs marked as noisy out of the speed averages
+    --parquet                                       Also write the parsed results as partitioned Parquet datasets (requires pyarrow)
+    --profile[=<path>]                              Profile each parsing stage and write a Chrome trace file (default test-data/profiles)
+    --profile-top=<num>                             Set the number of stages shown in the profile summary (default 10)
+    --compare                                       Compare the averaged results across all parsed machines
+    --baseline=<id>                                 Set the baseline Machine-ID for the comparison (default lowest Machine-ID)
+    --sqlite[=<path>]                               Ingest the parsed results into the SQLite results store (default test-data/pqc-results.db)
+    --campaign=<name>                               Set the campaign name the results are stored under (default: default)
 """
 
 #-----------------------------------------------------------------------------------------------------------
 from liboqs_parse import parse_liboqs
 from oqs_provider_parse import parse_oqs_provider
+from columnar_output import pyarrow_available
+from datetime import datetime
+import parse_profiler
+import results_comparison
+import results_store
+import argparse
 import os
+import re
 import sys
 
+# Declare the up-result directory and the file used to identify each test run for the supported tools
+run_marker_files = {
+    "liboqs": ("raw-speed-results", re.compile(r"^test-kem-speed-(\d+)\.csv$")),
+    "oqs-provider": (os.path.join("speed-results", "pqc"), re.compile(r"^tls-speed-kem-(\d+)\.txt$"))
+}
+
+# Declare the default memory limit in MB used to size the signing algorithm chunks in chunked mode
+default_chunk_memory_mb = 256
+
+#-----------------------------------------------------------------------------------------------------------
+def positive_int(value):
+    """ Helper function for validating that an argument value is an integer above 0 """
+
+    # Ensure the value is a valid integer above 0
+    try:
+        int_value = int(value)
+        if int_value < 1:
+            raise ValueError()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid value: {value}, must be an integer above 0")
+
+    return int_value
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_args():
+    """ Function for parsing the command line arguments passed to the script. The function returns the 
+        parsed arguments, with the number of worker processes set to use when parsing the machine results, 
+        where a single worker means the machines are parsed one after another. """
+
+    # Define the accepted script arguments
+    parser = argparse.ArgumentParser(
+        prog="parse_results.py",
+        description="Parse the Liboqs and OQS-Provider up-results into structured CSV files"
+    )
+    parser.add_argument("--batch", action="store_true", help="Parse all discovered results without prompting the user")
+    parser.add_argument("--tool", choices=["liboqs", "oqs-provider", "all"], default="all", help="Set which results are parsed in batch mode (default all)")
+    parser.add_argument("--on-existing", choices=["overwrite", "skip", "update", "version"], default=None, dest="results_policy",
+        help="Set how previously parsed results are handled (default: prompt, or update in batch mode)")
+    parser.add_argument("--parallel", action="store_true", help="Parse each machine's results in its own worker process")
+    parser.add_argument("--workers", type=positive_int, default=None, help="Set the maximum number of parsing worker processes (implies --parallel)")
+    parser.add_argument("--write-workers", type=positive_int, default=1,
+        help="Set the number of threads writing the OQS-Provider signing algorithm results (default 1)")
+    parser.add_argument("--chunked", action="store_true", help="Parse the OQS-Provider results one chunk of signing algorithms at a time to limit memory use")
+    parser.add_argument("--chunk-memory", type=positive_int, default=None, metavar="MB",
+        help="Set the memory limit in MB for each chunk in chunked mode, measured from the process RSS (default 256, implies --chunked)")
+    parser.add_argument("--drop-noisy-runs", action="store_true", help="Leave Liboqs speed runs started on a busy system out of the speed averages")
+    parser.add_argument("--parquet", action="store_true", help="Also write the parsed results as partitioned Parquet datasets (requires pyarrow)")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="PATH",
+        help="Profile each parsing stage and write a Chrome trace file (default test-data/profiles/parse-profile-<time>.json)")
+    parser.add_argument("--profile-top", type=positive_int, default=10, help="Set the number of stages shown in the profile summary (default 10)")
+    parser.add_argument("--compare", action="store_true", help="Compare the averaged results across all parsed machines")
+    parser.add_argument("--baseline", type=positive_int, default=None, help="Set the baseline Machine-ID for the comparison (default lowest Machine-ID)")
+    parser.add_argument("--sqlite", nargs="?", const="", default=None, metavar="PATH",
+        help="Ingest the parsed results into the SQLite results store (default test-data/pqc-results.db)")
+    parser.add_argument("--campaign", default="default", help="Set the campaign name the results are stored under (default: default)")
+    args = parser.parse_args()
+
+    # Ensure the pyarrow package is installed if the Parquet output has been requested
+    if args.parquet and not pyarrow_available():
+        print("[ERROR] - The --parquet option requires the pyarrow package, please install it using: pip install pyarrow")
+        sys.exit(1)
+
+    # Set the number of parsing workers, using up to one worker per available CPU core if no worker count has been set
+    if args.workers is not None:
+        args.max_workers = args.workers
+    elif args.parallel:
+        args.max_workers = os.cpu_count() or 1
+    else:
+        args.max_workers = 1
+
+    # Set the chunk memory limit if chunked mode has been requested, leaving it unset when parsing normally
+    if args.chunk_memory is not None:
+        args.chunk_memory_mb = args.chunk_memory
+    elif args.chunked:
+        args.chunk_memory_mb = default_chunk_memory_mb
+    else:
+        args.chunk_memory_mb = None
+
+    # Update previously parsed results in batch mode so no user interaction is needed and only new or changed runs are parsed
+    if args.batch and args.results_policy is None:
+        args.results_policy = "update"
+
+    return args
+
 #-----------------------------------------------------------------------------------------------------------
 def setup_base_env():
     """ Function for setting up the global environment variables for the test suite. The function establishes
@@ -43,9 +155,9 @@ def setup_base_env():
             sys.exit(1)
 
 #-----------------------------------------------------------------------------------------------------------
-def get_test_opts(root_dir):
+def get_test_opts(root_dir, args):
     """ Helper function for getting the test parameters used in during the automated testing, which includes 
-        the number of runs and number of machines tested. """
+        the number of runs and number of machines tested. The parsing options are added to the test options. """
 
     # Get the total number of machines tested from the user
     while True:
@@ -63,19 +175,196 @@ def get_test_opts(root_dir):
         except ValueError:
             print("Invalid Input - Please enter a number!")
     
-    test_opts = [machine_num, total_runs, root_dir]
+    # Set the test options, with each machine using the same number of test runs
+    machine_runs = {machine: total_runs for machine in range(1, machine_num+1)}
+    test_opts = {
+        "machine_runs": machine_runs,
+        "root_dir": root_dir,
+        "max_workers": args.max_workers,
+        "results_policy": args.results_policy,
+        "columnar": args.parquet,
+        "chunk_memory_mb": args.chunk_memory_mb,
+        "write_workers": args.write_workers,
+        "drop_noisy_runs": args.drop_noisy_runs
+    }
+
     return test_opts
 
+#-----------------------------------------------------------------------------------------------------------
+def discover_machine_runs(root_dir, tool_name):
+    """ Function for discovering the Machine-IDs and test runs present in the up-results directory for the 
+        supplied tool. Returns a dictionary mapping each Machine-ID to its number of test runs, where the runs 
+        must be numbered consecutively from 1. Machines without a first run are skipped. """
+
+    # Set the tool up-results directory and the run marker file details
+    up_results_dir = os.path.join(root_dir, "test-data", "up-results", tool_name)
+    run_subdir, run_pattern = run_marker_files[tool_name]
+    machine_runs = {}
+
+    # Return an empty dictionary if there are no up-results for the tool
+    if not os.path.isdir(up_results_dir):
+        return machine_runs
+
+    # Get the Machine-IDs from the machine directories present in the up-results directory
+    machine_nums = []
+    for dir_name in os.listdir(up_results_dir):
+        machine_match = re.fullmatch(r"machine-(\d+)", dir_name)
+        if machine_match and os.path.isdir(os.path.join(up_results_dir, dir_name)):
+            machine_nums.append(int(machine_match.group(1)))
+
+    # Loop through the machines and determine the test runs present
+    for machine_num in sorted(machine_nums):
+
+        # Get the run numbers from the run marker files for the machine
+        run_dir = os.path.join(up_results_dir, f"machine-{machine_num}", run_subdir)
+        run_nums = set()
+
+        if os.path.isdir(run_dir):
+            for filename in os.listdir(run_dir):
+                run_match = run_pattern.match(filename)
+                if run_match:
+                    run_nums.add(int(run_match.group(1)))
+
+        # Count the consecutive runs from the first run
+        num_runs = 0
+        while num_runs + 1 in run_nums:
+            num_runs += 1
+
+        # Skip the machine if there are no usable runs and warn if any runs are being ignored
+        if num_runs == 0:
+            print(f"[WARNING] - No test runs found for {tool_name} Machine-ID ({machine_num}), skipping machine")
+            continue
+
+        if len(run_nums) > num_runs:
+            ignored_runs = sorted(run_num for run_num in run_nums if run_num > num_runs)
+            print(f"[WARNING] - Runs {ignored_runs} for {tool_name} Machine-ID ({machine_num}) are not consecutive and will be ignored")
+
+        machine_runs[machine_num] = num_runs
+
+    return machine_runs
+
+#-----------------------------------------------------------------------------------------------------------
+def batch_parse(root_dir, args):
+    """ Function for parsing all of the discovered results without any user interaction. The Machine-IDs
+        and test runs for each selected tool are discovered from the up-results directory before the 
+        relevant parsing script is called. """
+
+    # Set the tools to be parsed and their parsing functions
+    parse_functions = {"liboqs": parse_liboqs, "oqs-provider": parse_oqs_provider}
+    tool_names = list(parse_functions) if args.tool == "all" else [args.tool]
+    tools_parsed = 0
+
+    # Loop through the selected tools, discovering and parsing their results
+    for tool_name in tool_names:
+
+        # Discover the machines and runs present for the current tool
+        machine_runs = discover_machine_runs(root_dir, tool_name)
+
+        if not machine_runs:
+            print(f"No {tool_name} up-results found, skipping {tool_name} parsing")
+            continue
+
+        # Output the discovered machines and runs
+        print(f"Discovered {tool_name} results:")
+        for machine_num, num_runs in machine_runs.items():
+            print(f"  Machine-ID ({machine_num}) - {num_runs} runs")
+
+        # Set the test options and call the parsing script for the current tool
+        test_opts = {
+            "machine_runs": machine_runs,
+            "root_dir": root_dir,
+            "max_workers": args.max_workers,
+            "results_policy": args.results_policy,
+            "columnar": args.parquet,
+            "chunk_memory_mb": args.chunk_memory_mb,
+            "write_workers": args.write_workers,
+            "drop_noisy_runs": args.drop_noisy_runs
+        }
+        parse_functions[tool_name](test_opts)
+        print(f"\n{tool_name} parsing complete\n")
+        tools_parsed += 1
+
+    # Exit with an error if no results were found to parse
+    if tools_parsed == 0:
+        print("[ERROR] - No up-results were found to parse in the test-data/up-results directory")
+        sys.exit(1)
+
+#-----------------------------------------------------------------------------------------------------------
+def output_profile(root_dir, args):
+    """ Function for writing the parsing stage profile to the Chrome trace file and outputting the
+        summary of the slowest stages once parsing is complete """
+
+    # Set the trace file path, using a timestamped file in the profiles directory if no path was given
+    if args.profile:
+        trace_filepath = os.path.abspath(args.profile)
+    else:
+        trace_filename = f"parse-profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        trace_filepath = os.path.join(root_dir, "test-data", "profiles", trace_filename)
+
+    # Output the profile summary and write the trace file
+    parse_profiler.print_summary(args.profile_top)
+    parse_profiler.write_trace(trace_filepath)
+    print(f"\nParsing profile trace written to {trace_filepath}")
+
+#-----------------------------------------------------------------------------------------------------------
+def compare_results(root_dir, args):
+    """ Function for comparing the averaged results across all of the parsed machines once parsing is complete """
+
+    # Compare the parsed machines and output where the comparison tables can be found
+    print(f"\nComparing averaged results across the parsed machines")
+    results_dir = os.path.join(root_dir, "test-data", "results")
+
+    if results_comparison.compare_machines(results_dir, args.baseline):
+        print(f"Comparison tables can be found in the {os.path.join(results_dir, 'comparison')} directory")
+
+#-----------------------------------------------------------------------------------------------------------
+def store_results(root_dir, args):
+    """ Function for ingesting the parsed results into the SQLite results store under the selected campaign
+        once parsing is complete """
+
+    # Set the results store database path, using the default path in the test-data directory if no path was given
+    db_path = os.path.abspath(args.sqlite) if args.sqlite else results_store.get_default_db_path(root_dir)
+    results_dir = os.path.join(root_dir, "test-data", "results")
+
+    # Ingest the parsed results and output the number of rows stored in each table
+    print(f"\nIngesting parsed results into the results store under the campaign '{args.campaign}'")
+    row_counts = results_store.ingest_results(db_path, results_dir, args.campaign)
+
+    for table_name, row_count in row_counts.items():
+        print(f"  {table_name} - {row_count} rows")
+
+    print(f"Results store updated at {db_path}")
+
 #-----------------------------------------------------------------------------------------------------------
 def main():
     """Main function which controls the parsing scripts for Liboqs and OQS-Provider testing results"""
 
-    # Setup the base environment for the script
+    # Parse the command line arguments and setup the base environment for the script
+    args = parse_args()
     root_dir = setup_base_env()
 
+    # Enable the parsing stage profiling if requested
+    if args.profile is not None:
+        parse_profiler.enable_profiling()
+
     # Output the greeting message to the terminal
     print(f"PQC-Evaluation-Tools Results Parsing Tool\n\n")
 
+    # Parse all discovered results without user interaction if batch mode is selected
+    if args.batch:
+        batch_parse(root_dir, args)
+        print(f"\nResults processing complete, parsed results can be found in the results folder at the repo root")
+
+        if args.compare:
+            compare_results(root_dir, args)
+
+        if args.sqlite is not None:
+            store_results(root_dir, args)
+
+        if args.profile is not None:
+            output_profile(root_dir, args)
+        return
+
     # Get the parsing mode from the user
     while True:
 
@@ -96,7 +385,7 @@ def main():
 
             # Get the test options used for the benchmarking
             print(f"Setting total liboqs machine results\n")
-            liboqs_test_opts = get_test_opts(root_dir)
+            liboqs_test_opts = get_test_opts(root_dir, args)
 
             # Call the parsing script for Liboqs results
             parse_liboqs(liboqs_test_opts)
@@ -109,7 +398,7 @@ def main():
 
             # Get the test options used for the benchmarking
             print(f"Setting total OQS-Provider machine results\n")
-            oqs_provider_test_opts = get_test_opts(root_dir)
+            oqs_provider_test_opts = get_test_opts(root_dir, args)
 
             # Call the parsing script for OQS-Provider TLS results
             parse_oqs_provider(oqs_provider_test_opts)
@@ -122,10 +411,10 @@ def main():
 
             # Get the test options used for the benchmarking
             print(f"Setting total Liboqs machine results\n")
-            liboqs_test_opts = get_test_opts(root_dir)
+            liboqs_test_opts = get_test_opts(root_dir, args)
 
             print(f"\nSetting total OQS-Provider machine results\n")
-            oqs_provider_test_opts = get_test_opts(root_dir)
+            oqs_provider_test_opts = get_test_opts(root_dir, args)
             
             # Parse the Liboqs results
             parse_liboqs(liboqs_test_opts)
@@ -137,8 +426,10 @@ def main():
             break
 
         elif user_parse_mode == '4':
+
+            # Exit without running the post-parsing steps, as no results have been parsed
             print("Exiting...")
-            break
+            return
 
         else:
             print("Invalid option, please select a valid option value (1-4)")
@@ -146,6 +437,18 @@ def main():
     # Output the parsing completed message to the terminal
     print(f"\nResults processing complete, parsed results can be found in the results folder at the repo root")
 
+    # Compare the averaged results across the parsed machines if enabled
+    if args.compare:
+        compare_results(root_dir, args)
+
+    # Ingest the parsed results into the results store if enabled
+    if args.sqlite is not None:
+        store_results(root_dir, args)
+
+    # Output the parsing stage profile if enabled
+    if args.profile is not None:
+        output_profile(root_dir, args)
+
 #------------------------------------------------------------------------------
 """Main boiler plate"""
 if __name__ == "__main__":
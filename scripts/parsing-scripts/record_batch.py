@@ -0,0 +1,62 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Record batch module for the PQC benchmarking result parsers. Defines a row builder that collects parsed
+result rows into per-column buffers and creates the output dataframe in a single step once all rows have been
+gathered. This avoids growing a dataframe one row at a time, where every append copies the full frame. This module
+is used internally by the Liboqs and OQS-Provider parsing scripts and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import pandas as pd
+
+#-----------------------------------------------------------------------------------------------------------
+class RecordBatchBuilder:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, columns):
+        """ Class for building a result dataframe from individual parsed rows. Each row is
+            split into the column buffers as it is appended, keeping the values in their parsed
+            types, and the dataframe is created once when the batch is complete. """
+
+        # Set the column headers and create an empty buffer for each column
+        self.columns = list(columns)
+        self.buffers = [[] for _ in self.columns]
+
+    #------------------------------------------------------------------------------
+    def __len__(self):
+        """ Method for returning the number of rows currently held in the batch """
+
+        return len(self.buffers[0]) if self.buffers else 0
+
+    #------------------------------------------------------------------------------
+    def append(self, row):
+        """ Method for appending a single row to the batch. The row values must be
+            supplied in the same order as the column headers """
+
+        # Ensure the row matches the column headers before adding it to the buffers
+        if len(row) != len(self.columns):
+            raise ValueError(f"{len(self.columns)} columns passed, passed row had {len(row)} columns")
+
+        # Add each row value to its column buffer
+        for buffer, value in zip(self.buffers, row):
+            buffer.append(value)
+
+    #------------------------------------------------------------------------------
+    def extend(self, rows):
+        """ Method for appending multiple rows to the batch """
+
+        # Append each of the passed rows
+        for row in rows:
+            self.append(row)
+
+    #------------------------------------------------------------------------------
+    def to_dataframe(self):
+        """ Method for creating the dataframe from the column buffers in a single step """
+
+        # Create the dataframe from the column buffers by position so the column header order is kept
+        batch_df = pd.DataFrame(dict(enumerate(self.buffers)))
+        batch_df.columns = self.columns
+
+        return batch_df
@@ -5,22 +5,26 @@ SPDX-License-Identifier: MIT
 Result averaging module for PQC benchmarking tools. Defines classes for calculating average metrics 
 from multi-run benchmarking outputs  produced by the Liboqs and OQS-Provider test suites. This module is 
 used internally by the main parsing scripts and is not intended to be run standalone. It computes per-algorithm averages 
-for memory, CPU speed, and TLS handshake results, and exports the aggregated values in structured CSV format.
+for memory, CPU speed, and TLS handshake results, and exports the aggregated values in structured CSV format. 
+The spread of the results across runs is also exported to statistics CSV files using the results_stats module.
 """
 
 #-----------------------------------------------------------------------------------------------------------
 import pandas as pd
+import numpy as np
 import os
+from results_stats import ResultStatsAggregator
 
 #-----------------------------------------------------------------------------------------------------------
 class LiboqsResultAverager:
 
     #------------------------------------------------------------------------------
-    def __init__(self, dir_paths, kem_algs, sig_algs, num_runs, alg_operations):
+    def __init__(self, dir_paths, kem_algs, sig_algs, num_runs, alg_operations, speed_runs=None):
         """ Class for generating average metrics from Liboqs performance results.
             Computes per-algorithm averages across multiple benchmarking runs for both 
             memory usage and CPU speed results. Called by the Liboqs parsing script after 
-            results have been processed into structured CSVs. """
+            results have been processed into structured CSVs. The optional speed_runs dictionary
+            sets the runs used for the KEM and digital signature speed averages, so that noisy runs can be dropped. """
 
         # Set the global class variables used in the class methods
         self.dir_paths = dir_paths
@@ -28,95 +32,83 @@ class LiboqsResultAverager:
         self.kem_algs = kem_algs
         self.sig_algs = sig_algs
         self.alg_operations = alg_operations
+        self.speed_runs = speed_runs if speed_runs is not None else {}
 
     #------------------------------------------------------------------------------
-    def avg_mem(self):
-        """ Method for taking in the provided memory 
-            results and generating an average for all the runs for
-            that current machine """
+    def load_run_results(self, file_prefix, run_stats, algs, runs=None):
+        """ Helper method for loading the per-run result files for the current result type
+            into a single long-form dataframe. Each run file is read exactly once and its rows 
+            are tagged with the run number so all averages can be calculated in one grouped pass. 
+            The rows for the supplied algorithms are also added to the run statistics as each file is read.
+            All of the runs are loaded unless a list of runs is supplied. """
+
+        # Read in the csv file for each run and tag its rows with the run number
+        run_dfs = []
+        for run_count in (runs if runs is not None else range(1, self.num_runs+1)):
+            run_df = pd.read_csv(file_prefix + str(run_count) + ".csv")
+            run_stats.add_run(run_df[run_df["Algorithm"].isin(algs)])
+            run_df["Run"] = run_count
+            run_dfs.append(run_df)
+
+        # Combine the run dataframes into the long-form results dataframe
+        return pd.concat(run_dfs, ignore_index=True)
 
-        # Declare the filepath prefix variables
-        kem_mem_file_prefix = os.path.join(self.dir_paths['type_mem_dir'], "kem-mem-metrics-")
-        sig_mem_file_prefix = os.path.join(self.dir_paths['type_mem_dir'], "sig-mem-metrics-")
+    #------------------------------------------------------------------------------
+    def calc_operation_avgs(self, results_df, algs, operations, fieldnames, runs=None):
+        """ Helper method for calculating the per-algorithm cryptographic operation averages from the 
+            long-form results dataframe. All of the algorithm/operation groups are averaged in a single 
+            vectorised pass and the averages dataframe is returned with the rows in algorithm list order.
+            All of the runs are averaged unless a list of runs is supplied. """
 
-        # Declare the dataframes and fieldnames
-        mem_fieldnames = ["Algorithm", "Operation", "intits", "maxBytes", "maxHeap", "extHeap", "maxStack"]
-        kem_mem_avg = pd.DataFrame(columns=mem_fieldnames)
-        sig_mem_avg = pd.DataFrame(columns=mem_fieldnames)
+        # Set the metric columns and the full algorithm/operation/run index, with the runs in descending order 
+        # so the summation order (and therefore the outputted float values) matches the original averaging method
+        metric_cols = fieldnames[2:]
+        avg_runs = sorted(runs if runs is not None else range(1, self.num_runs+1), reverse=True)
+        run_index = pd.MultiIndex.from_product([algs, operations, avg_runs], names=["Algorithm", "Operation", "Run"])
 
-        """ Calculate KEM Memory Averages """
-        # Loop through the KEM algorithms
-        for kem_alg in self.kem_algs:
+        # Align the results onto the full index using exact algorithm/operation matches, leaving any missing results empty
+        results_df = results_df.drop_duplicates(subset=["Algorithm", "Operation", "Run"])
+        metrics_df = results_df.set_index(["Algorithm", "Operation", "Run"])[metric_cols].reindex(run_index)
 
-            # Create the combined operations dataframe for the current algorithm
-            combined_operations = pd.DataFrame(columns=mem_fieldnames)
+        # Reshape the metrics into an (algorithm/operation, metric, run) array so each group is summed along its runs
+        metric_values = metrics_df.to_numpy(dtype=np.float64).reshape(len(algs) * len(operations), len(avg_runs), len(metric_cols))
+        metric_values = np.ascontiguousarray(metric_values.transpose(0, 2, 1))
 
-            # Loop through the results files for the number of test runs
-            for run_count in range(1, self.num_runs+1):
+        # Calculate the averages for every group, skipping any empty values in the same way as the pandas mean method
+        missing_mask = np.isnan(metric_values)
+        metric_sums = np.where(missing_mask, 0.0, metric_values).sum(axis=2)
+        metric_counts = (~missing_mask).sum(axis=2)
 
-                # Set the filename and read the csv into dataframe
-                kem_mem_filename = kem_mem_file_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(kem_mem_filename)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            metric_avgs = metric_sums / metric_counts
 
-                # Get the operations for the current algorithm across all files into one
-                if run_count == 1:
-                    combined_operations = temp_df.loc[temp_df["Algorithm"].str.contains(kem_alg, regex=False)]
-                else:
-                    temp_df = temp_df.loc[temp_df["Algorithm"].str.contains(kem_alg, regex=False)]
-                    combined_operations = pd.concat([temp_df, combined_operations], ignore_index=True, sort=False)
-            
-            # Get the averages for each KEM cryptographic operation
-            for operation in self.alg_operations['kem_operations']:
-                
-                # Get a list of the cryptographic operation metric averages 
-                operation_average = combined_operations.loc[combined_operations["Operation"].str.contains(operation)]
-                operation_average = operation_average[mem_fieldnames[2:]]
-
-                # Calculate the averages for the KEM results
-                operation_average = (operation_average.mean(axis=0)).to_frame()
-                            
-                # Create a new row and export to the main KEM speed average dataframe
-                row = operation_average.iloc[:, 0].to_list()
-                row.insert(0, kem_alg)
-                row.insert(1, operation)
-                kem_mem_avg.loc[len(kem_mem_avg)] = row
-
-        """ Calculate the Digital Signature Memory Averages """
-        # Loop through the digital signature algorithms
-        for sig_alg in self.sig_algs:
-
-            # Create the combined cryptographic operations dataframe for the current algorithm
-            combined_operations = pd.DataFrame(columns=mem_fieldnames)
-
-            # Loop through the run files
-            for run_count in range(1, self.num_runs+1):
-
-                # Set the filename and read the csv into dataframe
-                sig_mem_filename = sig_mem_file_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(sig_mem_filename)
-
-                # Get the cryptographic operations for the current algorithm across all files into one
-                if run_count == 1:
-                    combined_operations = temp_df.loc[temp_df["Algorithm"].str.contains(sig_alg, regex=False)]
-                else:
-                    temp_df = temp_df.loc[temp_df["Algorithm"].str.contains(sig_alg, regex=False)]
-                    combined_operations = pd.concat([temp_df, combined_operations], ignore_index=True, sort=False)
+        # Create the averages dataframe with the algorithm and operation columns
+        avg_df = pd.DataFrame(metric_avgs, columns=metric_cols)
+        avg_df.insert(0, fieldnames[0], [alg for alg in algs for _ in operations])
+        avg_df.insert(1, fieldnames[1], list(operations) * len(algs))
+
+        return avg_df
 
-            # Get the averages for each signature cryptographic operation
-            for operation in self.alg_operations['sig_operations']:
+    #------------------------------------------------------------------------------
+    def avg_mem(self):
+        """ Method for taking in the provided memory 
+            results and generating an average for all the runs for
+            that current machine """
 
-                # Create a list of the operation metric averages
-                operation_average = combined_operations.loc[combined_operations["Operation"].str.contains(operation, regex=False)]
-                operation_average = operation_average[mem_fieldnames[2:]]
+        # Declare the filepath prefix variables and fieldnames
+        kem_mem_file_prefix = os.path.join(self.dir_paths['type_mem_dir'], "kem-mem-metrics-")
+        sig_mem_file_prefix = os.path.join(self.dir_paths['type_mem_dir'], "sig-mem-metrics-")
+        mem_fieldnames = ["Algorithm", "Operation", "intits", "maxBytes", "maxHeap", "extHeap", "maxStack"]
 
-                # Calculate the averages
-                operation_average = (operation_average.mean(axis=0)).to_frame()
+        # Load the KEM and digital signature memory results for all runs and gather their statistics
+        kem_mem_stats = ResultStatsAggregator(mem_fieldnames[:2], mem_fieldnames[2:])
+        sig_mem_stats = ResultStatsAggregator(mem_fieldnames[:2], mem_fieldnames[2:])
+        kem_mem_results = self.load_run_results(kem_mem_file_prefix, kem_mem_stats, self.kem_algs)
+        sig_mem_results = self.load_run_results(sig_mem_file_prefix, sig_mem_stats, self.sig_algs)
 
-                # Create a new row and export to the main digital signature memory average dataframe
-                row = operation_average.iloc[:, 0].to_list()
-                row.insert(0, sig_alg)
-                row.insert(1, operation)
-                sig_mem_avg.loc[len(sig_mem_avg)] = row
+        # Calculate the KEM and digital signature memory averages
+        kem_mem_avg = self.calc_operation_avgs(kem_mem_results, self.kem_algs, self.alg_operations['kem_operations'], mem_fieldnames)
+        sig_mem_avg = self.calc_operation_avgs(sig_mem_results, self.sig_algs, self.alg_operations['sig_operations'], mem_fieldnames)
 
         # Export the average csv files
         kem_csv_name = os.path.join(self.dir_paths['type_mem_dir'], "kem-mem-avg.csv")
@@ -124,102 +116,37 @@ class LiboqsResultAverager:
         sig_csv_name = os.path.join(self.dir_paths['type_mem_dir'], "sig-mem-avg.csv")
         sig_mem_avg.to_csv(sig_csv_name, index=False)
 
+        # Export the statistics csv files
+        kem_mem_stats.write_csv(os.path.join(self.dir_paths['type_mem_dir'], "kem-mem-stats.csv"))
+        sig_mem_stats.write_csv(os.path.join(self.dir_paths['type_mem_dir'], "sig-mem-stats.csv"))
+
     #------------------------------------------------------------------------------
     def avg_speed(self):
         """ Method for taking in the provided speed 
             results and generating an average for all the runs for
             that current machine """
 
-        # Declare the filepath prefix variables and fieldnames list
+        # Declare the filepath prefix variables
         kem_filename_prefix = os.path.join(self.dir_paths['type_speed_dir'], "test-kem-speed-")
         sig_filename_prefix = os.path.join(self.dir_paths['type_speed_dir'], "test-sig-speed-")
-        speed_fieldnames = []
 
-        # Get the fieldnames from first file
-        test_filename = "test-kem-speed-1.csv"
-        test_filename = os.path.join(self.dir_paths['type_speed_dir'], test_filename)
+        # Set the statistics aggregators, giving the two standard deviation columns unique metric names
+        speed_metric_labels = {"pop. stdev": "Time (us): pop. stdev", "pop. stdev.1": "CPU cycles: pop. stdev"}
+        kem_speed_stats = ResultStatsAggregator(["Algorithm", "Operation"], metric_labels=speed_metric_labels)
+        sig_speed_stats = ResultStatsAggregator(["Algorithm", "Operation"], metric_labels=speed_metric_labels)
 
-        # Load the test file into dataframe and put the headers into a list
-        check_df = pd.read_csv(test_filename)
-        speed_fieldnames = check_df.columns.to_list()
+        # Load the KEM and digital signature speed results for the averaged runs and gather their statistics
+        kem_runs = self.speed_runs.get("kem")
+        sig_runs = self.speed_runs.get("sig")
+        kem_speed_results = self.load_run_results(kem_filename_prefix, kem_speed_stats, self.kem_algs, kem_runs)
+        sig_speed_results = self.load_run_results(sig_filename_prefix, sig_speed_stats, self.sig_algs, sig_runs)
 
-        # Set the output dataframe headers
-        kem_speed_avg = pd.DataFrame(columns=speed_fieldnames)
-        sig_speed_avg = pd.DataFrame(columns=speed_fieldnames)
+        # Get the fieldnames from the first KEM run file (excluding the added run column)
+        speed_fieldnames = kem_speed_results.columns.to_list()[:-1]
 
-        """ Calculate the KEM Speed Averages """
-        # Loop through the KEM algorithms
-        for kem_alg in self.kem_algs:
-
-            # Create the combined averages dataframe
-            combined_operations = pd.DataFrame(columns=speed_fieldnames)
-
-            # Loop through the run files
-            for run_count in range(1, self.num_runs+1):
-
-                # Set the filename and read the csv into dataframe
-                kem_filename = kem_filename_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(kem_filename)
-
-                # Get the algorithm cryptographic operations across all files into one
-                if run_count == 1:
-                    combined_operations = temp_df.loc[temp_df["Algorithm"].str.contains(kem_alg, regex=False)]
-                else:
-                    temp_df = temp_df.loc[temp_df["Algorithm"].str.contains(kem_alg, regex=False)]
-                    combined_operations = pd.concat([temp_df, combined_operations], ignore_index=True, sort=False)
-
-            # Get the average for each cryptographic operation
-            for operation in self.alg_operations['kem_operations']:
-
-                # Create a list of cryptographic operation metric averages
-                operation_average = combined_operations.loc[combined_operations["Operation"].str.contains(operation, regex=False)]
-                operation_average = operation_average[speed_fieldnames[2:]]
-
-                # Calculate the average for the cryptographic operation
-                operation_average = (operation_average.mean(axis=0)).to_frame()
-
-                # Create a new row and exporting to main KEM speed average dataframe
-                row = operation_average.iloc[:, 0].to_list()
-                row.insert(0, kem_alg)
-                row.insert(1, operation)
-                kem_speed_avg.loc[len(kem_speed_avg)] = row
-
-        """ Calculate the Digital Signature Speed Averages """
-        # Loop through the digital signature algorithms
-        for sig_alg in self.sig_algs:
-
-            # Create the combined averages dataframe
-            combined_operations = pd.DataFrame(columns=speed_fieldnames)
-
-            # Loop through the run files
-            for run_count in range(1, self.num_runs+1):
-
-                # Set the filename and read the csv into dataframe
-                sig_filename = sig_filename_prefix + str(run_count) + ".csv"
-                temp_df = pd.read_csv(sig_filename)
-
-                # Get the algorithm cryptographic operations across all files into one
-                if run_count == 1:
-                    combined_operations = temp_df.loc[temp_df["Algorithm"].str.contains(sig_alg, regex=False)]
-                else:
-                    temp_df = temp_df.loc[temp_df["Algorithm"].str.contains(sig_alg, regex=False)]
-                    combined_operations = pd.concat([temp_df, combined_operations], ignore_index=True, sort=False)
-            
-            # Get the average for each cryptographic operation
-            for operation in self.alg_operations['sig_operations']:
-
-                # Create a list of cryptographic operation metric averages
-                operation_average = combined_operations.loc[combined_operations["Operation"].str.contains(operation, regex=False)]
-                operation_average = operation_average[speed_fieldnames[2:]]
-
-                # Calculate the average for the cryptographic operation
-                operation_average = (operation_average.mean(axis=0)).to_frame()
-
-                # Create a new row and export to the main digital signature speed average dataframe
-                row = operation_average.iloc[:, 0].to_list()
-                row.insert(0, sig_alg)
-                row.insert(1, operation)
-                sig_speed_avg.loc[len(sig_speed_avg)] = row
+        # Calculate the KEM and digital signature speed averages
+        kem_speed_avg = self.calc_operation_avgs(kem_speed_results, self.kem_algs, self.alg_operations['kem_operations'], speed_fieldnames, kem_runs)
+        sig_speed_avg = self.calc_operation_avgs(sig_speed_results, self.sig_algs, self.alg_operations['sig_operations'], speed_fieldnames, sig_runs)
 
         # Export the average csv files
         kem_csv_name = os.path.join(self.dir_paths['type_speed_dir'], "kem-speed-avg.csv")
@@ -227,6 +154,10 @@ class LiboqsResultAverager:
         sig_csv_name = os.path.join(self.dir_paths['type_speed_dir'], "sig-speed-avg.csv")
         sig_speed_avg.to_csv(sig_csv_name, index=False)
 
+        # Export the statistics csv files
+        kem_speed_stats.write_csv(os.path.join(self.dir_paths['type_speed_dir'], "kem-speed-stats.csv"))
+        sig_speed_stats.write_csv(os.path.join(self.dir_paths['type_speed_dir'], "sig-speed-stats.csv"))
+
 #-----------------------------------------------------------------------------------------------------------
 class OqsProviderResultAverager:
 
@@ -245,71 +176,117 @@ class OqsProviderResultAverager:
         self.col_headers = col_headers
 
     #------------------------------------------------------------------------------
-    def gen_pqc_avgs(self):
-        """ Method for taking in the provided PQC TLS handshake
-            results and generating an average for all the runs for
-            that current machine """
-       
-        # Process the result averages for both PQC (0) and PQC-Hybrid (1) TLS test types
-        for type_index in range (0,2):
+    def write_run_stats(self, run_groups, key_columns, filter_column, filter_values, output_filepath):
+        """ Helper method for calculating the statistics of each result group across the supplied runs and writing
+            them to the statistics csv file. The grouped rows already loaded by load_run_groups are used, so the run
+            files are not read again, with only the rows whose filter column value is in the filter values being used """
 
-            # Loop through each signing algorithm
-            for sig in self.algs_dict[self.pqc_type_vars["sig_alg_type"][type_index]]:
+        # Add the results for each run to the statistics, keeping the rows in the order they appear in the run file
+        run_stats = ResultStatsAggregator(key_columns)
+        for run_group in run_groups:
 
-                # Get the current signing algorithm from sig_path
-                sig_path = os.path.join(self.dir_paths[self.pqc_type_vars['results_type'][type_index]], sig)
+            if not run_group:
+                continue
 
-                # Create the dataframe and filepaths
-                sig_avg_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
-                
-                # Get the sig/kem averages by reading in the average for specific kem across all runs
-                for kem in self.algs_dict[self.pqc_type_vars["kem_alg_type"][type_index]]:
+            run_df = pd.concat(run_group.values())
+            run_stats.add_run(run_df[run_df[filter_column].isin(filter_values)])
 
-                    # Reset the combined sig dataframe
-                    sig_first_combined_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
-                    sig_reused_combined_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
+        # Output the statistics for the result groups
+        run_stats.write_csv(output_filepath)
 
-                    # Loop through the runs
-                    for current_run in range(1, self.num_runs+1):
+    #------------------------------------------------------------------------------
+    def load_run_groups(self, run_filepaths, group_columns):
+        """ Helper method for reading in each of the supplied run files once and grouping their rows on the exact
+            values of the group columns, so the rows for each algorithm can be found with a dictionary lookup rather
+            than a substring search. Returns the groups for each run and an empty dataframe used for missing groups """
 
-                        # Set the current run filepath
-                        current_run_filename = f"tls-handshake-{sig}-run-{current_run}.csv"
-                        current_run_filepath = os.path.join(sig_path, current_run_filename)
+        # Read in each run file and group its rows, keeping the rows in the order they appear in the file
+        run_groups = []
+        for run_filepath in run_filepaths:
+            run_df = pd.read_csv(run_filepath)
+            run_groups.append(dict(tuple(run_df.groupby(group_columns, sort=False))))
 
-                        # Read in the current run csv to get metrics
-                        current_run_df = pd.read_csv(current_run_filepath)
+        return run_groups, run_df.iloc[0:0]
 
-                        # Extract the data for the current KEM
-                        kem_df = current_run_df[current_run_df["KEM Algorithm"].str.contains(kem, regex=False)]
+    #------------------------------------------------------------------------------
+    def gen_sig_avgs(self, type_index, sig):
+        """ Method for taking in the provided PQC or PQC-Hybrid TLS handshake results 
+            for a single signing algorithm and generating an average for all the runs for
+            that current machine. Used directly when the results are parsed in chunks """
+
+        # Get the current signing algorithm from sig_path
+        sig_path = os.path.join(self.dir_paths[self.pqc_type_vars['results_type'][type_index]], sig)
+
+        # Create the dataframe and filepaths
+        sig_avg_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
+
+        # Read in each run csv once and group its rows on the exact KEM algorithm name
+        run_kem_groups, empty_df = self.load_run_groups(
+            [os.path.join(sig_path, f"tls-handshake-{sig}-run-{current_run}.csv") for current_run in range(1, self.num_runs+1)],
+            "KEM Algorithm"
+        )
+        
+        # Get the sig/kem averages by reading in the average for specific kem across all runs
+        for kem in self.algs_dict[self.pqc_type_vars["kem_alg_type"][type_index]]:
 
-                        # Separate the data into combined dataframes
-                        if current_run == 1:
-                            sig_first_combined_df = kem_df.iloc[0:1]
-                            sig_reused_combined_df = kem_df.iloc[1:2]
-                        else:
-                            sig_first_combined_df = pd.concat([sig_first_combined_df, kem_df.iloc[0:1]])
-                            sig_reused_combined_df = pd.concat([sig_reused_combined_df, kem_df.iloc[1:2]])
-    
-                        # Define the average rows
-                        sig_first_average_row = [sig, kem, ""]
-                        sig_reused_average_row = [sig, kem, "*"]
-                    
-                    # Get the average value for each column and append to new row var
-                    for column in self.col_headers['pqc_based_headers']:
-                        if column in self.col_headers['pqc_based_headers'][:3]:
-                            continue
-                        else:
-                            sig_first_average_row.append(float(sig_first_combined_df[column].mean()))
-                            sig_reused_average_row.append(float(sig_reused_combined_df[column].mean()))
-                    
-                    # Append the average rows onto the averages dataframe
-                    sig_avg_df.loc[len(sig_avg_df)] = sig_first_average_row
-                    sig_avg_df.loc[len(sig_avg_df)] = sig_reused_average_row
+            # Reset the combined sig dataframe
+            sig_first_combined_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
+            sig_reused_combined_df = pd.DataFrame(columns=self.col_headers['pqc_based_headers'])
+
+            # Loop through the runs
+            for current_run in range(1, self.num_runs+1):
+
+                # Extract the data for the current KEM from the current run
+                kem_df = run_kem_groups[current_run - 1].get(kem, empty_df)
+
+                # Separate the data into combined dataframes
+                if current_run == 1:
+                    sig_first_combined_df = kem_df.iloc[0:1]
+                    sig_reused_combined_df = kem_df.iloc[1:2]
+                else:
+                    sig_first_combined_df = pd.concat([sig_first_combined_df, kem_df.iloc[0:1]])
+                    sig_reused_combined_df = pd.concat([sig_reused_combined_df, kem_df.iloc[1:2]])
 
-                # Output the averages for the current signing algorithm to csv file
-                avg_out_filename = f"tls-handshake-{sig}-avg.csv"
-                avg_out_filepath = os.path.join(sig_path, avg_out_filename)
-                sig_avg_df.to_csv(avg_out_filepath, index=False)
+                # Define the average rows
+                sig_first_average_row = [sig, kem, ""]
+                sig_reused_average_row = [sig, kem, "*"]
+            
+            # Get the average value for each column and append to new row var
+            for column in self.col_headers['pqc_based_headers']:
+                if column in self.col_headers['pqc_based_headers'][:3]:
+                    continue
+                else:
+                    sig_first_average_row.append(float(sig_first_combined_df[column].mean()))
+                    sig_reused_average_row.append(float(sig_reused_combined_df[column].mean()))
+            
+            # Append the average rows onto the averages dataframe
+            sig_avg_df.loc[len(sig_avg_df)] = sig_first_average_row
+            sig_avg_df.loc[len(sig_avg_df)] = sig_reused_average_row
+
+        # Output the averages for the current signing algorithm to csv file
+        avg_out_filename = f"tls-handshake-{sig}-avg.csv"
+        avg_out_filepath = os.path.join(sig_path, avg_out_filename)
+        sig_avg_df.to_csv(avg_out_filepath, index=False)
+
+        # Output the statistics for the current signing algorithm to csv file
+        self.write_run_stats(
+            run_kem_groups,
+            self.col_headers['pqc_based_headers'][:3],
+            "KEM Algorithm",
+            self.algs_dict[self.pqc_type_vars["kem_alg_type"][type_index]],
+            os.path.join(sig_path, f"tls-handshake-{sig}-stats.csv")
+        )
+
+    #------------------------------------------------------------------------------
+    def gen_pqc_avgs(self):
+        """ Method for taking in the provided PQC TLS handshake
+            results and generating an average for all the runs for
+            that current machine """
+       
+        # Process the result averages for each signing algorithm for both PQC (0) and PQC-Hybrid (1) TLS test types
+        for type_index in range (0,2):
+            for sig in self.algs_dict[self.pqc_type_vars["sig_alg_type"][type_index]]:
+                self.gen_sig_avgs(type_index, sig)
 
     #------------------------------------------------------------------------------
     def gen_classic_avgs(self):
@@ -320,6 +297,12 @@ class OqsProviderResultAverager:
         # Declaring main average dataframe
         classic_avg_df = pd.DataFrame(columns=self.col_headers['classic_headers'])
 
+        # Read in each run csv once and group its rows on the exact ciphersuite and algorithm names
+        run_curve_groups, empty_df = self.load_run_groups(
+            [os.path.join(self.dir_paths['classic_handshake_results'], f"classic-results-run-{str(current_run)}.csv") for current_run in range(1, self.num_runs+1)],
+            ["Ciphersuite", "Classic Algorithm"]
+        )
+
         # Loop through all ciphersuites
         for cipher in self.algs_dict['ciphers']:
 
@@ -333,16 +316,8 @@ class OqsProviderResultAverager:
                 # Looping through all the runs
                 for current_run in range(1, self.num_runs+1):
 
-                    # Setting current run filepath
-                    current_run_filename = f"classic-results-run-{str(current_run)}.csv"
-                    current_run_filepath = os.path.join(self.dir_paths['classic_handshake_results'], current_run_filename)
-
-                    # Reading in current run csv to get metrics
-                    current_run_df = pd.read_csv(current_run_filepath)
-
-                    # Extracting the data for the current curve and ciphersuite
-                    cipher_df = current_run_df[current_run_df["Ciphersuite"].str.contains(cipher, regex=False)]
-                    curve_df = cipher_df[cipher_df["Classic Algorithm"].str.contains(alg, regex=False)]
+                    # Extracting the data for the current curve and ciphersuite from the current run
+                    curve_df = run_curve_groups[current_run - 1].get((cipher, alg), empty_df)
 
                     # Separating the data into combined dataframes
                     if current_run == 1:
@@ -373,6 +348,100 @@ class OqsProviderResultAverager:
         avg_out_filepath = os.path.join(self.dir_paths['classic_handshake_results'], avg_out_filename)
         classic_avg_df.to_csv(avg_out_filepath, index=False)
 
+        # Output the statistics for the classic results to csv file
+        self.write_run_stats(
+            run_curve_groups,
+            self.col_headers['classic_headers'][:3],
+            "Classic Algorithm",
+            self.algs_dict['classic_algs'],
+            os.path.join(self.dir_paths['classic_handshake_results'], "classic-speed-stats.csv")
+        )
+
+    #------------------------------------------------------------------------------
+    def write_latency_avgs(self, run_filepaths, histogram_filepaths, key_columns, output_prefix):
+        """ Helper method for averaging the handshake latency summaries across the supplied run files and combining
+            the latency histograms for the runs. The summary values for each combination and handshake type are averaged
+            across the runs, with their spread written to the statistics file, and the histogram bin counts are added
+            together as the histograms for each run use the same bins. Returns the written result files """
+
+        # Read in the latency summaries for each run, keeping the empty session reuse markers for the full handshakes
+        run_dfs = [pd.read_csv(run_filepath, dtype={"Reused Session ID": str}).fillna({"Reused Session ID": ""}) for run_filepath in run_filepaths]
+        metric_columns = [column for column in run_dfs[0].columns if column not in key_columns]
+
+        # Average the summary values for each combination and handshake type in the order they appear in the results
+        latency_avg_df = pd.concat(run_dfs, ignore_index=True)
+        latency_avg_df[metric_columns] = latency_avg_df[metric_columns].apply(pd.to_numeric, errors="coerce")
+        latency_avg_df = latency_avg_df.groupby(key_columns, sort=False, as_index=False)[metric_columns].mean()
+        latency_avg_df.to_csv(f"{output_prefix}-avg.csv", index=False)
+
+        # Output the statistics for the latency summaries
+        run_stats = ResultStatsAggregator(key_columns, metric_columns)
+        for run_df in run_dfs:
+            run_stats.add_run(run_df)
+        run_stats.write_csv(f"{output_prefix}-stats.csv")
+
+        # Add together the histogram bin counts across the runs, keeping the bins for each combination in latency order
+        histogram_df = pd.concat(
+            [pd.read_csv(histogram_filepath, dtype={"Reused Session ID": str}).fillna({"Reused Session ID": ""}) for histogram_filepath in histogram_filepaths],
+            ignore_index=True
+        )
+        histogram_df = histogram_df.groupby(key_columns + ["Bin Lower (us)", "Bin Upper (us)"], sort=False, as_index=False)["Handshakes"].sum()
+        histogram_df["Group"] = histogram_df.groupby(key_columns, sort=False).ngroup()
+        histogram_df = histogram_df.sort_values(["Group", "Bin Lower (us)"], kind="stable").drop(columns="Group")
+        histogram_df.to_csv(f"{output_prefix}-histogram.csv", index=False)
+
+        return [f"{output_prefix}-avg.csv", f"{output_prefix}-stats.csv", f"{output_prefix}-histogram.csv"]
+
+    #------------------------------------------------------------------------------
+    def gen_latency_avgs(self):
+        """ Method for taking in the provided handshake latency results for the PQC, PQC-Hybrid, and classic
+            tests and generating the averages and combined histograms for the current machine. As the latency
+            tests are optional, only the runs with latency results are used, and the test types without any
+            latency results are skipped. Returns the written result files """
+
+        # Declare the written result files list
+        latency_avg_files = []
+
+        # Process the latency results for each signing algorithm for both PQC (0) and PQC-Hybrid (1) TLS test types
+        for type_index in range (0,2):
+            for sig in self.algs_dict[self.pqc_type_vars["sig_alg_type"][type_index]]:
+
+                # Get the runs with latency results for the current signing algorithm
+                sig_path = os.path.join(self.dir_paths[self.pqc_type_vars['results_type'][type_index]], sig)
+                latency_runs = [
+                    current_run for current_run in range(1, self.num_runs+1)
+                    if os.path.isfile(os.path.join(sig_path, f"tls-latency-{sig}-run-{current_run}.csv"))
+                ]
+
+                if not latency_runs:
+                    continue
+
+                # Output the averages, statistics, and combined histogram for the current signing algorithm
+                latency_avg_files.extend(self.write_latency_avgs(
+                    [os.path.join(sig_path, f"tls-latency-{sig}-run-{current_run}.csv") for current_run in latency_runs],
+                    [os.path.join(sig_path, f"tls-latency-histogram-{sig}-run-{current_run}.csv") for current_run in latency_runs],
+                    self.col_headers['pqc_latency_headers'][:3],
+                    os.path.join(sig_path, f"tls-latency-{sig}")
+                ))
+
+        # Get the runs with classic latency results
+        classic_dir = self.dir_paths['classic_handshake_results']
+        latency_runs = [
+            current_run for current_run in range(1, self.num_runs+1)
+            if os.path.isfile(os.path.join(classic_dir, f"classic-latency-run-{current_run}.csv"))
+        ]
+
+        # Output the averages, statistics, and combined histogram for the classic latency results
+        if latency_runs:
+            latency_avg_files.extend(self.write_latency_avgs(
+                [os.path.join(classic_dir, f"classic-latency-run-{current_run}.csv") for current_run in latency_runs],
+                [os.path.join(classic_dir, f"classic-latency-histogram-run-{current_run}.csv") for current_run in latency_runs],
+                self.col_headers['classic_latency_headers'][:3],
+                os.path.join(classic_dir, "classic-latency")
+            ))
+
+        return latency_avg_files
+
     #------------------------------------------------------------------------------
     def get_speed_algs(self, temp_filename, dir_list):
         """ Method for getting the algorithms present in the speed results files """
@@ -411,6 +480,12 @@ class OqsProviderResultAverager:
                 headers = speed_headers[0] if alg_type == "kem" else speed_headers[1]
                 speed_avg_df = pd.DataFrame(columns=headers)
 
+                # Read in each run csv once and group its rows on the exact algorithm name
+                run_alg_groups, empty_df = self.load_run_groups(
+                    [os.path.join(dir_list[1], f"{pqc_fileprefix}-{alg_type}-{run_num}.csv") for run_num in range(1, self.num_runs+1)],
+                    "Algorithm"
+                )
+
                 # Loop through the algs to get combined average dataframes
                 for alg in algs:
 
@@ -420,17 +495,12 @@ class OqsProviderResultAverager:
                     # Loop through the runs to get averages for the alg type
                     for run_num in range(1, self.num_runs+1):
 
-                        # Set the filename and path for current type and run
-                        current_filename = f"{pqc_fileprefix}-{alg_type}-{run_num}.csv"
-                        current_filepath = os.path.join(dir_list[1], current_filename)
-                    
                         # Pull in the algorithm values for the current run and alg
-                        current_run_df = pd.read_csv(current_filepath)
-                        current_run_df = current_run_df[current_run_df["Algorithm"].str.contains(alg, regex=False)]
+                        current_run_df = run_alg_groups[run_num - 1].get(alg, empty_df)
 
                         # Add  algorithm values to the combined dataframe that will be used to get averages for the alg across runs
                         if run_num == 1:
-                            combined_df = current_run_df.loc[current_run_df['Algorithm'].str.contains(alg, regex=False)]
+                            combined_df = current_run_df
                         else:
                             combined_df = pd.concat([combined_df, current_run_df.iloc[0:1]])
 
@@ -450,4 +520,13 @@ class OqsProviderResultAverager:
                 # Export the TLS speed averages to csv file
                 speed_avg_filename = f"{pqc_fileprefix}-{alg_type}-avg.csv"
                 speed_avg_filepath = os.path.join(dir_list[1], speed_avg_filename)
-                speed_avg_df.to_csv(speed_avg_filepath, index=False)
\ No newline at end of file
+                speed_avg_df.to_csv(speed_avg_filepath, index=False)
+
+                # Export the TLS speed statistics to csv file
+                self.write_run_stats(
+                    run_alg_groups,
+                    headers[:1],
+                    "Algorithm",
+                    algs,
+                    os.path.join(dir_list[1], f"{pqc_fileprefix}-{alg_type}-stats.csv")
+                )
\ No newline at end of file
@@ -0,0 +1,292 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Results comparison module for the PQC benchmarking result parsers. Provides the functions for comparing the averaged
+Liboqs speed and memory results and the OQS-Provider TLS handshake results across all of the parsed machines. The
+averages for each machine are aligned on their algorithm and operation keys into a single matrix, from which the
+ratios against a baseline machine, the algorithm rank changes, and the pairwise machine comparison matrix are
+calculated in vectorised form and written to the comparison results directory. This module is used by
+parse_results.py when the --compare option is passed and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import re
+import numpy as np
+import pandas as pd
+
+#-----------------------------------------------------------------------------------------------------------
+def load_liboqs_avgs(machine_dir, result_type):
+    """ Function for loading the averaged Liboqs speed or memory results for a machine into a single
+        dataframe, with the algorithm type added to each row. None is returned if the results are missing """
+
+    # Set the averaged results directory and filenames for the result type
+    results_dir = os.path.join(machine_dir, f"{result_type}-results")
+    avg_dfs = []
+
+    # Load the KEM and digital signature averages
+    for alg_type in ["kem", "sig"]:
+
+        avg_filepath = os.path.join(results_dir, f"{alg_type}-{result_type}-avg.csv")
+        if not os.path.isfile(avg_filepath):
+            return None
+
+        avg_df = pd.read_csv(avg_filepath)
+        avg_df.insert(0, "Algorithm Type", alg_type)
+        avg_dfs.append(avg_df)
+
+    return pd.concat(avg_dfs, ignore_index=True)
+
+#-----------------------------------------------------------------------------------------------------------
+def load_liboqs_speed_avgs(machine_dir):
+    """ Function for loading the averaged Liboqs speed results for a machine """
+
+    return load_liboqs_avgs(machine_dir, "speed")
+
+#-----------------------------------------------------------------------------------------------------------
+def load_liboqs_mem_avgs(machine_dir):
+    """ Function for loading the averaged Liboqs memory results for a machine """
+
+    return load_liboqs_avgs(machine_dir, "mem")
+
+#-----------------------------------------------------------------------------------------------------------
+def load_handshake_avgs(machine_dir):
+    """ Function for loading the averaged PQC, PQC-Hybrid, and classic TLS handshake results for a machine
+        into a single dataframe, with the test type added to each row. None is returned if the results are missing """
+
+    # Set the handshake results directory for the machine
+    handshake_dir = os.path.join(machine_dir, "handshake-results")
+    avg_dfs = []
+
+    # Load the averages for each of the signing algorithm directories of the PQC and PQC-Hybrid results
+    for test_type in ["pqc", "hybrid"]:
+
+        type_dir = os.path.join(handshake_dir, test_type)
+        if not os.path.isdir(type_dir):
+            return None
+
+        for sig_alg in sorted(os.listdir(type_dir)):
+
+            avg_filepath = os.path.join(type_dir, sig_alg, f"tls-handshake-{sig_alg}-avg.csv")
+            if os.path.isfile(avg_filepath):
+                avg_df = pd.read_csv(avg_filepath)
+                avg_df.insert(0, "Test Type", test_type)
+                avg_dfs.append(avg_df)
+
+    # Load the classic handshake averages
+    classic_filepath = os.path.join(handshake_dir, "classic", "classic-speed-avg.csv")
+    if not avg_dfs or not os.path.isfile(classic_filepath):
+        return None
+
+    avg_df = pd.read_csv(classic_filepath)
+    avg_df.insert(0, "Test Type", "classic")
+    avg_dfs.append(avg_df)
+
+    # Combine the averages, replacing the label columns that do not apply to the test type with empty values
+    avg_df = pd.concat(avg_dfs, ignore_index=True)
+    label_cols = ["Signing Algorithm", "KEM Algorithm", "Ciphersuite", "Classic Algorithm", "Reused Session ID"]
+    avg_df[label_cols] = avg_df[label_cols].fillna("")
+
+    return avg_df
+
+#-----------------------------------------------------------------------------------------------------------
+# Declare the comparison sets, with the averages loader, key columns, rank grouping columns, and metrics for each set.
+# Each metric has the output file name, whether a higher value is better, and the name of the ratio against the baseline
+comparison_sets = {
+    "liboqs-speed": {
+        "tool": "liboqs",
+        "loader": load_liboqs_speed_avgs,
+        "keys": ["Algorithm Type", "Algorithm", "Operation"],
+        "rank_group": ["Algorithm Type", "Operation"],
+        "metrics": {
+            "CPU cycles: mean": ("cpu-cycles", False, "speedup"),
+            "Time (us): mean": ("time", False, "speedup")
+        }
+    },
+    "liboqs-memory": {
+        "tool": "liboqs",
+        "loader": load_liboqs_mem_avgs,
+        "keys": ["Algorithm Type", "Algorithm", "Operation"],
+        "rank_group": ["Algorithm Type", "Operation"],
+        "metrics": {
+            "maxBytes": ("max-bytes", False, "relative"),
+            "maxHeap": ("max-heap", False, "relative"),
+            "maxStack": ("max-stack", False, "relative")
+        }
+    },
+    "tls-handshake": {
+        "tool": "oqs-provider",
+        "loader": load_handshake_avgs,
+        "keys": ["Test Type", "Signing Algorithm", "KEM Algorithm", "Ciphersuite", "Classic Algorithm", "Reused Session ID"],
+        "rank_group": ["Test Type", "Reused Session ID"],
+        "metrics": {
+            "Connections Per User Second": ("connections-per-user-second", True, "speedup")
+        }
+    }
+}
+
+#-----------------------------------------------------------------------------------------------------------
+def discover_machines(tool_results_dir):
+    """ Helper function for getting the Machine-IDs of the parsed results directories for a tool. Versioned
+        machine directories from previous parses are not included """
+
+    # Return no machines if the tool results directory is not present
+    if not os.path.isdir(tool_results_dir):
+        return []
+
+    # Get the Machine-IDs from the machine-N directory names
+    machine_dir_pattern = re.compile(r"^machine-(\d+)$")
+    machine_nums = [
+        int(dir_match.group(1)) for dir_match in map(machine_dir_pattern.match, os.listdir(tool_results_dir))
+        if dir_match and os.path.isdir(os.path.join(tool_results_dir, dir_match.group(0)))
+    ]
+
+    return sorted(machine_nums)
+
+#-----------------------------------------------------------------------------------------------------------
+def load_comparison_set(results_dir, comparison_set):
+    """ Function for loading the averages for all of the parsed machines for a comparison set into a single
+        long-form dataframe, with the Machine-ID added to each row. Machines with missing averages are skipped """
+
+    # Loop through the machines for the tool and load their averages
+    tool_results_dir = os.path.join(results_dir, comparison_set["tool"])
+    avg_dfs = []
+
+    for machine_num in discover_machines(tool_results_dir):
+
+        avg_df = comparison_set["loader"](os.path.join(tool_results_dir, f"machine-{machine_num}"))
+        if avg_df is None:
+            print(f"[WARNING] - Averaged {comparison_set['tool']} results missing for Machine-ID ({machine_num}), skipping machine in comparison")
+            continue
+
+        avg_df["Machine"] = machine_num
+        avg_dfs.append(avg_df)
+
+    return pd.concat(avg_dfs, ignore_index=True) if avg_dfs else None
+
+#-----------------------------------------------------------------------------------------------------------
+def get_metric_matrix(avg_df, keys, metric):
+    """ Function for aligning a metric from the long-form averages into a matrix with a row for each key
+        and a column for each machine. Keys not present on a machine are left as missing values """
+
+    # Pivot the metric so that each machine is a column, with the rows in the order the keys first appear
+    metric_df = avg_df.drop_duplicates(keys + ["Machine"]).set_index(keys + ["Machine"])[metric]
+    metric_matrix = metric_df.unstack("Machine").sort_index(axis=1)
+    key_order = avg_df[keys].drop_duplicates().set_index(keys).index
+
+    return metric_matrix.reindex(key_order).astype(float)
+
+#-----------------------------------------------------------------------------------------------------------
+def calc_pairwise_matrix(metric_matrix, direction):
+    """ Function for calculating the pairwise comparison matrix between all machines, where each cell is the
+        geometric mean ratio of the row machine against the column machine across the keys present on both
+        machines. The log-ratio sums for every pair are calculated together using matrix products """
+
+    # Take the log of the metric values, treating missing and non-positive values as not present
+    values = metric_matrix.to_numpy()
+    present = np.isfinite(values) & (values > 0)
+    log_values = np.where(present, np.log(np.where(present, values, 1.0)), 0.0)
+    present = present.astype(float)
+
+    # Calculate the sum of the log-ratios and the number of shared keys for each pair of machines
+    log_ratio_sums = log_values.T @ present - present.T @ log_values
+    shared_keys = present.T @ present
+
+    # Calculate the geometric mean ratio, leaving pairs without any shared keys as missing
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pairwise = np.exp(direction * log_ratio_sums / shared_keys)
+    pairwise[shared_keys == 0] = np.nan
+
+    # Return the pairwise matrix with the machine labels
+    machine_labels = [f"Machine-{machine_num}" for machine_num in metric_matrix.columns]
+    return pd.DataFrame(pairwise, index=pd.Index(machine_labels, name="Machine"), columns=machine_labels)
+
+#-----------------------------------------------------------------------------------------------------------
+def calc_rank_changes(metric_matrix, rank_group, higher_is_better, baseline_machine):
+    """ Function for ranking the keys within each rank group for every machine, with rank 1 being the best
+        performing, and calculating the change in rank of each key against the baseline machine """
+
+    # Rank the keys within each group for all machines at once
+    ranks = metric_matrix.groupby(level=rank_group, sort=False).rank(method="min", ascending=not higher_is_better)
+
+    # Calculate the change in rank against the baseline, where a positive change means the key moved up the ranking
+    rank_changes = ranks.rsub(ranks[baseline_machine], axis=0).drop(columns=baseline_machine)
+
+    # Combine the ranks and rank changes into the output table
+    ranks.columns = [f"Machine-{machine_num} Rank" for machine_num in ranks.columns]
+    rank_changes.columns = [f"Machine-{machine_num} Rank Change" for machine_num in rank_changes.columns]
+
+    return pd.concat([ranks, rank_changes], axis=1).astype("Int64")
+
+#-----------------------------------------------------------------------------------------------------------
+def compare_metric(metric_matrix, comparison_set, metric_opts, baseline_machine, output_dir):
+    """ Function for calculating and writing the comparison tables for a single metric of a comparison set.
+        The aligned values, the ratios against the baseline machine, the rank changes, and the pairwise
+        machine matrix are written to their own csv files """
+
+    # Set the metric options and the ratio direction, where speedups for lower-is-better metrics are inverted
+    file_prefix, higher_is_better, ratio_name = metric_opts
+    direction = -1 if ratio_name == "speedup" and not higher_is_better else 1
+    machine_labels = {machine_num: f"Machine-{machine_num}" for machine_num in metric_matrix.columns}
+
+    # Write the aligned metric values for all machines
+    metric_matrix.rename(columns=machine_labels).to_csv(os.path.join(output_dir, f"{file_prefix}-values.csv"))
+
+    # Calculate the ratio of each machine against the baseline machine and write the ratio table
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = metric_matrix.div(metric_matrix[baseline_machine], axis=0) ** direction
+    ratios = ratios.replace([np.inf, -np.inf], np.nan)
+    ratios.rename(columns=machine_labels).to_csv(os.path.join(output_dir, f"{file_prefix}-{ratio_name}.csv"))
+
+    # Calculate the key rankings for each machine and write the rank changes table
+    rank_changes = calc_rank_changes(metric_matrix, comparison_set["rank_group"], higher_is_better, baseline_machine)
+    rank_changes.to_csv(os.path.join(output_dir, f"{file_prefix}-rank-changes.csv"))
+
+    # Calculate the pairwise machine matrix and write the pairwise table
+    calc_pairwise_matrix(metric_matrix, direction).to_csv(os.path.join(output_dir, f"{file_prefix}-pairwise-{ratio_name}.csv"))
+
+#-----------------------------------------------------------------------------------------------------------
+def compare_machines(results_dir, baseline_machine=None):
+    """ Function for comparing the averaged results of all the parsed machines for each comparison set and
+        writing the comparison tables to the comparison directory in the results directory. The lowest Machine-ID
+        is used as the baseline if no baseline machine is supplied. Comparison sets with fewer than two machines
+        are skipped. The function returns the list of comparison sets that were written """
+
+    # Loop through the comparison sets and compare the machines for each set
+    compared_sets = []
+    for set_name, comparison_set in comparison_sets.items():
+
+        # Load the averages for all machines and ensure there are enough machines to compare
+        avg_df = load_comparison_set(results_dir, comparison_set)
+        machine_nums = sorted(avg_df["Machine"].unique()) if avg_df is not None else []
+
+        if len(machine_nums) < 2:
+            print(f"Fewer than two machines with averaged {comparison_set['tool']} results, skipping {set_name} comparison")
+            continue
+
+        # Set the baseline machine for the comparison set, ensuring the requested baseline has results
+        if baseline_machine is None:
+            set_baseline = machine_nums[0]
+        elif baseline_machine in machine_nums:
+            set_baseline = baseline_machine
+        else:
+            print(f"[WARNING] - Baseline Machine-ID ({baseline_machine}) has no averaged {comparison_set['tool']} results, skipping {set_name} comparison")
+            continue
+
+        # Create the output directory for the comparison set, clearing any tables from a previous comparison
+        output_dir = os.path.join(results_dir, "comparison", set_name)
+        os.makedirs(output_dir, exist_ok=True)
+        for filename in os.listdir(output_dir):
+            if filename.endswith(".csv"):
+                os.remove(os.path.join(output_dir, filename))
+
+        # Align and compare each of the metrics for the comparison set
+        for metric, metric_opts in comparison_set["metrics"].items():
+            metric_matrix = get_metric_matrix(avg_df, comparison_set["keys"], metric)
+            compare_metric(metric_matrix, comparison_set, metric_opts, set_baseline, output_dir)
+
+        print(f"Compared {set_name} results for {len(machine_nums)} machines against baseline Machine-ID ({set_baseline})")
+        compared_sets.append(set_name)
+
+    return compared_sets
@@ -0,0 +1,305 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Result statistics module for the PQC benchmarking result parsers. Defines classes for calculating the spread
+of the performance metrics across test runs, alongside the averages produced by the results_averager module.
+For each result group the mean, median, population and sample standard deviation, minimum and maximum,
+5th and 95th percentiles, and 95% confidence interval of the mean are calculated. The results are streamed into
+the statistics one run at a time using numerically stable online algorithms, so the memory used does not grow with
+the number of test runs. This module is used internally by the results averager and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import math
+import pandas as pd
+
+# Declare the two-sided 95% t-distribution critical values for 1 to 30 degrees of freedom
+t_crit_values_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+]
+
+# Declare the column headers for the statistics output files, which follow the result group key columns
+stats_headers = [
+    "Metric", "Runs", "Mean", "Median", "Pop. Stdev", "Sample Stdev", "Min", "Max", "P5", "P95", "CI95 Lower", "CI95 Upper"
+]
+
+#-----------------------------------------------------------------------------------------------------------
+def get_t_crit_95(degrees_freedom):
+    """ Helper function for getting the two-sided 95% t-distribution critical value for the supplied degrees of
+        freedom. Values above 30 degrees of freedom are calculated using the Cornish-Fisher expansion of the
+        normal critical value, which is accurate to three decimal places in this range """
+
+    # Use the table value for small degrees of freedom
+    if degrees_freedom <= len(t_crit_values_95):
+        return t_crit_values_95[degrees_freedom - 1]
+
+    # Expand the normal critical value for the supplied degrees of freedom
+    z = 1.959964
+    v = float(degrees_freedom)
+    return (
+        z
+        + (z**3 + z) / (4 * v)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * v**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * v**3)
+    )
+
+#-----------------------------------------------------------------------------------------------------------
+def exact_quantile(sorted_values, quantile):
+    """ Helper function for calculating the quantile of the supplied sorted values using linear
+        interpolation between the closest ranks, matching the default pandas and numpy method """
+
+    # Get the position of the quantile and interpolate between the values either side of it
+    position = (len(sorted_values) - 1) * quantile
+    lower_index = math.floor(position)
+    upper_index = min(lower_index + 1, len(sorted_values) - 1)
+    fraction = position - lower_index
+
+    return sorted_values[lower_index] + (sorted_values[upper_index] - sorted_values[lower_index]) * fraction
+
+#-----------------------------------------------------------------------------------------------------------
+class P2QuantileEstimator:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, quantile, sorted_values):
+        """ Class for estimating a single quantile of a stream of values in constant memory using the P-Square
+            algorithm (Jain and Chlamtac, 1985). Five markers track the minimum, maximum, the target quantile and
+            the points halfway to it, and their heights are adjusted using piecewise-parabolic interpolation as new
+            values are added. The markers are initialised from the supplied sorted values, which must contain at
+            least five values. """
+
+        # Set the desired marker positions and their increments for each added value
+        num_values = len(sorted_values)
+        self.increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+        self.desired_positions = [1 + (num_values - 1) * increment for increment in self.increments]
+
+        # Set the actual marker positions closest to the desired positions, ensuring they are strictly increasing
+        self.positions = [int(round(position)) for position in self.desired_positions]
+
+        for index in range(1, 5):
+            self.positions[index] = max(self.positions[index], self.positions[index - 1] + 1)
+        for index in range(3, -1, -1):
+            self.positions[index] = min(self.positions[index], self.positions[index + 1] - 1)
+
+        # Set the marker heights from the sorted values at the marker positions
+        self.heights = [float(sorted_values[position - 1]) for position in self.positions]
+
+    #------------------------------------------------------------------------------
+    def add(self, value):
+        """ Method for adding a new value to the estimator and adjusting the marker heights """
+
+        # Find the cell the value falls in, extending the minimum or maximum markers if needed
+        if value < self.heights[0]:
+            self.heights[0] = value
+            cell_index = 0
+
+        elif value >= self.heights[4]:
+            self.heights[4] = value
+            cell_index = 3
+
+        else:
+            cell_index = next(index for index in range(4) if self.heights[index] <= value < self.heights[index + 1])
+
+        # Increment the positions of the markers above the value and the desired positions of all markers
+        for index in range(cell_index + 1, 5):
+            self.positions[index] += 1
+
+        for index in range(5):
+            self.desired_positions[index] += self.increments[index]
+
+        # Adjust the heights of the middle markers that are off their desired positions
+        for index in range(1, 4):
+
+            offset = self.desired_positions[index] - self.positions[index]
+            gap_above = self.positions[index + 1] - self.positions[index]
+            gap_below = self.positions[index - 1] - self.positions[index]
+
+            if (offset >= 1 and gap_above > 1) or (offset <= -1 and gap_below < -1):
+
+                # Use the parabolic prediction for the new height, falling back to linear if it is out of order
+                step = 1 if offset > 0 else -1
+                new_height = self.parabolic_height(index, step)
+
+                if not self.heights[index - 1] < new_height < self.heights[index + 1]:
+                    new_height = self.linear_height(index, step)
+
+                self.heights[index] = new_height
+                self.positions[index] += step
+
+    #------------------------------------------------------------------------------
+    def parabolic_height(self, index, step):
+        """ Helper method for predicting the marker height after a move using piecewise-parabolic interpolation """
+
+        # Get the neighbouring marker positions and heights
+        pos, pos_below, pos_above = self.positions[index], self.positions[index - 1], self.positions[index + 1]
+        height, height_below, height_above = self.heights[index], self.heights[index - 1], self.heights[index + 1]
+
+        return height + step / (pos_above - pos_below) * (
+            (pos - pos_below + step) * (height_above - height) / (pos_above - pos)
+            + (pos_above - pos - step) * (height - height_below) / (pos - pos_below)
+        )
+
+    #------------------------------------------------------------------------------
+    def linear_height(self, index, step):
+        """ Helper method for predicting the marker height after a move using linear interpolation """
+
+        return self.heights[index] + step * (self.heights[index + step] - self.heights[index]) / (self.positions[index + step] - self.positions[index])
+
+    #------------------------------------------------------------------------------
+    def estimate(self):
+        """ Method for returning the current quantile estimate """
+
+        return self.heights[2]
+
+#-----------------------------------------------------------------------------------------------------------
+class RunningStats:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, quantiles=(0.05, 0.5, 0.95), exact_limit=1000):
+        """ Class for calculating the statistics of a single metric across test runs as each value is added.
+            The mean and variance are updated using Welford's online algorithm. The values are kept while there
+            are no more than exact_limit of them so that the quantiles are exact, after which they are discarded
+            and the quantiles are estimated using the P-Square algorithm, keeping the memory used constant. """
+
+        # Set the Welford running totals and the minimum and maximum values
+        self.count = 0
+        self.mean = 0.0
+        self.sum_sq_diff = 0.0
+        self.min = math.nan
+        self.max = math.nan
+
+        # Set the quantile tracking variables
+        self.quantiles = quantiles
+        self.exact_limit = max(exact_limit, 5)
+        self.values = []
+        self.estimators = None
+
+    #------------------------------------------------------------------------------
+    def add(self, value):
+        """ Method for adding a new value to the statistics """
+
+        # Update the count, mean and sum of squared differences using Welford's algorithm
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_sq_diff += delta * (value - self.mean)
+
+        # Update the minimum and maximum values
+        self.min = value if self.count == 1 else min(self.min, value)
+        self.max = value if self.count == 1 else max(self.max, value)
+
+        # Add the value to the quantile estimators, or store it if the quantiles are still being calculated exactly
+        if self.estimators is not None:
+            for estimator in self.estimators:
+                estimator.add(value)
+            return
+
+        self.values.append(value)
+
+        # Switch to the quantile estimators once the exact value limit is passed
+        if len(self.values) > self.exact_limit:
+            sorted_values = sorted(self.values)
+            self.estimators = [P2QuantileEstimator(quantile, sorted_values) for quantile in self.quantiles]
+            self.values = []
+
+    #------------------------------------------------------------------------------
+    def get_quantiles(self):
+        """ Method for returning the exact or estimated values for each of the tracked quantiles """
+
+        # Return empty values if no values have been added
+        if self.count == 0:
+            return [math.nan] * len(self.quantiles)
+
+        # Return the estimated quantiles if the exact value limit has been passed
+        if self.estimators is not None:
+            return [estimator.estimate() for estimator in self.estimators]
+
+        sorted_values = sorted(self.values)
+        return [exact_quantile(sorted_values, quantile) for quantile in self.quantiles]
+
+    #------------------------------------------------------------------------------
+    def summary(self):
+        """ Method for returning the statistics as a list in the same order as the statistics headers
+            (excluding the metric name). Values that need more runs to be calculated are left empty """
+
+        # Return empty statistics if no values have been added
+        if self.count == 0:
+            return [0] + [math.nan] * (len(stats_headers) - 2)
+
+        # Calculate the standard deviations and the confidence interval of the mean
+        pop_stdev = math.sqrt(self.sum_sq_diff / self.count)
+
+        if self.count > 1:
+            sample_stdev = math.sqrt(self.sum_sq_diff / (self.count - 1))
+            ci_margin = get_t_crit_95(self.count - 1) * sample_stdev / math.sqrt(self.count)
+            ci_lower, ci_upper = self.mean - ci_margin, self.mean + ci_margin
+        else:
+            sample_stdev, ci_lower, ci_upper = math.nan, math.nan, math.nan
+
+        # Get the 5th percentile, median and 95th percentile values
+        p5, median, p95 = self.get_quantiles()
+
+        return [self.count, self.mean, median, pop_stdev, sample_stdev, self.min, self.max, p5, p95, ci_lower, ci_upper]
+
+#-----------------------------------------------------------------------------------------------------------
+class ResultStatsAggregator:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, key_columns, metric_columns=None, metric_labels=None):
+        """ Class for calculating the statistics of each metric for every result group across test runs.
+            The result groups are identified by the values in the key columns (such as the algorithm and
+            operation), and the results for each run are added one run at a time. If no metric columns are
+            supplied, all of the non-key columns in the first added results are used. The metric labels
+            dictionary can be used to rename the metrics in the outputted statistics. """
+
+        # Set the class variables and the dictionary of running statistics for each result group
+        self.key_columns = list(key_columns)
+        self.metric_columns = list(metric_columns) if metric_columns is not None else None
+        self.metric_labels = metric_labels if metric_labels is not None else {}
+        self.group_stats = {}
+
+    #------------------------------------------------------------------------------
+    def add_run(self, run_df):
+        """ Method for adding the results for a single test run to the statistics of each result group.
+            Only the first row for each group in the run is used and any empty or non-numeric metric
+            values are skipped """
+
+        # Set the metric columns from the first run if they have not been supplied
+        if self.metric_columns is None:
+            self.metric_columns = [column for column in run_df.columns if column not in self.key_columns]
+
+        # Get the group keys and numeric metric values for the rows in the run
+        run_df = run_df.drop_duplicates(subset=self.key_columns)
+        group_keys = zip(*[run_df[column].fillna("").astype(str) for column in self.key_columns])
+        metric_values = zip(*[pd.to_numeric(run_df[column], errors="coerce") for column in self.metric_columns])
+
+        # Add each of the metric values to the running statistics for its result group
+        for group_key, row_values in zip(group_keys, metric_values):
+
+            if group_key not in self.group_stats:
+                self.group_stats[group_key] = [RunningStats() for _ in self.metric_columns]
+
+            for metric_stats, value in zip(self.group_stats[group_key], row_values):
+                if not pd.isna(value):
+                    metric_stats.add(value)
+
+    #------------------------------------------------------------------------------
+    def to_dataframe(self):
+        """ Method for creating the statistics dataframe, with a row for each metric of each result group """
+
+        # Create the statistics rows for each result group in the order they were first added
+        stats_rows = []
+        for group_key, metrics_stats in self.group_stats.items():
+            for metric, metric_stats in zip(self.metric_columns, metrics_stats):
+                stats_rows.append(list(group_key) + [self.metric_labels.get(metric, metric)] + metric_stats.summary())
+
+        return pd.DataFrame(stats_rows, columns=self.key_columns + stats_headers)
+
+    #------------------------------------------------------------------------------
+    def write_csv(self, output_filepath):
+        """ Method for writing the statistics for all of the result groups to the supplied csv file """
+
+        self.to_dataframe().to_csv(output_filepath, index=False)
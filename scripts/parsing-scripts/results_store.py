@@ -0,0 +1,417 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Results store module for the PQC benchmarking result parsers. Provides the functions for ingesting the parsed
+Liboqs speed and memory results and the OQS-Provider TLS handshake and speed results into a single SQLite database,
+along with a small query API that returns the stored results as pandas dataframes. Each ingest is recorded under a
+campaign name, so that the results from separate benchmarking campaigns can be compared directly without walking
+the parsed CSV trees. The per-run results are stored, with averages and other statistics being calculated at query
+time. This module is used by parse_results.py when the --sqlite option is passed, and its query functions can be
+imported directly for analysis.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import re
+import sqlite3
+from datetime import datetime
+import pandas as pd
+
+# Declare the tables in the results store, with the label and metric columns for each table
+store_tables = {
+    "liboqs_speed": {
+        "labels": ["algorithm_type", "algorithm", "operation"],
+        "metrics": ["iterations", "total_time_s", "time_mean_us", "time_stdev_us", "cycles_mean", "cycles_stdev"]
+    },
+    "liboqs_memory": {
+        "labels": ["algorithm_type", "algorithm", "operation"],
+        "metrics": ["intits", "max_bytes", "max_heap", "ext_heap", "max_stack"]
+    },
+    "tls_handshake": {
+        "labels": ["test_type", "algorithm", "operation", "signing_algorithm", "ciphersuite"],
+        "metrics": ["connections_user_time", "user_time_s", "connections_per_user_s", "connections_real_time", "real_time_s"]
+    },
+    "tls_speed": {
+        "labels": ["test_type", "algorithm_type", "algorithm", "operation"],
+        "metrics": ["time_s", "ops_per_s"]
+    }
+}
+
+# Declare the parsed csv column names for the metrics stored in each of the tables
+liboqs_speed_cols = {
+    "Iterations": "iterations", "Total time (s)": "total_time_s", "Time (us): mean": "time_mean_us",
+    "pop. stdev": "time_stdev_us", "CPU cycles: mean": "cycles_mean", "pop. stdev.1": "cycles_stdev"
+}
+liboqs_mem_cols = {"intits": "intits", "maxBytes": "max_bytes", "maxHeap": "max_heap", "extHeap": "ext_heap", "maxStack": "max_stack"}
+handshake_cols = {
+    "Connections in User Time": "connections_user_time", "User Time (s)": "user_time_s", "Connections Per User Second": "connections_per_user_s",
+    "Connections in Real Time": "connections_real_time", "Real Time (s)": "real_time_s"
+}
+
+# Declare the operations for each algorithm type, used to select the rows in the Liboqs memory results and to name the TLS speed operations
+store_operations = {"kem": ["keygen", "encaps", "decaps"], "sig": ["keypair", "sign", "verify"]}
+tls_speed_operations = {"kem": ["keygen", "encaps", "decaps"], "sig": ["keygen", "sign", "verify"]}
+
+# Declare the operation names used for the TLS handshake rows with and without session reuse
+handshake_operations = {False: "handshake", True: "session-reuse"}
+
+#-----------------------------------------------------------------------------------------------------------
+def get_default_db_path(root_dir):
+    """ Helper function for getting the default results store database path within the test-data directory """
+
+    return os.path.join(root_dir, "test-data", "pqc-results.db")
+
+#-----------------------------------------------------------------------------------------------------------
+def open_store(db_path):
+    """ Function for opening the results store database, creating the tables and indexes if they are not present """
+
+    # Create the database directory if needed and open the connection
+    db_dir = os.path.dirname(os.path.abspath(db_path))
+    os.makedirs(db_dir, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+
+    # Create the campaign table used to record each ingest
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS campaigns ("
+        "campaign TEXT NOT NULL, tool TEXT NOT NULL, machine INTEGER NOT NULL, runs INTEGER NOT NULL, "
+        "results_dir TEXT NOT NULL, ingested_at TEXT NOT NULL, PRIMARY KEY (campaign, tool, machine))"
+    )
+
+    # Create each of the results tables with the lookup index on the campaign, machine, algorithm, operation, and run,
+    # along with an index led by the algorithm and operation for queries across all campaigns and machines
+    for table_name, table in store_tables.items():
+
+        label_cols = ", ".join(f"{column} TEXT" for column in table["labels"])
+        metric_cols = ", ".join(f"{column} REAL" for column in table["metrics"])
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table_name} (campaign TEXT NOT NULL, machine INTEGER NOT NULL, run INTEGER NOT NULL, {label_cols}, {metric_cols})")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table_name}_lookup ON {table_name} (campaign, machine, algorithm, operation, run)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table_name}_alg_lookup ON {table_name} (algorithm, operation, campaign, machine, run)")
+
+    # Add the index for looking up the handshake results by signing algorithm
+    conn.execute("CREATE INDEX IF NOT EXISTS tls_handshake_sig_lookup ON tls_handshake (signing_algorithm, algorithm, campaign, machine, run)")
+    conn.commit()
+
+    return conn
+
+#-----------------------------------------------------------------------------------------------------------
+def discover_runs(results_dir, filename_pattern):
+    """ Helper function for getting the sorted run numbers of the parsed result files in a directory that
+        match the supplied pattern, where the first pattern group is the run number """
+
+    # Return no runs if the directory is not present
+    if not os.path.isdir(results_dir):
+        return []
+
+    # Get the run numbers from the matching filenames
+    run_nums = set()
+    for filename in os.listdir(results_dir):
+        filename_match = filename_pattern.match(filename)
+        if filename_match:
+            run_nums.add(int(filename_match.group(1)))
+
+    return sorted(run_nums)
+
+#-----------------------------------------------------------------------------------------------------------
+def discover_machines(tool_results_dir):
+    """ Helper function for getting the Machine-IDs of the parsed results directories for a tool. Versioned
+        machine directories from previous parses are not included """
+
+    # Return no machines if the tool results directory is not present
+    if not os.path.isdir(tool_results_dir):
+        return []
+
+    # Get the Machine-IDs from the machine-N directory names
+    machine_dir_pattern = re.compile(r"^machine-(\d+)$")
+    machine_nums = []
+
+    for dir_name in os.listdir(tool_results_dir):
+        dir_match = machine_dir_pattern.match(dir_name)
+        if dir_match and os.path.isdir(os.path.join(tool_results_dir, dir_name)):
+            machine_nums.append(int(dir_match.group(1)))
+
+    return sorted(machine_nums)
+
+#-----------------------------------------------------------------------------------------------------------
+def read_liboqs_results(machine_dir):
+    """ Function for reading the parsed Liboqs speed and memory results for all runs of a machine into
+        dataframes matching the liboqs_speed and liboqs_memory store tables """
+
+    # Set the parsed results directories for the machine
+    speed_dir = os.path.join(machine_dir, "speed-results")
+    mem_dir = os.path.join(machine_dir, "mem-results")
+    speed_dfs = []
+    mem_dfs = []
+
+    # Load the speed results for each run and algorithm type
+    for alg_type in ["kem", "sig"]:
+        for run_num in discover_runs(speed_dir, re.compile(rf"^test-{alg_type}-speed-(\d+)\.csv$")):
+
+            speed_df = pd.read_csv(os.path.join(speed_dir, f"test-{alg_type}-speed-{run_num}.csv"))
+            speed_df = speed_df.rename(columns={"Algorithm": "algorithm", "Operation": "operation", **liboqs_speed_cols})
+            speed_df.insert(0, "algorithm_type", alg_type)
+            speed_df.insert(0, "run", run_num)
+            speed_dfs.append(speed_df)
+
+    # Load the memory results for each run and algorithm type, only keeping the operations for the current type
+    for alg_type in ["kem", "sig"]:
+        for run_num in discover_runs(mem_dir, re.compile(rf"^{alg_type}-mem-metrics-(\d+)\.csv$")):
+
+            mem_df = pd.read_csv(os.path.join(mem_dir, f"{alg_type}-mem-metrics-{run_num}.csv"))
+            mem_df = mem_df.loc[mem_df["Operation"].isin(store_operations[alg_type])]
+            mem_df = mem_df.rename(columns={"Algorithm": "algorithm", "Operation": "operation", **liboqs_mem_cols})
+            mem_df.insert(0, "algorithm_type", alg_type)
+            mem_df.insert(0, "run", run_num)
+            mem_dfs.append(mem_df)
+
+    return {"liboqs_speed": speed_dfs, "liboqs_memory": mem_dfs}
+
+#-----------------------------------------------------------------------------------------------------------
+def read_oqs_provider_results(machine_dir):
+    """ Function for reading the parsed OQS-Provider TLS handshake and speed results for all runs of a machine
+        into dataframes matching the tls_handshake and tls_speed store tables. The handshake rows use the KEM
+        or classic algorithm as the algorithm, and whether the session was reused as the operation """
+
+    # Set the parsed results directories for the machine
+    handshake_dir = os.path.join(machine_dir, "handshake-results")
+    speed_dir = os.path.join(machine_dir, "speed-results")
+    handshake_dfs = []
+    speed_dfs = []
+
+    # Load the PQC and PQC-Hybrid base handshake results for each run
+    for test_type in ["pqc", "hybrid"]:
+
+        base_dir = os.path.join(handshake_dir, test_type, "base-results")
+        for run_num in discover_runs(base_dir, re.compile(rf"^{test_type}-base-results-run-(\d+)\.csv$")):
+
+            handshake_df = pd.read_csv(os.path.join(base_dir, f"{test_type}-base-results-run-{run_num}.csv"))
+            handshake_df = handshake_df.rename(columns={"Signing Algorithm": "signing_algorithm", "KEM Algorithm": "algorithm", **handshake_cols})
+            handshake_df.insert(0, "test_type", test_type)
+            handshake_df.insert(0, "run", run_num)
+            handshake_dfs.append(handshake_df)
+
+    # Load the classic handshake results for each run
+    classic_dir = os.path.join(handshake_dir, "classic")
+    for run_num in discover_runs(classic_dir, re.compile(r"^classic-results-run-(\d+)\.csv$")):
+
+        handshake_df = pd.read_csv(os.path.join(classic_dir, f"classic-results-run-{run_num}.csv"))
+        handshake_df = handshake_df.rename(columns={"Ciphersuite": "ciphersuite", "Classic Algorithm": "algorithm", **handshake_cols})
+        handshake_df.insert(0, "test_type", "classic")
+        handshake_df.insert(0, "run", run_num)
+        handshake_dfs.append(handshake_df)
+
+    # Set the handshake operation from the session reuse marker
+    for handshake_df in handshake_dfs:
+        handshake_df["operation"] = handshake_df.pop("Reused Session ID").eq("*").map(handshake_operations)
+
+    # Load the PQC and PQC-Hybrid speed results for each run and algorithm type
+    for test_type, file_prefix in [("pqc", "tls-speed"), ("hybrid", "tls-speed-hybrid")]:
+        for alg_type in ["kem", "sig"]:
+            for run_num in discover_runs(speed_dir, re.compile(rf"^{file_prefix}-{alg_type}-(\d+)\.csv$")):
+
+                # Split the time and operations per second columns into a row for each operation
+                speed_df = pd.read_csv(os.path.join(speed_dir, f"{file_prefix}-{alg_type}-{run_num}.csv"))
+                time_cols = list(speed_df.columns[1:4])
+                ops_cols = list(speed_df.columns[4:7])
+
+                for operation, time_col, ops_col in zip(tls_speed_operations[alg_type], time_cols, ops_cols):
+                    speed_dfs.append(pd.DataFrame({
+                        "run": run_num,
+                        "test_type": test_type,
+                        "algorithm_type": alg_type,
+                        "algorithm": speed_df["Algorithm"],
+                        "operation": operation,
+                        "time_s": speed_df[time_col],
+                        "ops_per_s": speed_df[ops_col]
+                    }))
+
+    return {"tls_handshake": handshake_dfs, "tls_speed": speed_dfs}
+
+#-----------------------------------------------------------------------------------------------------------
+def insert_results(conn, table_name, campaign, machine_num, result_dfs):
+    """ Function for inserting the supplied result dataframes for a machine into a store table, returning
+        the number of rows inserted """
+
+    # Return if there are no results to insert
+    if not result_dfs:
+        return 0
+
+    # Combine the results and set the column order to match the table
+    table = store_tables[table_name]
+    columns = ["run"] + table["labels"] + table["metrics"]
+    result_df = pd.concat(result_dfs, ignore_index=True).reindex(columns=columns)
+
+    # Convert the metric columns to numeric values and replace any missing values with nulls
+    for column in table["metrics"]:
+        result_df[column] = pd.to_numeric(result_df[column], errors="coerce")
+    result_df = result_df.astype(object).where(result_df.notna(), None)
+
+    # Insert the rows for the machine
+    placeholders = ", ".join(["?"] * (len(columns) + 2))
+    conn.executemany(
+        f"INSERT INTO {table_name} (campaign, machine, {', '.join(columns)}) VALUES ({placeholders})",
+        ((campaign, machine_num, *row) for row in result_df.itertuples(index=False, name=None))
+    )
+
+    return len(result_df)
+
+#-----------------------------------------------------------------------------------------------------------
+def ingest_results(db_path, results_dir, campaign, tools=None):
+    """ Function for ingesting the parsed results in the supplied results directory into the results store
+        under the supplied campaign name. Any previously stored results for the same campaign, tool, and
+        machine are replaced, so a campaign can be re-ingested after its results have been updated. The
+        function returns the number of rows stored in each table """
+
+    # Set the tools to ingest and their result readers
+    result_readers = {"liboqs": read_liboqs_results, "oqs-provider": read_oqs_provider_results}
+    tool_names = list(result_readers) if tools is None else tools
+    ingested_at = datetime.now().isoformat(timespec="seconds")
+    row_counts = {table_name: 0 for table_name in store_tables}
+
+    # Open the store and ingest all of the results in a single transaction
+    conn = open_store(db_path)
+    try:
+        with conn:
+            for tool_name in tool_names:
+
+                # Loop through the parsed machine results for the tool
+                tool_results_dir = os.path.join(results_dir, tool_name)
+                for machine_num in discover_machines(tool_results_dir):
+
+                    # Read the parsed results for the machine
+                    machine_dir = os.path.join(tool_results_dir, f"machine-{machine_num}")
+                    machine_results = result_readers[tool_name](machine_dir)
+
+                    # Skip the machine if it has no parsed run results
+                    if not any(machine_results.values()):
+                        print(f"[WARNING] - No parsed {tool_name} results found for Machine-ID ({machine_num}), skipping ingest")
+                        continue
+
+                    # Replace any stored results for the campaign and machine with the current results
+                    num_runs = 0
+                    for table_name, result_dfs in machine_results.items():
+                        conn.execute(f"DELETE FROM {table_name} WHERE campaign = ? AND machine = ?", (campaign, machine_num))
+                        row_counts[table_name] += insert_results(conn, table_name, campaign, machine_num, result_dfs)
+                        num_runs = max([num_runs] + [int(result_df["run"].max()) for result_df in result_dfs])
+
+                    # Record the ingest for the campaign, tool, and machine
+                    conn.execute(
+                        "INSERT OR REPLACE INTO campaigns (campaign, tool, machine, runs, results_dir, ingested_at) VALUES (?, ?, ?, ?, ?, ?)",
+                        (campaign, tool_name, machine_num, num_runs, os.path.abspath(results_dir), ingested_at)
+                    )
+    finally:
+        conn.close()
+
+    return row_counts
+
+#-----------------------------------------------------------------------------------------------------------
+def get_filter_clause(filters):
+    """ Helper function for building the SQL where clause and parameters for the supplied column filters. Each
+        filter value can be a single value or a list of values, and filters set to None are ignored """
+
+    # Build the condition for each of the set filters
+    conditions = []
+    params = []
+
+    for column, value in filters.items():
+
+        if value is None:
+            continue
+
+        if isinstance(value, (list, tuple, set)):
+            values = list(value)
+            conditions.append(f"{column} IN ({', '.join(['?'] * len(values))})")
+            params.extend(values)
+        else:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+
+    where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where_clause, params
+
+#-----------------------------------------------------------------------------------------------------------
+def check_columns(table_name, columns):
+    """ Helper function for ensuring the supplied table and columns are present in the results store, as
+        the table and column names can not be passed to SQLite as query parameters """
+
+    # Ensure the table is a known results store table
+    if table_name not in store_tables:
+        raise ValueError(f"Unknown results store table '{table_name}', expected one of: {', '.join(store_tables)}")
+
+    # Ensure each of the columns is present in the table
+    table = store_tables[table_name]
+    table_columns = ["campaign", "machine", "run"] + table["labels"] + table["metrics"]
+
+    for column in columns:
+        if column not in table_columns:
+            raise ValueError(f"Unknown column '{column}' for the {table_name} table, expected one of: {', '.join(table_columns)}")
+
+#-----------------------------------------------------------------------------------------------------------
+def query_results(db_path, table_name, columns=None, **filters):
+    """ Function for querying the stored results from a results store table, returning them as a dataframe.
+        The results can be filtered on any of the table columns by passing the column name as a keyword
+        argument, for example query_results(db_path, "liboqs_speed", algorithm="ML-KEM-768", operation="decaps") """
+
+    # Set the columns to return and check the requested columns and filters are valid
+    table = store_tables.get(table_name, {"labels": [], "metrics": []})
+    columns = columns or ["campaign", "machine", "run"] + table["labels"] + table["metrics"]
+    check_columns(table_name, list(columns) + list(filters))
+
+    # Query the results with the filters and return the dataframe
+    where_clause, params = get_filter_clause(filters)
+    query = f"SELECT {', '.join(columns)} FROM {table_name}{where_clause} ORDER BY campaign, machine, algorithm, operation, run"
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql_query(query, conn, params=params)
+    finally:
+        conn.close()
+
+#-----------------------------------------------------------------------------------------------------------
+def query_metric(db_path, table_name, metric, **filters):
+    """ Function for querying a single metric from a results store table for each campaign, machine, run,
+        algorithm, and operation matching the supplied filters. For example, the ML-KEM-768 decapsulation
+        CPU cycles across all machines can be returned using:
+        query_metric(db_path, "liboqs_speed", "cycles_mean", algorithm="ML-KEM-768", operation="decaps") """
+
+    # Set the identifying columns for the table, including the signing algorithm for the handshake results
+    id_columns = ["campaign", "machine", "run", "algorithm", "operation"]
+    if table_name == "tls_handshake":
+        id_columns.insert(3, "signing_algorithm")
+
+    return query_results(db_path, table_name, id_columns + [metric], **filters)
+
+#-----------------------------------------------------------------------------------------------------------
+def summarise_metric(db_path, table_name, metric, group_by=("campaign", "machine", "algorithm", "operation"), **filters):
+    """ Function for summarising a single metric across the stored runs, returning the number of runs and
+        the mean, minimum, and maximum value of the metric for each group as a dataframe """
+
+    # Check the metric, grouping columns, and filters are valid
+    group_by = list(group_by)
+    check_columns(table_name, [metric] + group_by + list(filters))
+
+    # Query the summarised metric for each group with the filters and return the dataframe
+    where_clause, params = get_filter_clause(filters)
+    group_cols = ", ".join(group_by)
+    query = (
+        f"SELECT {group_cols}, COUNT({metric}) AS runs, AVG({metric}) AS mean, MIN({metric}) AS min, MAX({metric}) AS max "
+        f"FROM {table_name}{where_clause} GROUP BY {group_cols} ORDER BY {group_cols}"
+    )
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql_query(query, conn, params=params)
+    finally:
+        conn.close()
+
+#-----------------------------------------------------------------------------------------------------------
+def list_campaigns(db_path):
+    """ Function for listing the campaigns stored in the results store, along with the tools and machines
+        ingested for each campaign """
+
+    # Query the recorded ingests and return the dataframe
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql_query("SELECT * FROM campaigns ORDER BY campaign, tool, machine", conn)
+    finally:
+        conn.close()
@@ -0,0 +1,153 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+OpenSSL s_time result reader for the OQS-Provider TLS handshake benchmarking results.
+Extracts both the session ID first use and session ID reused handshake metrics from the s_time output files produced
+by the automated OQS-Provider test suite, reading each file only once and returning the metrics as typed values.
+The first use and reused sections are parsed independently, so a file with one malformed section still returns the
+metrics for the other section along with the problem found in the malformed section. A thread pool can be used to read
+a full set of handshake result files at once, with missing and malformed files being returned separately so they can
+be reported. This module is used internally by the OQS-Provider parsing
+script and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Declare the metric records, with the fields in the same order as the parsed handshake metrics columns
+StimeMetrics = namedtuple("StimeMetrics", ["connections_user", "user_time", "connections_per_user_sec", "connections_real", "real_time"])
+HandshakeMetrics = namedtuple("HandshakeMetrics", ["first_use", "reused", "section_errors"])
+
+# Declare the patterns used to locate the user time and real time metric lines and the start of the session reuse metrics
+user_time_pattern = re.compile(rb"^(\d+) connections in ([\d.]+)s; ([\d.]+) connections/user sec", re.MULTILINE)
+real_time_pattern = re.compile(rb"^(\d+) connections in (\d+) real seconds", re.MULTILINE)
+reuse_marker = b"reuse"
+
+#-----------------------------------------------------------------------------------------------------------
+class StimeFormatError(ValueError):
+    """ Exception raised when an s_time output file does not contain the expected handshake metrics """
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_stime_section(contents):
+    """ Helper function for extracting the handshake metrics from a section of an s_time output file.
+        Returns None if the section does not contain both the user time and real time metric lines. """
+
+    # Locate the user time and real time metric lines
+    user_match = user_time_pattern.search(contents)
+    real_match = real_time_pattern.search(contents)
+
+    if user_match is None or real_match is None:
+        return None
+
+    # Convert the metrics to their numeric types and return the metrics record
+    return StimeMetrics(
+        int(user_match.group(1)),
+        float(user_match.group(2)),
+        float(user_match.group(3)),
+        int(real_match.group(1)),
+        int(real_match.group(2))
+    )
+
+#-----------------------------------------------------------------------------------------------------------
+def read_stime_file(filepath):
+    """ Function for reading both the session ID first use and reused metrics from the supplied s_time output
+        file. The file is read in a single call and split at the start of the session reuse metrics, with each
+        section being parsed independently. A HandshakeMetrics record is returned, with the metrics for a missing
+        or malformed section set to None and the problem found in that section added to its section errors. A
+        StimeFormatError is only raised if neither set of metrics is present. Any errors opening the file are
+        raised to the caller. """
+
+    # Read in the full file contents
+    with open(filepath, "rb") as stime_file:
+        contents = stime_file.read()
+
+    # Split the contents into the first use and reused sections and extract the metrics for each
+    reuse_index = contents.find(reuse_marker)
+
+    if reuse_index == -1:
+        first_use = parse_stime_section(contents)
+        reused = None
+    else:
+        first_use = parse_stime_section(contents[:reuse_index])
+        reused = parse_stime_section(contents[reuse_index:])
+
+    # Record the problem found in each section whose metrics are missing
+    section_errors = []
+
+    if first_use is None:
+        section_errors.append("session first use metrics could not be found")
+
+    if reuse_index == -1:
+        section_errors.append("no session reuse metrics present")
+    elif reused is None:
+        section_errors.append("session reuse metrics could not be found")
+
+    # Ensure that at least one set of metrics was found in the file
+    if first_use is None and reused is None:
+        raise StimeFormatError(", ".join(section_errors))
+
+    return HandshakeMetrics(first_use, reused, tuple(section_errors))
+
+#-----------------------------------------------------------------------------------------------------------
+def read_stime_file_safe(filepath):
+    """ Helper function for reading the handshake metrics for use in the thread pool, returning the
+        filepath, handshake metrics, and any error raised while reading the file. """
+
+    # Read the handshake metrics and return the error rather than raising it
+    try:
+        return filepath, read_stime_file(filepath), None
+    except (OSError, StimeFormatError) as e:
+        return filepath, None, e
+
+#-----------------------------------------------------------------------------------------------------------
+def scan_stime_files(filepaths, max_workers=None):
+    """ Function for reading the handshake metrics from a list of s_time output files using a thread pool.
+        Returns a dictionary of the handshake metrics keyed by filepath, and a dictionary of the errors
+        for any files that are missing, could not be read, or are malformed. """
+
+    # Declare the handshake metrics and errors dictionaries
+    metrics = {}
+    errors = {}
+
+    # Read the files in the thread pool and sort the results into the metrics and errors dictionaries
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for filepath, handshake_metrics, error in executor.map(read_stime_file_safe, filepaths):
+            if error is None:
+                metrics[filepath] = handshake_metrics
+            else:
+                errors[filepath] = error
+
+    return metrics, errors
+
+#-----------------------------------------------------------------------------------------------------------
+def scan_stime_dir(dir_path, max_workers=None):
+    """ Function for reading the handshake metrics for all of the s_time output files in the supplied
+        directory using a thread pool. Returns the metrics and errors dictionaries keyed by filename. """
+
+    # Get the handshake result files present in the directory
+    with os.scandir(dir_path) as dir_entries:
+        filepaths = [entry.path for entry in dir_entries if entry.is_file() and entry.name.endswith(".txt")]
+
+    # Read the handshake metrics and key the results by filename
+    metrics, errors = scan_stime_files(filepaths, max_workers)
+    metrics = {os.path.basename(filepath): handshake_metrics for filepath, handshake_metrics in metrics.items()}
+    errors = {os.path.basename(filepath): error for filepath, error in errors.items()}
+
+    return metrics, errors
+
+#-----------------------------------------------------------------------------------------------------------
+def get_metric_cells(handshake_metrics, reused):
+    """ Helper function for getting the first use or reused metric values for a handshake result row.
+        Empty values are returned if no metrics are available for the file or the requested section. """
+
+    # Return the empty row values if the file or the requested section has no metrics
+    section_metrics = None if handshake_metrics is None else (handshake_metrics.reused if reused else handshake_metrics.first_use)
+
+    if section_metrics is None:
+        return [""] * len(StimeMetrics._fields)
+
+    return list(section_metrics)
@@ -0,0 +1,176 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Up-results index module for the PQC benchmarking result parsers. Provides a file index for a machine's un-parsed
+results, built by walking the machine's up-results directory tree once using os.scandir. The index maps each
+up-result file, either by its path or by its result key (such as the run, signing algorithm, KEM algorithm, and
+operation), to its path, size, and modification time. This allows the parsers to check that all of the expected
+files for a run are present before any parsing starts, and to look up the file details without a separate system
+call for each file, which reduces the metadata lookups on network filesystems. This module is used internally by the
+Liboqs and OQS-Provider parsing scripts and is not intended to be run standalone.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import errno
+from collections import namedtuple
+
+# Declare the index entry record for each up-result file
+IndexEntry = namedtuple("IndexEntry", ["path", "size", "mtime_ns"])
+
+# Declare the up-result file path templates for each tool and result type, relative to the machine's up-results directory
+up_result_layouts = {
+    "liboqs": {
+        "speed": os.path.join("raw-speed-results", "test-{alg_type}-speed-{run}.csv"),
+        "mem": os.path.join("mem-results", "{alg_type}-mem-metrics", "{alg}-{op}-{run}.txt")
+    },
+    "oqs-provider": {
+        "handshake": os.path.join("handshake-results", "{test_type}", "tls-handshake-{run}-{sig}-{kem}.txt"),
+        "classic-handshake": os.path.join("handshake-results", "classic", "tls-handshake-classic-{run}-{cipher}-{alg}.txt"),
+        "latency": os.path.join("handshake-results", "{test_type}", "tls-latency-{run}-{sig}-{kem}.txt"),
+        "classic-latency": os.path.join("handshake-results", "classic", "tls-latency-classic-{run}-{cipher}-{alg}.txt"),
+        "speed": os.path.join("speed-results", "{test_type}", "{file_prefix}-{alg_type}-{run}.txt")
+    }
+}
+
+#-----------------------------------------------------------------------------------------------------------
+def missing_file_error(filepath):
+    """ Helper function for creating the error used for an up-result file that is not present in the index,
+        matching the error that would be raised when opening the missing file """
+
+    return FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), filepath)
+
+#-----------------------------------------------------------------------------------------------------------
+class UpResultsIndex:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, tool_name, mach_up_results_dir):
+        """ Class for indexing the up-result files for a single machine. The machine's up-results directory
+            tree is walked once when the index is created, with the size and modification time of each file
+            being stored so that later lookups do not need to access the filesystem. """
+
+        # Set the tool layout and the indexed directory, and walk the directory tree to build the index
+        self.layout = up_result_layouts[tool_name]
+        self.root_dir = os.path.normpath(os.path.abspath(mach_up_results_dir))
+        self.entries = {}
+        self.build()
+
+    #------------------------------------------------------------------------------
+    def build(self):
+        """ Method for walking the up-results directory tree using os.scandir and storing the index entry for
+            each file. Directories are walked iteratively, and a missing up-results directory results in an empty index """
+
+        # Walk the directory tree, starting from the machine's up-results directory
+        pending_dirs = [self.root_dir]
+        while pending_dirs:
+
+            # Read the entries for the current directory, skipping any directories that can not be read
+            try:
+                with os.scandir(pending_dirs.pop()) as dir_entries:
+                    for entry in dir_entries:
+
+                        # Add subdirectories to the walk and store the details of each file
+                        if entry.is_dir():
+                            pending_dirs.append(entry.path)
+
+                        elif entry.is_file():
+                            file_stat = entry.stat()
+                            self.entries[entry.path] = IndexEntry(entry.path, file_stat.st_size, file_stat.st_mtime_ns)
+
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+
+    #------------------------------------------------------------------------------
+    def __len__(self):
+        """ Method for returning the number of files in the index """
+
+        return len(self.entries)
+
+    #------------------------------------------------------------------------------
+    def covers(self, filepath):
+        """ Method for checking if the supplied file path is within the indexed up-results directory, in which
+            case the index can be used to determine if the file is present """
+
+        return os.path.normpath(os.path.abspath(filepath)).startswith(self.root_dir + os.sep)
+
+    #------------------------------------------------------------------------------
+    def get_entry(self, filepath):
+        """ Method for getting the index entry for the supplied file path, returning None if the file is not present """
+
+        return self.entries.get(os.path.normpath(os.path.abspath(filepath)))
+
+    #------------------------------------------------------------------------------
+    def get_path(self, result_type, **key):
+        """ Method for getting the full path of the up-result file for the supplied result type and key,
+            for example get_path("handshake", test_type="pqc", run=1, sig="mldsa44", kem="mlkem512") """
+
+        return os.path.join(self.root_dir, self.layout[result_type].format(**key))
+
+    #------------------------------------------------------------------------------
+    def lookup(self, result_type, **key):
+        """ Method for getting the index entry of the up-result file for the supplied result type and key,
+            returning None if the file is not present """
+
+        return self.entries.get(self.get_path(result_type, **key))
+
+    #------------------------------------------------------------------------------
+    def split_present(self, filepaths):
+        """ Method for splitting the supplied file paths into the files that are present in the index
+            and the files that are missing, keeping the order of the supplied paths """
+
+        # Sort the file paths depending on if they are present in the index
+        present = []
+        missing = []
+
+        for filepath in filepaths:
+            if self.get_entry(filepath) is not None:
+                present.append(filepath)
+            else:
+                missing.append(filepath)
+
+        return present, missing
+
+#-----------------------------------------------------------------------------------------------------------
+def check_runs_complete(up_index, runs, get_input_files, machine_num, max_listed=5):
+    """ Function for checking that all of the expected up-result files are present for the supplied runs before
+        parsing starts. The expected files for each run are taken from the supplied function, and a warning is
+        outputted for each run with missing files. A dictionary of the missing files for each incomplete run is returned """
+
+    # Check the expected files for each run against the index
+    missing_files = {}
+    for run_num in runs:
+
+        input_files = get_input_files(run_num)
+        _, missing = up_index.split_present(input_files)
+
+        if not missing:
+            continue
+
+        # Output the number of missing files for the run along with the first few missing filenames
+        missing_files[run_num] = missing
+        missing_names = ", ".join(os.path.basename(filepath) for filepath in missing[:max_listed])
+        more_files = f" (and {len(missing) - max_listed} more)" if len(missing) > max_listed else ""
+
+        print(f"[WARNING] - Machine-ID ({machine_num}) run {run_num} is missing {len(missing)} of {len(input_files)} up-result files: {missing_names}{more_files}")
+
+    return missing_files
+
+#-----------------------------------------------------------------------------------------------------------
+def scan_indexed_files(scan_files, filepaths, up_index=None):
+    """ Function for reading a list of up-result files using the supplied scanning function (such as the massif
+        or s_time reader thread pools). If an up-results index is supplied, only the files present in the index
+        are read and the missing files are added to the returned errors without trying to open them """
+
+    # Read all of the files if no index is supplied
+    if up_index is None:
+        return scan_files(filepaths)
+
+    # Read the files that are present and add the errors for the missing files
+    present, missing = up_index.split_present(filepaths)
+    results, errors = scan_files(present)
+
+    for filepath in missing:
+        errors[filepath] = missing_file_error(filepath)
+
+    return results, errors
@@ -0,0 +1,94 @@
+#!/bin/bash
+
+# Copyright (c) 2023-2025 Callum Turino
+# SPDX-License-Identifier: MIT
+
+# Helper functions for the checkpoint journal used by the automated benchmarking scripts to resume interrupted test campaigns.
+# The journal is a plain text file stored in the machine's un-parsed results directory which records the test parameters for the
+# campaign and each test unit once it has completed (such as a run/algorithm memory test or a run/sig/kem handshake test). When a
+# campaign is resumed, the completed units are skipped and only the unfinished units are performed. This file is sourced by the
+# Liboqs and OQS-Provider test scripts and is not intended to be run standalone.
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function checkpoint_create() {
+    # Function for creating a new checkpoint journal at the passed filepath for a fresh test campaign, removing any previous journal.
+    # The remaining arguments are stored in the journal as the campaign test parameters in the form name=value.
+
+    # Set the global journal filepath and clear the completed units array
+    checkpoint_journal="$1"
+    shift
+    declare -gA checkpoint_units=()
+
+    # Create the new journal file and store the test parameters
+    mkdir -p "$(dirname "$checkpoint_journal")"
+    : > "$checkpoint_journal"
+
+    for param in "$@"; do
+        echo "#param|$param" >> "$checkpoint_journal"
+    done
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function checkpoint_load() {
+    # Function for loading the completed test units from the checkpoint journal at the passed filepath into the completed units array.
+    # The function will return 1 if the journal file is not present.
+
+    # Set the global journal filepath and clear the completed units array
+    checkpoint_journal="$1"
+    declare -gA checkpoint_units=()
+
+    # Ensure that the journal file is present before loading
+    if [ ! -f "$checkpoint_journal" ]; then
+        return 1
+    fi
+
+    # Read in the completed units, skipping the test parameter lines
+    while IFS= read -r line; do
+        if [[ -n "$line" && "$line" != \#param\|* ]]; then
+            checkpoint_units["$line"]=1
+        fi
+    done < "$checkpoint_journal"
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function checkpoint_get_param() {
+    # Helper function for outputting the value of the passed test parameter name stored in the loaded checkpoint journal
+
+    # Output the value of the last matching parameter line in the journal
+    grep "^#param|$1=" "$checkpoint_journal" | tail -n 1 | cut -d'=' -f2-
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function checkpoint_is_done() {
+    # Helper function for checking if the passed test unit has been recorded as completed in the checkpoint journal.
+    # The function will return 0 if the unit is complete and 1 if it is not, or if no journal has been loaded.
+
+    # Check the completed units array for the passed unit
+    [[ -n "$checkpoint_journal" && -n "${checkpoint_units[$1]}" ]]
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function checkpoint_record() {
+    # Helper function for recording the passed test unit as completed in the checkpoint journal. Each unit is appended to the
+    # journal as a single line so that units recorded by parallel background jobs are not interleaved.
+
+    # Append the unit to the journal if one has been loaded and add it to the completed units array
+    if [ -n "$checkpoint_journal" ]; then
+        echo "$1" >> "$checkpoint_journal"
+        checkpoint_units["$1"]=1
+    fi
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function checkpoint_count() {
+    # Helper function for outputting the number of completed test units loaded from the checkpoint journal
+
+    # Output the size of the completed units array
+    echo "${#checkpoint_units[@]}"
+
+}
@@ -0,0 +1,92 @@
+#!/bin/bash
+
+# Copyright (c) 2023-2025 Callum Turino
+# SPDX-License-Identifier: MIT
+
+# Helper functions for the control channel used to coordinate the OQS-Provider TLS handshake tests between the client and server
+# machines. Rather than opening a new netcat connection for every control signal, a single TCP connection is established at the start
+# of testing and kept open for the whole test campaign. The server runs one netcat listener as a coprocess on the server control port
+# and the client connects to it using the bash /dev/tcp interface. Control messages (next, ready, skip, complete, failed) are sent as
+# newline-delimited frames over this connection, so each message is delivered in order without polling for an open port or sleeping
+# between signals. This file is sourced by the OQS-Provider client and server test scripts and is not intended to be run standalone.
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function control_channel_listen() {
+    # Function for opening the server side of the control channel. A netcat listener is started as a coprocess on the passed port,
+    # with its input and output being used to send and receive the control messages once the client has connected.
+
+    # Declare the local variables for the arguments passed to function
+    local port="$1"
+
+    # Start the netcat listener coprocess for the control channel
+    coproc control_channel_proc { nc -l -p "$port"; }
+
+    # Store the file descriptors used to receive and send the control messages
+    control_in_fd="${control_channel_proc[0]}"
+    control_out_fd="${control_channel_proc[1]}"
+    control_channel_pid="$control_channel_proc_PID"
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function control_channel_connect() {
+    # Function for opening the client side of the control channel. The function connects to the server control port at the passed
+    # address, retrying until the server script has started its listener.
+
+    # Declare the local variables for the arguments passed to function
+    local host="$1"
+    local port="$2"
+
+    # Connect to the server control port until successful
+    until { exec {control_fd}<>"/dev/tcp/$host/$port"; } 2>/dev/null; do
+        sleep 0.1
+    done
+
+    # Use the same file descriptor to receive and send the control messages
+    control_in_fd="$control_fd"
+    control_out_fd="$control_fd"
+    control_channel_pid=""
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function control_channel_send() {
+    # Helper function for sending the passed control message to the other machine as a single newline-delimited frame.
+    # The script will exit if the control channel connection has been lost.
+
+    # Write the message frame to the control channel
+    if ! printf '%s\n' "$1" >&"$control_out_fd" 2>/dev/null; then
+        echo "[ERROR] - Failed to send the control message ($1), the control channel connection has been lost"
+        exit 1
+    fi
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function control_channel_receive() {
+    # Helper function for receiving the next control message from the other machine and storing it in the control_message variable.
+    # The script will exit if the control channel connection has been closed.
+
+    # Read the next message frame from the control channel
+    if ! IFS= read -r control_message <&"$control_in_fd"; then
+        echo "[ERROR] - The control channel connection has been closed by the other machine"
+        exit 1
+    fi
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function control_channel_close() {
+    # Function for closing the control channel once testing has completed, stopping the netcat listener coprocess on the server
+
+    # Close the control channel file descriptors
+    { exec {control_out_fd}>&-; } 2>/dev/null
+    { exec {control_in_fd}<&-; } 2>/dev/null
+
+    # Stop the netcat listener coprocess if running, ignoring its exit status as it is expected to be terminated
+    if [ -n "$control_channel_pid" ]; then
+        kill "$control_channel_pid" 2>/dev/null
+        wait "$control_channel_pid" 2>/dev/null || :
+    fi
+
+}
@@ -9,6 +9,124 @@
 # The script also handles the organisation and storage of results, ensuring they are saved in the appropriate 
 # directories based on the assigned machine number.
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function output_help_message() {
+    # Helper function for outputting the help message to the user when the --help flag is present or when incorrect arguments are passed
+
+    # Output the supported options and their usage to the user
+    echo "Usage: full-liboqs-test.sh [options]"
+    echo "Options:"
+    echo "  --mem-jobs=<num>                   Set the number of parallel Valgrind memory test jobs (default: $(nproc))"
+    echo "  --resume                           Resume an interrupted test campaign using its checkpoint journal"
+    echo "  --cpu-cores=<list>                 Pin the speed tests to the listed CPU cores using taskset (e.g. 2 or 2,3 or 2-3)"
+    echo "  --max-busy=<percent>               Set the CPU usage above which the system is treated as busy (default: 10)"
+    echo "  --noise-policy=<flag|refuse>       Flag speed runs started on a busy system, or wait for it to become idle (default: flag)"
+    echo "  --no-warmup                        Skip the speed test warm-up pass"
+    echo "  --help                             Display the help message"
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function parse_args {
+    # Function for parsing the command line arguments passed to the script. Based on the detected arguments, the function will
+    # set the relevant global parameter variables that are used throughout the test control process.
+
+    # Check if the help flag is passed at any position in the command line arguments
+    if [[ "$*" =~ --help ]]; then
+        output_help_message
+        exit 0
+    fi
+
+    # Loop through the passed command line arguments and check for the supported options
+    while [[ $# -gt 0 ]]; do
+
+        # Check if the argument is a valid option, then shift to the next argument
+        case "$1" in
+
+            --mem-jobs=*)
+
+                # Store the number of parallel memory test jobs
+                mem_jobs="${1#*=}"
+
+                # Check if the number of jobs is a valid integer above 0
+                if [[ ! "$mem_jobs" =~ ^[1-9][0-9]*$ ]]; then
+                    echo "[ERROR] - Invalid number of memory test jobs: $mem_jobs"
+                    exit 1
+                fi
+
+                shift
+                ;;
+
+            --resume)
+
+                # Set the resume flag so that completed tests are skipped using the checkpoint journal
+                resume_flag="True"
+                shift
+                ;;
+
+            --cpu-cores=*)
+
+                # Store the list of CPU cores that the speed tests will be pinned to
+                cpu_cores="${1#*=}"
+
+                # Check if the core list is in the taskset list format
+                if [[ ! "$cpu_cores" =~ ^[0-9]+(-[0-9]+)?(,[0-9]+(-[0-9]+)?)*$ ]]; then
+                    echo "[ERROR] - Invalid CPU core list: $cpu_cores"
+                    exit 1
+                fi
+
+                shift
+                ;;
+
+            --max-busy=*)
+
+                # Store the CPU usage percentage above which the system is treated as busy
+                max_busy="${1#*=}"
+
+                # Check if the percentage is a valid integer between 0 and 100
+                if [[ ! "$max_busy" =~ ^[0-9]+$ ]] || (( max_busy > 100 )); then
+                    echo "[ERROR] - Invalid maximum CPU usage percentage: $max_busy"
+                    exit 1
+                fi
+
+                shift
+                ;;
+
+            --noise-policy=*)
+
+                # Store the policy used when the system is busy before a speed test run
+                noise_policy="${1#*=}"
+
+                # Check if the policy is one of the supported values
+                if [ "$noise_policy" != "flag" ] && [ "$noise_policy" != "refuse" ]; then
+                    echo "[ERROR] - Invalid noise policy: $noise_policy, please use flag or refuse"
+                    exit 1
+                fi
+
+                shift
+                ;;
+
+            --no-warmup)
+
+                # Set the flag to skip the speed test warm-up pass
+                warmup_flag="False"
+                shift
+                ;;
+
+            *)
+
+                # Output the error message for unknown options and display the help message
+                echo "[ERROR] - Unknown option: $1"
+                output_help_message
+                exit 1
+                ;;
+
+        esac
+
+    done
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function enable_arm_pmu() {
     # Function for enabling the ARM PMU and allowing it to be used in user space. The function will also check if the system is a Raspberry-Pi
@@ -133,6 +251,9 @@ function setup_base_env() {
     test_data_dir="$root_dir/test-data"
     test_scripts_path="$root_dir/scripts/test-scripts"
 
+    # Source the checkpoint journal helper functions
+    source "$test_scripts_path/checkpoint-journal.sh"
+
     # Check if the system is ARM based and if PMU checks are required
     if [[ "$(uname -m)" = arm* || "$(uname -m)" == aarch* ]]; then
 
@@ -295,6 +416,11 @@ function get_test_options() {
 
     done
 
+    # Skip the number of test runs prompt if resuming, as it is taken from the checkpoint journal
+    if [ "$resume_flag" == "True" ]; then
+        return 0
+    fi
+
     # Ask the user for the number of test runs to perform
     while true; do
 
@@ -316,6 +442,33 @@ function get_test_options() {
 
 }
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function resume_test_campaign() {
+    # Function for resuming an interrupted test campaign for the assigned machine-ID. The checkpoint journal stored in the machine's
+    # results directory is loaded, and the number of test runs is restored from the journal so that the completed tests can be skipped.
+
+    # Load the checkpoint journal for the machine-ID and exit if there is no campaign to resume
+    if ! checkpoint_load "$machine_results_path/.checkpoint-journal"; then
+        echo "[ERROR] - No checkpoint journal found for Machine-ID ($machine_num) in $machine_results_path, unable to resume testing"
+        exit 1
+    fi
+
+    # Restore the number of test runs from the journal
+    number_of_runs=$(checkpoint_get_param "number_of_runs")
+
+    if [[ ! "$number_of_runs" =~ ^[1-9][0-9]*$ ]]; then
+        echo "[ERROR] - The checkpoint journal for Machine-ID ($machine_num) does not contain a valid number of test runs"
+        exit 1
+    fi
+
+    # Ensure the results directories are present and output the resume details to the terminal
+    mkdir -p "$machine_speed_results"
+    mkdir -p "$kem_mem_results" && mkdir -p "$sig_mem_results"
+
+    echo -e "Resuming test campaign for Machine-ID ($machine_num) with $number_of_runs test runs, $(checkpoint_count) tests already completed\n"
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function setup_test_suite() {
     # Function for setting up the Liboqs test suite. This includes creating the necessary directories for storing results,
@@ -330,22 +483,33 @@ function setup_test_suite() {
     get_test_options
     set_result_paths
 
-    # Create the un-parsed results directory for the machine-ID
-    if [ -d "$test_data_dir/up-results" ]; then
+    # Resume the previous test campaign for the machine-ID, or create the results directories and journal for a new campaign
+    if [ "$resume_flag" == "True" ]; then
+        resume_test_campaign
+
+    else
+
+        # Create the un-parsed results directory for the machine-ID
+        if [ -d "$test_data_dir/up-results" ]; then
+
+            # Check if there is already results present for assigned machine-ID and handle any clashes
+            if [ -d "$machine_results_path" ]; then
+                handle_machine_id_clash
+
+            else
+                mkdir -p "$machine_speed_results"
+                mkdir -p "$kem_mem_results" && mkdir -p "$sig_mem_results"
+
+            fi
 
-        # Check if there is already results present for assigned machine-ID and handle any clashes
-        if [ -d "$machine_results_path" ]; then
-            handle_machine_id_clash
-            
         else
             mkdir -p "$machine_speed_results"
             mkdir -p "$kem_mem_results" && mkdir -p "$sig_mem_results"
 
         fi
 
-    else
-        mkdir -p "$machine_speed_results"
-        mkdir -p "$kem_mem_results" && mkdir -p "$sig_mem_results"
+        # Create the checkpoint journal for the new test campaign
+        checkpoint_create "$machine_results_path/.checkpoint-journal" "number_of_runs=$number_of_runs"
 
     fi
 
@@ -394,119 +558,431 @@ function setup_test_suite() {
     op_kem=("Keygen" "Encaps" "Decaps")
     op_sig=("Keygen" "Sign" "Verify")
 
-    # Create the temp memory results directories for storing Valgrind operation files
+    # Set the temp memory results directory for storing the Valgrind job files
     mem_tmp_dir="$tmp_dir/mem_test_tmp"
-    rm -rf "$mem_tmp_dir/" && mkdir -p "$mem_tmp_dir"
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function expand_cpu_list() {
+    # Helper function for expanding the passed CPU core list in the taskset list format (such as 0,2-3) into a space separated list of cores
+
+    # Split the core list and expand any core ranges
+    local cores=()
+    IFS=',' read -ra list_parts <<< "$1"
+
+    for list_part in "${list_parts[@]}"; do
+        if [[ "$list_part" =~ ^([0-9]+)-([0-9]+)$ ]]; then
+            cores+=($(seq "${BASH_REMATCH[1]}" "${BASH_REMATCH[2]}"))
+        else
+            cores+=("$list_part")
+        fi
+    done
+
+    echo "${cores[@]}"
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function get_cpu_busy_percent() {
+    # Helper function for outputting the CPU usage percentage of the measured cores (or all cores if none are set), sampled from /proc/stat
+    # over one second. The idle and iowait times are treated as idle, and the guest times are excluded as they are included in the user time.
+
+    # Set the /proc/stat line pattern for the measured cores
+    local stat_pattern="^cpu "
+    if [ -n "$measured_cores" ]; then
+        stat_pattern="^cpu($(echo $measured_cores | tr ' ' '|')) "
+    fi
+
+    # Take two samples of the idle and total CPU times one second apart
+    local idle_1 total_1 idle_2 total_2
+    read -r idle_1 total_1 <<< "$(grep -E "$stat_pattern" /proc/stat | awk '{idle += $5 + $6; for (i = 2; i <= 9; i++) total += $i} END {print idle, total}')"
+    sleep 1
+    read -r idle_2 total_2 <<< "$(grep -E "$stat_pattern" /proc/stat | awk '{idle += $5 + $6; for (i = 2; i <= 9; i++) total += $i} END {print idle, total}')"
+
+    # Calculate and output the busy percentage for the sample period
+    local total_diff=$((total_2 - total_1))
+    if [ "$total_diff" -le 0 ]; then
+        echo 0
+    else
+        echo $(( 100 * (total_diff - (idle_2 - idle_1)) / total_diff ))
+    fi
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function get_scaling_governor() {
+    # Helper function for outputting the CPU frequency scaling governor used by the measured cores (or all cores if none are set).
+    # If the cores use different governors, they are all outputted separated by a slash, and unknown is outputted if unavailable.
+
+    # Set the cores to check the governor for
+    local cores="$measured_cores"
+    if [ -z "$cores" ]; then
+        cores=$(seq 0 $(( $(nproc --all) - 1 )))
+    fi
+
+    # Read the governor for each core and output the unique governors
+    local governors=()
+    for core in $cores; do
+        governor_file="/sys/devices/system/cpu/cpu$core/cpufreq/scaling_governor"
+        if [ -r "$governor_file" ]; then
+            governors+=("$(cat "$governor_file")")
+        fi
+    done
+
+    if [ ${#governors[@]} -eq 0 ]; then
+        echo "unknown"
+    else
+        printf "%s\n" "${governors[@]}" | sort -u | paste -sd "/"
+    fi
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function get_turbo_state() {
+    # Helper function for outputting whether the CPU turbo/boost feature is enabled, disabled, or unknown if it can not be determined
+
+    # Check the Intel P-State driver and then the generic cpufreq boost control
+    if [ -r "/sys/devices/system/cpu/intel_pstate/no_turbo" ]; then
+        [ "$(cat /sys/devices/system/cpu/intel_pstate/no_turbo)" == "1" ] && echo "disabled" || echo "enabled"
+
+    elif [ -r "/sys/devices/system/cpu/cpufreq/boost" ]; then
+        [ "$(cat /sys/devices/system/cpu/cpufreq/boost)" == "1" ] && echo "enabled" || echo "disabled"
+
+    else
+        echo "unknown"
+
+    fi
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function setup_speed_harness() {
+    # Function for setting up the speed test measurement harness. This sets the command used to pin the speed tests to the chosen CPU
+    # cores, and checks the CPU scaling governor and turbo/boost state, warning the user if they are likely to add noise to the results.
+
+    # Set the speed test command prefix used to pin the tests to the chosen CPU cores
+    speed_cmd_prefix=()
+    measured_cores=""
+
+    if [ -n "$cpu_cores" ]; then
+
+        # Ensure that taskset is available and the chosen cores are present on the system
+        if ! command -v taskset &>/dev/null; then
+            echo "[ERROR] - The taskset tool is required to pin the speed tests to CPU cores, please install util-linux"
+            exit 1
+        fi
+
+        measured_cores=$(expand_cpu_list "$cpu_cores")
+
+        for core in $measured_cores; do
+            if [ ! -d "/sys/devices/system/cpu/cpu$core" ]; then
+                echo "[ERROR] - CPU core $core is not present on this system"
+                exit 1
+            fi
+        done
+
+        speed_cmd_prefix=(taskset -c "$cpu_cores")
+        echo "Speed tests will be pinned to CPU cores - $cpu_cores"
+
+    fi
+
+    # Check the CPU scaling governor and turbo/boost state and warn the user if they may add noise to the results
+    scaling_governor=$(get_scaling_governor)
+    turbo_state=$(get_turbo_state)
+    echo -e "CPU scaling governor - $scaling_governor, Turbo/boost - $turbo_state\n"
+
+    if [ "$scaling_governor" != "performance" ] && [ "$scaling_governor" != "unknown" ]; then
+        echo -e "[WARNING] - The CPU scaling governor is not set to performance, which may increase the variance of the speed results\n"
+    fi
+
+    if [ "$turbo_state" == "enabled" ]; then
+        echo -e "[WARNING] - CPU turbo/boost is enabled, which may increase the variance of the speed results\n"
+    fi
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function record_machine_state() {
+    # Function for checking that the system is idle before a speed test run and storing the machine-state record for the run next to its
+    # speed results. If the system is busy, the run is either flagged in the record or the function waits for the system to become idle,
+    # depending on the noise policy. If the system is still busy after waiting, the script exits so the campaign can be resumed later.
+
+    # Set the local variables to what was passed to the function
+    local alg_type="$1"
+    local run_num="$2"
+    local wait_attempts=0
+    local cpu_busy
+    local system_busy
+
+    # Check the CPU usage of the measured cores until the system is idle or the noise policy allows the run to continue
+    while true; do
+
+        cpu_busy=$(get_cpu_busy_percent)
+
+        if [ "$cpu_busy" -le "$max_busy" ]; then
+            system_busy=0
+            break
+
+        elif [ "$noise_policy" == "flag" ]; then
+            echo -e "[WARNING] - System is busy ($cpu_busy% CPU usage) before the $alg_type speed test run $run_num, the run will be flagged as noisy\n"
+            system_busy=1
+            break
+
+        fi
+
+        # Wait for the system to become idle, exiting if the maximum number of attempts has been reached
+        wait_attempts=$((wait_attempts + 1))
+
+        if [ "$wait_attempts" -gt "$noise_wait_attempts" ]; then
+            echo "[ERROR] - System is still busy ($cpu_busy% CPU usage) after waiting for it to become idle"
+            echo "The test campaign can be continued once the system is idle using the --resume flag"
+            exit 1
+        fi
+
+        echo "[WARNING] - System is busy ($cpu_busy% CPU usage), waiting 10 seconds before retrying ($wait_attempts/$noise_wait_attempts)"
+        sleep 10
+
+    done
+
+    # Store the machine-state record for the run
+    {
+        echo "run=$run_num"
+        echo "alg_type=$alg_type"
+        echo "timestamp=$(date -u +%Y-%m-%dT%H:%M:%SZ)"
+        echo "cpu_cores=${cpu_cores:-all}"
+        echo "scaling_governor=$(get_scaling_governor)"
+        echo "turbo=$(get_turbo_state)"
+        echo "load_avg_1m=$(cut -d' ' -f1 /proc/loadavg)"
+        echo "cpu_busy_percent=$cpu_busy"
+        echo "max_busy_percent=$max_busy"
+        echo "noise_policy=$noise_policy"
+        echo "warmup=$warmup_flag"
+        echo "busy=$system_busy"
+    } > "$machine_speed_results/machine-state-$alg_type-$run_num.txt"
 
 }
 
 #-------------------------------------------------------------------------------------------------------------------------------
 function speed_tests() {
     # Function for performing the Liboqs CPU speed benchmarking tests. This includes running the KEM and digital signature speed tests
-    # for the specified number of runs and storing the results in the appropriate results directories.
+    # for the specified number of runs and storing the results in the appropriate results directories. The tests are run through the
+    # measurement harness, which pins the tests to the chosen CPU cores, performs a warm-up pass, and records the machine state for each run.
 
     # Output the current task to the terminal
     echo "#############################"
     echo "Performing Liboqs Speed Tests"
     echo -e "#############################\n"
 
+    # Set up the speed test measurement harness
+    setup_speed_harness
+
+    # Declare the speed test binaries and descriptions for each algorithm type
+    declare -A speed_bins=(["kem"]="$kem_speed_bin" ["sig"]="$sig_speed_bin")
+    declare -A speed_names=(["kem"]="PQC KEM" ["sig"]="PQC digital signature")
+
+    # Perform the warm-up pass so that the first run is not affected by cold caches and CPU frequency ramp up
+    if [ "$warmup_flag" == "True" ]; then
+        echo -e "Performing the speed test warm-up pass\n"
+        "${speed_cmd_prefix[@]}" "$kem_speed_bin" > /dev/null
+        "${speed_cmd_prefix[@]}" "$sig_speed_bin" > /dev/null
+    fi
+
     # Perform the Liboqs CPU performance testing for the specified number of runs
-    for run_num in $(seq 1 $number_of_runs); do 
+    for run_num in $(seq 1 $number_of_runs); do
+
+        for alg_type in kem sig; do
+
+            # Skip the test if it has already been completed
+            if checkpoint_is_done "speed|$alg_type|$run_num"; then
+                echo -e "Skipping completed ${speed_names[$alg_type]} speed test run number - $run_num\n"
+                continue
+            fi
 
-        # Execute KEM CPU performance benchmarking
-        echo -e "Performing PQC KEM speed test run number - $run_num\n"
-        "$kem_speed_bin" > "$machine_speed_results/test-kem-speed-$run_num.csv"
+            # Check and record the machine state before executing the CPU performance benchmarking
+            record_machine_state "$alg_type" "$run_num"
+            echo -e "Performing ${speed_names[$alg_type]} speed test run number - $run_num\n"
+            "${speed_cmd_prefix[@]}" "${speed_bins[$alg_type]}" > "$machine_speed_results/test-$alg_type-speed-$run_num.csv" && checkpoint_record "speed|$alg_type|$run_num"
 
-        # Execute digital signature CPU performance benchmarking
-        echo -e "Performing PQC digital signature speed test run number - $run_num\n"
-        "$sig_speed_bin" > "$machine_speed_results/test-sig-speed-$run_num.csv"
+        done
 
     done
 
 }
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function format_duration() {
+    # Helper function for formatting the passed number of seconds as a HH:MM:SS string for the memory test progress output
+
+    # Set the local seconds variable to what was passed to the function and output the formatted duration
+    local total_secs="$1"
+    printf "%02d:%02d:%02d" $((total_secs / 3600)) $(((total_secs % 3600) / 60)) $((total_secs % 60))
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function mem_test_job() {
+    # Function for performing the memory tests for a single algorithm and run number, which is executed as a background job by
+    # the memory test scheduler. The three cryptographic operations are run in order as the later operations use the keys created
+    # by the keygen operation. Each job uses its own working directory and Valgrind massif output files so that jobs can run at the
+    # same time, and the Valgrind output is written to a log file in the job directory which is kept if the job fails.
+
+    # Set the local variables to what was passed to the function
+    local alg_type="$1"
+    local alg="$2"
+    local run_num="$3"
+
+    # Set the memory test binary, results directory, and operation names based on the algorithm type
+    local mem_bin
+    local results_dir
+    local op_names
+
+    if [ "$alg_type" == "kem" ]; then
+        mem_bin="$kem_mem_bin"
+        results_dir="$kem_mem_results"
+        op_names=("${op_kem[@]}")
+    else
+        mem_bin="$sig_mem_bin"
+        results_dir="$sig_mem_results"
+        op_names=("${op_sig[@]}")
+    fi
+
+    # Create the job working directory, which holds the key files written by the memory test binary and the massif output files
+    local job_dir="$mem_tmp_dir/$alg_type-$alg-$run_num"
+    local job_log="$job_dir/valgrind.log"
+    mkdir -p "$job_dir" && cd "$job_dir" || return 1
+
+    # Perform the memory metrics test for each cryptographic operation
+    for operation in {0..2}; do
+
+        # Run the memory test with the Valgrind memory profiler using the job's own massif output file
+        local massif_out="$job_dir/massif-$operation.out"
+        valgrind --tool=massif --stacks=yes --massif-out-file="$massif_out" "$mem_bin" "$alg" "$operation" >> "$job_log" 2>&1
+
+        # Ensure that the massif output was created before outputting the memory metrics
+        if [ ! -s "$massif_out" ]; then
+            echo "[WARNING] - Memory test failed for $alg ${op_names[operation]} run $run_num, see $job_log"
+            return 1
+        fi
+
+        ms_print "$massif_out" > "$results_dir/$alg-$operation-$run_num.txt"
+
+    done
+
+    # Record the job as completed in the checkpoint journal and remove the job working directory
+    checkpoint_record "mem|$alg_type|$alg|$run_num"
+    cd "$mem_tmp_dir" && rm -rf "$job_dir"
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function mem_test_completed() {
+    # Helper function for waiting for the next memory test job to finish, updating the completed and failed job counts
+    # and outputting the progress of the memory tests to the terminal along with the estimated time remaining
+
+    # Wait for the next job to finish and update the job counts
+    wait -n
+    local job_status=$?
+    completed_jobs=$((completed_jobs + 1))
+
+    if [ "$job_status" -ne 0 ]; then
+        failed_jobs=$((failed_jobs + 1))
+    fi
+
+    # Calculate the elapsed time and the estimated time remaining based on the average job time so far
+    local elapsed_secs=$(( $(date +%s) - mem_start_time ))
+    local eta_secs=$(( elapsed_secs * (total_jobs - completed_jobs) / completed_jobs ))
+    local percent=$(( completed_jobs * 100 / total_jobs ))
+
+    # Output the current progress to the terminal
+    echo "Memory tests completed - $completed_jobs/$total_jobs ($percent%) - Elapsed $(format_duration $elapsed_secs) - ETA $(format_duration $eta_secs)"
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function mem_tests() {
     # Function for performing the Liboqs memory performance benchmarking tests. This includes running the KEM and digital signature memory tests
-    # for the specified number of runs and storing the results in the appropriate results directories.
+    # for the specified number of runs and storing the results in the appropriate results directories. Valgrind massif output does not depend
+    # on timing, so the tests are split into a job for each algorithm and run number which are run in parallel by a simple job scheduler.
 
     # Output the current task to the terminal
     echo -e "##############################"
     echo -e "Performing Liboqs Memory Tests"
-    echo -e "*##############################\n"
+    echo -e "##############################\n"
 
-    # Ensure the temp memory results directories are present
-    if [ -d "$test_scripts_path/tmp/" ]; then
-        rm -rf "$test_scripts_path/tmp/"
-    fi
+    # Ensure the temp memory results directory is present and empty
+    rm -rf "$mem_tmp_dir" && mkdir -p "$mem_tmp_dir"
 
-    # Perform the Liboqs memory performance testing for the specified number of runs
+    # Create the list of memory test jobs, with a job for each algorithm and run number not already completed
+    job_list=()
+    skipped_jobs=0
     for run_count in $(seq 1 $number_of_runs); do
 
-        # Output the current test run number to the terminal
-        echo -e "Memory Test Run - $run_count\n\n"
-        
-        # Output the current set of tests to the terminal
-        echo -e "KEM Memory Tests\n"
-
-        # Loop through the KEM algorithms and perform the memory tests
         for kem_alg in "${kem_algs[@]}"; do
+            if checkpoint_is_done "mem|kem|$kem_alg|$run_count"; then
+                skipped_jobs=$((skipped_jobs + 1))
+            else
+                job_list+=("kem|$kem_alg|$run_count")
+            fi
+        done
 
-            # Perform the memory metrics test for each cryptographic operation
-            for operation in {0..2}; do
-
-                # Get the current operation string and output to terminal
-                op_kem_str=${op_kem[operation]}
-                echo -e "$kem_alg - $op_kem_str Test\n"
-
-                # Run the memory test with the Valgrind memory profiler and output the memory metrics
-                filename="$kem_mem_results/$kem_alg-$operation-$run_count.txt"
-                valgrind --tool=massif --stacks=yes --massif-out-file="$mem_tmp_dir/massif.out" "$kem_mem_bin" "$kem_alg" "$operation"
-                ms_print "$mem_tmp_dir/massif.out" > $filename
-                rm -f "$mem_tmp_dir/massif.out" && echo -e "\n"
-  
-            done
-
-            # Clear the temp memory results directory before the next test
-            rm -rf "$test_scripts_path/tmp/"
-
+        for sig_alg in "${sig_algs[@]}"; do
+            if checkpoint_is_done "mem|sig|$sig_alg|$run_count"; then
+                skipped_jobs=$((skipped_jobs + 1))
+            else
+                job_list+=("sig|$sig_alg|$run_count")
+            fi
         done
 
-        # Output the current set of tests to the terminal
-        echo -e "\nDigital Signature Memory Tests\n"
+    done
 
-        # Loop through the digital signature algorithms and the perform memory tests
-        for sig_alg in "${sig_algs[@]}"; do
+    # Output the number of completed jobs being skipped if resuming
+    if [ "$skipped_jobs" -gt 0 ]; then
+        echo -e "Skipping $skipped_jobs memory test jobs already completed in the checkpoint journal\n"
+    fi
 
-            # Perform the memory metrics test for each cryptographic operation
-            for operation in {0..2}; do
+    # Set the job counts and output the scheduler parameters to the terminal
+    total_jobs=${#job_list[@]}
 
-                # Get the current operation string and output to terminal
-                op_sig_str=${op_sig[operation]}
-                echo -e "$sig_alg - $op_sig_str Test\n"
+    if [ "$total_jobs" -eq 0 ]; then
+        echo -e "All memory test jobs have already been completed\n"
+        rm -rf "$mem_tmp_dir"
+        return 0
+    fi
 
-                # Run the memory test with the Valgrind memory profiler and output the memory metrics
-                filename="$sig_mem_results/$sig_alg-$operation-$run_count.txt"
-                valgrind --tool=massif --stacks=yes --massif-out-file="$mem_tmp_dir/massif.out" "$sig_mem_bin" "$sig_alg" "$operation"
-                ms_print "$mem_tmp_dir/massif.out" > $filename
-                rm -f "$mem_tmp_dir/massif.out" && echo -e "\n"
+    started_jobs=0
+    completed_jobs=0
+    failed_jobs=0
+    mem_start_time=$(date +%s)
 
-            done
+    echo -e "Running $total_jobs memory test jobs ($((total_jobs * 3)) Valgrind runs) using $mem_jobs parallel jobs\n"
 
-            # Clear the temp memory results directory before the next test
-            rm -rf "$test_scripts_path/tmp/"
+    # Start each job in the background, waiting for a running job to finish when the job limit has been reached
+    for job in "${job_list[@]}"; do
 
-        done
+        if (( started_jobs - completed_jobs >= mem_jobs )); then
+            mem_test_completed
+        fi
 
-        # Clean up the temp memory results directory
-        rm -rf $mem_tmp_dir && rm -rf "$test_scripts_path/tmp"
-        mkdir -p "$mem_tmp_dir"
+        IFS='|' read -r alg_type alg run_num <<< "$job"
+        mem_test_job "$alg_type" "$alg" "$run_num" &
+        started_jobs=$((started_jobs + 1))
 
     done
 
-    # Perform the final clean up of the Liboqs memory test temp dirs
-    rm -rf $mem_tmp_dir
-    rm -rf "$test_scripts_path/tmp"
+    # Wait for the remaining jobs to finish
+    while (( completed_jobs < started_jobs )); do
+        mem_test_completed
+    done
+
+    # Output the total memory test time and keep the temp directory if any jobs failed so the Valgrind logs can be checked
+    echo -e "\nMemory tests finished in $(format_duration $(( $(date +%s) - mem_start_time )))\n"
+
+    if [ "$failed_jobs" -gt 0 ]; then
+        echo -e "[WARNING] - $failed_jobs memory test jobs failed, the Valgrind logs can be found in $mem_tmp_dir\n"
+    else
+        rm -rf "$mem_tmp_dir"
+    fi
 
 }
 
@@ -519,6 +995,22 @@ function main() {
     echo "PQC-Evaluation-Tools - Automated Liboqs Performance Testing"
     echo -e "###########################################################\n"
 
+    # Set the default number of parallel memory test jobs to the number of CPU cores and the default resume flag
+    mem_jobs=$(nproc)
+    resume_flag="False"
+
+    # Set the default speed test measurement harness parameters
+    cpu_cores=""
+    max_busy=10
+    noise_policy="flag"
+    noise_wait_attempts=30
+    warmup_flag="True"
+
+    # Parse the command line arguments passed to the script if any
+    if [[ $# -gt 0 ]]; then
+        parse_args "$@"
+    fi
+
     # Setup the base environment and testing suite setup
     setup_base_env
     setup_test_suite
@@ -532,4 +1024,4 @@ function main() {
     echo "Results Dir Path - $machine_results_path"
 
 }
-main
\ No newline at end of file
+main "$@"
\ No newline at end of file
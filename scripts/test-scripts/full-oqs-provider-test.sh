@@ -54,10 +54,11 @@ function output_help_message() {
     echo "Usage: full-oqs-provider-test.sh [options]"
     echo "Options:"
     echo "  --server-control-port=<PORT>       Set the server control port             (1024-65535)"
-    echo "  --client-control-port=<PORT>       Set the client control port             (1024-65535)"
     echo "  --s-server-port=<PORT>             Set the OpenSSL S_Server port           (1024-65535)"
-    echo "  --control-sleep-time=<TIME>        Set the control sleep time in seconds   (integer or float)"
-    echo "  --disable-control-sleep            Disable the control signal sleep time"
+    echo "  --resume                           Resume an interrupted test campaign using its checkpoint journal (client only)"
+    echo "  --reuse-s-server                   Use one s_server process per signature algorithm for all KEM groups (client only)"
+    echo "  --lanes=<num>                      Run the TLS handshake tests in parallel lanes pinned to separate CPU cores (default: 1)"
+    echo "  --latency-handshakes=<num>         Record the latency of <num> full and resumed handshakes for each combination (client only)"
     echo "  --help                             Display the help message"
 
 }
@@ -110,15 +111,8 @@ function parse_args {
 
             --client-control-port=*)
 
-                # Store the custom client control port number
-                client_control_port="${1#*=}"
-
-                # Check if the port number is valid
-                if ! is_valid_port "$client_control_port"; then
-                    echo "[ERROR] - Invalid client control port number: $client_control_port"
-                    exit 1
-                fi
-
+                # Output a warning that the client control port is no longer used, as the client connects to the server control port
+                echo "[WARNING] - The --client-control-port flag is no longer used, as all control signals are sent over the server control port"
                 shift
                 ;;
 
@@ -136,38 +130,52 @@ function parse_args {
                 shift
                 ;;
 
-            --control-sleep-time=*)
+            --control-sleep-time=*|--disable-control-sleep)
 
-                # Check if the disable control sleep flag has been set
-                if [ "$disable_control_sleep" == "True" ]; then
-                    echo "[ERROR] - Cannot use the --control-sleep-time flag when the --disable-control-sleep flag has been set"
-                    exit 1
-                fi
+                # Output a warning that the control sleep options are no longer used, as the control channel does not sleep between signals
+                echo "[WARNING] - The ${1%%=*} flag is no longer used, as control signals are sent over a persistent control channel"
+                shift
+                ;;
+
+            --resume)
+
+                # Set the resume flag so that completed tests are skipped using the checkpoint journal
+                resume_flag="True"
+                shift
+                ;;
+
+            --reuse-s-server)
 
-                # Store the custom control sleep time and set the custom control time flag
-                control_sleep_time="${1#*=}"
-                custom_control_time_flag="True"
+                # Set the s_server reuse flag so that the server uses one s_server process for each signature algorithm
+                reuse_s_server="True"
+                shift
+                ;;
+
+            --lanes=*)
+
+                # Store the number of parallel test lanes
+                lanes="${1#*=}"
 
-                # Check if the sleep timer is valid integer or float
-                if [[ ! $control_sleep_time =~ ^[0-9]+([.][0-9]+)?$ ]]; then
-                    echo "[ERROR] - Invalid control sleep time: $control_sleep_time"
+                # Check if the number of lanes is a valid integer above 0
+                if [[ ! "$lanes" =~ ^[1-9][0-9]*$ ]]; then
+                    echo "[ERROR] - Invalid number of test lanes: $lanes"
                     exit 1
                 fi
 
                 shift
                 ;;
 
-            --disable-control-sleep)
+            --latency-handshakes=*)
 
-                # Check if the custom sleep time flag has been
-                if [ "$custom_control_time_flag" == "True" ]; then
-                    echo "[ERROR] - Cannot use the --disable-control-sleep flag when the --control-sleep-time flag has been set"
+                # Store the number of full and resumed handshakes recorded by the handshake latency driver
+                latency_handshakes="${1#*=}"
+
+                # Check if the number of handshakes is a valid integer above 0
+                if [[ ! "$latency_handshakes" =~ ^[1-9][0-9]*$ ]]; then
+                    echo "[ERROR] - Invalid number of latency handshakes: $latency_handshakes"
                     exit 1
                 fi
 
-                # Set the disable control sleep flag and shift
-                disable_control_sleep="True"
-
                 shift
                 ;;
 
@@ -184,47 +192,35 @@ function parse_args {
 
     done
 
-    # Ensure that none of the custom ports set are the same
-    if [ "$server_control_port" == "$client_control_port" ] || [ "$server_control_port" == "$s_server_port" ] || [ "$client_control_port" == "$s_server_port" ]; then
-        echo -e "[ERROR] - Custom TCP ports cannot be the same"
+    # Ensure that the custom ports set are not the same, including the port ranges used when there are multiple test lanes
+    if (( server_control_port < s_server_port + lanes && s_server_port < server_control_port + lanes )); then
+        echo -e "[ERROR] - Custom TCP ports cannot be the same or overlap with the ports used by the other test lanes"
         exit 1
     fi
 
-    # If the custom control sleep time flag has been set, perform additional checks
-    if [ "$custom_control_time_flag" == "True" ]; then
-
-        # Check if the set sleep time value falls into given special cases
-        if (( $(echo "$control_sleep_time > 0 && $control_sleep_time < 0.25" | bc -l) )); then
-
-            # Output the warning to the user
-            echo "[WARNING] - Control sleep time is below the lowest tested value of 0.25 seconds"
-            echo "In most instances this should be fine, but some environments have shown testing to fail using lower values"
-
-            # Ask the user if they wish to continue with the lower value
-            get_user_yes_no "Do you wish to continue with the sleep timer set to $control_sleep_time seconds?"
-
-            # Determine if the script should based on the user response
-            if [ $user_y_n_response -eq 0 ]; then
-                echo -e "\nExiting script..."
-                exit 1
-            fi
+    # Ensure that the port ranges for the test lanes are valid
+    if (( server_control_port + lanes - 1 > 65535 || s_server_port + lanes - 1 > 65535 )); then
+        echo "[ERROR] - The TCP ports for the $lanes test lanes exceed the maximum port number of 65535"
+        exit 1
+    fi
 
-        elif (( $(echo "$control_sleep_time == 0" | bc -l) )); then
+    # Ensure that the CPU cores can be split between the test lanes if multiple lanes are used
+    if [ "$lanes" -gt 1 ]; then
 
-            # Output the option to disable the sleep timer to the user and get their response
-            echo "[NOTICE] - You have set the control sleep time to 0 seconds"
-            get_user_yes_no "Do you wish to disable the control signal sleep statement?"
+        # Check that taskset is available to pin the lanes to their CPU cores
+        if ! command -v taskset &>/dev/null; then
+            echo "[ERROR] - The taskset command is required to use multiple test lanes, please install the util-linux package"
+            exit 1
+        fi
 
-            # Determine the next action based on the user response
-            if [ $user_y_n_response -eq 1 ]; then
-                disable_control_sleep="True"
-            else
-                echo -e "\nExiting script..."
-                exit 1
-            fi
+        # Set the number of CPU cores for each lane and ensure there is at least one core per lane
+        lane_core_count=$(( $(nproc) / lanes ))
 
+        if [ "$lane_core_count" -lt 1 ]; then
+            echo "[ERROR] - There are not enough CPU cores ($(nproc)) to run $lanes test lanes"
+            exit 1
         fi
-    
+
     fi
 
 }
@@ -345,6 +341,9 @@ function setup_base_env() {
     test_scripts_path="$root_dir/scripts/test-scripts"
     util_scripts="$root_dir/scripts/utility-scripts"
 
+    # Source the checkpoint journal helper functions
+    source "$test_scripts_path/checkpoint-journal.sh"
+
     # Declare the global library directory path variables
     openssl_path="$libs_dir/openssl_3.4"
     oqs_provider_path="$libs_dir/oqs-provider"
@@ -375,25 +374,26 @@ function setup_base_env() {
 
     # Export the testing suite TCP port variables
     export SERVER_CONTROL_PORT="$server_control_port"
-    export CLIENT_CONTROL_PORT="$client_control_port"
     export S_SERVER_PORT="$s_server_port"
 
-    # Determine what control signal parameters to export
-    if [ "$disable_control_sleep" == "False" ] && [ "$custom_control_time_flag" == "False" ]; then
-        export CONTROL_SLEEP_TIME="0.25"
+    # Define the flag variables and arrays used for the port checking, including the ports used by each test lane
+    skip_port_check="False"
+    ports_to_check=()
+    port_names=()
+    port_processes=()
 
-    elif [ "$disable_control_sleep" == "False" ] && [ "$custom_control_time_flag" == "True" ]; then
-        export CONTROL_SLEEP_TIME="$control_sleep_time"
-    
-    elif [ "$disable_control_sleep" == "True" ]; then
-        export DISABLE_CONTROL_SLEEP="True"
+    for lane in $(seq 0 $((lanes - 1))); do
 
-    fi
+        ports_to_check+=("$((server_control_port + lane))" "$((s_server_port + lane))")
+        port_processes+=("nc" "openssl")
 
-    # Define the flag variables and arrays used for the port checking
-    skip_port_check="False"
-    ports_to_check=("$server_control_port" "$client_control_port" "$s_server_port")
-    port_names=("Server control port" "Client control port" "OpenSSL S_Server port")
+        if [ "$lanes" -gt 1 ]; then
+            port_names+=("Lane $lane server control port" "Lane $lane OpenSSL S_Server port")
+        else
+            port_names+=("Server control port" "OpenSSL S_Server port")
+        fi
+
+    done
 
     # Ensure that control ports are not in use by other processes in the system
     for custom_port_index in "${!ports_to_check[@]}"; do
@@ -408,10 +408,10 @@ function setup_base_env() {
             if echo "$process_cmdline" | grep -q "$root_dir"; then
 
                 # Determine if the process is from this testing suite
-                if [ "$port_process" == "nc" ] && [ "$custom_port_index" -ne 2 ]; then
+                if [ "$port_process" == "nc" ] && [ "${port_processes[$custom_port_index]}" == "nc" ]; then
                     continue
 
-                elif [ "$custom_port_index" -eq 2 ] && [ "$port_process" == "openssl" ]; then
+                elif [ "${port_processes[$custom_port_index]}" == "openssl" ] && [ "$port_process" == "openssl" ]; then
                     echo "[WARNING] - ${port_names[$custom_port_index]} is active from a previous test, killing the process"
                     kill -9 "$port_pid"
 
@@ -478,14 +478,11 @@ function clean_environment() {
     unset SERVER_IP
     unset LD_LIBRARY_PATH
     unset SERVER_CONTROL_PORT
-    unset CLIENT_CONTROL_PORT
     unset S_SERVER_PORT
-    unset CONTROL_SLEEP_TIME
-
-    # Clear the DISABLE_CONTROL_SLEEP variable if set
-    if [ -z $DISABLE_CONTROL_SLEEP ]; then
-        unset DISABLE_CONTROL_SLEEP
-    fi
+    unset CHECKPOINT_JOURNAL
+    unset RESUME_TESTING
+    unset REUSE_S_SERVER
+    unset LATENCY_HANDSHAKES
 
     # Clear the result types directory paths 
     for var in "${result_dir_paths[@]}"; do
@@ -596,6 +593,54 @@ function handle_machine_id_clash() {
 
 }
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function resume_test_campaign() {
+    # Function for resuming an interrupted test campaign for the assigned machine-ID on the client machine. The checkpoint journal
+    # stored in the machine's results directory is loaded, and the test parameters are restored from the journal and exported to the
+    # environment. The journal path is then exported so that the client and speed test scripts can skip the completed tests.
+
+    # Load the checkpoint journal for the machine-ID and exit if there is no campaign to resume
+    if ! checkpoint_load "$MACHINE_RESULTS_PATH/.checkpoint-journal"; then
+        echo "[ERROR] - No checkpoint journal found for Machine-ID ($MACHINE_NUM) in $MACHINE_RESULTS_PATH, unable to resume testing"
+        exit 1
+    fi
+
+    # Restore the test parameters from the journal and ensure they are valid
+    for param_name in NUM_RUN TIME_NUM SPEED_NUM; do
+
+        param_value=$(checkpoint_get_param "$param_name")
+
+        if [[ ! "$param_value" =~ ^[1-9][0-9]*$ ]]; then
+            echo "[ERROR] - The checkpoint journal for Machine-ID ($MACHINE_NUM) does not contain a valid $param_name value"
+            exit 1
+        fi
+
+        export "$param_name=$param_value"
+
+    done
+
+    # Restore the s_server mode from the journal, using the default mode for journals created before the option was added
+    REUSE_S_SERVER=$(checkpoint_get_param "REUSE_S_SERVER")
+    export REUSE_S_SERVER="${REUSE_S_SERVER:-False}"
+
+    # Restore the number of latency handshakes from the journal, with latency testing disabled for journals created before the option was added
+    LATENCY_HANDSHAKES=$(checkpoint_get_param "LATENCY_HANDSHAKES")
+    export LATENCY_HANDSHAKES="${LATENCY_HANDSHAKES:-0}"
+
+    # Ensure the result directories are present and export the journal path and resume flag
+    for result_dir in "${result_dir_paths[@]}"; do
+        mkdir -p "$result_dir"
+    done
+
+    export CHECKPOINT_JOURNAL="$checkpoint_journal"
+    export RESUME_TESTING="True"
+
+    # Output the resume details to the terminal
+    echo -e "Resuming test campaign for Machine-ID ($MACHINE_NUM) with $NUM_RUN test runs, $(checkpoint_count) tests already completed"
+    echo -e "Please ensure the server has been started with the same number of test runs ($NUM_RUN)\n"
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function configure_results_dir() {
     # Function for configuring the results directories for the test results
@@ -603,6 +648,12 @@ function configure_results_dir() {
     # Set the results paths based on the machine-ID
     set_tls_paths
 
+    # Resume the previous test campaign for the machine-ID instead of creating new result directories if the resume flag is set
+    if [ "$resume_flag" == "True" ]; then
+        resume_test_campaign
+        return 0
+    fi
+
     # Create the un-parsed result directories for the machine-ID and and handle any clashes
     if [ -d "$test_data_dir/up-results" ]; then
     
@@ -739,6 +790,26 @@ function configure_test_options {
 
     done
 
+    # If resuming on the client, get the machine-ID and restore the test parameters from the checkpoint journal
+    if [ "$resume_flag" == "True" ] && [ $machine_type == "Client" ]; then
+        get_test_comparison_choice
+        return 0
+
+    elif [ "$resume_flag" == "True" ]; then
+        echo -e "[NOTICE] - The --resume flag only applies to the client, the server will skip the tests the client has already completed\n"
+
+    fi
+
+    # Output a notice if the s_server reuse flag has been passed to the server, as the s_server mode is set by the client
+    if [ "$reuse_s_server" == "True" ] && [ $machine_type == "Server" ]; then
+        echo -e "[NOTICE] - The --reuse-s-server flag only applies to the client, the server will use the s_server mode sent by the client\n"
+    fi
+
+    # Output a notice if the latency handshakes flag has been passed to the server, as the latency driver is run by the client
+    if [ "$latency_handshakes" -gt 0 ] && [ $machine_type == "Server" ]; then
+        echo -e "[NOTICE] - The --latency-handshakes flag only applies to the client, the server does not need to be passed it\n"
+    fi
+
     # Prompt the user for the number of test runs until a valid response is given
     while true; do
 
@@ -790,9 +861,19 @@ function configure_test_options {
             else
                 echo -e "Invalid input. Please enter a valid integer above 0.\n"
             fi
-        
+
         done
 
+        # Export the s_server mode and the number of latency handshakes for the client test script
+        export REUSE_S_SERVER="$reuse_s_server"
+        export LATENCY_HANDSHAKES="$latency_handshakes"
+
+        # Create the checkpoint journal for the new test campaign and export its path for the client and speed test scripts
+        checkpoint_create "$MACHINE_RESULTS_PATH/.checkpoint-journal" "NUM_RUN=$NUM_RUN" "TIME_NUM=$TIME_NUM" "SPEED_NUM=$SPEED_NUM" \
+            "REUSE_S_SERVER=$REUSE_S_SERVER" "LATENCY_HANDSHAKES=$LATENCY_HANDSHAKES"
+        export CHECKPOINT_JOURNAL="$checkpoint_journal"
+        export RESUME_TESTING="False"
+
     fi
 
 }
@@ -824,6 +905,62 @@ function check_transferred_keys() {
 
 }
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function run_test_lanes() {
+    # Function for running the TLS handshake tests in parallel test lanes. The passed test script is started once for each lane, with
+    # each lane being pinned to its own set of CPU cores using taskset and using its own server control and s_server ports. The lane
+    # number and lane count are exported to each lane so that the test scripts can split the algorithm combinations between the lanes.
+    # The output of each lane is written to its own log file in the tmp directory.
+
+    # Declare the local variables for the arguments passed to function
+    local test_script="$1"
+
+    # Create the directory for the lane log files, removing any logs from a previous test
+    lane_log_dir="$tmp_dir/tls-lane-logs"
+    rm -rf "$lane_log_dir" && mkdir -p "$lane_log_dir"
+
+    # Start the test script for each lane in the background on its own set of CPU cores
+    lane_pids=()
+    for lane in $(seq 0 $((lanes - 1))); do
+
+        # Set the CPU cores and TCP ports for the current lane
+        first_core=$((lane * lane_core_count))
+        lane_cores="$first_core-$((first_core + lane_core_count - 1))"
+        lane_control_port=$((server_control_port + lane))
+        lane_s_server_port=$((s_server_port + lane))
+
+        # Start the test script for the current lane
+        LANE_INDEX="$lane" LANE_COUNT="$lanes" SERVER_CONTROL_PORT="$lane_control_port" S_SERVER_PORT="$lane_s_server_port" \
+            taskset -c "$lane_cores" "$test_script" > "$lane_log_dir/lane-$lane.log" 2>&1 &
+        lane_pids+=("$!")
+
+        echo "Started test lane $lane on CPU cores $lane_cores (Control Port: $lane_control_port, S_Server Port: $lane_s_server_port)"
+
+    done
+
+    echo -e "\nWaiting for the $lanes test lanes to complete, the output of each lane is written to $lane_log_dir\n"
+
+    # Wait for each lane to complete and count the number of lanes that failed
+    failed_lanes=0
+    for lane in "${!lane_pids[@]}"; do
+
+        if wait "${lane_pids[$lane]}"; then
+            echo "[OUTPUT] - Test lane $lane completed"
+        else
+            echo "[ERROR] - Test lane $lane failed, please see $lane_log_dir/lane-$lane.log for details"
+            failed_lanes=$((failed_lanes + 1))
+        fi
+
+    done
+
+    # Exit if any of the lanes failed, as the completed tests have been recorded they can be resumed
+    if [ "$failed_lanes" -gt 0 ]; then
+        echo "[ERROR] - $failed_lanes of the $lanes test lanes failed, testing can be continued by passing the --resume flag to the client"
+        exit 1
+    fi
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function run_tests() {
     # Function for performing the TLS handshake and speed tests. It will get the IP address of the other machine from the user
@@ -882,9 +1019,13 @@ function run_tests() {
         # Export the client IP to the environment
         export CLIENT_IP="$machine_ip"
 
-        # Call the server machine test script
-        $test_scripts_path/oqsprovider-test-server.sh 
-        #>> "$root_dir/server-test-output.txt" - uncomment to save output for debugging
+        # Call the server machine test script, running a copy for each test lane if multiple lanes are used
+        if [ "$lanes" -gt 1 ]; then
+            run_test_lanes "$test_scripts_path/oqsprovider-test-server.sh"
+        else
+            $test_scripts_path/oqsprovider-test-server.sh
+            #>> "$root_dir/server-test-output.txt" - uncomment to save output for debugging
+        fi
 
     else
     
@@ -896,9 +1037,13 @@ function run_tests() {
         echo "Performing TLS Handshake Tests"
         echo -e "####################################\n"
 
-        # Call the server machine test script
-        $test_scripts_path/oqsprovider-test-client.sh
-        #>> "$root_dir/client-test-output.txt" - uncomment to save output for debugging
+        # Call the client machine test script, running a copy for each test lane if multiple lanes are used
+        if [ "$lanes" -gt 1 ]; then
+            run_test_lanes "$test_scripts_path/oqsprovider-test-client.sh"
+        else
+            $test_scripts_path/oqsprovider-test-client.sh
+            #>> "$root_dir/client-test-output.txt" - uncomment to save output for debugging
+        fi
 
         # Output the current task to the terminal
         echo -e "\n##########################"
@@ -922,12 +1067,17 @@ function main() {
     echo -e "#####################################################################\n"
 
     # Set the default global flag variables
-    custom_control_time_flag="False"
-    disable_control_sleep="False"
+    resume_flag="False"
+    reuse_s_server="False"
+
+    # Set the default number of parallel test lanes
+    lanes=1
+
+    # Set the default number of latency handshakes, with latency testing disabled by default
+    latency_handshakes=0
 
     # Set the default TCP port values
     server_control_port="25000"
-    client_control_port="25001"
     s_server_port="4433"
 
     # Parse the command line arguments passed to the script if any
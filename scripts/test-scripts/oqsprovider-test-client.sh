@@ -85,10 +85,28 @@ function setup_base_env() {
     classic_algs=( "RSA_2048" "RSA_3072" "RSA_4096" "prime256v1" "secp384r1" "secp521r1")
     ciphers=("TLS_AES_256_GCM_SHA384" "TLS_CHACHA20_POLY1305_SHA256" "TLS_AES_128_GCM_SHA256")
 
-    # Ensure that a control sleep time env variables has been passed if not disabled
-    if [ -z "$CONTROL_SLEEP_TIME" ] && [ -z "$DISABLE_CONTROL_SLEEP" ]; then
-        echo "[ERROR] - Control sleep time env variable not set, this indicates a wider issue with the full-oqs-provider-test.sh script"
-        exit 1
+    # Source the control channel helper functions used to coordinate the tests with the server
+    source "$test_scripts_path/control-channel.sh"
+
+    # Load the checkpoint journal so that the tests already completed in the current campaign can be skipped
+    source "$test_scripts_path/checkpoint-journal.sh"
+
+    if [ -n "$CHECKPOINT_JOURNAL" ]; then
+        checkpoint_load "$CHECKPOINT_JOURNAL"
+    fi
+
+    # Set the test lane number and lane count, which default to a single lane if the tests are not being run in parallel lanes
+    LANE_INDEX="${LANE_INDEX:-0}"
+    LANE_COUNT="${LANE_COUNT:-1}"
+
+    # Set the number of handshakes recorded by the handshake latency driver, which defaults to latency testing being disabled
+    LATENCY_HANDSHAKES="${LATENCY_HANDSHAKES:-0}"
+
+    # Set the python binary used to run the handshake latency driver
+    if [ -x "$(command -v python3)" ]; then
+        python_bin="python3"
+    else
+        python_bin="python"
     fi
 
 }
@@ -182,93 +200,46 @@ function set_test_env() {
     
 }
 
-#-------------------------------------------------------------------------------------------------------------------------------
-function check_control_port() {
-    # Helper function that waits until the server is listening on the control port 
-    # before allowing the client to send a control signal. If enabled, it includes 
-    # a short delay to ensure the server is ready to receive the connection.
-
-    # Wait until the server is listening on the control port before sending signal
-    until nc -z "$SERVER_IP" "$SERVER_CONTROL_PORT" > /dev/null 2>&1; do
-        :
-    done
-
-    # Perform a small delay before sending signal to allow target device to be ready
-    if [ -v $DISABLE_CONTROL_SLEEP ]; then
-        sleep $CONTROL_SLEEP_TIME
-    fi
-
-}
-
 #-------------------------------------------------------------------------------------------------------------------------------
 function control_signal() {
-    # Function for handling client-to-server control signalling during TLS handshake testing.
+    # Function for handling client-to-server control signalling during TLS handshake testing over the persistent control channel.
     # Supports: control_send, control_wait, and iteration_handshake modes for coordination.
 
     # Declare the local variables for arguments passed to function
     local type="$1"
     local message="$2"
 
-    # Kill any lingering netcat processes
-    pkill -f "nc -l -p $CLIENT_CONTROL_PORT"
-
     # Determine the type of control signal method to be used
     case "$type" in
 
         "control_send")
 
-            # Check if the control port is open on the server before sending signal
-            check_control_port
-
-            # Send the control signal to the server until successful
-            until echo "$message" | nc -n -w 1 "$SERVER_IP" "$SERVER_CONTROL_PORT" > /dev/null 2>&1; do
-                exit_status=$?
-                if [ "$exit_status" -ne 0 ]; then
-                    :
-                else
-                    break
-                fi
-            done
+            # Send the control signal to the server
+            control_channel_send "$message"
             ;;
 
         "control_wait")
 
-            # Wait until the control signal has been received and return the message
-            while true; do
+            # Wait for the next control signal from the server and ensure that it is valid
+            control_channel_receive
+            signal_message="$control_message"
 
-                # Wait for a connection from the server and capture the request in a variable
-                signal_message=$(nc -l -p "$CLIENT_CONTROL_PORT")
-
-                # Check if the received control signal message is valid
-                if [[ "$signal_message" == "ready" || "$signal_message" == "skip" || "$signal_message" == "complete" ]]; then
-                    break
-                fi
-
-            done
+            if [[ "$signal_message" != "ready" && "$signal_message" != "skip" && "$signal_message" != "complete" ]]; then
+                echo "[ERROR] - Unexpected control signal received from server: $signal_message"
+                exit 1
+            fi
             ;;
 
         "iteration_handshake")
 
-            # Check if the control port is open on the server before sending signal
-            check_control_port
-
-            # Send the handshake ready signal to the server until successful
-            until echo "handshake_ready" | nc -n -w 1 "$SERVER_IP" "$SERVER_CONTROL_PORT" > /dev/null 2>&1; do
-                exit_status=$?
-                if [ "$exit_status" -ne 0 ]; then
-                    :
-                else
-                    break
-                fi
-            done
+            # Send the next signal to the server and wait for the server to send it back
+            control_channel_send "next"
+            control_channel_receive
 
-            # Wait for the server to send the handshake ready signal
-            while true; do
-                signal_message=$(nc -l -p "$CLIENT_CONTROL_PORT")
-                if [[ "$signal_message" == "handshake_ready" ]]; then
-                    break
-                fi
-            done
+            if [ "$control_message" != "next" ]; then
+                echo "[ERROR] - Unexpected control signal received from server: $control_message"
+                exit 1
+            fi
             ;;
 
         *)
@@ -282,11 +253,44 @@ function control_signal() {
 
 }
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function latency_test() {
+    # Function for recording the handshake latency distribution for the current algorithm combination using the tls_latency_driver.py
+    # script. The driver performs the set number of full and resumed handshakes against the running s_server using the project's
+    # OpenSSL build, and records the latency of each handshake to the passed output file. The function is passed the CA file and
+    # the output filepath, and returns the exit code of the driver.
+
+    # Declare the local variables for the arguments passed to function
+    local cert_file="$1"
+    local output_file="$2"
+
+    # Load the OQS-Provider in the same way as the s_time tests for the PQC and Hybrid-PQC tests
+    local provider_args=()
+
+    if [ "$test_type" -ne 2 ]; then
+        provider_args=(--provider-path "$provider_path")
+    fi
+
+    # Run the handshake latency driver with the current test parameters
+    "$python_bin" "$test_scripts_path/tls_latency_driver.py" \
+        --host "$SERVER_IP" \
+        --port "$S_SERVER_PORT" \
+        --cafile "$cert_file" \
+        --handshakes "$LATENCY_HANDSHAKES" \
+        --lib-dir "$openssl_lib_path" \
+        "${provider_args[@]}" \
+        --output "$output_file"
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function pqc_tests() {
     # Function for performing the PQC and Hybrid-PQC TLS handshake tests. Digital signature and KEM algorithms are 
     # loaded based on the selected test type (0=pqc, 1=hybrid) via set_test_env. Each sig/KEM pair is tested
-    # using OpenSSL's s_time.
+    # using OpenSSL's s_time, followed by the handshake latency driver if latency testing is enabled.
+
+    # Reset the combination counter used to split the combinations between the test lanes
+    combination_num=0
 
     # Loop through all PQC/Hybrid-PQC sig algorithms to be used for signing
     for sig in "${sig_algs[@]}"; do
@@ -294,6 +298,12 @@ function pqc_tests() {
         # Loop through all PQC/Hybrid-PQC KEM algorithms to be used for key exchange
         for kem in "${kem_algs[@]}"; do
 
+            # Skip the combination if it is assigned to another test lane
+            combination_num=$((combination_num + 1))
+            if (( (combination_num - 1) % LANE_COUNT != LANE_INDEX )); then
+                continue
+            fi
+
             # Set the fail flag to default value of false
             fail_flag=0
 
@@ -307,6 +317,19 @@ function pqc_tests() {
                 # Perform the iteration handshake
                 control_signal "iteration_handshake"
 
+                # Set the checkpoint unit for the current combination and skip it if already completed
+                if [ "$test_type" -eq 0 ]; then
+                    checkpoint_unit="handshake|pqc|$run_num|$sig|$kem"
+                else
+                    checkpoint_unit="handshake|hybrid|$run_num|$sig|$kem"
+                fi
+
+                if checkpoint_is_done "$checkpoint_unit"; then
+                    echo "[OUTPUT] - Skipping test already completed in the checkpoint journal"
+                    control_signal "control_send" "skip"
+                    break
+                fi
+
                 # Send the client ready signal and wait for server ready signal
                 control_signal "control_send" "ready"
                 control_signal "control_wait"
@@ -330,6 +353,13 @@ function pqc_tests() {
                     # Set the output filename based on current combination and run
                     output_name="tls-handshake-$run_num-$sig_name-$kem.txt"
 
+                    # Set the groups offered by the client, selecting the current KEM if the server is advertising all of the KEM groups
+                    if [ "$REUSE_S_SERVER" == "True" ]; then
+                        client_groups="$kem"
+                    else
+                        client_groups="$DEFAULT_GROUPS"
+                    fi
+
                     # Reset the fail counter
                     fail_counter=0
 
@@ -337,7 +367,7 @@ function pqc_tests() {
                     while true; do
 
                         # Run the OpenSSL s_time process with current test parameters and grab the exit code
-                        "$openssl_path/bin/openssl" s_time \
+                        DEFAULT_GROUPS="$client_groups" "$openssl_path/bin/openssl" s_time \
                             -connect $SERVER_IP:$S_SERVER_PORT \
                             -CAfile $cert_file -time $TIME_NUM  \
                             -verify 1 \
@@ -346,6 +376,12 @@ function pqc_tests() {
                             -provider-path $provider_path > $handshake_dir/$output_name
                         exit_code=$?
 
+                        # Record the handshake latencies against the same s_server if latency testing is enabled
+                        if [ $exit_code -eq 0 ] && [ "$LATENCY_HANDSHAKES" -gt 0 ]; then
+                            DEFAULT_GROUPS="$client_groups" latency_test "$cert_file" "$handshake_dir/tls-latency-$run_num-$sig_name-$kem.txt"
+                            exit_code=$?
+                        fi
+
                         # Check if the test was successful and retry if not
                         if [ $exit_code -eq 0 ]; then
                             fail_flag=0
@@ -353,7 +389,7 @@ function pqc_tests() {
 
                         elif [ $fail_counter -ne 3000 ]; then
                             ((fail_counter++))
-                            echo "[ERROR] - s-time process failed $fail_counter times, retrying"
+                            echo "[ERROR] - handshake test failed $fail_counter times, retrying"
 
                         else
                             fail_flag=1
@@ -365,14 +401,14 @@ function pqc_tests() {
 
                     # Send the test complete or failed signal to server, if failed then restart the current run sig/kem combination
                     if [ $fail_flag -eq 0 ]; then
+                        checkpoint_record "$checkpoint_unit"
                         control_signal "control_send" "complete"
                         break
 
                     else
                         echo "[ERROR] - Failed to establish test connection, restarting current run sig/kem combination"
                         control_signal "control_send" "failed"
-                        sleep 4
-                    
+
                     fi
 
                 elif [ $signal_message == "skip" ]; then
@@ -395,7 +431,11 @@ function pqc_tests() {
 #-------------------------------------------------------------------------------------------------------------------------------
 function classic_tests() {
     # Function for performing the Classic TLS handshake tests using predefined signature algorithms and ciphers.
-    # Each classic cipher/sig combination is tested using OpenSSL's s_time utility.
+    # Each classic cipher/sig combination is tested using OpenSSL's s_time utility, followed by the handshake latency
+    # driver if latency testing is enabled.
+
+    # Reset the combination counter used to split the combinations between the test lanes
+    combination_num=0
 
     # Loop through all the classic ciphers to be used for testing
     for cipher in "${ciphers[@]}"; do
@@ -403,6 +443,12 @@ function classic_tests() {
         # Loop through all the classic signature algorithms and perform tests with current cipher
         for classic_alg in "${classic_algs[@]}"; do
 
+            # Skip the combination if it is assigned to another test lane
+            combination_num=$((combination_num + 1))
+            if (( (combination_num - 1) % LANE_COUNT != LANE_INDEX )); then
+                continue
+            fi
+
             # Set the fail flag to default value of false
             fail_flag=0
 
@@ -416,6 +462,15 @@ function classic_tests() {
                 # Perform the iteration handshake
                 control_signal "iteration_handshake"
 
+                # Skip the current combination if it has already been completed
+                checkpoint_unit="handshake|classic|$run_num|$cipher|$classic_alg"
+
+                if checkpoint_is_done "$checkpoint_unit"; then
+                    echo "[OUTPUT] - Skipping test already completed in the checkpoint journal"
+                    control_signal "control_send" "skip"
+                    break
+                fi
+
                 # Send the client ready signal and wait for server ready signal
                 control_signal "control_send" "ready"
                 control_signal "control_wait"
@@ -437,6 +492,12 @@ function classic_tests() {
                         -time $TIME_NUM > "$CLASSIC_HANDSHAKE/$output_name"
                     exit_code=$?
 
+                    # Record the handshake latencies against the same s_server if latency testing is enabled
+                    if [ $exit_code -eq 0 ] && [ "$LATENCY_HANDSHAKES" -gt 0 ]; then
+                        latency_test "$classic_cert_file" "$CLASSIC_HANDSHAKE/tls-latency-classic-$run_num-$cipher-$classic_alg.txt"
+                        exit_code=$?
+                    fi
+
                     # Check if the test was successful and retrying if not
                     if [ $exit_code -eq 0 ]; then
                         fail_flag=0
@@ -444,7 +505,7 @@ function classic_tests() {
 
                     elif [ $fail_counter -ne 3000 ]; then
                         ((fail_counter++))
-                        echo "[ERROR] - s-time process failed $fail_counter times, retrying"
+                        echo "[ERROR] - handshake test failed $fail_counter times, retrying"
 
                     else
                         fail_flag=1
@@ -457,16 +518,16 @@ function classic_tests() {
                 # Send the test complete or failed signal to server
                 if [ $fail_flag -eq 0 ]; then
 
-                    # Send the complete signal to server
+                    # Record the completed test and send the complete signal to server
+                    checkpoint_record "$checkpoint_unit"
                     control_signal "control_send" "complete"
                     break
 
                 else
 
-                    # Send the failed signal to server and restart the current run cipher/sig combination after 4 seconds
+                    # Send the failed signal to server and restart the current run cipher/sig combination
                     echo "[ERROR] - Failed to establish test connection, restarting current run cipher/sig combination"
                     control_signal "control_send" "failed"
-                    sleep 4
 
                 fi
 
@@ -488,17 +549,23 @@ function tls_client_test_entrypoint() {
     setup_base_env
 
     # Check if custom ports have been used and if so, outputting a warning message
-    if [ "$SERVER_CONTROL_PORT" != "25000" ] || [ "$CLIENT_CONTROL_PORT" != "25001" ] || [ "$S_SERVER_PORT" != "4433" ]; then
+    if [ "$SERVER_CONTROL_PORT" != "25000" ] || [ "$S_SERVER_PORT" != "4433" ]; then
         echo "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-        echo "Custom TCP ports detected - Server Control Port: $SERVER_CONTROL_PORT, Client Control Port: $CLIENT_CONTROL_PORT, S_Server Port: $S_SERVER_PORT"
+        echo "Custom TCP ports detected - Server Control Port: $SERVER_CONTROL_PORT, S_Server Port: $S_SERVER_PORT"
         echo "Please ensure that the server has been passed the same custom TCP port values, otherwise tests will fail"
         echo -e "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!\n"
     fi
 
-    # Output the start message and beginning the initial handshake
+    # Output the start message, open the control channel to the server, and begin the initial handshake
     echo -e "Client Script Activated, connecting to server...\n"
+    control_channel_connect "$SERVER_IP" "$SERVER_CONTROL_PORT"
     control_signal "iteration_handshake"
 
+    # Send the s_server mode for the test campaign and the test lane details to the server
+    REUSE_S_SERVER="${REUSE_S_SERVER:-False}"
+    control_signal "control_send" "reuse_s_server|$REUSE_S_SERVER"
+    control_signal "control_send" "lane|$LANE_INDEX|$LANE_COUNT"
+
     # Perform the TLS handshake tests for the specified number of runs
     for run_num in $(seq 1 $NUM_RUN); do
 
@@ -548,5 +615,8 @@ function tls_client_test_entrypoint() {
 
     done
 
+    # Close the control channel now that all of the handshake tests have completed
+    control_channel_close
+
 }
 tls_client_test_entrypoint
\ No newline at end of file
@@ -85,11 +85,12 @@ function setup_base_env() {
     classic_algs=("RSA_2048" "RSA_3072" "RSA_4096" "prime256v1" "secp384r1" "secp521r1")
     ciphers=("TLS_AES_256_GCM_SHA384" "TLS_CHACHA20_POLY1305_SHA256" "TLS_AES_128_GCM_SHA256")
 
-    # Ensure that a control sleep time env variables has been passed if not disabled
-    if [ -z "$CONTROL_SLEEP_TIME" ] && [ -z "$DISABLE_CONTROL_SLEEP" ]; then
-        echo "[ERROR] - Control sleep time env variable not set, this indicates a wider issue with the full-oqs-provider-test.sh script"
-        exit 1
-    fi
+    # Source the control channel helper functions used to coordinate the tests with the client
+    source "$test_scripts_path/control-channel.sh"
+
+    # Set the test lane number and lane count, which default to a single lane if the tests are not being run in parallel lanes
+    LANE_INDEX="${LANE_INDEX:-0}"
+    LANE_COUNT="${LANE_COUNT:-1}"
 
 }
 
@@ -182,93 +183,46 @@ function set_test_env() {
     
 }
 
-#-------------------------------------------------------------------------------------------------------------------------------
-function check_control_port() {
-    # Helper function that waits until the client is listening on the control port 
-    # before allowing the client to send a control signal. If enabled, it includes 
-    # a short delay to ensure the client is ready to receive the connection.
-
-    # Wait until the client is listening on the control port before sending signal
-    until nc -z "$CLIENT_IP" "$CLIENT_CONTROL_PORT" > /dev/null 2>&1; do
-        :
-    done
-
-    # Perform a small delay before sending signal to allow target device to be ready
-    if [ -v $DISABLE_CONTROL_SLEEP ]; then
-        sleep $CONTROL_SLEEP_TIME
-    fi
-
-}
-
 #-------------------------------------------------------------------------------------------------------------------------------
 function control_signal() {
-    # Function for handling server-to-client control signalling during TLS handshake testing.
+    # Function for handling server-to-client control signalling during TLS handshake testing over the persistent control channel.
     # Supports: control_send, control_wait, and iteration_handshake modes for coordination.
 
     # Declare the local variables for arguments passed to function
     local type="$1"
     local message="$2"
 
-    # Kill any lingering netcat processes
-    pkill -f "nc -l -p $SERVER_CONTROL_PORT"
-
     # Determine the type of control signal method to be used
     case "$type" in
 
         "control_send")
 
-            # Check if the control port is open on the client before sending signal
-            check_control_port
-
-            # Send the control signal to the client until successful
-            until echo "$message" | nc -n -w 1 "$CLIENT_IP" "$CLIENT_CONTROL_PORT" > /dev/null 2>&1; do
-                exit_status=$?
-                if [ "$exit_status" -ne 0 ]; then
-                    :
-                else
-                    break
-                fi
-            done
+            # Send the control signal to the client
+            control_channel_send "$message"
             ;;
 
         "control_wait")
 
-            # Wait until the control signal has been received and return the message
-            while true; do
-
-                # Wait for a connection from the client and capture the request in a variable
-                signal_message=$(nc -l -p "$SERVER_CONTROL_PORT")
-
-                # Check if the received control signal message is valid
-                if [[ "$signal_message" == "ready" || "$signal_message" == "skip" || "$signal_message" == "complete" ]]; then
-                    break
-                fi
+            # Wait for the next control signal from the client and ensure that it is valid
+            control_channel_receive
+            signal_message="$control_message"
 
-            done
+            if [[ "$signal_message" != "ready" && "$signal_message" != "skip" && "$signal_message" != "complete" && "$signal_message" != "failed" ]]; then
+                echo "[ERROR] - Unexpected control signal received from client: $signal_message"
+                exit 1
+            fi
             ;;
 
         "iteration_handshake")
 
-            # Wait for the client to send the handshake ready signal
-            while true; do
-                signal_message=$(nc -l -p "$SERVER_CONTROL_PORT")
-                if [[ "$signal_message" == "handshake_ready" ]]; then
-                    break
-                fi
-            done
-
-            # Check if the control port is open on the client before sending signal
-            check_control_port
+            # Wait for the client to send the next signal and send it back to the client
+            control_channel_receive
+            control_channel_send "next"
 
-            # Send the handshake ready signal to the client until successful
-            until echo "handshake_ready" | nc -n -w 1 "$CLIENT_IP" "$CLIENT_CONTROL_PORT" > /dev/null 2>&1; do
-                exit_status=$?
-                if [ "$exit_status" -ne 0 ]; then
-                    :
-                else
-                    break
-                fi
-            done
+            if [ "$control_message" != "next" ]; then
+                echo "[ERROR] - Unexpected control signal received from client: $control_message"
+                exit 1
+            fi
             ;;
 
         *)
@@ -282,27 +236,101 @@ function control_signal() {
 
 }
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function start_pqc_s_server() {
+    # Helper function for starting the OpenSSL s_server process for the current PQC/Hybrid-PQC signature algorithm. The function is
+    # passed the groups that the s_server will advertise, which is either the current KEM or all of the KEMs for the test type when
+    # the s_server is being reused for every KEM. The function returns once the s_server is listening on the s_server port.
+
+    # Declare the local variables for the arguments passed to function
+    local groups="$1"
+
+    # Set the cert and key files depending on the test type
+    if [ "$test_type" -eq 0 ]; then
+        cert_file="$pqc_cert_dir/""${sig/:/_}""-srv.crt"
+        key_file="$pqc_cert_dir/""${sig/:/_}""-srv.key"
+
+    elif [ "$test_type" -eq 1 ]; then
+        cert_file="$hybrid_cert_dir/""${sig/:/_}""-srv.crt"
+        key_file="$hybrid_cert_dir/""${sig/:/_}""-srv.key"
+    fi
+
+    # Start the OpenSSL s_server process
+    "$openssl_path/bin/openssl" s_server \
+        -cert $cert_file \
+        -key $key_file \
+        -www \
+        -tls1_3 \
+        -groups $groups \
+        -provider oqsprovider \
+        -provider-path $provider_path \
+        -accept $S_SERVER_PORT &
+    server_pid=$!
+
+    # Check if the server has started before returning
+    until netstat -tuln | grep -E ":$S_SERVER_PORT[[:space:]]" > /dev/null; do
+        :
+    done
+
+}
+
+#-------------------------------------------------------------------------------------------------------------------------------
+function stop_s_server() {
+    # Helper function for stopping the running OpenSSL s_server process and waiting for it to exit so that the s_server port is free
+
+    # Kill the s_server process if one is running and wait for it to exit
+    if [ -n "$server_pid" ]; then
+        kill $server_pid 2>/dev/null
+        wait $server_pid 2>/dev/null
+        server_pid=""
+    fi
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function pqc_tests() {
-    # Function for performing the PQC and Hybrid-PQC TLS handshake tests. Digital signature and KEM algorithms are 
+    # Function for performing the PQC and Hybrid-PQC TLS handshake tests. Digital signature and KEM algorithms are
     # loaded based on the selected test type (0=pqc, 1=hybrid) via set_test_env. Using the current sig/kem
     # algorithm combination, the function starts a OpenSSL s_server process and that the client can connect to.
+    # If the client has enabled the s_server reuse mode, a single s_server process advertising all of the KEM groups
+    # is started for each sig and kept running for all of its KEMs, with the client selecting the group for each test.
+
+    # Reset the combination counter used to split the combinations between the test lanes
+    combination_num=0
 
     # Loop through all PQC/Hybrid-PQC sig algorithms to be used for signing
     for sig in "${sig_algs[@]}"; do
 
+        # Clear the s_server process ID for the current sig
+        server_pid=""
+
         # Loop through all PQC/Hybrid-PQC KEM algorithms to be used for key exchange
         for kem in "${kem_algs[@]}"; do
 
+            # Skip the combination if it is assigned to another test lane
+            combination_num=$((combination_num + 1))
+            if (( (combination_num - 1) % LANE_COUNT != LANE_INDEX )); then
+                continue
+            fi
+
             # Perform the current run sig/kem combination test until passed
             while true; do
 
-                # Check if an old OpenSSL process is still active
-                pgrep_output=$(pgrep openssl)
+                # Clear the s_server process ID if the reused s_server is no longer running
+                if [ -n "$server_pid" ] && ! kill -0 "$server_pid" 2>/dev/null; then
+                    echo "[WARNING] - The s_server process for $sig is no longer running, restarting it"
+                    server_pid=""
+                fi
+
+                # Check if an old OpenSSL s_server process is still active on the s_server port and kill it, unless it is being reused
+                if [ -z "$server_pid" ]; then
+
+                    pgrep_output=$(pgrep -f -- "-accept $S_SERVER_PORT\$")
+
+                    if [[ ! -z $pgrep_output ]]; then
+                        kill "$pgrep_output"
+                    fi
 
-                # Kill the old process if active
-                if [[ ! -z $pgrep_output ]]; then
-                    kill "$pgrep_output"
                 fi
 
                 # Output the current TLS test info
@@ -315,32 +343,22 @@ function pqc_tests() {
                 # Wait for the ready signal from client signal
                 control_signal "control_wait"
 
-                # Set the cert and key files depending on the test type
-                if [ "$test_type" -eq 0 ]; then
-                    cert_file="$pqc_cert_dir/""${sig/:/_}""-srv.crt"
-                    key_file="$pqc_cert_dir/""${sig/:/_}""-srv.key"
-
-                elif [ "$test_type" -eq 1 ]; then
-                    cert_file="$hybrid_cert_dir/""${sig/:/_}""-srv.crt"
-                    key_file="$hybrid_cert_dir/""${sig/:/_}""-srv.key"
+                # Skip the combination if the client has already completed it in a previous run of the campaign
+                if [ $signal_message == "skip" ]; then
+                    echo "[OUTPUT] - Skipping test already completed by the client"
+                    break
                 fi
 
-                # Start the OpenSSL s_server process
-                "$openssl_path/bin/openssl" s_server \
-                    -cert $cert_file \
-                    -key $key_file \
-                    -www \
-                    -tls1_3 \
-                    -groups $kem \
-                    -provider oqsprovider \
-                    -provider-path $provider_path \
-                    -accept $S_SERVER_PORT &
-                server_pid=$!
-
-                # Check if the server has started before sending ready signal to client
-                until netstat -tuln | grep ":$S_SERVER_PORT" > /dev/null; do
-                    :
-                done
+                # Start the s_server process if one is not already running, advertising all of the KEM groups if it is being reused
+                if [ -z "$server_pid" ]; then
+
+                    if [ "$reuse_s_server" == "True" ]; then
+                        start_pqc_s_server "$DEFAULT_GROUPS"
+                    else
+                        start_pqc_s_server "$kem"
+                    fi
+
+                fi
 
                 # Send the ready signal to client
                 control_signal "control_send" "ready"
@@ -351,23 +369,28 @@ function pqc_tests() {
                 # Check if test status signal received from client is complete or failed
                 if [ $signal_message == "complete" ]; then
 
-                    # Successful completion of test from client
-                    kill $server_pid
+                    # Successful completion of test from client, stopping the s_server unless it is being reused for the next KEM
+                    if [ "$reuse_s_server" != "True" ]; then
+                        stop_s_server
+                    fi
+
                     break
 
                 elif [ $signal_message == "failed" ]; then
 
-                    # Restart sig/kem combination if failed signal received from client
+                    # Restart sig/kem combination with a new s_server process if failed signal received from client
                     echo "[ERROR] - 3000 failed attempts signal received from client, restarting sig/kem combination"
-                    kill $server_pid
-                    sleep 2
-                
+                    stop_s_server
+
                 fi
 
             done
 
         done
-    
+
+        # Stop the s_server process for the current sig once all of its KEMs have been tested
+        stop_s_server
+
     done
 
 }
@@ -378,17 +401,26 @@ function classic_tests() {
     # The function will loop through all classic algorithms and ciphers, starting a new OpenSSL s_server process
     # for each combination so that the client can connect to.
 
+    # Reset the combination counter used to split the combinations between the test lanes
+    combination_num=0
+
     # Loop through all the classic ciphers to be used for testing
     for cipher in "${ciphers[@]}"; do
 
         # Loop through all the classic signature algorithms and perform tests with current cipher
         for classic_alg in "${classic_algs[@]}"; do
 
+            # Skip the combination if it is assigned to another test lane
+            combination_num=$((combination_num + 1))
+            if (( (combination_num - 1) % LANE_COUNT != LANE_INDEX )); then
+                continue
+            fi
+
             # Perform the current run cipher/sig combination test until passed
             while true; do
 
-                # Check if an old OpenSSL process is still active
-                pgrep_output=$(pgrep openssl)
+                # Check if an old OpenSSL s_server process is still active on the s_server port
+                pgrep_output=$(pgrep -f -- "-accept $S_SERVER_PORT\$")
 
                 # Kill the old process if active
                 if [[ ! -z $pgrep_output ]]; then
@@ -405,6 +437,12 @@ function classic_tests() {
                 # Wait for the ready signal from client
                 control_signal "control_wait"
 
+                # Skip the combination if the client has already completed it in a previous run of the campaign
+                if [ $signal_message == "skip" ]; then
+                    echo "[OUTPUT] - Skipping test already completed by the client"
+                    break
+                fi
+
                 # Check if the current digital signature is RSA or ECC to determine what parameters s_server needs
                 if [[ $classic_alg == "prime256v1" || $classic_alg == "secp384r1" || $classic_alg == "secp521r1" ]]; then
 
@@ -442,7 +480,7 @@ function classic_tests() {
                 fi
 
                 # Check if the s_server has started before sending the ready signal to the client
-                until netstat -tuln | grep ":$S_SERVER_PORT" > /dev/null; do
+                until netstat -tuln | grep -E ":$S_SERVER_PORT[[:space:]]" > /dev/null; do
                     :
                 done
 
@@ -455,8 +493,9 @@ function classic_tests() {
                 # Check if the test status signal received from client is complete or failed
                 if [ $signal_message == "complete" ]; then
 
-                    # Successful completion of test from client
+                    # Successful completion of test from client, waiting for the s_server process to exit
                     kill $server_pid
+                    wait $server_pid 2>/dev/null
                     break
 
                 elif [ $signal_message == "failed" ]; then
@@ -464,7 +503,7 @@ function classic_tests() {
                     # Restart the sig/cipher combination if failed signal from client
                     echo "[ERROR] - 3000 failed attempts signal received from client, restarting cipher/sig combination"
                     kill $server_pid
-                    sleep 2
+                    wait $server_pid 2>/dev/null
                 
                 fi
 
@@ -487,17 +526,42 @@ function tls_server_test_entrypoint() {
     clear
 
     # Check if custom ports have been used and if so, outputting a warning message
-    if [ "$SERVER_CONTROL_PORT" != "25000" ] || [ "$CLIENT_CONTROL_PORT" != "25001" ] || [ "$S_SERVER_PORT" != "4433" ]; then
+    if [ "$SERVER_CONTROL_PORT" != "25000" ] || [ "$S_SERVER_PORT" != "4433" ]; then
         echo "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-        echo "Custom TCP ports detected - Server Control Port: $SERVER_CONTROL_PORT, Client Control Port: $CLIENT_CONTROL_PORT, S_Server Port: $S_SERVER_PORT"
+        echo "Custom TCP ports detected - Server Control Port: $SERVER_CONTROL_PORT, S_Server Port: $S_SERVER_PORT"
         echo "Please ensure that the client is passed the flags for any custom TCP port values"
         echo -e "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!\n"
     fi
 
-    # Output the start message and beginning the initial handshake
+    # Output the start message, open the control channel listener, and wait for the initial handshake from the client
     echo -e "Server Script Activated, waiting for connection from client..."
+    control_channel_listen "$SERVER_CONTROL_PORT"
     control_signal "iteration_handshake"
 
+    # Receive the s_server mode for the test campaign from the client
+    control_channel_receive
+
+    if [[ "$control_message" =~ ^reuse_s_server\|(True|False)$ ]]; then
+        reuse_s_server="${BASH_REMATCH[1]}"
+    else
+        echo "[ERROR] - Unexpected control signal received from client: $control_message"
+        exit 1
+    fi
+
+    # Receive the test lane details from the client and ensure they match the lane details for the server
+    control_channel_receive
+
+    if [ "$control_message" != "lane|$LANE_INDEX|$LANE_COUNT" ]; then
+        echo "[ERROR] - The client test lane details ($control_message) do not match the server (lane|$LANE_INDEX|$LANE_COUNT)"
+        echo "Please ensure that the same number of test lanes has been set on both the server and client"
+        exit 1
+    fi
+
+    # Output the s_server mode if one s_server process is being used for each sig
+    if [ "$reuse_s_server" == "True" ]; then
+        echo -e "[NOTICE] - Reusing one s_server process for all of the KEM groups of each signature algorithm\n"
+    fi
+
     # Perform the TLS handshake tests for the specified number of runs
     for run_num in $(seq 1 $NUM_RUN); do
 
@@ -546,6 +610,9 @@ function tls_server_test_entrypoint() {
         echo "[OUTPUT] - All $run_num Testing Completed"
 
     done
-    
+
+    # Close the control channel now that all of the handshake tests have completed
+    control_channel_close
+
 }
 tls_server_test_entrypoint
\ No newline at end of file
@@ -101,19 +101,53 @@ function setup_test_env() {
         hybrid_sig_algs+=("$line")
     done < $hybrid_sig_alg_file
 
-    # Create the result output directories and removing old if needed
-    if [ -d $PQC_SPEED ]; then
+    # Load the checkpoint journal so that the speed tests already completed in the current campaign can be skipped
+    source "$test_scripts_path/checkpoint-journal.sh"
+
+    if [ -n "$CHECKPOINT_JOURNAL" ]; then
+        checkpoint_load "$CHECKPOINT_JOURNAL"
+    fi
+
+    # Create the result output directories and removing old if needed, keeping the completed results when resuming
+    if [ -d $PQC_SPEED ] && [ "$RESUME_TESTING" != "True" ]; then
         rm -rf $PQC_SPEED
     fi
     mkdir -p $PQC_SPEED
 
-    if [ -d $HYBRID_SPEED ]; then
+    if [ -d $HYBRID_SPEED ] && [ "$RESUME_TESTING" != "True" ]; then
         rm -rf $HYBRID_SPEED
     fi
     mkdir -p $HYBRID_SPEED
 
 }
 
+#-------------------------------------------------------------------------------------------------------------------------------
+function run_speed_test() {
+    # Helper function for running a single OpenSSL speed test for the passed algorithm type and run number, storing the output in the
+    # passed output file. The remaining arguments are the algorithms to test. The test is skipped if it has already been completed in
+    # the checkpoint journal, and is recorded in the journal once completed.
+
+    # Set the local variables to what was passed to the function
+    local speed_type="$1"
+    local run_num="$2"
+    local output_filename="$3"
+    shift 3
+
+    # Skip the test if it has already been completed
+    if checkpoint_is_done "tls-speed|$speed_type|$run_num"; then
+        echo "[OUTPUT] - Skipping completed $speed_type speed test run - $run_num"
+        return 0
+    fi
+
+    # Perform the speed test and record it in the checkpoint journal if successful
+    "$openssl_path/bin/openssl" speed \
+        -seconds $TIME_NUM \
+        -provider-path $provider_path \
+        -provider oqsprovider \
+        "$@" > $output_filename && checkpoint_record "tls-speed|$speed_type|$run_num"
+
+}
+
 #-------------------------------------------------------------------------------------------------------------------------------
 function tls_speed_test() {
     # Function for running the TLS speed tests for the various algorithm types. It uses the OpenSSL s_speed utility to benchmark
@@ -136,32 +170,16 @@ function tls_speed_test() {
         classic_output_filename="$CLASSIC_SPEED/tls-speed-classic-$run_num.txt"
 
         # Perform the PQC KEM algorithms speed tests
-        "$openssl_path/bin/openssl" speed \
-            -seconds $TIME_NUM \
-            -provider-path $provider_path \
-            -provider oqsprovider  \
-            $kem_algs_string > $kem_output_filename
+        run_speed_test "kem" "$run_num" "$kem_output_filename" $kem_algs_string
 
         # Perform the PQC digital signature algorithms speed tests
-        "$openssl_path/bin/openssl" speed \
-            -seconds $TIME_NUM \
-            -provider-path $provider_path \
-            -provider oqsprovider \
-            $sig_algs_string > $sig_output_filename
+        run_speed_test "sig" "$run_num" "$sig_output_filename" $sig_algs_string
 
         # Perform the Hybrid-PQC KEM algorithms speed tests
-        "$openssl_path/bin/openssl" speed \
-            -seconds $TIME_NUM \
-            -provider-path $provider_path \
-            -provider oqsprovider \
-            $hybrid_kem_algs_string > $hybrid_kem_output_filename
+        run_speed_test "hybrid-kem" "$run_num" "$hybrid_kem_output_filename" $hybrid_kem_algs_string
 
         # Perform the Hybrid-PQC digital signature algorithms speed tests
-        "$openssl_path/bin/openssl" speed \
-            -seconds $TIME_NUM \
-            -provider-path $provider_path \
-            -provider oqsprovider \
-            $hybrid_sig_algs_string > $hybrid_sig_output_filename
+        run_speed_test "hybrid-sig" "$run_num" "$hybrid_sig_output_filename" $hybrid_sig_algs_string
 
     done
 
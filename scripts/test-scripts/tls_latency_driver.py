@@ -0,0 +1,328 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+TLS handshake latency driver for the automated OQS-Provider TLS performance testing. OpenSSL's s_time tool only reports
+the number of connections made in the test window, so this driver performs a set number of full and resumed TLS handshakes
+against the running s_server and records the latency of each one. The driver loads the project's OpenSSL 3.4.1 libssl and
+libcrypto libraries using ctypes, so the handshakes use the same OpenSSL build, openssl.cnf configuration, and OQS-Provider
+as the s_time tests, with the KEM groups being taken from the DEFAULT_GROUPS environment variable through openssl.cnf.
+
+Each full handshake is followed by a resumed handshake using the session ticket from the full handshake, with the time
+taken by SSL_connect being recorded for each. The latencies are written to the output file in microseconds, one handshake
+per line, and a percentile summary is outputted to the terminal. This script is called by the oqsprovider-test-client.sh
+script when handshake latency testing is enabled and is not intended to be run manually.
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import argparse
+import ctypes
+import os
+import socket
+import statistics
+import sys
+import time
+
+# Declare the OpenSSL constants used by the driver
+openssl_init_load_config = 0x00000040
+ssl_verify_none = 0
+
+# Declare the HTTP request sent to the s_server, which is started with the -www option
+www_request = b"GET / HTTP/1.0\r\n\r\n"
+
+#-----------------------------------------------------------------------------------------------------------
+class LatencyDriverError(RuntimeError):
+    """ Exception raised when a TLS handshake performed by the latency driver fails """
+
+#-----------------------------------------------------------------------------------------------------------
+def positive_int(value):
+    """ Helper function for checking that a command line argument is an integer above 0 """
+
+    # Convert the value and ensure that it is above 0
+    try:
+        int_value = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid value: {value}, must be an integer above 0")
+
+    if int_value < 1:
+        raise argparse.ArgumentTypeError(f"invalid value: {value}, must be an integer above 0")
+
+    return int_value
+
+#-----------------------------------------------------------------------------------------------------------
+def get_args():
+    """ Function for parsing the command line arguments passed to the driver """
+
+    # Set the accepted command line arguments
+    parser = argparse.ArgumentParser(description="Record the latency of full and resumed TLS handshakes against a running s_server")
+    parser.add_argument("--host", required=True, help="Set the IP address of the s_server")
+    parser.add_argument("--port", required=True, type=positive_int, help="Set the TCP port of the s_server")
+    parser.add_argument("--cafile", required=True, help="Set the CA certificate file used to verify the s_server")
+    parser.add_argument("--handshakes", required=True, type=positive_int, help="Set the number of full and resumed handshakes to record")
+    parser.add_argument("--warmup", type=int, default=10, help="Set the number of unrecorded handshakes performed first (default 10)")
+    parser.add_argument("--lib-dir", default=None, help="Set the directory containing the OpenSSL libssl and libcrypto libraries")
+    parser.add_argument("--provider-path", default=None, help="Set the directory containing the OQS-Provider library, which is loaded with the default provider")
+    parser.add_argument("--output", required=True, help="Set the file the handshake latencies are written to")
+
+    return parser.parse_args()
+
+#-----------------------------------------------------------------------------------------------------------
+class OpenSSLClient:
+
+    #------------------------------------------------------------------------------
+    def __init__(self, lib_dir, provider_path, cafile):
+        """ Class for performing TLS handshakes using the OpenSSL libssl library through ctypes. The libraries
+            are loaded from the supplied directory, or from the library search path if no directory is supplied,
+            and a single client SSL_CTX is created which is used for all of the handshakes """
+
+        # Load the libcrypto and libssl libraries, with libcrypto being loaded globally so libssl uses the same copy
+        lib_prefix = lib_dir if lib_dir is not None else ""
+        self.libcrypto = ctypes.CDLL(os.path.join(lib_prefix, "libcrypto.so.3"), mode=ctypes.RTLD_GLOBAL)
+        self.libssl = ctypes.CDLL(os.path.join(lib_prefix, "libssl.so.3"))
+        self.set_prototypes()
+
+        # Initialise libssl, loading the openssl.cnf configuration used by the s_time tests
+        if self.libssl.OPENSSL_init_ssl(openssl_init_load_config, None) != 1:
+            raise LatencyDriverError(f"unable to initialise libssl: {self.get_error_string()}")
+
+        # Load the default and OQS-Provider providers in the same way as the s_time tests if the provider path is supplied
+        if provider_path is not None:
+            self.libcrypto.OSSL_PROVIDER_set_default_search_path(None, provider_path.encode())
+
+            for provider_name in [b"default", b"oqsprovider"]:
+                if not self.libcrypto.OSSL_PROVIDER_load(None, provider_name):
+                    raise LatencyDriverError(f"unable to load the {provider_name.decode()} provider: {self.get_error_string()}")
+
+        # Create the client context, loading the CA file and recording the verification result without ending the handshake like s_time
+        self.ctx = self.libssl.SSL_CTX_new(self.libssl.TLS_client_method())
+
+        if not self.ctx:
+            raise LatencyDriverError(f"unable to create the SSL context: {self.get_error_string()}")
+
+        if self.libssl.SSL_CTX_load_verify_locations(self.ctx, cafile.encode(), None) != 1:
+            raise LatencyDriverError(f"unable to load the CA file {cafile}: {self.get_error_string()}")
+
+        self.libssl.SSL_CTX_set_verify(self.ctx, ssl_verify_none, None)
+
+    #------------------------------------------------------------------------------
+    def set_prototypes(self):
+        """ Method for setting the argument and return types of the OpenSSL functions used by the driver """
+
+        # Declare the argument and return types for each library function
+        prototypes = [
+            (self.libssl, "OPENSSL_init_ssl", [ctypes.c_uint64, ctypes.c_void_p], ctypes.c_int),
+            (self.libcrypto, "OSSL_PROVIDER_set_default_search_path", [ctypes.c_void_p, ctypes.c_char_p], ctypes.c_int),
+            (self.libcrypto, "OSSL_PROVIDER_load", [ctypes.c_void_p, ctypes.c_char_p], ctypes.c_void_p),
+            (self.libcrypto, "ERR_get_error", [], ctypes.c_ulong),
+            (self.libcrypto, "ERR_error_string_n", [ctypes.c_ulong, ctypes.c_char_p, ctypes.c_size_t], None),
+            (self.libssl, "TLS_client_method", [], ctypes.c_void_p),
+            (self.libssl, "SSL_CTX_new", [ctypes.c_void_p], ctypes.c_void_p),
+            (self.libssl, "SSL_CTX_free", [ctypes.c_void_p], None),
+            (self.libssl, "SSL_CTX_load_verify_locations", [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p], ctypes.c_int),
+            (self.libssl, "SSL_CTX_set_verify", [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p], None),
+            (self.libssl, "SSL_new", [ctypes.c_void_p], ctypes.c_void_p),
+            (self.libssl, "SSL_free", [ctypes.c_void_p], None),
+            (self.libssl, "SSL_set_fd", [ctypes.c_void_p, ctypes.c_int], ctypes.c_int),
+            (self.libssl, "SSL_set_session", [ctypes.c_void_p, ctypes.c_void_p], ctypes.c_int),
+            (self.libssl, "SSL_connect", [ctypes.c_void_p], ctypes.c_int),
+            (self.libssl, "SSL_get_error", [ctypes.c_void_p, ctypes.c_int], ctypes.c_int),
+            (self.libssl, "SSL_session_reused", [ctypes.c_void_p], ctypes.c_int),
+            (self.libssl, "SSL_write", [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_int),
+            (self.libssl, "SSL_read", [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_int),
+            (self.libssl, "SSL_shutdown", [ctypes.c_void_p], ctypes.c_int),
+            (self.libssl, "SSL_get1_session", [ctypes.c_void_p], ctypes.c_void_p),
+            (self.libssl, "SSL_SESSION_free", [ctypes.c_void_p], None)
+        ]
+
+        # Set the types for each function
+        for library, function_name, arg_types, return_type in prototypes:
+            function = getattr(library, function_name)
+            function.argtypes = arg_types
+            function.restype = return_type
+
+    #------------------------------------------------------------------------------
+    def get_error_string(self):
+        """ Method for getting the most recent error from the OpenSSL error queue as a string """
+
+        # Get the error code from the queue and convert it to a string
+        error_code = self.libcrypto.ERR_get_error()
+
+        if error_code == 0:
+            return "no OpenSSL error reported"
+
+        error_buffer = ctypes.create_string_buffer(256)
+        self.libcrypto.ERR_error_string_n(error_code, error_buffer, len(error_buffer))
+
+        return error_buffer.value.decode(errors="replace")
+
+    #------------------------------------------------------------------------------
+    def handshake(self, host, port, session=None):
+        """ Method for performing a single TLS handshake with the s_server, resuming the supplied session if one
+            is passed. Only the SSL_connect call is timed, after which the s_server page is read so that the
+            session tickets are received. Returns the handshake time in nanoseconds, whether the session was
+            resumed, and the session to be used for resumption, which must be freed by the caller """
+
+        # Open the TCP connection to the s_server and create the SSL object for the connection
+        with socket.create_connection((host, port)) as tcp_socket:
+
+            tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            ssl = self.libssl.SSL_new(self.ctx)
+
+            if not ssl:
+                raise LatencyDriverError(f"unable to create the SSL object: {self.get_error_string()}")
+
+            try:
+
+                # Set the connection socket and the session to be resumed
+                self.libssl.SSL_set_fd(ssl, tcp_socket.fileno())
+
+                if session is not None:
+                    self.libssl.SSL_set_session(ssl, session)
+
+                # Perform the handshake and record the time taken
+                start_time = time.perf_counter_ns()
+                connect_result = self.libssl.SSL_connect(ssl)
+                handshake_time = time.perf_counter_ns() - start_time
+
+                if connect_result != 1:
+                    ssl_error = self.libssl.SSL_get_error(ssl, connect_result)
+                    raise LatencyDriverError(f"handshake failed with SSL error {ssl_error}: {self.get_error_string()}")
+
+                reused = self.libssl.SSL_session_reused(ssl) == 1
+
+                # Request and read the s_server page so that the session tickets sent after the handshake are received
+                self.libssl.SSL_write(ssl, www_request, len(www_request))
+                read_buffer = ctypes.create_string_buffer(4096)
+
+                while self.libssl.SSL_read(ssl, read_buffer, len(read_buffer)) > 0:
+                    pass
+
+                # Get the session for resumption and close the connection
+                new_session = self.libssl.SSL_get1_session(ssl)
+                self.libssl.SSL_shutdown(ssl)
+
+            finally:
+                self.libssl.SSL_free(ssl)
+
+        return handshake_time, reused, new_session
+
+    #------------------------------------------------------------------------------
+    def free_session(self, session):
+        """ Method for freeing a session returned by the handshake method """
+
+        if session:
+            self.libssl.SSL_SESSION_free(session)
+
+    #------------------------------------------------------------------------------
+    def close(self):
+        """ Method for freeing the client context """
+
+        self.libssl.SSL_CTX_free(self.ctx)
+
+#-----------------------------------------------------------------------------------------------------------
+def run_handshakes(client, host, port, num_handshakes, num_warmup):
+    """ Function for performing the warm-up handshakes and then the recorded full and resumed handshakes. Each full
+        handshake is followed by a resumption of its session, so that both handshake types are spread evenly across
+        the test. Returns the full and resumed handshake latencies in microseconds and the number of resumption
+        attempts where the s_server performed a full handshake instead """
+
+    # Declare the latency lists and the resumption miss counter
+    full_latencies = []
+    resumed_latencies = []
+    resume_misses = 0
+
+    # Perform the warm-up handshakes, which are not recorded
+    for _ in range(num_warmup):
+        _, _, session = client.handshake(host, port)
+        client.free_session(session)
+
+    # Perform the full handshakes, resuming each of their sessions
+    for _ in range(num_handshakes):
+
+        full_time, _, session = client.handshake(host, port)
+        full_latencies.append(full_time / 1000)
+
+        try:
+            resumed_time, reused, resumed_session = client.handshake(host, port, session)
+            client.free_session(resumed_session)
+        finally:
+            client.free_session(session)
+
+        # Only record the resumed handshake if the s_server accepted the session
+        if reused:
+            resumed_latencies.append(resumed_time / 1000)
+        else:
+            resume_misses += 1
+
+    return full_latencies, resumed_latencies, resume_misses
+
+#-----------------------------------------------------------------------------------------------------------
+def get_percentiles(latencies):
+    """ Helper function for getting the 50th, 95th, and 99th percentiles of the supplied latencies,
+        using linear interpolation between the closest ranks """
+
+    # Return the single value if only one latency is present
+    if len(latencies) == 1:
+        return latencies * 3
+
+    cut_points = statistics.quantiles(latencies, n=100, method="inclusive")
+    return [cut_points[49], cut_points[94], cut_points[98]]
+
+#-----------------------------------------------------------------------------------------------------------
+def write_latencies(output_filepath, args, full_latencies, resumed_latencies, resume_misses):
+    """ Function for writing the handshake latencies to the output file, with the test parameters
+        being written as comment lines before the latency for each handshake """
+
+    # Write the test parameters and then each of the handshake latencies
+    with open(output_filepath, "w") as output_file:
+
+        output_file.write("# TLS handshake latencies in microseconds\n")
+        output_file.write(f"# groups={os.environ.get('DEFAULT_GROUPS', '')}\n")
+        output_file.write(f"# handshakes={args.handshakes}\n")
+        output_file.write(f"# warmup={args.warmup}\n")
+        output_file.write(f"# resume_misses={resume_misses}\n")
+
+        for handshake_type, latencies in (("full", full_latencies), ("resumed", resumed_latencies)):
+            for latency in latencies:
+                output_file.write(f"{handshake_type} {latency:.3f}\n")
+
+#-----------------------------------------------------------------------------------------------------------
+def main():
+    """ Main function for controlling the TLS handshake latency driver """
+
+    # Parse the command line arguments
+    args = get_args()
+
+    # Perform the handshakes using the project's OpenSSL libraries, returning a non-zero exit code so that the client retries the test
+    try:
+        client = OpenSSLClient(args.lib_dir, args.provider_path, args.cafile)
+
+        try:
+            full_latencies, resumed_latencies, resume_misses = run_handshakes(client, args.host, args.port, args.handshakes, args.warmup)
+        finally:
+            client.close()
+
+    except (OSError, LatencyDriverError) as e:
+        print(f"[ERROR] - Handshake latency test failed: {e}")
+        sys.exit(1)
+
+    # Write the handshake latencies to the output file
+    write_latencies(args.output, args, full_latencies, resumed_latencies, resume_misses)
+
+    # Output the percentile summary for each of the handshake types
+    for handshake_type, latencies in (("Full", full_latencies), ("Resumed", resumed_latencies)):
+
+        if not latencies:
+            print(f"[WARNING] - No {handshake_type.lower()} handshakes were recorded")
+            continue
+
+        p50, p95, p99 = get_percentiles(latencies)
+        print(f"[OUTPUT] - {handshake_type} handshake latency (us) - P50: {p50:.1f}, P95: {p95:.1f}, P99: {p99:.1f}")
+
+    # Output a warning if the s_server did not resume all of the sessions
+    if resume_misses > 0:
+        print(f"[WARNING] - The s_server performed a full handshake for {resume_misses} of the {args.handshakes} resumption attempts, these are not recorded")
+
+#-----------------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,569 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Utility script for benchmarking the result parsing scripts against synthetic up-results. By default, a synthetic
+results tree is generated in a temporary directory using the generate_synthetic_results.py utility script, and each
+parsing stage (Liboqs speed, memory and averages, OQS-Provider handshake, speed and averages, the full parse for
+each tool, and the chunked OQS-Provider parse) is run in its own process. The wall time, CPU time, input files per second, output rows per second and
+peak RSS for each stage are outputted, and the results are appended to a benchmark history file so that runs can be
+compared over time, with the change from the last run using the same configuration being shown. This script can be
+executed manually from any location.
+
+Accepted arguments:
+    --machines=<num>       Number of machines to generate results for (default 2)
+    --runs=<num>           Number of test runs for each machine (default 5)
+    --kems=<num>           Number of KEM algorithms in each algorithm list (default 10)
+    --sigs=<num>           Number of digital signature algorithms in each algorithm list (default 10)
+    --seed=<num>           Seed for the synthetic results generator (default 1)
+    --root-dir=<path>      Benchmark an existing synthetic results tree instead of generating one
+    --history-file=<path>  File the benchmark results are appended to (default test-data/benchmarks/parser-benchmarks.jsonl)
+    --label=<text>         Label stored with the benchmark results to identify the run
+    --no-save              Do not append the benchmark results to the history file
+    --keep                 Keep the generated results tree and parsed results once the benchmark is complete
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import tempfile
+import platform
+import contextlib
+import subprocess
+import multiprocessing
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+
+# Import the resource module used for the peak RSS measurements, which is not available on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Add the parsing scripts directory to the module search path so the parsers can be imported
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
+sys.path.insert(0, os.path.join(project_root, "scripts", "parsing-scripts"))
+
+import pandas as pd
+import liboqs_parse
+import oqs_provider_parse
+from results_averager import LiboqsResultAverager, OqsProviderResultAverager
+from parse_results import discover_machine_runs, default_chunk_memory_mb
+from generate_synthetic_results import generate_results
+
+# Declare the benchmark stages in the order they are run, along with the tool each stage parses
+stage_tools = {
+    "liboqs-speed": "liboqs",
+    "liboqs-memory": "liboqs",
+    "liboqs-averages": "liboqs",
+    "oqs-provider-handshake": "oqs-provider",
+    "oqs-provider-speed": "oqs-provider",
+    "oqs-provider-averages": "oqs-provider",
+    "liboqs-full": "liboqs",
+    "oqs-provider-full": "oqs-provider",
+    "oqs-provider-chunked": "oqs-provider"
+}
+
+#-----------------------------------------------------------------------------------------------------------
+def output_help_message():
+    """ Helper function for outputting the help message to the user when the --help flag is present
+        or when incorrect arguments are passed """
+
+    # Output the supported options and their usage to the user
+    print("Usage: benchmark_parsers.py [options]\n")
+    print("Options:")
+    print("  --machines=<num>              Number of machines to generate results for (default 2)")
+    print("  --runs=<num>                  Number of test runs for each machine (default 5)")
+    print("  --kems=<num>                  Number of KEM algorithms in each algorithm list (default 10)")
+    print("  --sigs=<num>                  Number of digital signature algorithms in each algorithm list (default 10)")
+    print("  --seed=<num>                  Seed for the synthetic results generator (default 1)")
+    print("  --root-dir=<path>             Benchmark an existing synthetic results tree instead of generating one")
+    print("  --history-file=<path>         File the benchmark results are appended to")
+    print("  --label=<text>                Label stored with the benchmark results to identify the run")
+    print("  --no-save                     Do not append the benchmark results to the history file")
+    print("  --keep                        Keep the generated results tree and parsed results once complete")
+    print("  --help                        Display this help message and exit")
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_args():
+    """ Function for parsing the command line arguments passed to the script, returning the benchmark options """
+
+    # Set the default benchmark options
+    bench_opts = {
+        "machines": 2, "runs": 5, "kems": 10, "sigs": 10, "seed": 1, "root-dir": None,
+        "history-file": os.path.join(project_root, "test-data", "benchmarks", "parser-benchmarks.jsonl"),
+        "label": None, "no-save": False, "keep": False
+    }
+    flag_opts = ["no-save", "keep"]
+    path_opts = ["root-dir", "history-file"]
+
+    # Loop through the passed arguments and set the benchmark options
+    for arg in sys.argv[1:]:
+
+        if arg == "--help":
+            output_help_message()
+            sys.exit(0)
+
+        # Ensure the argument is a supported option
+        opt_name, has_value, opt_value = arg.partition("=")
+        opt_name = opt_name.lstrip("-")
+
+        if not arg.startswith("--") or opt_name not in bench_opts or (opt_name in flag_opts) == bool(has_value):
+            print(f"[ERROR] - Invalid argument passed: {arg}")
+            output_help_message()
+            sys.exit(1)
+
+        # Set the option value based on the option type, ensuring the numeric options are positive integers
+        if opt_name in flag_opts:
+            bench_opts[opt_name] = True
+
+        elif opt_name in path_opts:
+            bench_opts[opt_name] = os.path.abspath(opt_value)
+
+        elif opt_name == "label":
+            bench_opts[opt_name] = opt_value
+
+        elif opt_value.isdigit() and (int(opt_value) > 0 or opt_name == "seed"):
+            bench_opts[opt_name] = int(opt_value)
+
+        else:
+            print(f"[ERROR] - Invalid value passed for --{opt_name}: {opt_value}")
+            output_help_message()
+            sys.exit(1)
+
+    return bench_opts
+
+#-----------------------------------------------------------------------------------------------------------
+def get_peak_rss_mb():
+    """ Helper function for getting the peak resident set size of the current process in MB,
+        returning None if the resource module is not available on the system """
+
+    # Return None if the peak RSS can not be measured
+    if resource is None:
+        return None
+
+    # Convert the peak RSS to MB, which is reported in bytes on macOS and in KB on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+#-----------------------------------------------------------------------------------------------------------
+def count_csv_rows(filepaths):
+    """ Helper function for counting the data rows in the supplied csv files, excluding the header rows """
+
+    # Count the lines in each of the files that are present
+    num_rows = 0
+    for filepath in filepaths:
+        if os.path.isfile(filepath):
+            with open(filepath, "rb") as csv_file:
+                num_rows += max(sum(1 for _ in csv_file) - 1, 0)
+
+    return num_rows
+
+#-----------------------------------------------------------------------------------------------------------
+def get_liboqs_machines(root_dir, machine_runs):
+    """ Helper function for getting the Liboqs directory paths and algorithm lists for each machine,
+        creating the parsed results directories for the machines if not present """
+
+    # Set up the Liboqs parsing environment and create the directory paths for each machine
+    base_paths, kem_algs, sig_algs = liboqs_parse.setup_parse_env(root_dir)
+    machines = []
+
+    for machine_num, num_runs in machine_runs.items():
+        dir_paths = liboqs_parse.set_machine_paths(base_paths, machine_num)
+        os.makedirs(dir_paths["type_speed_dir"], exist_ok=True)
+        os.makedirs(dir_paths["type_mem_dir"], exist_ok=True)
+        machines.append((dir_paths, num_runs, kem_algs, sig_algs))
+
+    return machines
+
+#-----------------------------------------------------------------------------------------------------------
+def get_oqs_provider_machines(root_dir, machine_runs):
+    """ Helper function for getting the OQS-Provider directory paths for each machine and the algorithm lists,
+        creating the parsed results directories for the machines if not present """
+
+    # Set up the OQS-Provider parsing environment and create the directory paths for each machine
+    base_paths, algs_dict = oqs_provider_parse.setup_parse_env(root_dir)
+    machines = []
+
+    for machine_num, num_runs in machine_runs.items():
+        dir_paths = oqs_provider_parse.set_machine_paths(base_paths, machine_num)
+        for dir_key in ["pqc_base_results", "classic_handshake_results", "hybrid_base_results", "mach_speed_results_dir"]:
+            os.makedirs(dir_paths[dir_key], exist_ok=True)
+        machines.append((dir_paths, num_runs, algs_dict))
+
+    return machines
+
+#-----------------------------------------------------------------------------------------------------------
+def get_liboqs_run_files(dir_paths, num_runs, kem_algs, sig_algs, input_dir_key=None):
+    """ Helper function for getting the Liboqs run input and output files for a machine, only keeping
+        the files within the supplied up-results directory if one is given """
+
+    # Gather the input and output files for each run
+    input_files = []
+    output_files = []
+
+    for run_num in range(1, num_runs+1):
+        run_inputs, run_outputs = liboqs_parse.get_run_files(dir_paths, run_num, kem_algs, sig_algs)
+        input_files.extend(run_inputs)
+        output_files.extend(run_outputs)
+
+    # Only keep the files for the supplied result type
+    if input_dir_key is not None:
+        output_dir_key = "type_speed_dir" if input_dir_key == "raw_speed_dir" else "type_mem_dir"
+        input_files = [filepath for filepath in input_files if filepath.startswith(dir_paths[input_dir_key])]
+        output_files = [filepath for filepath in output_files if filepath.startswith(dir_paths[output_dir_key])]
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def get_liboqs_avg_files(dir_paths):
+    """ Helper function for getting the Liboqs average and statistics files for a machine """
+
+    return [
+        os.path.join(dir_paths[dir_key], f"{alg_type}-{result_type}-{file_type}.csv")
+        for dir_key, result_type in [("type_mem_dir", "mem"), ("type_speed_dir", "speed")]
+        for alg_type in ["kem", "sig"] for file_type in ["avg", "stats"]
+    ]
+
+#-----------------------------------------------------------------------------------------------------------
+def get_oqs_provider_run_files(dir_paths, num_runs, algs_dict, result_type=None):
+    """ Helper function for getting the OQS-Provider run input and output files for a machine, only keeping
+        the handshake or speed files if a result type is given """
+
+    # Gather the input and output files for each run
+    input_files = []
+    output_files = []
+
+    for run_num in range(1, num_runs+1):
+        run_inputs, run_outputs = oqs_provider_parse.get_run_files(dir_paths, run_num, algs_dict)
+        input_files.extend(run_inputs)
+        output_files.extend(run_outputs)
+
+    # Only keep the files for the supplied result type
+    if result_type is not None:
+        result_dir = f"{os.sep}{result_type}-results{os.sep}"
+        input_files = [filepath for filepath in input_files if result_dir in filepath]
+        output_files = [filepath for filepath in output_files if result_dir in filepath]
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_liboqs_speed(root_dir, machine_runs):
+    """ Stage function for parsing the Liboqs speed results for all machines """
+
+    # Parse the speed results for each machine and gather the stage input and output files
+    input_files, output_files = [], []
+    for dir_paths, num_runs, kem_algs, sig_algs in get_liboqs_machines(root_dir, machine_runs):
+        liboqs_parse.speed_processing(dir_paths, range(1, num_runs+1))
+        stage_inputs, stage_outputs = get_liboqs_run_files(dir_paths, num_runs, kem_algs, sig_algs, "raw_speed_dir")
+        input_files.extend(stage_inputs)
+        output_files.extend(stage_outputs)
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_liboqs_memory(root_dir, machine_runs):
+    """ Stage function for parsing the Liboqs memory results for all machines """
+
+    # Parse the memory results for each machine and gather the stage input and output files
+    input_files, output_files = [], []
+    for dir_paths, num_runs, kem_algs, sig_algs in get_liboqs_machines(root_dir, machine_runs):
+        liboqs_parse.memory_processing(dir_paths, range(1, num_runs+1), kem_algs, sig_algs)
+        stage_inputs, stage_outputs = get_liboqs_run_files(dir_paths, num_runs, kem_algs, sig_algs, "up_mem_dir")
+        input_files.extend(stage_inputs)
+        output_files.extend(stage_outputs)
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_liboqs_averages(root_dir, machine_runs):
+    """ Stage function for calculating the Liboqs averages and statistics for all machines """
+
+    # Calculate the averages for each machine, where the stage inputs are the parsed run files
+    input_files, output_files = [], []
+    for dir_paths, num_runs, kem_algs, sig_algs in get_liboqs_machines(root_dir, machine_runs):
+        liboqs_avg = LiboqsResultAverager(dir_paths, kem_algs, sig_algs, num_runs, liboqs_parse.alg_operations)
+        liboqs_avg.avg_mem()
+        liboqs_avg.avg_speed()
+        input_files.extend(get_liboqs_run_files(dir_paths, num_runs, kem_algs, sig_algs)[1])
+        output_files.extend(get_liboqs_avg_files(dir_paths))
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_oqs_provider_handshake(root_dir, machine_runs):
+    """ Stage function for parsing the OQS-Provider TLS handshake results for all machines """
+
+    # Parse the PQC, PQC-Hybrid and classic handshake results for each run of each machine
+    input_files, output_files = [], []
+    for dir_paths, num_runs, algs_dict in get_oqs_provider_machines(root_dir, machine_runs):
+        for run_num in range(1, num_runs+1):
+            oqs_provider_parse.pqc_based_processing(run_num, dir_paths, algs_dict)
+            oqs_provider_parse.classic_based_processing(run_num, dir_paths, algs_dict)
+
+        stage_inputs, stage_outputs = get_oqs_provider_run_files(dir_paths, num_runs, algs_dict, "handshake")
+        input_files.extend(stage_inputs)
+        output_files.extend(stage_outputs)
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_oqs_provider_speed(root_dir, machine_runs):
+    """ Stage function for parsing the OQS-Provider TLS speed results for all machines """
+
+    # Parse the speed results for each run of each machine
+    input_files, output_files = [], []
+    for dir_paths, num_runs, algs_dict in get_oqs_provider_machines(root_dir, machine_runs):
+        for run_num in range(1, num_runs+1):
+            oqs_provider_parse.speed_processing(run_num, dir_paths)
+
+        stage_inputs, stage_outputs = get_oqs_provider_run_files(dir_paths, num_runs, algs_dict, "speed")
+        input_files.extend(stage_inputs)
+        output_files.extend(stage_outputs)
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_oqs_provider_averages(root_dir, machine_runs):
+    """ Stage function for calculating the OQS-Provider averages and statistics for all machines """
+
+    # Calculate the averages for each machine, where the stage inputs are the parsed run files
+    input_files, output_files = [], []
+    for dir_paths, num_runs, algs_dict in get_oqs_provider_machines(root_dir, machine_runs):
+        oqs_provider_avg = OqsProviderResultAverager(
+            dir_paths, num_runs, algs_dict, oqs_provider_parse.pqc_type_vars, oqs_provider_parse.col_headers
+        )
+        oqs_provider_avg.gen_pqc_avgs()
+        oqs_provider_avg.gen_classic_avgs()
+        oqs_provider_avg.gen_speed_avgs(oqs_provider_parse.speed_headers)
+        input_files.extend(get_oqs_provider_run_files(dir_paths, num_runs, algs_dict)[1])
+        output_files.extend(oqs_provider_parse.get_avg_files(dir_paths, algs_dict))
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_full_parse(root_dir, machine_runs, tool_name, chunk_memory_mb=None):
+    """ Stage function for running the full parse for the supplied tool, as performed by the parse_results.py
+        script, with any previously parsed results for the machines being overwritten. If a chunk memory limit
+        is set, the OQS-Provider results are parsed in chunked mode """
+
+    # Set the parsing options for the tool and run the full parse
+    test_opts = {
+        "machine_runs": machine_runs, "root_dir": root_dir, "max_workers": 1, "results_policy": "overwrite", 
+        "columnar": False, "chunk_memory_mb": chunk_memory_mb, "drop_noisy_runs": False,
+        "write_workers": 1
+    }
+
+    if tool_name == "liboqs":
+        liboqs_parse.parse_liboqs(test_opts)
+        machines = get_liboqs_machines(root_dir, machine_runs)
+        run_files = [get_liboqs_run_files(*machine) + (get_liboqs_avg_files(machine[0]),) for machine in machines]
+    else:
+        oqs_provider_parse.parse_oqs_provider(test_opts)
+        machines = get_oqs_provider_machines(root_dir, machine_runs)
+        run_files = [get_oqs_provider_run_files(*machine) + (oqs_provider_parse.get_avg_files(machine[0], machine[2]),) for machine in machines]
+
+    # Gather the stage input files and the parsed and averaged output files
+    input_files = [filepath for machine_files in run_files for filepath in machine_files[0]]
+    output_files = [filepath for machine_files in run_files for filepath in machine_files[1] + machine_files[2]]
+
+    return input_files, output_files
+
+#-----------------------------------------------------------------------------------------------------------
+def run_stage(stage_name, root_dir, machine_runs):
+    """ Function for running a single benchmark stage and measuring its performance. This function is run in a
+        new worker process for each stage, so the peak RSS measured is for the stage alone. The console output
+        from the parsing functions is suppressed while the stage is running. """
+
+    # Set the stage functions for each of the benchmark stages
+    stage_funcs = {
+        "liboqs-speed": run_liboqs_speed,
+        "liboqs-memory": run_liboqs_memory,
+        "liboqs-averages": run_liboqs_averages,
+        "oqs-provider-handshake": run_oqs_provider_handshake,
+        "oqs-provider-speed": run_oqs_provider_speed,
+        "oqs-provider-averages": run_oqs_provider_averages,
+        "liboqs-full": lambda root, runs: run_full_parse(root, runs, "liboqs"),
+        "oqs-provider-full": lambda root, runs: run_full_parse(root, runs, "oqs-provider"),
+        "oqs-provider-chunked": lambda root, runs: run_full_parse(root, runs, "oqs-provider", default_chunk_memory_mb)
+    }
+
+    # Get the baseline RSS once the parsing modules are loaded and run the stage while timing it
+    base_rss = get_peak_rss_mb()
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        input_files, output_files = stage_funcs[stage_name](root_dir, machine_runs)
+
+    wall_time = time.perf_counter() - start_wall
+    cpu_time = time.process_time() - start_cpu
+    peak_rss = get_peak_rss_mb()
+
+    # Count the stage outputs and calculate the throughput metrics
+    output_rows = count_csv_rows(output_files)
+
+    return {
+        "stage": stage_name,
+        "wall_s": round(wall_time, 4),
+        "cpu_s": round(cpu_time, 4),
+        "input_files": len(input_files),
+        "files_per_s": round(len(input_files) / wall_time, 1) if wall_time > 0 else None,
+        "output_rows": output_rows,
+        "rows_per_s": round(output_rows / wall_time, 1) if wall_time > 0 else None,
+        "base_rss_mb": round(base_rss, 1) if base_rss is not None else None,
+        "peak_rss_mb": round(peak_rss, 1) if peak_rss is not None else None
+    }
+
+#-----------------------------------------------------------------------------------------------------------
+def get_git_commit():
+    """ Helper function for getting the current git commit of the project, returning None if unavailable """
+
+    # Get the short commit hash from git, ignoring any errors if git or the repository are not present
+    try:
+        git_result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True)
+        return git_result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+#-----------------------------------------------------------------------------------------------------------
+def load_previous_result(history_file, config):
+    """ Function for loading the most recent benchmark result from the history file with the same configuration """
+
+    # Return None if no history is present
+    if not os.path.isfile(history_file):
+        return None
+
+    # Loop through the stored results and keep the last one with a matching configuration
+    previous_result = None
+    with open(history_file, "r") as history:
+        for line in history:
+            try:
+                stored_result = json.loads(line)
+            except ValueError:
+                continue
+
+            if stored_result.get("config") == config:
+                previous_result = stored_result
+
+    return previous_result
+
+#-----------------------------------------------------------------------------------------------------------
+def output_results(stage_results, previous_result):
+    """ Function for outputting the benchmark results table, including the wall time change
+        from the previous benchmark result if one is present """
+
+    # Get the previous wall times for each stage
+    previous_times = {}
+    if previous_result is not None:
+        previous_times = {stage["stage"]: stage["wall_s"] for stage in previous_result["stages"]}
+
+    # Output the table header and the row for each stage
+    print(f"\n{'Stage':<24}{'Wall (s)':>10}{'CPU (s)':>10}{'Files':>8}{'Files/s':>10}{'Rows':>9}{'Rows/s':>11}{'Peak RSS (MB)':>15}{'vs prev':>10}")
+
+    for stage in stage_results:
+
+        # Set the change in wall time from the previous result for the stage
+        previous_time = previous_times.get(stage["stage"])
+        change = f"{(stage['wall_s'] - previous_time) / previous_time * 100:+.1f}%" if previous_time else "-"
+        peak_rss = f"{stage['peak_rss_mb']:.1f}" if stage["peak_rss_mb"] is not None else "n/a"
+
+        print(
+            f"{stage['stage']:<24}{stage['wall_s']:>10.3f}{stage['cpu_s']:>10.3f}{stage['input_files']:>8}{stage['files_per_s'] or 0:>10.1f}"
+            f"{stage['output_rows']:>9}{stage['rows_per_s'] or 0:>11.1f}{peak_rss:>15}{change:>10}"
+        )
+
+    if previous_result is not None:
+        print(f"\nCompared against the previous result from {previous_result['timestamp']} (commit {previous_result['git_commit']})")
+
+#-----------------------------------------------------------------------------------------------------------
+def main():
+    """ Main function for running the parser benchmark stages and storing the results """
+
+    # Get the benchmark options and set the results tree to use, generating the synthetic results if needed
+    bench_opts = parse_args()
+    generated_dir = None
+
+    if bench_opts["root-dir"] is None:
+
+        generated_dir = tempfile.mkdtemp(prefix="pqc-parser-bench-")
+        root_dir = generated_dir
+        print(f"Generating synthetic results in {root_dir}")
+        generate_results(root_dir, bench_opts["machines"], bench_opts["runs"], bench_opts["kems"], bench_opts["sigs"], bench_opts["seed"])
+
+        config = {key: bench_opts[key] for key in ["machines", "runs", "kems", "sigs", "seed"]}
+
+    else:
+
+        # Ensure the supplied tree contains up-results and has not already been parsed
+        root_dir = bench_opts["root-dir"]
+
+        if not os.path.isfile(os.path.join(root_dir, ".pqc_eval_dir_marker.tmp")):
+            print(f"[ERROR] - {root_dir} is not a results tree, the .pqc_eval_dir_marker.tmp file is missing")
+            sys.exit(1)
+
+        if os.path.exists(os.path.join(root_dir, "test-data", "results")):
+            print(f"[ERROR] - {root_dir} already contains parsed results, please remove the test-data/results directory first")
+            sys.exit(1)
+
+        config = {"root_dir": root_dir}
+
+    # Get the machines and runs present in the results tree for each tool
+    tool_machine_runs = {tool_name: discover_machine_runs(root_dir, tool_name) for tool_name in ["liboqs", "oqs-provider"]}
+    stage_names = [stage_name for stage_name, tool_name in stage_tools.items() if tool_machine_runs[tool_name]]
+
+    if not stage_names:
+        print(f"[ERROR] - No up-results were found in {root_dir}")
+        sys.exit(1)
+
+    # Run each of the benchmark stages in a new worker process
+    stage_results = []
+    spawn_context = multiprocessing.get_context("spawn")
+
+    try:
+        for stage_name in stage_names:
+            print(f"Running stage {stage_name}...")
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn_context) as executor:
+                stage_results.append(executor.submit(run_stage, stage_name, root_dir, tool_machine_runs[stage_tools[stage_name]]).result())
+
+    finally:
+
+        # Remove the generated results tree or the parsed results unless they are being kept
+        if not bench_opts["keep"]:
+            if generated_dir is not None:
+                shutil.rmtree(generated_dir)
+            else:
+                shutil.rmtree(os.path.join(root_dir, "test-data", "results"), ignore_errors=True)
+
+        elif generated_dir is not None:
+            print(f"Generated results tree kept in {generated_dir}")
+
+    # Create the benchmark result record and output the results table
+    benchmark_result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "label": bench_opts["label"],
+        "git_commit": get_git_commit(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "config": config,
+        "stages": stage_results
+    }
+    output_results(stage_results, load_previous_result(bench_opts["history-file"], config))
+
+    # Append the benchmark result to the history file
+    if not bench_opts["no-save"]:
+        os.makedirs(os.path.dirname(bench_opts["history-file"]), exist_ok=True)
+        with open(bench_opts["history-file"], "a") as history:
+            history.write(json.dumps(benchmark_result) + "\n")
+        print(f"\nBenchmark results saved to {bench_opts['history-file']}")
+
+#------------------------------------------------------------------------------
+"""Main boiler plate"""
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Utility script for benchmarking the dataframe row building methods used by the result parsing scripts.
+It builds a full-size TLS handshake result grid (every signature/KEM combination with a first use and session
+reuse row) and a Liboqs memory result grid using the previous per-row dataframe appends and the shared
+RecordBatchBuilder, then outputs the timings and speedup for each method. The generated dataframes are compared
+to ensure both methods produce the same results. This script can be executed manually from any location.
+
+Accepted arguments:
+    --sigs=<num>     Number of signature algorithms in the grid (default 70)
+    --kems=<num>     Number of KEM algorithms in the grid (default 30)
+    --repeats=<num>  Number of times each method is timed, keeping the fastest time (default 3)
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import sys
+import time
+import pandas as pd
+
+# Add the parsing scripts directory to the module search path so the row builder can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "parsing-scripts"))
+from record_batch import RecordBatchBuilder
+
+# Declare the column headers used for the benchmark grids
+handshake_headers = ["Signing Algorithm", "KEM Algorithm", "Reused Session ID", "Connections in User Time", "User Time (s)", "Connections Per User Second", "Connections in Real Time", "Real Time (s)"]
+mem_headers = ["Algorithm", "Operation", "intits", "maxBytes", "maxHeap", "extHeap", "maxStack"]
+
+#-----------------------------------------------------------------------------------------------------------
+def output_help_message():
+    """ Helper function for outputting the help message to the user when the --help flag is present
+        or when incorrect arguments are passed """
+
+    # Output the supported options and their usage to the user
+    print("Usage: benchmark_row_builder.py [options]\n")
+    print("Options:")
+    print("  --sigs=<num>                  Number of signature algorithms in the grid (default 70)")
+    print("  --kems=<num>                  Number of KEM algorithms in the grid (default 30)")
+    print("  --repeats=<num>               Number of times each method is timed (default 3)")
+    print("  --help                        Display this help message and exit")
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_args():
+    """ Function for parsing the command line arguments passed to the script, returning
+        the grid size and number of timing repeats """
+
+    # Set the default benchmark options
+    bench_opts = {"sigs": 70, "kems": 30, "repeats": 3}
+
+    # Loop through the passed arguments and set the benchmark options
+    for arg in sys.argv[1:]:
+
+        if arg == "--help":
+            output_help_message()
+            sys.exit(0)
+
+        # Ensure the argument is a supported option with a positive integer value
+        opt_name, _, opt_value = arg.partition("=")
+        opt_name = opt_name.lstrip("-")
+
+        if not arg.startswith("--") or opt_name not in bench_opts or not opt_value.isdigit() or int(opt_value) < 1:
+            print(f"[ERROR] - Invalid argument passed: {arg}")
+            output_help_message()
+            sys.exit(1)
+
+        bench_opts[opt_name] = int(opt_value)
+
+    return bench_opts
+
+#-----------------------------------------------------------------------------------------------------------
+def gen_handshake_rows(num_sigs, num_kems):
+    """ Function for generating the handshake result rows for the full signature/KEM grid,
+        in the same form as the rows created by the OQS-Provider parsing script """
+
+    # Create the first use and session reuse rows for each sig/kem combination
+    rows = []
+    for sig_index in range(num_sigs):
+        for kem_index in range(num_kems):
+            for reused in ["", "*"]:
+                rows.append([f"sig-{sig_index}", f"kem-{kem_index}", reused, "2517", "9.99", "251.95", "2517", "10.00"])
+
+    return rows
+
+#-----------------------------------------------------------------------------------------------------------
+def gen_mem_rows(num_algs):
+    """ Function for generating the memory result rows for the supplied number of algorithms,
+        in the same form as the rows created by the Liboqs parsing script """
+
+    # Create the row for each cryptographic operation of each algorithm
+    rows = []
+    for alg_index in range(num_algs):
+        for operation in ["keygen", "sign", "verify"]:
+            rows.append([f"alg-{alg_index}", operation, 119752999, 35297, 30202, 36, 5059])
+
+    return rows
+
+#-----------------------------------------------------------------------------------------------------------
+def build_concat(rows, headers):
+    """ Function for building the dataframe by concatenating a new dataframe for each row """
+
+    # Append each row onto the dataframe
+    result_df = pd.DataFrame(columns=headers)
+    for row in rows:
+        new_row_df = pd.DataFrame([row], columns=headers)
+        result_df = pd.concat([result_df, new_row_df], ignore_index=True)
+
+    return result_df
+
+#-----------------------------------------------------------------------------------------------------------
+def build_loc(rows, headers):
+    """ Function for building the dataframe by enlarging it with loc for each row """
+
+    # Append each row onto the dataframe
+    result_df = pd.DataFrame(columns=headers)
+    for row in rows:
+        result_df.loc[len(result_df)] = row
+
+    return result_df
+
+#-----------------------------------------------------------------------------------------------------------
+def build_batch(rows, headers):
+    """ Function for building the dataframe using the shared record batch builder """
+
+    # Append each row onto the batch and create the dataframe once
+    result_batch = RecordBatchBuilder(headers)
+    for row in rows:
+        result_batch.append(row)
+
+    return result_batch.to_dataframe()
+
+#-----------------------------------------------------------------------------------------------------------
+def time_method(build_method, rows, headers, repeats):
+    """ Function for timing the supplied build method, returning the fastest time and the created dataframe """
+
+    # Time the build method for the number of repeats and keep the fastest time
+    best_time = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result_df = build_method(rows, headers)
+        elapsed_time = time.perf_counter() - start_time
+        best_time = elapsed_time if best_time is None else min(best_time, elapsed_time)
+
+    return best_time, result_df
+
+#-----------------------------------------------------------------------------------------------------------
+def run_benchmark(grid_name, rows, headers, old_method, repeats):
+    """ Function for benchmarking the previous row append method against the record batch builder
+        for the supplied grid and outputting the results """
+
+    # Time both build methods for the current grid
+    old_time, old_df = time_method(old_method, rows, headers, repeats)
+    batch_time, batch_df = time_method(build_batch, rows, headers, repeats)
+
+    # Ensure both methods produce the same csv output
+    matching = old_df.to_csv(index=False) == batch_df.to_csv(index=False)
+
+    # Output the benchmark results for the grid
+    print(f"\n{grid_name} ({len(rows)} rows)")
+    print(f"  per-row {old_method.__name__[6:]:<8} {old_time:10.4f}s")
+    print(f"  record batch     {batch_time:10.4f}s")
+    print(f"  speedup          {old_time / batch_time:10.1f}x")
+    print(f"  matching output  {matching}")
+
+    return matching
+
+#-----------------------------------------------------------------------------------------------------------
+def main():
+    """ Main function for running the row builder benchmarks """
+
+    # Get the benchmark options
+    bench_opts = parse_args()
+    print(f"Benchmarking row building for a {bench_opts['sigs']} sig x {bench_opts['kems']} KEM algorithm grid")
+
+    # Benchmark the handshake grid built with pd.concat and the memory grid built with loc
+    handshake_rows = gen_handshake_rows(bench_opts["sigs"], bench_opts["kems"])
+    mem_rows = gen_mem_rows(bench_opts["sigs"] + bench_opts["kems"])
+
+    handshake_match = run_benchmark("TLS handshake grid", handshake_rows, handshake_headers, build_concat, bench_opts["repeats"])
+    mem_match = run_benchmark("Liboqs memory grid", mem_rows, mem_headers, build_loc, bench_opts["repeats"])
+
+    # Exit with an error if either method produced differing output
+    if not (handshake_match and mem_match):
+        print("\n[ERROR] - The record batch output does not match the per-row output")
+        sys.exit(1)
+
+#------------------------------------------------------------------------------
+"""Main boiler plate"""
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+Copyright (c) 2023-2025 Callum Turino
+SPDX-License-Identifier: MIT
+
+Utility script for generating synthetic un-parsed benchmarking results for testing and benchmarking the result
+parsing scripts without performing a full testing campaign. It creates a project-like directory containing the
+algorithm lists (and the algorithm registry) and a test-data/up-results tree for the supplied number of machines, test runs and algorithms,
+with the Valgrind Massif (ms_print), speed_kem/speed_sig, OpenSSL s_time and OpenSSL speed outputs written in the
+same formats the Liboqs and OQS-Provider parsing scripts expect. The generated metrics are random but consistent
+across runs for each algorithm, and the same seed always generates the same results. This script can be executed
+manually from any location, and its functions are also used by the benchmark_parsers.py utility script.
+
+Accepted arguments:
+    --output-dir=<path>  Directory to create the synthetic project in (required, must not already contain up-results)
+    --machines=<num>     Number of machines to generate results for (default 2)
+    --runs=<num>         Number of test runs for each machine (default 5)
+    --kems=<num>         Number of KEM algorithms in each algorithm list (default 10)
+    --sigs=<num>         Number of digital signature algorithms in each algorithm list (default 10)
+    --seed=<num>         Seed for the random number generator (default 1)
+"""
+
+#-----------------------------------------------------------------------------------------------------------
+import os
+import sys
+import random
+
+# Add the parsing scripts directory to the module search path so the algorithm registry module can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "parsing-scripts"))
+import alg_registry
+
+# Declare the real algorithm names used as the base of the generated algorithm lists
+base_alg_names = {
+    "kem_algs": [
+        "BIKE-L1", "BIKE-L3", "Classic-McEliece-348864", "Classic-McEliece-348864f", "HQC-128", "HQC-192", "Kyber512",
+        "Kyber768", "ML-KEM-512", "ML-KEM-768", "ML-KEM-1024", "sntrup761", "FrodoKEM-640-AES", "FrodoKEM-640-SHAKE"
+    ],
+    "sig_algs": [
+        "Dilithium2", "ML-DSA-44", "ML-DSA-65", "ML-DSA-87", "Falcon-512", "Falcon-1024", "Falcon-padded-512",
+        "SPHINCS+-SHA2-128f-simple", "SPHINCS+-SHAKE-128f-simple", "MAYO-1", "MAYO-2", "cross-rsdp-128-balanced", "OV-Is", "OV-Ip"
+    ],
+    "tls_kem_algs": ["frodo640aes", "frodo640shake", "mlkem512", "mlkem768", "mlkem1024", "bikel1", "hqc128"],
+    "tls_sig_algs": ["mldsa44", "mldsa65", "mldsa87", "falcon512", "falcon1024", "sphincssha2128fsimple", "mayo1"],
+    "tls_hybr_kem_algs": ["p256_mlkem512", "x25519_mlkem512", "p384_mlkem768", "X25519MLKEM768", "SecP256r1MLKEM768", "p256_frodo640aes"],
+    "tls_hybr_sig_algs": ["p256_mldsa44", "rsa3072_mldsa44", "p384_mldsa65", "p521_mldsa87", "p256_falcon512", "rsa3072_falcon512"]
+}
+
+# Declare the alg-list filenames for each of the algorithm lists
+alg_list_filenames = {
+    "kem_algs": "kem-algs.txt",
+    "sig_algs": "sig-algs.txt",
+    "tls_kem_algs": "tls-kem-algs.txt",
+    "tls_sig_algs": "tls-sig-algs.txt",
+    "tls_hybr_kem_algs": "tls-hybr-kem-algs.txt",
+    "tls_hybr_sig_algs": "tls-hybr-sig-algs.txt"
+}
+
+# Declare the classic algorithms and ciphersuites, which are fixed in the algorithm registry module
+classic_algs = alg_registry.classic_tls_algs["classic-tls-sig-algs"]
+ciphers = alg_registry.tls_ciphersuites
+
+# Declare the cryptographic operations for the Liboqs KEM and digital signature speed tests
+alg_operations = {"kem_operations": ["keygen", "encaps", "decaps"], "sig_operations": ["keypair", "sign", "verify"]}
+
+# Declare the format strings for the speed_kem/speed_sig results table rows
+liboqs_speed_row = "{:<36} | {:>10} | {:>14} | {:>15} | {:>10} | {:>25} | {:>10}\n"
+liboqs_speed_separator = "{} | {}:| {}:| {}:| {}:| {}:| {}:\n".format("-" * 36, "-" * 10, "-" * 14, "-" * 15, "-" * 10, "-" * 25, "-" * 10)
+
+# Declare the ms_print snapshot table header
+massif_table_header = (
+    "-" * 80 + "\n"
+    + "  n        time(i)         total(B)   useful-heap(B) extra-heap(B)    stacks(B)\n"
+    + "-" * 80 + "\n"
+)
+
+#-----------------------------------------------------------------------------------------------------------
+def output_help_message():
+    """ Helper function for outputting the help message to the user when the --help flag is present
+        or when incorrect arguments are passed """
+
+    # Output the supported options and their usage to the user
+    print("Usage: generate_synthetic_results.py --output-dir=<path> [options]\n")
+    print("Options:")
+    print("  --output-dir=<path>           Directory to create the synthetic project in (required)")
+    print("  --machines=<num>              Number of machines to generate results for (default 2)")
+    print("  --runs=<num>                  Number of test runs for each machine (default 5)")
+    print("  --kems=<num>                  Number of KEM algorithms in each algorithm list (default 10)")
+    print("  --sigs=<num>                  Number of digital signature algorithms in each algorithm list (default 10)")
+    print("  --seed=<num>                  Seed for the random number generator (default 1)")
+    print("  --help                        Display this help message and exit")
+
+#-----------------------------------------------------------------------------------------------------------
+def parse_args():
+    """ Function for parsing the command line arguments passed to the script, returning the generation options """
+
+    # Set the default generation options
+    gen_opts = {"output-dir": None, "machines": 2, "runs": 5, "kems": 10, "sigs": 10, "seed": 1}
+
+    # Loop through the passed arguments and set the generation options
+    for arg in sys.argv[1:]:
+
+        if arg == "--help":
+            output_help_message()
+            sys.exit(0)
+
+        # Ensure the argument is a supported option
+        opt_name, _, opt_value = arg.partition("=")
+        opt_name = opt_name.lstrip("-")
+
+        if not arg.startswith("--") or opt_name not in gen_opts or not opt_value:
+            print(f"[ERROR] - Invalid argument passed: {arg}")
+            output_help_message()
+            sys.exit(1)
+
+        # Set the output directory option, or ensure the numeric options are positive integers
+        if opt_name == "output-dir":
+            gen_opts[opt_name] = os.path.abspath(opt_value)
+
+        elif opt_value.isdigit() and (int(opt_value) > 0 or opt_name == "seed"):
+            gen_opts[opt_name] = int(opt_value)
+
+        else:
+            print(f"[ERROR] - Invalid value passed for --{opt_name}: {opt_value}")
+            output_help_message()
+            sys.exit(1)
+
+    # Ensure the output directory has been supplied
+    if gen_opts["output-dir"] is None:
+        print("[ERROR] - The --output-dir option must be supplied")
+        output_help_message()
+        sys.exit(1)
+
+    return gen_opts
+
+#-----------------------------------------------------------------------------------------------------------
+def gen_alg_names(alg_type, num_algs):
+    """ Helper function for creating an algorithm list of the supplied size. The real algorithm names are used
+        first, with numbered variants of them being added if more algorithms are needed than are available """
+
+    # Create the algorithm list by cycling through the real algorithm names
+    base_names = base_alg_names[alg_type]
+    alg_names = []
+
+    for alg_index in range(num_algs):
+        cycle, name_index = divmod(alg_index, len(base_names))
+        alg_names.append(base_names[name_index] if cycle == 0 else f"{base_names[name_index]}-{cycle}")
+
+    return alg_names
+
+#-----------------------------------------------------------------------------------------------------------
+def jitter(rng, value, spread=0.05):
+    """ Helper function for applying a random run-to-run variation to the supplied base metric value """
+
+    return value * rng.lognormvariate(0, spread)
+
+#-----------------------------------------------------------------------------------------------------------
+def write_liboqs_speed_file(filepath, rng, algs, operations, base_times):
+    """ Function for writing a synthetic speed_kem/speed_sig results file, including the system information
+        before the results table and the footer line after it """
+
+    # Write the system information and results table header
+    with open(filepath, "w") as speed_file:
+
+        speed_file.write(
+            "Configuration info\n==================\nTarget platform:  x86_64-Linux-6.8.0\nCompiler:         gcc (13.3.0)\n"
+            "Compile options:  [-march=native;-Werror;-Wall]\nOQS version:      0.12.0\nGit commit:       unknown\n"
+            "OpenSSL enabled:  Yes (OpenSSL 3.4.1 11 Feb 2025)\nAES:              NI\nSHA-2:            OpenSSL\n"
+            "SHA-3:            C\nCPU exts active:  ADX AES AVX AVX2 BMI1 BMI2 PCLMUL POPCNT SSE SSE2 SSE3\n"
+            "Speed test\n==========\nStarted at 2025-01-01 10:00:00\n"
+        )
+        speed_file.write(liboqs_speed_row.format("Operation", "Iterations", "Total time (s)", "Time (us): mean", "pop. stdev", "CPU cycles: mean", "pop. stdev"))
+        speed_file.write(liboqs_speed_separator)
+
+        # Write the algorithm section header and the operation rows for each algorithm
+        for alg in algs:
+
+            speed_file.write(liboqs_speed_row.format(alg, "", "", "", "", "", ""))
+
+            for operation in operations:
+                mean_time = jitter(rng, base_times[(alg, operation)])
+                iterations = max(int(3000000 / mean_time), 1)
+                total_time = iterations * mean_time / 1000000
+                speed_file.write(liboqs_speed_row.format(
+                    operation, iterations, f"{total_time:.3f}", f"{mean_time:.3f}", f"{mean_time * rng.uniform(0.01, 0.1):.3f}",
+                    int(mean_time * 3000), int(mean_time * 3000 * rng.uniform(0.01, 0.1))
+                ))
+
+        speed_file.write("Ended at 2025-01-01 10:01:00\n")
+
+#-----------------------------------------------------------------------------------------------------------
+def write_massif_file(filepath, rng, alg, operation_index, base_heap):
+    """ Function for writing a synthetic Valgrind Massif result file in the ms_print report format,
+        with the peak snapshot listed in the detailed snapshots line and the snapshot table """
+
+    # Set the snapshot count, the peak snapshot and the other detailed snapshots
+    num_snapshots = rng.randint(20, 60)
+    peak_snapshot = rng.randint(num_snapshots // 2, num_snapshots - 1)
+    detailed_snapshots = sorted(set([peak_snapshot] + rng.sample(range(num_snapshots), 4)))
+    heap_values = [int(base_heap * index / peak_snapshot) if index < peak_snapshot else int(base_heap * 0.6) for index in range(num_snapshots)]
+    heap_values[peak_snapshot] = base_heap
+
+    # Write the report header, the memory usage graph placeholder and the detailed snapshots line
+    with open(filepath, "w") as massif_file:
+
+        massif_file.write(
+            "-" * 80 + "\n"
+            + f"Command:            ./test_mem {alg} {operation_index}\n"
+            + "Massif arguments:   --stacks=yes --massif-out-file=massif.out\n"
+            + "ms_print arguments: massif.out\n"
+            + "-" * 80 + "\n\n\n"
+            + f"    KB\n{base_heap / 1024:.2f}^" + " " * 40 + "#\n" + "   |" + " " * 40 + "#\n" + "   0 +" + "-" * 40 + ">Mi\n"
+            + "     0" + " " * 40 + "1.234\n\n"
+        )
+        snapshot_labels = [f"{index} (peak)" if index == peak_snapshot else str(index) for index in detailed_snapshots]
+        massif_file.write(f"Number of snapshots: {num_snapshots}\n Detailed snapshots: [{', '.join(snapshot_labels)}]\n\n")
+
+        # Write the snapshot table, with the heap tree after each detailed snapshot
+        massif_file.write(massif_table_header)
+
+        for index in range(num_snapshots):
+
+            heap = heap_values[index]
+            heap_extra = heap // 64
+            stacks = rng.randint(1000, 9000)
+            massif_file.write(f"{index:>3} {index * 123457:>14,} {heap + heap_extra + stacks:>16,} {heap:>16,} {heap_extra:>13,} {stacks:>12,}\n")
+
+            if index in detailed_snapshots:
+                massif_file.write(
+                    f"99.10% ({heap:,}B) (heap allocation functions) malloc/new/new[], --alloc-fns, etc.\n"
+                    + f"->99.10% ({heap:,}B) 0x10A8F3: main (test_mem.c:123)\n\n"
+                )
+                massif_file.write(massif_table_header)
+
+#-----------------------------------------------------------------------------------------------------------
+def write_s_time_file(filepath, rng, base_connections):
+    """ Function for writing a synthetic OpenSSL s_time result file with the session id
+        first use and session id reuse results """
+
+    # Set the connection counts and user times for the first use and reused session tests
+    first_connections = int(jitter(rng, base_connections))
+    first_user_time = rng.uniform(0.8, 1.2)
+    reused_connections = int(jitter(rng, base_connections * 4))
+    reused_user_time = rng.uniform(0.6, 1.0)
+
+    # Write the s_time output for both tests
+    with open(filepath, "w") as s_time_file:
+        s_time_file.write(
+            "Collecting connection statistics for 5 seconds\n" + "*" * 80 + "\n\n"
+            + f"{first_connections} connections in {first_user_time:.2f}s; {first_connections / first_user_time:.2f} connections/user sec, bytes read 0\n"
+            + f"{first_connections} connections in 6 real seconds, 0 bytes read per connection\n\n\n"
+            + "Now timing with session id reuse.\nstarting\n" + "*" * 80 + "\n\n"
+            + f"{reused_connections} connections in {reused_user_time:.2f}s; {reused_connections / reused_user_time:.2f} connections/user sec, bytes read 0\n"
+            + f"{reused_connections} connections in 6 real seconds, 0 bytes read per connection\n"
+        )
+
+#-----------------------------------------------------------------------------------------------------------
+def write_openssl_speed_file(filepath, rng, algs, alg_type, base_times):
+    """ Function for writing a synthetic OpenSSL speed result file for the supplied KEM or digital signature algorithms """
+
+    # Set the results table header for the algorithm type
+    if alg_type == "kem":
+        table_header = f"{'':>31}{'keygen':>10}{'encaps':>10}{'decaps':>10}{'keygens/s':>10}{'encaps/s':>10}{'decaps/s':>10}\n"
+    else:
+        table_header = f"{'':>31}{'keygen':>10}{'signs':>10}{'verify':>10}{'keygens/s':>10}{'sign/s':>10}{'verify/s':>10}\n"
+
+    # Write the OpenSSL build information, the results table header and the row for each algorithm
+    with open(filepath, "w") as speed_file:
+
+        speed_file.write(
+            "version: 3.4.1\nbuilt on: Tue Feb 11 12:00:00 2025 UTC\noptions: bn(64,64)\n"
+            "compiler: gcc -fPIC -pthread -m64 -Wa,--noexecstack -O3 -DOPENSSL_USE_NODELETE\nCPUINFO: OPENSSL_ia32cap=0x7ffaf3ffffebffff:0x29c67af\n"
+        )
+        speed_file.write(table_header)
+
+        for alg in algs:
+            op_times = [jitter(rng, base_time) for base_time in base_times[alg]]
+            speed_file.write(
+                f"{alg:>31} {op_times[0]:.6f}s {op_times[1]:.6f}s {op_times[2]:.6f}s"
+                + f" {1 / op_times[0]:9.1f} {1 / op_times[1]:9.1f} {1 / op_times[2]:9.1f}\n"
+            )
+
+#-----------------------------------------------------------------------------------------------------------
+def gen_liboqs_results(machine_dir, rng, num_runs, algs):
+    """ Function for generating the Liboqs speed and memory up-results for a single machine """
+
+    # Create the machine's up-results directories
+    speed_dir = os.path.join(machine_dir, "raw-speed-results")
+    mem_dirs = {"kem": os.path.join(machine_dir, "mem-results", "kem-mem-metrics"), "sig": os.path.join(machine_dir, "mem-results", "sig-mem-metrics")}
+
+    for dir_path in [speed_dir] + list(mem_dirs.values()):
+        os.makedirs(dir_path, exist_ok=True)
+
+    # Set the base operation times and peak heap usage for each algorithm on the machine
+    alg_types = {"kem": (algs["kem_algs"], alg_operations["kem_operations"]), "sig": (algs["sig_algs"], alg_operations["sig_operations"])}
+    base_times = {}
+    base_heaps = {}
+
+    for alg_list, operations in alg_types.values():
+        for alg in alg_list:
+            for operation_index, operation in enumerate(operations):
+                base_times[(alg, operation)] = rng.lognormvariate(4, 1.5)
+                base_heaps[(alg, operation_index)] = int(rng.lognormvariate(10, 1.5))
+
+    # Write the speed and memory results for each run
+    for run_num in range(1, num_runs+1):
+        for alg_type, (alg_list, operations) in alg_types.items():
+
+            speed_filepath = os.path.join(speed_dir, f"test-{alg_type}-speed-{run_num}.csv")
+            write_liboqs_speed_file(speed_filepath, rng, alg_list, operations, base_times)
+
+            for alg in alg_list:
+                for operation_index in range(len(operations)):
+                    massif_filepath = os.path.join(mem_dirs[alg_type], f"{alg}-{operation_index}-{run_num}.txt")
+                    write_massif_file(massif_filepath, rng, alg, operation_index, base_heaps[(alg, operation_index)])
+
+#-----------------------------------------------------------------------------------------------------------
+def gen_oqs_provider_results(machine_dir, rng, num_runs, algs):
+    """ Function for generating the OQS-Provider TLS handshake and speed up-results for a single machine """
+
+    # Create the machine's up-results directories
+    handshake_dirs = {test_type: os.path.join(machine_dir, "handshake-results", test_type) for test_type in ["pqc", "hybrid", "classic"]}
+    speed_dirs = {test_type: os.path.join(machine_dir, "speed-results", test_type) for test_type in ["pqc", "hybrid"]}
+
+    for dir_path in list(handshake_dirs.values()) + list(speed_dirs.values()):
+        os.makedirs(dir_path, exist_ok=True)
+
+    # Set the algorithm lists and speed filename prefixes for the PQC and PQC-Hybrid test types
+    test_types = {
+        "pqc": (algs["tls_sig_algs"], algs["tls_kem_algs"], "tls-speed"),
+        "hybrid": (algs["tls_hybr_sig_algs"], algs["tls_hybr_kem_algs"], "tls-speed-hybrid")
+    }
+
+    # Set the base connection counts for each handshake combination and the base speed times for each algorithm
+    base_connections = {}
+    base_times = {}
+
+    for sig_algs, kem_algs, _ in test_types.values():
+        for alg in sig_algs + kem_algs:
+            base_times[alg] = [rng.lognormvariate(-8, 1.5) for _ in range(3)]
+        for sig in sig_algs:
+            for kem in kem_algs:
+                base_connections[(sig, kem)] = rng.uniform(500, 5000)
+
+    for cipher in ciphers:
+        for alg in classic_algs:
+            base_connections[(cipher, alg)] = rng.uniform(1000, 8000)
+
+    # Write the handshake and speed results for each run
+    for run_num in range(1, num_runs+1):
+
+        for test_type, (sig_algs, kem_algs, speed_prefix) in test_types.items():
+
+            for sig in sig_algs:
+                for kem in kem_algs:
+                    s_time_filepath = os.path.join(handshake_dirs[test_type], f"tls-handshake-{run_num}-{sig}-{kem}.txt")
+                    write_s_time_file(s_time_filepath, rng, base_connections[(sig, kem)])
+
+            for alg_type, alg_list in [("kem", kem_algs), ("sig", sig_algs)]:
+                speed_filepath = os.path.join(speed_dirs[test_type], f"{speed_prefix}-{alg_type}-{run_num}.txt")
+                write_openssl_speed_file(speed_filepath, rng, alg_list, alg_type, base_times)
+
+        for cipher in ciphers:
+            for alg in classic_algs:
+                s_time_filepath = os.path.join(handshake_dirs["classic"], f"tls-handshake-classic-{run_num}-{cipher}-{alg}.txt")
+                write_s_time_file(s_time_filepath, rng, base_connections[(cipher, alg)])
+
+#-----------------------------------------------------------------------------------------------------------
+def generate_results(output_dir, num_machines, num_runs, num_kems, num_sigs, seed=1):
+    """ Function for generating a synthetic project directory containing the algorithm lists and the Liboqs and
+        OQS-Provider up-results for the supplied number of machines and runs. The project root marker file is
+        also created so the parsing scripts can be pointed at the directory. Returns the algorithm lists. """
+
+    # Ensure existing results are not overwritten
+    up_results_dir = os.path.join(output_dir, "test-data", "up-results")
+    if os.path.exists(up_results_dir):
+        raise FileExistsError(f"The output directory already contains up-results: {up_results_dir}")
+
+    # Create the algorithm lists, using the KEM and digital signature counts for each list type
+    rng = random.Random(seed)
+    algs = {alg_type: gen_alg_names(alg_type, num_kems if "kem" in alg_type else num_sigs) for alg_type in base_alg_names}
+
+    # Create the project root marker file and write out the algorithm list files
+    alg_list_dir = os.path.join(output_dir, "test-data", "alg-lists")
+    os.makedirs(alg_list_dir, exist_ok=True)
+    open(os.path.join(output_dir, ".pqc_eval_dir_marker.tmp"), "w").close()
+
+    for alg_type, filename in alg_list_filenames.items():
+        with open(os.path.join(alg_list_dir, filename), "w") as alg_file:
+            alg_file.write("".join(f"{alg}\n" for alg in algs[alg_type]))
+
+    # Write the algorithm registry for the generated algorithm lists
+    alg_registry.write_registry(alg_list_dir)
+
+    # Generate the Liboqs and OQS-Provider results for each machine
+    for machine_num in range(1, num_machines+1):
+        gen_liboqs_results(os.path.join(up_results_dir, "liboqs", f"machine-{machine_num}"), rng, num_runs, algs)
+        gen_oqs_provider_results(os.path.join(up_results_dir, "oqs-provider", f"machine-{machine_num}"), rng, num_runs, algs)
+
+    return algs
+
+#-----------------------------------------------------------------------------------------------------------
+def main():
+    """ Main function for generating the synthetic up-results tree """
+
+    # Get the generation options and generate the results
+    gen_opts = parse_args()
+
+    try:
+        generate_results(gen_opts["output-dir"], gen_opts["machines"], gen_opts["runs"], gen_opts["kems"], gen_opts["sigs"], gen_opts["seed"])
+    except FileExistsError as e:
+        print(f"[ERROR] - {e}")
+        sys.exit(1)
+
+    # Output the location of the generated results
+    print(f"Synthetic results for {gen_opts['machines']} machines with {gen_opts['runs']} runs generated in {gen_opts['output-dir']}")
+    print(f"Parse them by passing --root-dir={gen_opts['output-dir']} to the benchmark_parsers.py utility script")
+
+#------------------------------------------------------------------------------
+"""Main boiler plate"""
+if __name__ == "__main__":
+    main()
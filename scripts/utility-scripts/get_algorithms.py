@@ -4,7 +4,8 @@ SPDX-License-Identifier: MIT
 
 Utility script for retrieving supported cryptographic algorithms from the Liboqs and OQS-Provider libraries. 
 It outputs these algorithms to text files used by benchmarking and parsing scripts to determine which 
-algorithms to test and evaluate.
+algorithms to test and evaluate, along with a JSON algorithm registry holding the lists and the metadata
+for each algorithm, which is loaded by the parsing scripts.
 
 Primarily intended to be called by the main setup.sh script, this utility accepts an argument that specifies 
 the installation type and determines which algorithm lists should be generated. It can also be executed manually.
@@ -22,6 +23,10 @@ import subprocess
 import sys
 import re
 
+# Add the parsing scripts directory to the module search path so the algorithm registry module can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "parsing-scripts"))
+import alg_registry
+
 # Set the root directory path variable
 root_dir = ""
 
@@ -278,9 +283,9 @@ def set_tls_classic_algs():
     """ Function to set the classic algorithm lists for the TLS benchmarking. The classic algorithms are not subject 
         to change, so they can be set in the script and then outputted to text files for the benchmarking and parsing scripts. """
 
-    # Set the classic algorithms for the TLS benchmarking
-    classic_kems = ["prime256v1", "secp384r1", "secp521r1"]
-    classic_sigs = ["RSA_2048", "RSA_3072", "RSA_4096", "prime256v1", "secp384r1", "secp521r1"]
+    # Set the classic algorithms for the TLS benchmarking from the algorithm registry module
+    classic_kems = alg_registry.classic_tls_algs["classic-tls-kem-algs"]
+    classic_sigs = alg_registry.classic_tls_algs["classic-tls-sig-algs"]
 
     # Set the output directory and text file names
     output_dir = os.path.join(root_dir, "test-data", "alg-lists")
@@ -291,6 +296,17 @@ def set_tls_classic_algs():
     write_to_file(classic_kems, kem_list_file)
     write_to_file(classic_sigs, sig_list_file)
 
+#-----------------------------------------------------------------------------------------------------------
+def write_alg_registry():
+    """ Function for writing the JSON algorithm registry for the algorithm lists that have been created, holding 
+        the lists and the metadata for each algorithm so the parsing scripts can load them in a single read """
+
+    # Write the registry for the algorithm list files present in the alg-lists directory
+    registry_filepath = alg_registry.write_registry(os.path.join(root_dir, "test-data", "alg-lists"))
+
+    if registry_filepath is None:
+        print("[WARNING] - No algorithm lists were created, the algorithm registry has not been written")
+
 #-----------------------------------------------------------------------------------------------------------
 def parse_oqs_provider_algorithms_md():
     """ Function for parsing the ALGORITHMS.md file of the OQS-Provider library to extract the total number of algorithms supported
@@ -378,8 +394,9 @@ def main():
                 print("[ERROR]- Liboqs library not found")
                 sys.exit(1)
             
-            # Get the algorithms supported by the Liboqs library
+            # Get the algorithms supported by the Liboqs library and write the algorithm registry
             get_liboqs_algs()
+            write_alg_registry()
 
         elif sys.argv[1] == "2":
 
@@ -403,6 +420,9 @@ def main():
             get_tls_pqc_algs()
             set_tls_classic_algs()
 
+            # Write the algorithm registry for all of the algorithm lists
+            write_alg_registry()
+
         elif sys.argv[1] == "3":
 
             # Ensure that the OQS-Provider and OpenSSL libraries are present before continuing
@@ -414,9 +434,10 @@ def main():
                 print("[ERROR]- OpenSSL library not found")
                 sys.exit(1)
             
-            # Get the algorithms supported by the OQS-Provider library and set the classic TLS algorithms
+            # Get the algorithms supported by the OQS-Provider library, set the classic TLS algorithms, and write the algorithm registry
             get_tls_pqc_algs()
             set_tls_classic_algs()
+            write_alg_registry()
 
         elif sys.argv[1] == "4":
 